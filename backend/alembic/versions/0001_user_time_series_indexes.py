@@ -0,0 +1,45 @@
+"""사용자별 시계열 테이블에 (user_id, 시간) 복합 인덱스 추가
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-18
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "0001"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+# (인덱스 이름, 테이블, 컬럼)
+INDEXES = [
+    ("ix_chat_histories_user_id_created_at", "chat_histories", ["user_id", "created_at"]),
+    ("ix_chat_histories_user_id_session_id_created_at", "chat_histories", ["user_id", "session_id", "created_at"]),
+    ("ix_meals_user_id_meal_date", "meals", ["user_id", "meal_date"]),
+    ("ix_sleep_records_user_id_sleep_start", "sleep_records", ["user_id", "sleep_start"]),
+    ("ix_voice_health_analyses_user_id_recording_date", "voice_health_analyses", ["user_id", "recording_date"]),
+    ("ix_disease_progress_logs_user_id_log_date", "disease_progress_logs", ["user_id", "log_date"]),
+    ("ix_mood_records_user_id_recorded_at", "mood_records", ["user_id", "recorded_at"]),
+    ("ix_health_records_user_id_measured_at", "health_records", ["user_id", "measured_at"]),
+]
+
+
+def upgrade():
+    # 새 DB는 앱 시작 시 create_all로 테이블과 인덱스가 함께 생성되므로
+    # 이미 존재하는 테이블에만 인덱스를 추가
+    tables = set(sa.inspect(op.get_bind()).get_table_names())
+    for name, table, columns in INDEXES:
+        if table in tables:
+            op.create_index(name, table, columns, if_not_exists=True)
+
+
+def downgrade():
+    tables = set(sa.inspect(op.get_bind()).get_table_names())
+    for name, table, _ in INDEXES:
+        if table in tables:
+            op.drop_index(name, table_name=table, if_exists=True)
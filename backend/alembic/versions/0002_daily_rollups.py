@@ -0,0 +1,56 @@
+"""통계용 일별 집계 테이블(daily_rollups) 추가 및 기존 기록 집계
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-18
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "0002"
+down_revision = "0001"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    tables = set(sa.inspect(op.get_bind()).get_table_names())
+    # 새 DB는 앱 시작 시 create_all로 생성됨
+    if "users" not in tables:
+        return
+
+    if "daily_rollups" not in tables:
+        op.create_table(
+            "daily_rollups",
+            sa.Column("id", sa.Integer(), primary_key=True),
+            sa.Column("user_id", sa.Integer(), sa.ForeignKey("users.id"), nullable=False),
+            sa.Column("source", sa.String(50), nullable=False),
+            sa.Column("subject", sa.String(50), nullable=False),
+            sa.Column("metric", sa.String(50), nullable=False),
+            sa.Column("day", sa.Date(), nullable=False),
+            sa.Column("count", sa.Integer(), nullable=False),
+            sa.Column("total", sa.Float(), nullable=False),
+            sa.Column("min_value", sa.Float(), nullable=True),
+            sa.Column("max_value", sa.Float(), nullable=True),
+            sa.UniqueConstraint(
+                "user_id", "source", "subject", "metric", "day",
+                name="uq_daily_rollups_user_source_subject_metric_day",
+            ),
+        )
+        op.create_index("ix_daily_rollups_id", "daily_rollups", ["id"])
+
+    # 집계 대상 테이블이 모두 있을 때만 기존 기록으로 채움
+    if {"sleep_records", "health_records", "disease_progress_logs"} <= tables:
+        from app.services.daily_rollup import rebuild_all
+
+        rebuild_all(op.get_bind())
+
+
+def downgrade():
+    tables = set(sa.inspect(op.get_bind()).get_table_names())
+    if "daily_rollups" in tables:
+        op.drop_index("ix_daily_rollups_id", table_name="daily_rollups")
+        op.drop_table("daily_rollups")
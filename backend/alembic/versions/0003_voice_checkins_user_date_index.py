@@ -0,0 +1,37 @@
+"""voice_checkins에 (user_id, checkin_date) 복합 인덱스 추가
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-18
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "0003"
+down_revision = "0002"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    tables = set(sa.inspect(op.get_bind()).get_table_names())
+    if "voice_checkins" in tables:
+        op.create_index(
+            "ix_voice_checkins_user_id_checkin_date",
+            "voice_checkins",
+            ["user_id", "checkin_date"],
+            if_not_exists=True,
+        )
+
+
+def downgrade():
+    tables = set(sa.inspect(op.get_bind()).get_table_names())
+    if "voice_checkins" in tables:
+        op.drop_index(
+            "ix_voice_checkins_user_id_checkin_date",
+            table_name="voice_checkins",
+            if_exists=True,
+        )
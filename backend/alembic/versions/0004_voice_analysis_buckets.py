@@ -0,0 +1,104 @@
+"""상시 음성 모니터링 구간 집계 테이블 추가 및 원본 샘플 출처 컬럼 추가
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-18
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "0004"
+down_revision = "0003"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    tables = set(inspector.get_table_names())
+    # 새 DB는 앱 시작 시 create_all로 생성됨
+    if "users" not in tables:
+        return
+
+    if "voice_analysis_buckets" not in tables:
+        op.create_table(
+            "voice_analysis_buckets",
+            sa.Column("id", sa.Integer(), primary_key=True),
+            sa.Column("user_id", sa.Integer(), sa.ForeignKey("users.id"), nullable=False),
+            sa.Column("resolution", sa.Integer(), nullable=False),
+            sa.Column("bucket_start", sa.DateTime(), nullable=False),
+            sa.Column("sample_count", sa.Integer(), nullable=False),
+            sa.Column("stress_sum", sa.Float(), nullable=False),
+            sa.Column("stress_max", sa.Float()),
+            sa.Column("anxiety_sum", sa.Float(), nullable=False),
+            sa.Column("anxiety_max", sa.Float()),
+            sa.Column("depression_sum", sa.Float(), nullable=False),
+            sa.Column("depression_max", sa.Float()),
+            sa.Column("concern_count", sa.Integer(), nullable=False),
+            sa.UniqueConstraint(
+                "user_id", "resolution", "bucket_start",
+                name="uq_voice_analysis_buckets_user_resolution_start",
+            ),
+        )
+        op.create_index("ix_voice_analysis_buckets_id", "voice_analysis_buckets", ["id"])
+
+    if "voice_health_analyses" not in tables:
+        return
+
+    columns = {column["name"] for column in inspector.get_columns("voice_health_analyses")}
+    if "source" not in columns:
+        with op.batch_alter_table("voice_health_analyses") as batch_op:
+            batch_op.add_column(sa.Column("source", sa.String(20), nullable=True))
+
+    # 기존 상시 모니터링 샘플 표시 및 구간 집계 생성
+    analyses = sa.table(
+        "voice_health_analyses",
+        sa.column("user_id", sa.Integer()),
+        sa.column("recording_date", sa.DateTime()),
+        sa.column("stress_level", sa.Integer()),
+        sa.column("anxiety_indicator", sa.Float()),
+        sa.column("depression_indicator", sa.Float()),
+        sa.column("detected_emotion", sa.String()),
+        sa.column("ai_analysis", sa.Text()),
+        sa.column("source", sa.String()),
+    )
+    op.execute(
+        analyses.update()
+        .where(analyses.c.ai_analysis.like("상시 모니터링 - %"))
+        .values(source="continuous")
+    )
+
+    from app.models.voice_health import VoiceAnalysisBucket
+    from app.services.continuous_ingest import build_bucket_rows
+
+    rows = bind.execute(
+        sa.select(
+            analyses.c.user_id,
+            analyses.c.recording_date,
+            sa.func.coalesce(analyses.c.stress_level, 0).label("stress_level"),
+            sa.func.coalesce(analyses.c.anxiety_indicator, 0).label("anxiety_indicator"),
+            sa.func.coalesce(analyses.c.depression_indicator, 0).label("depression_indicator"),
+            analyses.c.detected_emotion,
+        ).where(analyses.c.source == "continuous", analyses.c.recording_date.isnot(None))
+    ).mappings().all()
+    buckets = build_bucket_rows([dict(row) for row in rows])
+    if buckets:
+        # 모델 테이블 정의를 사용해야 DateTime이 앱과 같은 형식으로 저장됨
+        op.bulk_insert(VoiceAnalysisBucket.__table__, buckets)
+
+
+def downgrade():
+    inspector = sa.inspect(op.get_bind())
+    tables = set(inspector.get_table_names())
+    if "voice_analysis_buckets" in tables:
+        op.drop_index("ix_voice_analysis_buckets_id", table_name="voice_analysis_buckets")
+        op.drop_table("voice_analysis_buckets")
+    if "voice_health_analyses" in tables:
+        columns = {column["name"] for column in inspector.get_columns("voice_health_analyses")}
+        if "source" in columns:
+            with op.batch_alter_table("voice_health_analyses") as batch_op:
+                batch_op.drop_column("source")
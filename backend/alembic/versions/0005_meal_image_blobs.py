@@ -0,0 +1,72 @@
+"""식단 사진을 DB의 Base64 문자열에서 파일 저장소로 이전
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-18
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "0005"
+down_revision = "0004"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    # 새 DB는 앱 시작 시 create_all로 생성됨
+    if "meals" not in inspector.get_table_names():
+        return
+
+    columns = {column["name"] for column in inspector.get_columns("meals")}
+    if "image_hash" not in columns:
+        with op.batch_alter_table("meals") as batch_op:
+            batch_op.add_column(sa.Column("image_hash", sa.String(64), nullable=True))
+        op.create_index("ix_meals_image_hash", "meals", ["image_hash"])
+
+    from app.services.blob_store import blob_key, decode_data_url, get_blob_store
+
+    meals = sa.table(
+        "meals",
+        sa.column("id", sa.Integer()),
+        sa.column("image_url", sa.String()),
+        sa.column("image_hash", sa.String()),
+    )
+    backend = get_blob_store().backend
+
+    # 한 건씩 옮겨 수 MB 문자열을 한꺼번에 메모리에 올리지 않음
+    ids = bind.execute(
+        sa.select(meals.c.id).where(meals.c.image_url.like("data:%"))
+    ).scalars().all()
+    for meal_id in ids:
+        image_url = bind.execute(
+            sa.select(meals.c.image_url).where(meals.c.id == meal_id)
+        ).scalar_one()
+        try:
+            data = decode_data_url(image_url)
+        except ValueError:
+            continue
+        key = blob_key(data)
+        backend.put(key, data)
+        bind.execute(
+            meals.update()
+            .where(meals.c.id == meal_id)
+            .values(image_url=f"/api/meals/images/{key}", image_hash=key)
+        )
+
+
+def downgrade():
+    # 파일 저장소의 사진은 그대로 두고 컬럼만 제거 (image_url은 저장소 주소로 유지)
+    inspector = sa.inspect(op.get_bind())
+    if "meals" not in inspector.get_table_names():
+        return
+    columns = {column["name"] for column in inspector.get_columns("meals")}
+    if "image_hash" in columns:
+        op.drop_index("ix_meals_image_hash", table_name="meals")
+        with op.batch_alter_table("meals") as batch_op:
+            batch_op.drop_column("image_hash")
@@ -0,0 +1,77 @@
+"""식단 목록용 썸네일(thumbnail_url) 추가 및 기존 사진 썸네일 생성
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-18
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "0006"
+down_revision = "0005"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    # 새 DB는 앱 시작 시 create_all로 생성됨
+    if "meals" not in inspector.get_table_names():
+        return
+
+    columns = {column["name"] for column in inspector.get_columns("meals")}
+    if "thumbnail_url" not in columns:
+        with op.batch_alter_table("meals") as batch_op:
+            batch_op.add_column(sa.Column("thumbnail_url", sa.String(), nullable=True))
+
+    from app.config import settings
+    from app.services.blob_store import blob_key, get_blob_store
+    from app.services.image_pipeline import make_thumbnail
+
+    meals = sa.table(
+        "meals",
+        sa.column("id", sa.Integer()),
+        sa.column("image_hash", sa.String()),
+        sa.column("thumbnail_url", sa.String()),
+    )
+    backend = get_blob_store().backend
+
+    rows = bind.execute(
+        sa.select(meals.c.id, meals.c.image_hash).where(
+            meals.c.image_hash.isnot(None), meals.c.thumbnail_url.is_(None)
+        )
+    ).all()
+    for meal_id, image_hash in rows:
+        size = backend.size(image_hash)
+        if size is None:
+            continue
+        try:
+            thumbnail, _ = make_thumbnail(
+                backend.read_range(image_hash, 0, size),
+                settings.THUMBNAIL_SIZE,
+                settings.VISION_IMAGE_FORMAT,
+                settings.VISION_IMAGE_QUALITY,
+            )
+        except Exception:
+            continue
+        key = blob_key(thumbnail)
+        backend.put(key, thumbnail)
+        bind.execute(
+            meals.update()
+            .where(meals.c.id == meal_id)
+            .values(thumbnail_url=f"/api/meals/images/{key}")
+        )
+
+
+def downgrade():
+    inspector = sa.inspect(op.get_bind())
+    if "meals" not in inspector.get_table_names():
+        return
+    columns = {column["name"] for column in inspector.get_columns("meals")}
+    if "thumbnail_url" in columns:
+        with op.batch_alter_table("meals") as batch_op:
+            batch_op.drop_column("thumbnail_url")
@@ -0,0 +1,42 @@
+"""비슷한 식단 사진 분석 결과 재사용용 meal_image_analyses 테이블 추가
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-18
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "0007"
+down_revision = "0006"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    tables = set(sa.inspect(op.get_bind()).get_table_names())
+    # 새 DB는 앱 시작 시 create_all로 생성됨
+    if "users" not in tables or "meal_image_analyses" in tables:
+        return
+
+    # 기존 식단 기록에는 detected_foods/health_score가 없으므로 새 분석부터 쌓음
+    op.create_table(
+        "meal_image_analyses",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("perceptual_hash", sa.String(16), nullable=False),
+        sa.Column("image_hash", sa.String(64), nullable=True),
+        sa.Column("meal_type", sa.String(), nullable=False),
+        sa.Column("result", sa.JSON(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+    )
+    op.create_index("ix_meal_image_analyses_id", "meal_image_analyses", ["id"])
+
+
+def downgrade():
+    tables = set(sa.inspect(op.get_bind()).get_table_names())
+    if "meal_image_analyses" in tables:
+        op.drop_index("ix_meal_image_analyses_id", table_name="meal_image_analyses")
+        op.drop_table("meal_image_analyses")
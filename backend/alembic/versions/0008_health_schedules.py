@@ -0,0 +1,46 @@
+"""건강 스케줄 저장 테이블(health_schedules) 추가
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-10-18
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "0008"
+down_revision = "0007"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    tables = set(sa.inspect(op.get_bind()).get_table_names())
+    # 새 DB는 앱 시작 시 create_all로 생성됨
+    if "users" not in tables or "health_schedules" in tables:
+        return
+
+    # 스케줄은 첫 조회나 입력 데이터 변경 시 백그라운드에서 생성됨
+    op.create_table(
+        "health_schedules",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("user_id", sa.Integer(), sa.ForeignKey("users.id"), nullable=False),
+        sa.Column("start_date", sa.Date(), nullable=False),
+        sa.Column("days", sa.Integer(), nullable=False),
+        sa.Column("schedule", sa.JSON(), nullable=False),
+        sa.Column("input_fingerprint", sa.String(64), nullable=False),
+        sa.Column("is_stale", sa.Boolean(), nullable=False, server_default=sa.false()),
+        sa.Column("generated_at", sa.DateTime(), nullable=False),
+    )
+    op.create_index("ix_health_schedules_id", "health_schedules", ["id"])
+    op.create_index("ix_health_schedules_user_id", "health_schedules", ["user_id"])
+
+
+def downgrade():
+    tables = set(sa.inspect(op.get_bind()).get_table_names())
+    if "health_schedules" in tables:
+        op.drop_index("ix_health_schedules_user_id", table_name="health_schedules")
+        op.drop_index("ix_health_schedules_id", table_name="health_schedules")
+        op.drop_table("health_schedules")
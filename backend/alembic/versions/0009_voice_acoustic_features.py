@@ -0,0 +1,43 @@
+"""음성 분석 음향 특징 컬럼(pause_frequency, acoustic_features) 추가
+
+Revision ID: 0009
+Revises: 0008
+Create Date: 2026-10-18
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "0009"
+down_revision = "0008"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    inspector = sa.inspect(op.get_bind())
+    # 새 DB는 앱 시작 시 create_all로 생성됨
+    if "voice_health_analyses" not in inspector.get_table_names():
+        return
+
+    columns = {column["name"] for column in inspector.get_columns("voice_health_analyses")}
+    with op.batch_alter_table("voice_health_analyses") as batch_op:
+        if "pause_frequency" not in columns:
+            batch_op.add_column(sa.Column("pause_frequency", sa.Integer(), nullable=True))
+        if "acoustic_features" not in columns:
+            batch_op.add_column(sa.Column("acoustic_features", sa.JSON(), nullable=True))
+
+
+def downgrade():
+    inspector = sa.inspect(op.get_bind())
+    if "voice_health_analyses" not in inspector.get_table_names():
+        return
+
+    columns = {column["name"] for column in inspector.get_columns("voice_health_analyses")}
+    with op.batch_alter_table("voice_health_analyses") as batch_op:
+        if "acoustic_features" in columns:
+            batch_op.drop_column("acoustic_features")
+        if "pause_frequency" in columns:
+            batch_op.drop_column("pause_frequency")
@@ -0,0 +1,53 @@
+"""백그라운드 작업 테이블(jobs) 추가
+
+Revision ID: 0010
+Revises: 0009
+Create Date: 2026-10-18
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "0010"
+down_revision = "0009"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    tables = set(sa.inspect(op.get_bind()).get_table_names())
+    # 새 DB는 앱 시작 시 create_all로 생성됨
+    if "users" not in tables or "jobs" in tables:
+        return
+
+    op.create_table(
+        "jobs",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("user_id", sa.Integer(), sa.ForeignKey("users.id"), nullable=False),
+        sa.Column("job_type", sa.String(50), nullable=False),
+        sa.Column("status", sa.String(20), nullable=False),
+        sa.Column("payload", sa.JSON(), nullable=False),
+        sa.Column("result", sa.JSON(), nullable=True),
+        sa.Column("error", sa.Text(), nullable=True),
+        sa.Column("attempts", sa.Integer(), nullable=False),
+        sa.Column("max_attempts", sa.Integer(), nullable=False),
+        sa.Column("run_after", sa.DateTime(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("started_at", sa.DateTime(), nullable=True),
+        sa.Column("finished_at", sa.DateTime(), nullable=True),
+    )
+    op.create_index("ix_jobs_id", "jobs", ["id"])
+    op.create_index("ix_jobs_user_id", "jobs", ["user_id"])
+    # 작업 큐가 종류별로 실행할 작업을 찾는 조회용
+    op.create_index("ix_jobs_status_type_run_after", "jobs", ["status", "job_type", "run_after"])
+
+
+def downgrade():
+    tables = set(sa.inspect(op.get_bind()).get_table_names())
+    if "jobs" in tables:
+        op.drop_index("ix_jobs_status_type_run_after", table_name="jobs")
+        op.drop_index("ix_jobs_user_id", table_name="jobs")
+        op.drop_index("ix_jobs_id", table_name="jobs")
+        op.drop_table("jobs")
@@ -0,0 +1,43 @@
+"""대화 세션 누적 요약 테이블(chat_sessions) 추가
+
+Revision ID: 0011
+Revises: 0010
+Create Date: 2026-10-18
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "0011"
+down_revision = "0010"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    tables = set(sa.inspect(op.get_bind()).get_table_names())
+    # 새 DB는 앱 시작 시 create_all로 생성됨
+    if "users" not in tables or "chat_sessions" in tables:
+        return
+
+    # 기존 세션은 다음 대화 때 요약 작업이 이전 메시지부터 요약함
+    op.create_table(
+        "chat_sessions",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("user_id", sa.Integer(), sa.ForeignKey("users.id"), nullable=False),
+        sa.Column("session_id", sa.String(), nullable=False),
+        sa.Column("summary", sa.Text(), nullable=False),
+        sa.Column("summarized_until", sa.Integer(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=True),
+        sa.UniqueConstraint("user_id", "session_id", name="uq_chat_sessions_user_id_session_id"),
+    )
+    op.create_index("ix_chat_sessions_id", "chat_sessions", ["id"])
+
+
+def downgrade():
+    tables = set(sa.inspect(op.get_bind()).get_table_names())
+    if "chat_sessions" in tables:
+        op.drop_index("ix_chat_sessions_id", table_name="chat_sessions")
+        op.drop_table("chat_sessions")
@@ -0,0 +1,63 @@
+"""상시 모니터링 상태 컬럼(monitoring_status) 분리
+
+상시 모니터링 샘플이 detected_emotion에 normal/concern/warning을 저장하던 것을
+monitoring_status로 옮긴다 (detected_emotion은 감정 유형 값만 사용).
+
+Revision ID: 0012
+Revises: 0011
+Create Date: 2026-10-18
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "0012"
+down_revision = "0011"
+branch_labels = None
+depends_on = None
+
+
+analyses = sa.table(
+    "voice_health_analyses",
+    sa.column("source", sa.String()),
+    sa.column("detected_emotion", sa.String()),
+    sa.column("monitoring_status", sa.String()),
+)
+
+
+def upgrade():
+    inspector = sa.inspect(op.get_bind())
+    # 새 DB는 앱 시작 시 create_all로 생성됨
+    if "voice_health_analyses" not in inspector.get_table_names():
+        return
+
+    columns = {column["name"] for column in inspector.get_columns("voice_health_analyses")}
+    if "monitoring_status" not in columns:
+        with op.batch_alter_table("voice_health_analyses") as batch_op:
+            batch_op.add_column(sa.Column("monitoring_status", sa.String(20), nullable=True))
+
+    op.execute(
+        analyses.update()
+        .where(analyses.c.source == "continuous")
+        .values(monitoring_status=analyses.c.detected_emotion, detected_emotion=None)
+    )
+
+
+def downgrade():
+    inspector = sa.inspect(op.get_bind())
+    if "voice_health_analyses" not in inspector.get_table_names():
+        return
+
+    columns = {column["name"] for column in inspector.get_columns("voice_health_analyses")}
+    if "monitoring_status" not in columns:
+        return
+
+    op.execute(
+        analyses.update()
+        .where(analyses.c.source == "continuous")
+        .values(detected_emotion=analyses.c.monitoring_status)
+    )
+    with op.batch_alter_table("voice_health_analyses") as batch_op:
+        batch_op.drop_column("monitoring_status")
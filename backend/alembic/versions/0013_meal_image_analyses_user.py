@@ -0,0 +1,46 @@
+"""meal_image_analyses에 user_id 추가 (식단 사진 분석 재사용을 사용자별로 제한)
+
+분석/추천 문구는 사용자 개인 기록이므로 다른 사용자의 비슷한 사진 결과를 재사용하지 않는다.
+주인을 알 수 없는 기존 행은 user_id가 비어 있어 더 이상 재사용되지 않는다.
+
+Revision ID: 0013
+Revises: 0012
+Create Date: 2026-10-18
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "0013"
+down_revision = "0012"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    inspector = sa.inspect(op.get_bind())
+    # 새 DB는 앱 시작 시 create_all로 생성됨
+    if "meal_image_analyses" not in inspector.get_table_names():
+        return
+
+    columns = {column["name"] for column in inspector.get_columns("meal_image_analyses")}
+    if "user_id" not in columns:
+        with op.batch_alter_table("meal_image_analyses") as batch_op:
+            batch_op.add_column(sa.Column("user_id", sa.Integer(), nullable=True))
+            batch_op.create_foreign_key(
+                "fk_meal_image_analyses_user_id_users", "users", ["user_id"], ["id"]
+            )
+
+
+def downgrade():
+    inspector = sa.inspect(op.get_bind())
+    if "meal_image_analyses" not in inspector.get_table_names():
+        return
+
+    columns = {column["name"] for column in inspector.get_columns("meal_image_analyses")}
+    if "user_id" in columns:
+        with op.batch_alter_table("meal_image_analyses") as batch_op:
+            batch_op.drop_constraint("fk_meal_image_analyses_user_id_users", type_="foreignkey")
+            batch_op.drop_column("user_id")
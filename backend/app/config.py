@@ -1,5 +1,5 @@
 from pydantic_settings import BaseSettings
-from typing import Optional
+from typing import Dict, Optional
 
 
 class Settings(BaseSettings):
@@ -12,13 +12,105 @@ class Settings(BaseSettings):
     # 서비스 계정 JSON 파일 경로 (선택)
     GOOGLE_APPLICATION_CREDENTIALS: Optional[str] = None
 
+    # LLM Gateway
+    LLM_MAX_CONCURRENCY: int = 16  # 동시 Gemini 호출 수 상한
+    LLM_TIMEOUT_SECONDS: float = 60.0  # 호출별 타임아웃
+
+    # AI 응답 캐시
+    RESPONSE_CACHE_TTL_SECONDS: int = 3600
+    RESPONSE_CACHE_MAX_ENTRIES: int = 1000
+    RESPONSE_CACHE_URL: Optional[str] = None  # redis://... 설정 시 워커 간 공유 캐시 사용
+
+    # 음성 체크인 통계 캐시 (다른 워커의 체크인은 TTL 이후 반영)
+    CHECKIN_STATS_TTL_SECONDS: int = 300
+    CHECKIN_STATS_MAX_ENTRIES: int = 10000
+
+    # 상시 음성 모니터링 쓰기 버퍼
+    CONTINUOUS_BUFFER_MAX_ROWS: int = 500  # 이만큼 모이면 즉시 저장
+    CONTINUOUS_BUFFER_FLUSH_SECONDS: float = 2.0  # 최대 저장 지연
+    VOICE_RAW_RETENTION_HOURS: int = 48  # 원본 샘플 보존 기간
+    VOICE_5MIN_RETENTION_DAYS: int = 14  # 5분 구간 집계 보존 기간
+    VOICE_HOURLY_RETENTION_DAYS: int = 365  # 1시간 구간 집계 보존 기간
+
     # Database
     DATABASE_URL: str = "sqlite+aiosqlite:///./health_chatbot.db"
+    DATABASE_READ_URL: Optional[str] = None  # 읽기 전용 복제본 (없으면 DATABASE_URL 사용)
+    SQL_ECHO: Optional[bool] = None  # 미설정 시 DEBUG 값을 따름
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 20
+    DB_POOL_PRE_PING: bool = True
+    DB_POOL_RECYCLE_SECONDS: int = 1800
+    DB_POOL_TIMEOUT_SECONDS: int = 30
+    DB_STATEMENT_CACHE_SIZE: int = 100  # asyncpg prepared statement 캐시 (PgBouncer 사용 시 0)
+
+    # 파일 저장소 (식단 사진 등)
+    BLOB_STORE_BACKEND: str = "local"  # local 또는 s3
+    BLOB_STORE_PATH: str = "./uploads/blobs"
+    BLOB_S3_BUCKET: Optional[str] = None
+    BLOB_S3_ENDPOINT_URL: Optional[str] = None  # MinIO, R2 등 S3 호환 저장소 주소
+    BLOB_S3_PREFIX: str = "blobs/"
+    MEAL_IMAGE_MAX_BYTES: int = 10 * 1024 * 1024
+
+    # 이미지 전처리 (Gemini Vision 전송 전 축소, 목록용 썸네일)
+    IMAGE_PIPELINE_WORKERS: int = 2  # Pillow 작업 프로세스 수
+    VISION_IMAGE_MAX_PIXELS: int = 1024 * 1024  # 전송 이미지 최대 픽셀 수
+    VISION_IMAGE_FORMAT: str = "JPEG"  # JPEG 또는 WEBP
+    VISION_IMAGE_QUALITY: int = 85
+    THUMBNAIL_SIZE: int = 320  # 썸네일 긴 변 (px)
+
+    # 비슷한 식단 사진 분석 결과 재사용 (dHash 해밍 거리, -1이면 사용 안 함)
+    MEAL_DEDUP_MAX_DISTANCE: int = 5
+    MEAL_DEDUP_MAX_ENTRIES: int = 100000
+
+    # 음식 영양 DB 이름 검색 (자모 3-gram Dice 계수 최소값)
+    FOOD_MATCH_MIN_SCORE: float = 0.6
+
+    # 건강 스케줄 저장/백그라운드 재생성
+    HEALTH_SCHEDULE_DAYS: int = 7  # 한 번에 생성하는 기간 (일)
+    HEALTH_SCHEDULE_TTL_HOURS: int = 24  # 이 시간이 지나면 조회 시 재생성 예약
+    HEALTH_SCHEDULE_DEBOUNCE_SECONDS: float = 30.0  # 입력 데이터 변경 후 재생성까지 대기
+    HEALTH_SCHEDULE_RETRY_SECONDS: float = 600.0  # 생성 실패 후 재시도 대기
+    HEALTH_SCHEDULE_CONCURRENCY: int = 2  # 동시 Gemini 호출 수
+
+    # 실시간 음성 인식 (WebSocket /api/speech/stream)
+    STT_STREAMING_BACKEND: str = "google"  # google 또는 local (오프라인 테스트용)
+    STT_STREAM_MAX_SESSIONS: int = 16  # 동시 스트리밍 세션 수 (세션당 스레드 1개)
+    STT_STREAM_MAX_SECONDS: int = 290  # 세션 최대 길이 (Google 스트리밍 제한 약 5분)
+    STT_STREAM_MAX_CHUNK_BYTES: int = 64 * 1024
+
+    # 오디오 업로드 (원본 바디 또는 multipart)
+    AUDIO_UPLOAD_MAX_BYTES: int = 10 * 1024 * 1024  # Google STT 동기 인식 요청 한도와 같음
+    AUDIO_SPOOL_MEMORY_BYTES: int = 1024 * 1024  # 이보다 크면 임시 파일로 넘김
+
+    # 백그라운드 AI 작업 큐 (GET /api/jobs/{id}로 결과 조회)
+    JOB_DEFAULT_CONCURRENCY: int = 4  # 작업 종류별 동시 실행 수 기본값
+    JOB_CONCURRENCY: Dict[str, int] = {"meal_analysis": 2}  # 종류별 동시 실행 수 (JSON)
+    JOB_MAX_ATTEMPTS: int = 3
+    JOB_RETRY_BASE_SECONDS: float = 5.0  # 재시도 대기: 5초, 10초, 20초... (지수 백오프)
+    JOB_RETRY_MAX_SECONDS: float = 300.0
+    JOB_TIMEOUT_SECONDS: float = 120.0  # 작업 1회 실행 제한 (넘으면 실패로 보고 재시도)
+    JOB_POLL_SECONDS: float = 5.0  # 다른 워커 프로세스가 넣은 작업 확인 주기
+    JOB_RETENTION_DAYS: int = 7  # 끝난 작업 보관 기간
+
+    # 음성 음향 특징 추출 (/voice/analyze)
+    VOICE_FEATURE_WORKERS: int = 2  # NumPy 분석 프로세스 수
+    FFMPEG_PATH: str = "ffmpeg"  # WebM/Ogg/MP3 디코딩 (WAV는 ffmpeg 없이 분석)
+
+    # 증상 체크 대화 문맥 (같은 session_id의 이전 대화를 요약 + 최근 메시지로 전달)
+    CHAT_CONTEXT_RECENT_MESSAGES: int = 6  # 원문으로 넣는 최근 메시지 수 (사용자/AI 합계)
+    CHAT_CONTEXT_MAX_TOKENS: int = 1500  # 요약 + 최근 메시지 토큰 상한 (추정치)
+    CHAT_CONTEXT_MESSAGE_MAX_TOKENS: int = 300  # 메시지 하나당 상한 (긴 AI 답변은 앞부분만)
+    CHAT_SUMMARY_MAX_TOKENS: int = 400  # 누적 요약 상한
+    CHAT_SUMMARY_BATCH_MESSAGES: int = 20  # 요약 작업 1회에 합치는 최대 메시지 수
 
     # Security
     SECRET_KEY: str = "temp-secret-key-please-change-in-production"
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
+    PRINCIPAL_CACHE_TTL_SECONDS: int = 60  # 인증 사용자 캐시 유지 시간
+    PRINCIPAL_CACHE_MAX_ENTRIES: int = 10000
+    BCRYPT_ROUNDS: int = 12  # 올리면 기존 사용자는 다음 로그인 시 재해시됨
+    PASSWORD_HASH_WORKERS: int = 4  # bcrypt 전용 스레드 수
 
     # App
     APP_NAME: str = "AI Health Chatbot"
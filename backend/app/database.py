@@ -1,26 +1,79 @@
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
+from typing import Optional
 import os
 from dotenv import load_dotenv
+from .config import settings
 
 load_dotenv()
 
-# Railway PostgreSQL URL 변환
-DATABASE_URL = os.getenv("DATABASE_URL", "sqlite+aiosqlite:///./health_chatbot.db")
 
-# Railway provides postgres:// but SQLAlchemy async needs postgresql+asyncpg://
-if DATABASE_URL.startswith("postgres://"):
-    DATABASE_URL = DATABASE_URL.replace("postgres://", "postgresql+asyncpg://", 1)
-elif DATABASE_URL.startswith("postgresql://"):
-    DATABASE_URL = DATABASE_URL.replace("postgresql://", "postgresql+asyncpg://", 1)
+def _to_async_url(url: str) -> str:
+    """Railway PostgreSQL URL 변환
 
-engine = create_async_engine(DATABASE_URL, echo=True, future=True)
+    Railway provides postgres:// but SQLAlchemy async needs postgresql+asyncpg://
+    """
+    if url.startswith("postgres://"):
+        return url.replace("postgres://", "postgresql+asyncpg://", 1)
+    if url.startswith("postgresql://"):
+        return url.replace("postgresql://", "postgresql+asyncpg://", 1)
+    return url
+
+
+DATABASE_URL = _to_async_url(
+    os.getenv("DATABASE_URL", "sqlite+aiosqlite:///./health_chatbot.db")
+)
+DATABASE_READ_URL = _to_async_url(
+    os.getenv("DATABASE_READ_URL") or settings.DATABASE_READ_URL or DATABASE_URL
+)
+
+# SQL 로그는 DEBUG 모드에서만 (SQL_ECHO로 별도 지정 가능)
+SQL_ECHO = settings.DEBUG if settings.SQL_ECHO is None else settings.SQL_ECHO
+
+
+def _engine_options(url: str) -> dict:
+    """설정(config.Settings)에 따른 엔진 옵션"""
+    options = {"echo": SQL_ECHO, "future": True}
+
+    # SQLite는 파일 잠금 기반이라 커넥션 풀 튜닝이 의미 없음
+    if url.startswith("sqlite"):
+        return options
+
+    options.update(
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_pre_ping=settings.DB_POOL_PRE_PING,
+        pool_recycle=settings.DB_POOL_RECYCLE_SECONDS,
+        pool_timeout=settings.DB_POOL_TIMEOUT_SECONDS,
+    )
+    if url.startswith("postgresql+asyncpg"):
+        # PgBouncer(transaction 모드) 사용 시 DB_STATEMENT_CACHE_SIZE=0
+        options["connect_args"] = {
+            "statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+        }
+    return options
+
+
+engine = create_async_engine(DATABASE_URL, **_engine_options(DATABASE_URL))
+
+# 읽기 전용 복제본이 설정되지 않으면 쓰기 엔진을 그대로 사용
+if DATABASE_READ_URL == DATABASE_URL:
+    read_engine = engine
+else:
+    read_engine = create_async_engine(
+        DATABASE_READ_URL, **_engine_options(DATABASE_READ_URL)
+    )
 
 AsyncSessionLocal = sessionmaker(
     engine, class_=AsyncSession, expire_on_commit=False
 )
 
+AsyncReadSessionLocal = sessionmaker(
+    read_engine, class_=AsyncSession, expire_on_commit=False
+)
+
 Base = declarative_base()
 
 
@@ -33,7 +86,51 @@ async def get_db():
             await session.close()
 
 
+async def get_read_db():
+    """읽기 전용 데이터베이스 세션 의존성 (복제본 설정 시 복제본 사용)"""
+    async with AsyncReadSessionLocal() as session:
+        try:
+            yield session
+        finally:
+            await session.close()
+
+
 async def init_db():
     """데이터베이스 초기화"""
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
+
+
+async def check_db():
+    """시작 시 DB 연결 자체 점검 (쓰기/읽기 엔진 모두 SELECT 1)"""
+    for name, target in _engines().items():
+        async with target.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+        print(f"DB 연결 확인 ({name}): {target.url.render_as_string(hide_password=True)}")
+
+
+def _engines() -> dict:
+    engines = {"write": engine}
+    if read_engine is not engine:
+        engines["read"] = read_engine
+    return engines
+
+
+def _pool_status(pool) -> dict:
+    """커넥션 풀 사용 현황"""
+    status = {"pool_class": type(pool).__name__}
+    for metric in ("size", "checkedin", "checkedout", "overflow"):
+        method = getattr(pool, metric, None)
+        if callable(method):
+            status[metric] = method()
+
+    size: Optional[int] = status.get("size")
+    if size:
+        capacity = size + max(settings.DB_MAX_OVERFLOW, 0)
+        status["utilization"] = round(status.get("checkedout", 0) / capacity, 4)
+    return status
+
+
+def pool_metrics() -> dict:
+    """엔진별 커넥션 풀 메트릭"""
+    return {name: _pool_status(target.pool) for name, target in _engines().items()}
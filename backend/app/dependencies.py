@@ -1,19 +1,24 @@
-from fastapi import Depends, HTTPException, status
+from typing import AsyncIterator
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from .database import get_db
 from .models.user import User
+from .services.audio_upload import AudioTooLargeError, AudioUpload, receive_audio
 from .services.auth_service import AuthService
+from .services.principal_cache import get_principal_cache
 
 security = HTTPBearer()
 
 
-async def get_current_user(
+async def get_current_user_id(
     credentials: HTTPAuthorizationCredentials = Depends(security),
-    db: AsyncSession = Depends(get_db),
-) -> User:
-    """JWT 토큰에서 현재 사용자 가져오기"""
+) -> int:
+    """JWT 토큰에서 사용자 ID만 가져오기 (DB 조회 없음)
+
+    user_id만 필요한 엔드포인트에서 사용합니다.
+    """
 
     token = credentials.credentials
     payload = AuthService.verify_token(token)
@@ -33,6 +38,20 @@ async def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
+    return user_id
+
+
+async def get_current_user(
+    user_id: int = Depends(get_current_user_id),
+    db: AsyncSession = Depends(get_db),
+) -> User:
+    """JWT 토큰에서 현재 사용자 가져오기 (짧은 TTL 캐시 사용)"""
+
+    cache = get_principal_cache()
+    user = cache.get(user_id)
+    if user:
+        return user
+
     result = await db.execute(select(User).where(User.id == user_id))
     user = result.scalar_one_or_none()
 
@@ -42,4 +61,30 @@ async def get_current_user(
             detail="사용자를 찾을 수 없습니다.",
         )
 
+    cache.set(user)
     return user
+
+
+async def get_audio_upload(request: Request) -> AsyncIterator[AudioUpload]:
+    """요청 바디의 오디오를 임시 파일로 받기 (원본 바이트 또는 multipart의 file 필드)
+
+    인증 의존성 뒤에 선언해야 인증 실패 시 바디를 읽지 않습니다.
+    """
+
+    try:
+        audio = await receive_audio(request)
+    except AudioTooLargeError as e:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=str(e),
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
+
+    try:
+        yield audio
+    finally:
+        audio.close()
@@ -1,8 +1,22 @@
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
+from fastapi.encoders import jsonable_encoder
+from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 from contextlib import asynccontextmanager
-from .database import init_db
+from .database import init_db, check_db, pool_metrics, AsyncSessionLocal
 from .config import settings
+from .services.llm_gateway import get_llm_gateway
+from .services.response_cache import get_response_cache
+from .services.emergency_detector import get_emergency_detector
+from .services.continuous_ingest import get_continuous_buffer
+from .services.image_pipeline import get_image_pipeline
+from .services.meal_image_index import get_meal_analysis_index
+from .services.food_index import get_food_index
+from .services.health_schedule_store import get_schedule_refresher
+from .services.streaming_speech import get_streaming_speech_service
+from .services.voice_features import get_voice_feature_extractor
+from .services.job_queue import get_job_queue
 from .routers import (
     auth_router,
     chat_router,
@@ -20,17 +34,35 @@ from .routers import (
     health_schedule_router,
     emotion_router,
     speech_router,
+    jobs_router,
 )
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """앱 시작/종료 시 실행"""
-    # 시작 시 데이터베이스 초기화
+    # 시작 시 데이터베이스 연결 점검 및 초기화
+    await check_db()
     await init_db()
     print("데이터베이스 초기화 완료")
+    # 음식 영양 DB 색인 로드
+    async with AsyncSessionLocal() as db:
+        await get_food_index().load(db)
+    # 응급 키워드 오토마톤 미리 컴파일
+    get_emergency_detector()
+    # 상시 모니터링 쓰기 버퍼 주기적 저장 시작
+    get_continuous_buffer().start()
+    # 건강 스케줄 백그라운드 재생성 시작
+    get_schedule_refresher().start()
+    # AI 분석 작업 큐 시작 (이전 실행에서 남은 대기 작업도 이어서 실행)
+    get_job_queue().start()
     yield
     # 종료 시 정리 작업
+    await get_continuous_buffer().stop()
+    await get_schedule_refresher().stop()
+    await get_job_queue().stop()
+    get_image_pipeline().shutdown()
+    get_voice_feature_extractor().shutdown()
     print("앱 종료")
 
 
@@ -42,6 +74,7 @@ app = FastAPI(
 )
 
 # CORS 설정 - 현재 모든 origin 허용 (프로덕션에서는 제한 필요)
+import math
 import os
 
 # 개발/프로덕션 구분
@@ -70,6 +103,20 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+
+
+@app.exception_handler(RequestValidationError)
+async def validation_exception_handler(request: Request, exc: RequestValidationError):
+    """422 응답 - NaN/inf 입력은 JSON으로 직렬화할 수 없으므로 문자열로 바꿔 돌려줌"""
+    errors = [
+        {**error, "input": str(error["input"])}
+        if isinstance(error.get("input"), float) and not math.isfinite(error["input"])
+        else error
+        for error in exc.errors()
+    ]
+    return JSONResponse(status_code=422, content={"detail": jsonable_encoder(errors)})
+
+
 # 라우터 등록
 app.include_router(auth_router)
 app.include_router(chat_router)
@@ -87,6 +134,7 @@ app.include_router(voice_health_router)
 app.include_router(health_schedule_router)
 app.include_router(emotion_router)
 app.include_router(speech_router)
+app.include_router(jobs_router)
 
 
 @app.get("/")
@@ -105,6 +153,54 @@ async def health_check():
     return {"status": "healthy"}
 
 
+@app.get("/health/llm")
+async def llm_health_check():
+    """LLM 게이트웨이 상태 (동시 호출 수, 대기열 깊이 등)"""
+    return get_llm_gateway().metrics()
+
+
+@app.get("/health/db")
+async def db_health_check():
+    """데이터베이스 커넥션 풀 사용 현황"""
+    return pool_metrics()
+
+
+@app.get("/health/cache")
+async def cache_health_check():
+    """AI 응답 캐시 상태 (적중률 등)"""
+    return get_response_cache().metrics()
+
+
+@app.get("/health/ingest")
+async def ingest_health_check():
+    """상시 모니터링 쓰기 버퍼 상태"""
+    return get_continuous_buffer().metrics()
+
+
+@app.get("/health/meal-index")
+async def meal_index_health_check():
+    """식단 사진 분석 재사용 색인 상태"""
+    return get_meal_analysis_index().metrics()
+
+
+@app.get("/health/schedules")
+async def schedule_health_check():
+    """건강 스케줄 백그라운드 재생성 상태"""
+    return get_schedule_refresher().metrics()
+
+
+@app.get("/health/speech-stream")
+async def speech_stream_health_check():
+    """실시간 음성 인식 세션 상태"""
+    return get_streaming_speech_service().metrics()
+
+
+@app.get("/health/jobs")
+async def job_queue_health_check():
+    """백그라운드 작업 큐 상태 (종류별 실행 수, 완료/실패/재시도 횟수)"""
+    return get_job_queue().metrics()
+
+
 # 법적 면책 조항 엔드포인트
 @app.get("/api/disclaimer")
 async def get_disclaimer():
@@ -1,14 +1,17 @@
 from .user import User
 from .health_record import HealthRecord
 from .medication import Medication
-from .chat_history import ChatHistory
+from .chat_history import ChatHistory, ChatSession
 from .mental_health import MentalHealthCheck
 from .mood_record import MoodRecord
 from .meditation import MeditationSession
 from .music_therapy import MusicSession
 from .sleep import SleepRecord
-from .meal import Meal
+from .meal import Meal, MealImageAnalysis
 from .disease import DiseaseRecord, TreatmentPlan, DiseaseChecklist, DiseaseProgressLog
+from .daily_rollup import DailyRollup
+from .health_schedule import HealthSchedule
+from .job import Job, JobStatus
 from .pregnancy import (
     PregnancyRecord,
     PrenatalCare,
@@ -31,6 +34,7 @@ from .nutrition import (
 )
 from .voice_health import (
     VoiceHealthAnalysis,
+    VoiceAnalysisBucket,
     VoiceBasedReminder,
     ConversationLog,
     VoiceCheckIn,
@@ -43,16 +47,22 @@ __all__ = [
     "HealthRecord",
     "Medication",
     "ChatHistory",
+    "ChatSession",
     "MentalHealthCheck",
     "MoodRecord",
     "MeditationSession",
     "MusicSession",
     "SleepRecord",
     "Meal",
+    "MealImageAnalysis",
     "DiseaseRecord",
     "TreatmentPlan",
     "DiseaseChecklist",
     "DiseaseProgressLog",
+    "DailyRollup",
+    "HealthSchedule",
+    "Job",
+    "JobStatus",
     "PregnancyRecord",
     "PrenatalCare",
     "PregnancyLog",
@@ -70,6 +80,7 @@ __all__ = [
     "NutritionRecommendation",
     "RecipeRecommendation",
     "VoiceHealthAnalysis",
+    "VoiceAnalysisBucket",
     "VoiceBasedReminder",
     "ConversationLog",
     "VoiceCheckIn",
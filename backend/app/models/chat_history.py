@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text, Enum
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text, Enum, Index, UniqueConstraint
 from sqlalchemy.orm import relationship
 from datetime import datetime
 import enum
@@ -16,6 +16,10 @@ class ChatHistory(Base):
     """챗봇 대화 기록 모델"""
 
     __tablename__ = "chat_histories"
+    __table_args__ = (
+        Index("ix_chat_histories_user_id_created_at", "user_id", "created_at"),
+        Index("ix_chat_histories_user_id_session_id_created_at", "user_id", "session_id", "created_at"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
@@ -34,3 +38,25 @@ class ChatHistory(Base):
 
     # Relationships
     user = relationship("User", back_populates="chat_histories")
+
+
+class ChatSession(Base):
+    """대화 세션별 누적 요약 (services/chat_context.py가 프롬프트 문맥으로 사용)
+
+    최근 메시지는 chat_histories 원문을 그대로 쓰고, 그보다 오래된 메시지는
+    summary에 합쳐 둔다. summarized_until은 요약에 반영된 마지막 ChatHistory.id.
+    """
+
+    __tablename__ = "chat_sessions"
+    __table_args__ = (
+        UniqueConstraint("user_id", "session_id", name="uq_chat_sessions_user_id_session_id"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    session_id = Column(String, nullable=False)
+
+    summary = Column(Text, nullable=False, default="")
+    summarized_until = Column(Integer, nullable=False, default=0)
+
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
@@ -0,0 +1,35 @@
+from sqlalchemy import Column, Integer, String, Float, Date, ForeignKey, UniqueConstraint
+from ..database import Base
+
+
+class DailyRollup(Base):
+    """사용자별 일별 집계 (통계 조회용)
+
+    원본 기록(수면, 건강 기록, 질병 진행 로그)이 추가/수정/삭제될 때
+    services/daily_rollup.py에서 해당 날짜 행을 다시 계산한다.
+    """
+    __tablename__ = "daily_rollups"
+    __table_args__ = (
+        UniqueConstraint(
+            "user_id", "source", "subject", "metric", "day",
+            name="uq_daily_rollups_user_source_subject_metric_day",
+        ),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+
+    # 집계 대상
+    source = Column(String(50), nullable=False)  # sleep, health, disease_progress
+    subject = Column(String(50), nullable=False, default="")  # 기록 종류, 질병 기록 ID 등
+    metric = Column(String(50), nullable=False)  # 원본 컬럼명
+    day = Column(Date, nullable=False)  # UTC 기준 날짜
+
+    # 집계 값
+    count = Column(Integer, nullable=False, default=0)
+    total = Column(Float, nullable=False, default=0.0)
+    min_value = Column(Float, nullable=True)
+    max_value = Column(Float, nullable=True)
+
+    def __repr__(self):
+        return f"<DailyRollup {self.source}/{self.subject}/{self.metric} {self.day}: {self.count}>"
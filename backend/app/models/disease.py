@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, Float, DateTime, ForeignKey, Boolean, Enum, JSON
+from sqlalchemy import Column, Integer, String, Text, Float, DateTime, ForeignKey, Boolean, Enum, JSON, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 import enum
@@ -136,6 +136,9 @@ class DiseaseChecklist(Base):
 class DiseaseProgressLog(Base):
     """질병 진행 상황 로그 모델"""
     __tablename__ = "disease_progress_logs"
+    __table_args__ = (
+        Index("ix_disease_progress_logs_user_id_log_date", "user_id", "log_date"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     disease_record_id = Column(Integer, ForeignKey("disease_records.id"), nullable=False)
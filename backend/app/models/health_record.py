@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Float, DateTime, ForeignKey, Enum
+from sqlalchemy import Column, Integer, String, Float, DateTime, ForeignKey, Enum, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 import enum
@@ -19,6 +19,9 @@ class HealthRecord(Base):
     """건강 기록 모델"""
 
     __tablename__ = "health_records"
+    __table_args__ = (
+        Index("ix_health_records_user_id_measured_at", "user_id", "measured_at"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
@@ -0,0 +1,28 @@
+from sqlalchemy import Column, Integer, Date, DateTime, Boolean, ForeignKey, JSON, String
+from datetime import datetime
+from ..database import Base
+
+
+class HealthSchedule(Base):
+    """AI가 생성한 건강 관리 스케줄 (사용자별 최신 1건)
+
+    조회 시에는 저장된 스케줄을 그대로 내려주고, 입력 데이터(복약, 수면, 식단, 프로필)가
+    바뀌면 services/health_schedule_store.py의 백그라운드 작업이 다시 생성한다.
+    """
+    __tablename__ = "health_schedules"
+
+    id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
+
+    # 스케줄 기간
+    start_date = Column(Date, nullable=False)
+    days = Column(Integer, nullable=False)
+
+    schedule = Column(JSON, nullable=False)  # [{"date": "YYYY-MM-DD", "tasks": [...]}]
+    input_fingerprint = Column(String(64), nullable=False)  # 생성 당시 입력 데이터 해시
+    is_stale = Column(Boolean, nullable=False, default=False)  # 입력 데이터 변경됨 (재생성 대기)
+
+    generated_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+
+    def __repr__(self):
+        return f"<HealthSchedule user={self.user_id} {self.start_date}+{self.days}d>"
@@ -0,0 +1,45 @@
+from sqlalchemy import Column, Integer, DateTime, ForeignKey, JSON, String, Text, Index
+from datetime import datetime
+import enum
+from ..database import Base
+
+
+class JobStatus(str, enum.Enum):
+    """작업 상태"""
+    QUEUED = "queued"
+    RUNNING = "running"
+    DONE = "done"
+    FAILED = "failed"
+
+
+class Job(Base):
+    """AI 분석 등 오래 걸리는 작업 (services/job_queue.py가 앱 프로세스 안에서 실행)
+
+    요청은 작업을 저장하고 바로 응답하며, 결과는 GET /api/jobs/{id}로 조회한다.
+    작업이 DB에 남으므로 서버가 재시작되어도 대기 중인 작업은 이어서 실행된다.
+    """
+    __tablename__ = "jobs"
+    __table_args__ = (
+        Index("ix_jobs_status_type_run_after", "status", "job_type", "run_after"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
+
+    job_type = Column(String(50), nullable=False)  # mood_analysis, mental_health_assessment, meal_analysis, symptom_check
+    status = Column(String(20), nullable=False, default=JobStatus.QUEUED.value)
+    payload = Column(JSON, nullable=False)
+    result = Column(JSON, nullable=True)
+    error = Column(Text, nullable=True)  # 마지막 실패 사유
+
+    # 재시도
+    attempts = Column(Integer, nullable=False, default=0)
+    max_attempts = Column(Integer, nullable=False, default=3)
+    run_after = Column(DateTime, nullable=False, default=datetime.utcnow)  # 이 시각 이후 실행 (재시도 대기)
+
+    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    started_at = Column(DateTime, nullable=True)
+    finished_at = Column(DateTime, nullable=True)
+
+    def __repr__(self):
+        return f"<Job {self.id} {self.job_type} {self.status}>"
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, Float, ForeignKey, Text
+from sqlalchemy import Column, Integer, String, DateTime, Float, ForeignKey, Text, Index, JSON
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from ..database import Base
@@ -8,6 +8,9 @@ class Meal(Base):
     """식단 기록 모델"""
 
     __tablename__ = "meals"
+    __table_args__ = (
+        Index("ix_meals_user_id_meal_date", "user_id", "meal_date"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
@@ -17,7 +20,9 @@ class Meal(Base):
     meal_date = Column(DateTime, nullable=False, default=datetime.utcnow)
 
     # 이미지 정보
-    image_url = Column(String)  # 식단 사진 URL
+    image_url = Column(String)  # 식단 사진 URL (/api/meals/images/<해시> 또는 외부 URL)
+    image_hash = Column(String(64), index=True)  # 파일 저장소 키 (SHA-256)
+    thumbnail_url = Column(String)  # 목록용 썸네일 URL
 
     # AI 분석 결과
     ai_analysis = Column(Text)  # AI 이미지 분석 결과
@@ -38,3 +43,18 @@ class Meal(Base):
 
     # Relationships
     user = relationship("User", back_populates="meals")
+
+
+class MealImageAnalysis(Base):
+    """식단 사진 AI 분석 결과 (비슷한 사진 재분석 시 재사용)"""
+
+    __tablename__ = "meal_image_analyses"
+
+    id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(Integer, ForeignKey("users.id"))  # 분석 문구가 사용자별이므로 같은 사용자끼리만 재사용
+    perceptual_hash = Column(String(16), nullable=False)  # 64비트 dHash (16진수)
+    image_hash = Column(String(64))  # 원본 파일 저장소 키
+    meal_type = Column(String, nullable=False)
+    result = Column(JSON, nullable=False)  # NutritionAnalyzer.analyze_meal 결과
+
+    created_at = Column(DateTime, default=datetime.utcnow)
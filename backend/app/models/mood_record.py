@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text, Enum
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text, Enum, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 import enum
@@ -22,6 +22,9 @@ class MoodLevel(str, enum.Enum):
 class MoodRecord(Base):
     """감정 기록 모델"""
     __tablename__ = "mood_records"
+    __table_args__ = (
+        Index("ix_mood_records_user_id_recorded_at", "user_id", "recorded_at"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
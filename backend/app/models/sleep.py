@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, Float, ForeignKey, Text
+from sqlalchemy import Column, Integer, String, DateTime, Float, ForeignKey, Text, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from ..database import Base
@@ -7,6 +7,9 @@ from ..database import Base
 class SleepRecord(Base):
     """수면 기록"""
     __tablename__ = "sleep_records"
+    __table_args__ = (
+        Index("ix_sleep_records_user_id_sleep_start", "user_id", "sleep_start"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, Float, DateTime, ForeignKey, Boolean, JSON
+from sqlalchemy import Column, Integer, String, Text, Float, DateTime, ForeignKey, Boolean, JSON, Index, UniqueConstraint
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from ..database import Base
@@ -7,6 +7,9 @@ from ..database import Base
 class VoiceHealthAnalysis(Base):
     """음성 기반 건강 분석 모델"""
     __tablename__ = "voice_health_analyses"
+    __table_args__ = (
+        Index("ix_voice_health_analyses_user_id_recording_date", "user_id", "recording_date"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
@@ -21,6 +24,8 @@ class VoiceHealthAnalysis(Base):
     pitch_variance = Column(Float)  # 음높이 변동성
     speech_rate = Column(Float)  # 말하기 속도 (단어/분)
     volume_level = Column(Float)  # 음량 수준 (dB)
+    pause_frequency = Column(Integer)  # 0.25초 이상 휴지 수
+    acoustic_features = Column(JSON)  # 음향 특징 전체 (지터, 쉬머, 떨림 지수 등)
 
     # 감정 분석
     detected_emotion = Column(String(50))  # happy, sad, angry, anxious, neutral, stressed
@@ -51,6 +56,10 @@ class VoiceHealthAnalysis(Base):
     comparison_with_baseline = Column(JSON)  # 기준선과의 비교
     trend_analysis = Column(Text)  # 추세 분석
 
+    # 데이터 출처 (continuous: 상시 모니터링 샘플, 보존 기간 후 삭제됨)
+    source = Column(String(20), nullable=True)
+    monitoring_status = Column(String(20), nullable=True)  # 상시 모니터링 상태: normal, concern, warning
+
     # 타임스탬프
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
 
@@ -58,6 +67,35 @@ class VoiceHealthAnalysis(Base):
     user = relationship("User")
 
 
+class VoiceAnalysisBucket(Base):
+    """상시 모니터링 샘플의 시간 구간별 집계 (5분, 1시간)"""
+    __tablename__ = "voice_analysis_buckets"
+    __table_args__ = (
+        UniqueConstraint(
+            "user_id", "resolution", "bucket_start",
+            name="uq_voice_analysis_buckets_user_resolution_start",
+        ),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+
+    resolution = Column(Integer, nullable=False)  # 구간 길이 (초): 300, 3600
+    bucket_start = Column(DateTime, nullable=False)  # 구간 시작 시각 (UTC)
+
+    sample_count = Column(Integer, nullable=False, default=0)
+    stress_sum = Column(Float, nullable=False, default=0.0)
+    stress_max = Column(Float)
+    anxiety_sum = Column(Float, nullable=False, default=0.0)
+    anxiety_max = Column(Float)
+    depression_sum = Column(Float, nullable=False, default=0.0)
+    depression_max = Column(Float)
+    concern_count = Column(Integer, nullable=False, default=0)
+
+    # 관계
+    user = relationship("User")
+
+
 class VoiceBasedReminder(Base):
     """음성 기반 알림 모델"""
     __tablename__ = "voice_based_reminders"
@@ -150,6 +188,9 @@ class ConversationLog(Base):
 class VoiceCheckIn(Base):
     """일일 음성 체크인 모델"""
     __tablename__ = "voice_checkins"
+    __table_args__ = (
+        Index("ix_voice_checkins_user_id_checkin_date", "user_id", "checkin_date"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
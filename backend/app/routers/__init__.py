@@ -14,6 +14,7 @@ from .voice_health import router as voice_health_router
 from .health_schedule import router as health_schedule_router
 from .emotion import router as emotion_router
 from .speech import router as speech_router
+from .jobs import router as jobs_router
 
 __all__ = [
     "auth_router",
@@ -32,4 +33,5 @@ __all__ = [
     "health_schedule_router",
     "emotion_router",
     "speech_router",
+    "jobs_router",
 ]
@@ -33,7 +33,7 @@ async def register(user_data: UserCreate, db: AsyncSession = Depends(get_db)):
         )
 
     # 비밀번호 해시
-    hashed_password = AuthService.get_password_hash(user_data.password)
+    hashed_password = await AuthService.get_password_hash_async(user_data.password)
 
     # 사용자 생성 (빈 문자열을 None으로 변환)
     new_user = User(
@@ -65,15 +65,24 @@ async def login(user_data: UserLogin, db: AsyncSession = Depends(get_db)):
     )
     user = result.scalar_one_or_none()
 
-    if not user or not AuthService.verify_password(
-        user_data.password, user.hashed_password
-    ):
+    password_valid, new_hash = (
+        await AuthService.verify_password_async(user_data.password, user.hashed_password)
+        if user
+        else (False, None)
+    )
+
+    if not password_valid:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="이메일 또는 비밀번호가 올바르지 않습니다.",
             headers={"WWW-Authenticate": "Bearer"},
         )
 
+    # 비용 인자가 변경된 경우 새 해시로 교체
+    if new_hash:
+        user.hashed_password = new_hash
+        await db.commit()
+
     # JWT 토큰 생성 (email 사용)
     access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
     access_token = AuthService.create_access_token(
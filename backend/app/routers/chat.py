@@ -1,28 +1,146 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
-from ..database import get_db
+from sqlalchemy import select, func, case, or_, and_
+from ..database import get_db, get_read_db, AsyncSessionLocal
 from ..models.user import User
 from ..models.chat_history import ChatHistory
 from ..schemas.chat import ChatRequest, ChatResponse
+from ..schemas.job import JobResponse
 from ..services.ai_service import AIService
+from ..services.job_queue import get_job_queue
+from ..services.chat_context import ConversationContext, SUMMARY_JOB, load_context, update_summary
 from ..dependencies import get_current_user
+from .jobs import job_accepted
+from typing import Optional
+from datetime import datetime
 import uuid
+import json
 
 router = APIRouter(prefix="/api/chat", tags=["chat"])
 ai_service = AIService()
+job_queue = get_job_queue()
 
+# 세션 목록 미리보기 길이
+PREVIEW_LENGTH = 50
 
-@router.post("/symptom-check", response_model=ChatResponse)
+
+def save_exchange(
+    db: AsyncSession,
+    user_id: int,
+    chat_type: str,
+    session_id: str,
+    message: str,
+    ai_response: dict,
+    context: ConversationContext,
+):
+    """사용자 메시지와 AI 응답 저장 (커밋은 호출한 쪽에서)
+
+    최근 범위를 넘는 메시지가 생기면 같은 트랜잭션에 세션 요약 작업을 넣는다.
+    """
+    db.add(ChatHistory(
+        user_id=user_id,
+        chat_type=chat_type,
+        session_id=session_id,
+        role="user",
+        message=message,
+    ))
+    db.add(ChatHistory(
+        user_id=user_id,
+        chat_type=chat_type,
+        session_id=session_id,
+        role="assistant",
+        message=ai_response["response"],
+        urgency_level=ai_response["urgency_level"],
+        suggested_action=ai_response["suggested_action"],
+    ))
+    if context.needs_summary():
+        job_queue.enqueue(db, user_id, SUMMARY_JOB, {"user_id": user_id, "session_id": session_id})
+
+
+@job_queue.handler(SUMMARY_JOB, title="대화 요약", notify=False)
+async def summarize_chat_session(payload: dict) -> dict:
+    """최근 범위를 벗어난 메시지를 세션 누적 요약에 합침 (작업 큐에서 실행)"""
+    async with AsyncSessionLocal() as db:
+        summarized = await update_summary(
+            db, payload["user_id"], payload["session_id"], ai_service.summarize_conversation
+        )
+    return {"session_id": payload["session_id"], "summarized_messages": summarized}
+
+
+@job_queue.handler("symptom_check", title="증상 체크")
+async def symptom_check_job(payload: dict) -> dict:
+    """증상 체크 작업 (작업 큐에서 실행, 실패하면 재시도) - 대화 기록 저장 후 ChatResponse 형식으로 반환"""
+    async with AsyncSessionLocal() as db:
+        context = await load_context(db, payload["user_id"], payload["session_id"])
+        await db.commit()
+
+        ai_response = await ai_service.symptom_check(
+            payload["message"], payload["user_context"], context.render(), raise_errors=True
+        )
+        return await save_job_exchange(db, payload, ai_response, context)
+
+
+@job_queue.on_failure("symptom_check")
+async def symptom_check_fallback(payload: dict, error: str) -> dict:
+    """재시도까지 모두 실패하면 폴백 응답을 대화 기록에 남김"""
+    async with AsyncSessionLocal() as db:
+        context = await load_context(db, payload["user_id"], payload["session_id"])
+        ai_response = ai_service.symptom_fallback(payload["message"], error)
+        return await save_job_exchange(db, payload, ai_response, context)
+
+
+async def save_job_exchange(
+    db: AsyncSession, payload: dict, ai_response: dict, context: ConversationContext
+) -> dict:
+    save_exchange(
+        db, payload["user_id"], payload["chat_type"], payload["session_id"],
+        payload["message"], ai_response, context,
+    )
+    await db.commit()
+
+    return ChatResponse(
+        message=ai_response["response"],
+        urgency_level=ai_response["urgency_level"],
+        suggested_action=ai_response["suggested_action"],
+        session_id=payload["session_id"],
+    ).model_dump()
+
+
+@router.post("/symptom-check", response_model=ChatResponse, responses={202: {"model": JobResponse}})
 async def symptom_check(
     chat_request: ChatRequest,
+    background: bool = Query(False),
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    """증상 체크 챗봇"""
+    """증상 체크 챗봇
+
+    session_id가 이어지면 이전 대화(누적 요약 + 최근 메시지)를 함께 전달한다.
+    background=true면 응답 생성을 작업 큐에 넣고 202와 작업 정보를 바로 반환한다.
+    작업 결과(result)는 ChatResponse와 같은 형식이다.
+    """
 
     user = current_user
 
+    if background:
+        session_id = chat_request.session_id or str(uuid.uuid4())
+        job = job_queue.enqueue(db, user.id, "symptom_check", {
+            "user_id": user.id,
+            "chat_type": chat_request.chat_type,
+            "session_id": session_id,
+            "message": chat_request.message,
+            "user_context": {
+                "age": user.age,
+                "gender": user.gender.value if user.gender else None,
+                "chronic_conditions": user.chronic_conditions,
+                "allergies": user.allergies,
+            },
+        })
+        await db.commit()
+        await db.refresh(job)
+        return job_accepted(job)
+
     # 사용자 컨텍스트 준비
     user_context = {
         "age": user.age,
@@ -31,10 +149,15 @@ async def symptom_check(
         "allergies": user.allergies,
     }
 
+    # 이전 대화 문맥
+    context = await load_context(db, user.id, chat_request.session_id)
+    # LLM 호출 동안 트랜잭션(SQLite 쓰기 잠금, Postgres 연결 점유)을 잡고 있지 않도록 먼저 종료
+    await db.commit()
+
     # AI 응답 생성
     try:
         ai_response = await ai_service.symptom_check(
-            chat_request.message, user_context
+            chat_request.message, user_context, context.render()
         )
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"AI 서비스 오류: {str(e)}")
@@ -42,28 +165,11 @@ async def symptom_check(
     # 세션 ID 생성 또는 사용
     session_id = chat_request.session_id or str(uuid.uuid4())
 
-    # 사용자 메시지 저장
-    user_message = ChatHistory(
-        user_id=user.id,
-        chat_type=chat_request.chat_type,
-        session_id=session_id,
-        role="user",
-        message=chat_request.message,
-    )
-    db.add(user_message)
-
-    # AI 응답 저장
-    assistant_message = ChatHistory(
-        user_id=user.id,
-        chat_type=chat_request.chat_type,
-        session_id=session_id,
-        role="assistant",
-        message=ai_response["response"],
-        urgency_level=ai_response["urgency_level"],
-        suggested_action=ai_response["suggested_action"],
+    # 사용자 메시지와 AI 응답 저장
+    save_exchange(
+        db, user.id, chat_request.chat_type, session_id,
+        chat_request.message, ai_response, context,
     )
-    db.add(assistant_message)
-
     await db.commit()
 
     return ChatResponse(
@@ -74,72 +180,158 @@ async def symptom_check(
     )
 
 
+@router.post("/symptom-check/stream")
+async def symptom_check_stream(
+    chat_request: ChatRequest,
+    current_user: User = Depends(get_current_user),
+):
+    """
+    증상 체크 챗봇 (SSE 스트리밍)
+
+    이벤트 형식:
+        event: emergency - data: {"category", "guidance", "urgency_level", "suggested_action"}
+                         응급 키워드 감지 시 LLM 응답보다 먼저 전송
+        event: token  - data: {"text": "..."}  응답 조각
+        event: done   - data: {"urgency_level", "suggested_action", "session_id"}
+    대화 기록은 스트림이 끝난 뒤 저장됩니다.
+    """
+
+    user = current_user
+    user_context = {
+        "age": user.age,
+        "gender": user.gender,
+        "chronic_conditions": user.chronic_conditions,
+        "allergies": user.allergies,
+    }
+    session_id = chat_request.session_id or str(uuid.uuid4())
+
+    async def event_stream():
+        # 요청 스코프의 세션은 응답 전에 닫히므로 별도 세션 사용
+        async with AsyncSessionLocal() as db:
+            context = await load_context(db, user.id, chat_request.session_id)
+            await db.commit()
+
+        result = None
+        async for event in ai_service.symptom_check_stream(
+            chat_request.message, user_context, context.render()
+        ):
+            if event["type"] == "token":
+                yield _sse("token", {"text": event["text"]})
+            elif event["type"] == "emergency":
+                yield _sse("emergency", {
+                    "category": event["category"],
+                    "guidance": event["guidance"],
+                    "urgency_level": event["urgency_level"],
+                    "suggested_action": event["suggested_action"],
+                })
+            else:
+                result = event
+
+        async with AsyncSessionLocal() as db:
+            save_exchange(
+                db, user.id, chat_request.chat_type, session_id,
+                chat_request.message, result, context,
+            )
+            await db.commit()
+
+        yield _sse("done", {
+            "message": result["response"],
+            "urgency_level": result["urgency_level"],
+            "suggested_action": result["suggested_action"],
+            "session_id": session_id,
+        })
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+def _sse(event: str, data: dict) -> str:
+    """Server-Sent Events 메시지 포맷"""
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
 @router.get("/sessions")
 async def get_chat_sessions(
-    db: AsyncSession = Depends(get_db),
+    limit: int = Query(50, ge=1, le=200),
+    before: Optional[datetime] = Query(None, description="이전 페이지 마지막 항목의 last_message_at"),
+    before_session_id: Optional[str] = Query(None, description="이전 페이지 마지막 항목의 session_id"),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_user),
 ):
-    """사용자의 모든 채팅 세션 목록 조회"""
+    """
+    사용자의 채팅 세션 목록 조회 (최신순, 키셋 페이지네이션)
 
-    result = await db.execute(
+    세션별 마지막 메시지 시간과 첫 사용자 메시지를 한 번의 집계 쿼리로 가져옵니다.
+    다음 페이지는 마지막 항목의 last_message_at, session_id를 before, before_session_id로 함께 전달합니다.
+    """
+
+    # 마지막 메시지 시간이 같은 세션들을 session_id로 구분하므로 커서 두 값이 모두 있어야 함
+    if (before is None) != (before_session_id is None):
+        raise HTTPException(
+            status_code=422, detail="before와 before_session_id는 함께 전달해야 합니다."
+        )
+
+    # 세션별 집계: 마지막 메시지 시간, 첫 사용자 메시지 ID
+    stats = (
         select(
             ChatHistory.session_id,
-            ChatHistory.created_at.label("last_message_at")
+            func.max(ChatHistory.created_at).label("last_message_at"),
+            func.min(
+                case((ChatHistory.role == "user", ChatHistory.id))
+            ).label("first_user_message_id"),
         )
         .where(ChatHistory.user_id == current_user.id)
-        .distinct(ChatHistory.session_id)
-        .order_by(ChatHistory.session_id, ChatHistory.created_at.desc())
+        .group_by(ChatHistory.session_id)
+        .subquery()
     )
 
-    sessions_dict = {}
-    for row in result:
-        session_id = row.session_id
-        if session_id not in sessions_dict:
-            # 각 세션의 첫 번째 메시지 가져오기
-            first_msg_result = await db.execute(
-                select(ChatHistory)
-                .where(
-                    ChatHistory.user_id == current_user.id,
-                    ChatHistory.session_id == session_id,
-                    ChatHistory.role == "user"
-                )
-                .order_by(ChatHistory.created_at)
-                .limit(1)
-            )
-            first_msg = first_msg_result.scalar_one_or_none()
-
-            # 세션의 마지막 메시지 시간 가져오기
-            last_msg_result = await db.execute(
-                select(ChatHistory.created_at)
-                .where(
-                    ChatHistory.user_id == current_user.id,
-                    ChatHistory.session_id == session_id
-                )
-                .order_by(ChatHistory.created_at.desc())
-                .limit(1)
-            )
-            last_msg_time = last_msg_result.scalar_one()
-
-            sessions_dict[session_id] = {
-                "session_id": session_id,
-                "preview": first_msg.message[:50] + "..." if first_msg and len(first_msg.message) > 50 else (first_msg.message if first_msg else "대화 없음"),
-                "last_message_at": last_msg_time,
-            }
-
-    # 최신순 정렬
-    sessions = sorted(
-        sessions_dict.values(),
-        key=lambda x: x["last_message_at"],
-        reverse=True
+    query = (
+        select(
+            stats.c.session_id,
+            stats.c.last_message_at,
+            func.substr(ChatHistory.message, 1, PREVIEW_LENGTH + 1).label("preview"),
+        )
+        .outerjoin(ChatHistory, ChatHistory.id == stats.c.first_user_message_id)
     )
 
-    return sessions
+    if before is not None:
+        query = query.where(
+            or_(
+                stats.c.last_message_at < before,
+                and_(
+                    stats.c.last_message_at == before,
+                    stats.c.session_id < before_session_id,
+                ),
+            )
+        )
+
+    query = query.order_by(
+        stats.c.last_message_at.desc(), stats.c.session_id.desc()
+    ).limit(limit)
+
+    result = await db.execute(query)
+
+    return [
+        {
+            "session_id": row.session_id,
+            "preview": (
+                row.preview[:PREVIEW_LENGTH] + "..."
+                if row.preview and len(row.preview) > PREVIEW_LENGTH
+                else (row.preview or "대화 없음")
+            ),
+            "last_message_at": row.last_message_at,
+        }
+        for row in result
+    ]
 
 
 @router.get("/history/{session_id}")
 async def get_chat_history(
     session_id: str,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_user),
 ):
     """채팅 기록 조회"""
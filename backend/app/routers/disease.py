@@ -1,7 +1,7 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, and_
-from ..database import get_db
+from ..database import get_db, get_read_db
 from ..models.user import User
 from ..models.disease import (
     DiseaseRecord,
@@ -23,7 +23,8 @@ from ..schemas.disease import (
     DiseaseProgressLogResponse,
     GenerateTreatmentPlanRequest
 )
-from ..dependencies import get_current_user
+from ..dependencies import get_current_user, get_current_user_id
+from ..services.daily_rollup import window_totals, daily_series, average
 from typing import List, Optional
 from datetime import datetime, timedelta
 
@@ -518,29 +519,23 @@ async def get_progress_logs(
 async def get_progress_statistics(
     disease_record_id: int,
     days: int = 30,
-    db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_read_db),
+    user_id: int = Depends(get_current_user_id),
 ):
-    """진행 상황 통계 조회"""
+    """진행 상황 통계 조회
 
-    start_date = datetime.utcnow() - timedelta(days=days)
+    평균과 점수 이력은 일별 집계에서 읽으므로 기간 일수만큼의 행만 조회한다.
+    scores_history는 날짜별 평균 점수이다.
+    """
 
-    query = (
-        select(DiseaseProgressLog)
-        .where(
-            and_(
-                DiseaseProgressLog.disease_record_id == disease_record_id,
-                DiseaseProgressLog.user_id == current_user.id,
-                DiseaseProgressLog.log_date >= start_date
-            )
-        )
-        .order_by(DiseaseProgressLog.log_date.asc())
-    )
+    start_date = datetime.utcnow() - timedelta(days=days)
+    subject = str(disease_record_id)
 
-    result = await db.execute(query)
-    logs = result.scalars().all()
+    totals = (await window_totals(
+        db, "disease_progress", user_id, start_date, subject=subject
+    )).get("improvement_score")
 
-    if not logs:
+    if not totals:
         return {
             "count": 0,
             "average_improvement": 0,
@@ -548,11 +543,22 @@ async def get_progress_statistics(
             "latest_score": 0,
         }
 
-    scores = [log.improvement_score for log in logs]
-    avg_improvement = sum(scores) / len(scores)
+    avg_improvement = average(totals)
 
     # 추세 계산 (최근 점수 vs 평균 점수)
-    latest_score = scores[-1] if scores else 0
+    latest_result = await db.execute(
+        select(DiseaseProgressLog.improvement_score)
+        .where(
+            and_(
+                DiseaseProgressLog.disease_record_id == disease_record_id,
+                DiseaseProgressLog.user_id == user_id,
+                DiseaseProgressLog.log_date >= start_date
+            )
+        )
+        .order_by(DiseaseProgressLog.log_date.desc())
+        .limit(1)
+    )
+    latest_score = latest_result.scalar_one()
     if latest_score > avg_improvement + 10:
         trend = "상승"
     elif latest_score < avg_improvement - 10:
@@ -560,12 +566,19 @@ async def get_progress_statistics(
     else:
         trend = "안정"
 
+    series = await daily_series(
+        db, "disease_progress", user_id, "improvement_score", start_date, subject=subject
+    )
+
     return {
-        "count": len(logs),
+        "count": totals["count"],
         "average_improvement": round(avg_improvement, 2),
         "trend": trend,
         "latest_score": latest_score,
-        "scores_history": [{"date": log.log_date.isoformat(), "score": log.improvement_score} for log in logs]
+        "scores_history": [
+            {"date": day["day"].isoformat(), "score": round(average(day), 2), "count": day["count"]}
+            for day in series
+        ]
     }
 
 
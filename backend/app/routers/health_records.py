@@ -1,13 +1,13 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, desc
-from ..database import get_db
-from ..models.user import User
-from ..models.health_record import HealthRecord
+from ..database import get_db, get_read_db
+from ..models.health_record import HealthRecord, RecordType
 from ..schemas.health_record import HealthRecordCreate, HealthRecordResponse
-from ..dependencies import get_current_user
+from ..dependencies import get_current_user_id
+from ..services.daily_rollup import window_totals, daily_series, average
 from typing import List
-from datetime import datetime
+from datetime import datetime, timedelta
 
 router = APIRouter(prefix="/api/health-records", tags=["health-records"])
 
@@ -16,12 +16,12 @@ router = APIRouter(prefix="/api/health-records", tags=["health-records"])
 async def create_health_record(
     record_data: HealthRecordCreate,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    user_id: int = Depends(get_current_user_id),
 ):
     """건강 기록 생성"""
 
     new_record = HealthRecord(
-        user_id=current_user.id,
+        user_id=user_id,
         record_type=record_data.record_type,
         value=record_data.value,
         unit=record_data.unit,
@@ -43,11 +43,11 @@ async def get_health_records(
     record_type: str = None,
     limit: int = 50,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    user_id: int = Depends(get_current_user_id),
 ):
     """건강 기록 조회"""
 
-    query = select(HealthRecord).where(HealthRecord.user_id == current_user.id)
+    query = select(HealthRecord).where(HealthRecord.user_id == user_id)
 
     if record_type:
         query = query.where(HealthRecord.record_type == record_type)
@@ -60,17 +60,64 @@ async def get_health_records(
     return records
 
 
+@router.get("/statistics")
+async def get_health_record_statistics(
+    record_type: RecordType,
+    days: int = Query(30, ge=1, le=3650),
+    db: AsyncSession = Depends(get_read_db),
+    user_id: int = Depends(get_current_user_id),
+):
+    """건강 기록 종류별 통계 조회 (일별 집계 사용)"""
+
+    start_date = datetime.utcnow() - timedelta(days=days)
+    totals = (await window_totals(
+        db, "health", user_id, start_date, subject=record_type.value
+    )).get("value")
+
+    if not totals:
+        return {
+            "record_type": record_type.value,
+            "count": 0,
+            "average": 0,
+            "min": None,
+            "max": None,
+            "daily": [],
+        }
+
+    series = await daily_series(
+        db, "health", user_id, "value", start_date, subject=record_type.value
+    )
+
+    return {
+        "record_type": record_type.value,
+        "count": totals["count"],
+        "average": round(average(totals), 2),
+        "min": totals["min"],
+        "max": totals["max"],
+        "daily": [
+            {
+                "date": day["day"].isoformat(),
+                "count": day["count"],
+                "average": round(average(day), 2),
+                "min": day["min"],
+                "max": day["max"],
+            }
+            for day in series
+        ],
+    }
+
+
 @router.get("/{record_id}", response_model=HealthRecordResponse)
 async def get_health_record(
     record_id: int,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    user_id: int = Depends(get_current_user_id),
 ):
     """특정 건강 기록 조회"""
 
     result = await db.execute(
         select(HealthRecord).where(
-            HealthRecord.id == record_id, HealthRecord.user_id == current_user.id
+            HealthRecord.id == record_id, HealthRecord.user_id == user_id
         )
     )
     record = result.scalar_one_or_none()
@@ -88,13 +135,13 @@ async def get_health_record(
 async def delete_health_record(
     record_id: int,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    user_id: int = Depends(get_current_user_id),
 ):
     """건강 기록 삭제"""
 
     result = await db.execute(
         select(HealthRecord).where(
-            HealthRecord.id == record_id, HealthRecord.user_id == current_user.id
+            HealthRecord.id == record_id, HealthRecord.user_id == user_id
         )
     )
     record = result.scalar_one_or_none()
@@ -0,0 +1,48 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+from ..database import get_db
+from ..models.job import Job, JobStatus
+from ..schemas.job import JobResponse
+from ..dependencies import get_current_user_id
+from ..services.job_queue import get_job_queue
+
+router = APIRouter(prefix="/api/jobs", tags=["jobs"])
+
+FINISHED = (JobStatus.DONE.value, JobStatus.FAILED.value)
+
+
+def job_accepted(job: Job) -> JSONResponse:
+    """작업을 예약한 엔드포인트의 202 응답 (커밋 후 refresh된 Job)"""
+    return JSONResponse(
+        status_code=status.HTTP_202_ACCEPTED,
+        content=jsonable_encoder(JobResponse.model_validate(job)),
+        headers={"Location": f"/api/jobs/{job.id}"},
+    )
+
+
+@router.get("/{job_id}", response_model=JobResponse)
+async def get_job(
+    job_id: int,
+    wait: float = Query(0, ge=0, le=30),
+    db: AsyncSession = Depends(get_db),
+    user_id: int = Depends(get_current_user_id),
+):
+    """
+    백그라운드 작업 상태/결과 조회
+
+    wait(초)를 주면 작업이 끝날 때까지 최대 그 시간만큼 기다렸다가 응답한다 (long polling).
+    """
+    job = await db.get(Job, job_id)
+    if job is None or job.user_id != user_id:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="작업을 찾을 수 없습니다.",
+        )
+
+    if wait and job.status not in FINISHED:
+        await get_job_queue().wait(job_id, wait)
+        await db.refresh(job)
+
+    return job
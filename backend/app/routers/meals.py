@@ -1,19 +1,99 @@
-from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File
+from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File, Request, Query
+from fastapi.responses import Response, StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
-from ..database import get_db
+from ..database import get_db, AsyncSessionLocal
 from ..models.user import User
 from ..models.meal import Meal
-from ..schemas.meal import MealCreate, MealResponse
+from ..schemas.meal import MealCreate, MealTextCreate, MealResponse
+from ..schemas.job import JobResponse
 from ..dependencies import get_current_user
 from ..services.ai_nutrition_analyzer import get_nutrition_analyzer
-from typing import List
+from ..services.blob_store import (
+    get_blob_store,
+    sniff_image_type,
+    is_blob_key,
+    parse_range,
+    decode_data_url,
+)
+from ..services.image_pipeline import get_image_pipeline
+from ..services.food_index import get_food_index, parse_meal_text
+from ..services.job_queue import get_job_queue
+from .jobs import job_accepted
+from ..config import settings
+from typing import List, Optional, Tuple
 from datetime import datetime, timedelta
-import base64
-import os
-import json
+import binascii
 
 router = APIRouter(prefix="/api/meals", tags=["meals"])
+job_queue = get_job_queue()
+
+IMAGE_URL_PREFIX = "/api/meals/images/"
+
+
+def image_url_for(key: str) -> str:
+    return f"{IMAGE_URL_PREFIX}{key}"
+
+
+async def store_meal_image(data: bytes) -> Tuple[str, bool]:
+    """이미지 검증 후 파일 저장소에 저장 -> (해시 키, 새로 저장 여부)"""
+    if len(data) > settings.MEAL_IMAGE_MAX_BYTES:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"이미지 크기는 {settings.MEAL_IMAGE_MAX_BYTES // (1024 * 1024)}MB 이하만 가능합니다.",
+        )
+    if not sniff_image_type(data[:16]):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="지원하지 않는 파일 형식입니다. (jpg, jpeg, png, webp만 가능)",
+        )
+    return await get_blob_store().put(data)
+
+
+async def resolve_image(image_url: Optional[str]) -> Tuple[Optional[str], Optional[str]]:
+    """
+    요청의 image_url을 (image_url, image_hash)로 정리
+
+    - 업로드 API가 반환한 /api/meals/images/<해시> 주소는 해시만 추출
+    - 예전 클라이언트가 보내는 data: URL은 파일 저장소에 저장 후 주소로 교체
+    - 그 외 외부 URL은 그대로 유지
+    """
+    if not image_url:
+        return None, None
+
+    if image_url.startswith(IMAGE_URL_PREFIX):
+        key = image_url[len(IMAGE_URL_PREFIX):]
+        if is_blob_key(key) and await get_blob_store().size(key) is not None:
+            return image_url, key
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="업로드된 이미지를 찾을 수 없습니다.",
+        )
+
+    if image_url.startswith("data:"):
+        try:
+            data = decode_data_url(image_url)
+        except (binascii.Error, ValueError):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="이미지 데이터를 읽을 수 없습니다.",
+            )
+        key, _ = await store_meal_image(data)
+        return image_url_for(key), key
+
+    return image_url, None
+
+
+async def create_thumbnail(image_hash: str) -> Optional[str]:
+    """원본 사진으로 목록용 썸네일을 만들어 저장 -> 썸네일 주소 (실패 시 None)"""
+    try:
+        data = await get_blob_store().read(image_hash)
+        thumbnail, _ = await get_image_pipeline().thumbnail(data)
+        key, _ = await get_blob_store().put(thumbnail)
+    except Exception as e:
+        print(f"썸네일 생성 오류: {e}")
+        return None
+    return image_url_for(key)
 
 
 @router.post("/", response_model=MealResponse, status_code=status.HTTP_201_CREATED)
@@ -24,11 +104,16 @@ async def create_meal(
 ):
     """식단 기록 생성"""
 
+    image_url, image_hash = await resolve_image(meal_data.image_url)
+    thumbnail_url = await create_thumbnail(image_hash) if image_hash else None
+
     new_meal = Meal(
         user_id=current_user.id,
         meal_type=meal_data.meal_type,
         meal_date=meal_data.meal_date,
-        image_url=meal_data.image_url,
+        image_url=image_url,
+        image_hash=image_hash,
+        thumbnail_url=thumbnail_url,
         notes=meal_data.notes,
     )
 
@@ -44,7 +129,11 @@ async def upload_meal_image(
     file: UploadFile = File(...),
     current_user: User = Depends(get_current_user),
 ):
-    """식단 사진 업로드"""
+    """식단 사진 업로드
+
+    같은 내용의 사진은 사용자와 관계없이 한 번만 저장하지만, 다른 사용자가 이미 같은 사진을
+    올렸는지 알 수 없도록 응답은 새로 저장했을 때와 같다.
+    """
 
     # 파일 확장자 검증
     allowed_extensions = ["jpg", "jpeg", "png", "webp"]
@@ -56,14 +145,130 @@ async def upload_meal_image(
             detail="지원하지 않는 파일 형식입니다. (jpg, jpeg, png, webp만 가능)",
         )
 
-    # 파일 읽기
-    contents = await file.read()
+    # 파일 읽기 (최대 크기 + 1바이트까지만 읽어 초과 여부 판단)
+    contents = await file.read(settings.MEAL_IMAGE_MAX_BYTES + 1)
+    key, _ = await store_meal_image(contents)
+
+    return {
+        "image_url": image_url_for(key),
+        "image_hash": key,
+        "filename": file.filename,
+        "size": len(contents),
+    }
+
+
+@router.post("/text", status_code=status.HTTP_201_CREATED)
+async def create_meal_from_text(
+    meal_data: MealTextCreate,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    문장으로 식단 기록 (AI 호출 없이 음식 영양 DB로 계산)
+
+    DB에서 찾지 못한 음식은 unmatched로 돌려주며 합계에서 제외된다.
+    """
+
+    estimate = get_food_index().estimate(parse_meal_text(meal_data.description))
+    if not estimate["items"]:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="음식 정보를 찾을 수 없습니다. 사진으로 기록해주세요.",
+        )
+
+    totals = estimate["totals"]
+    new_meal = Meal(
+        user_id=current_user.id,
+        meal_type=meal_data.meal_type,
+        meal_date=meal_data.meal_date,
+        ai_analysis="음식 영양 DB 기준: " + ", ".join(
+            f"{item['food_name']} {item['grams']:g}g" for item in estimate["items"]
+        ),
+        calories=totals["calories"],
+        protein=totals["protein"],
+        carbs=totals["carbohydrates"],
+        fat=totals["fat"],
+        notes=meal_data.notes or meal_data.description,
+    )
+
+    db.add(new_meal)
+    await db.commit()
+    await db.refresh(new_meal)
+
+    return {
+        "meal": MealResponse.model_validate(new_meal),
+        "items": estimate["items"],
+        "unmatched": estimate["unmatched"],
+        "totals": totals,
+        "allergens": estimate["allergens"],
+    }
+
+
+@router.get("/foods/search")
+async def search_foods(
+    q: str = Query(..., min_length=1, max_length=100),
+    limit: int = Query(10, ge=1, le=50),
+    current_user: User = Depends(get_current_user),
+):
+    """음식 영양 DB 이름 검색 (오타/띄어쓰기 차이 허용)"""
+    return get_food_index().search(q, limit)
+
+
+@router.get("/images/{image_hash}")
+async def get_meal_image(image_hash: str, request: Request):
+    """
+    식단 사진 조회 (Range 요청 지원)
+
+    내용이 바뀌지 않아 브라우저/CDN에 영구 캐시된다.
+
+    접근 제어: <img> 태그에서 바로 쓸 수 있도록 인증 헤더를 요구하지 않고, 추측할 수 없는
+    주소(내용의 SHA-256 해시)를 아는 것을 열람 권한으로 본다 (capability URL).
+    업로드 직후 식단 기록을 만들기 전에도 미리보기가 되어야 하므로 식단 소유 여부는 확인하지 않는다.
+    따라서 같은 사진 파일을 이미 가진 사람은 해시를 계산해 조회할 수 있지만 얻는 것은 그 사진뿐이고,
+    주소가 다른 사용자에게 노출되지 않도록 응답은 private 캐시로만 둔다.
+    """
+    store = get_blob_store()
+    size = await store.size(image_hash) if is_blob_key(image_hash) else None
+    if size is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="이미지를 찾을 수 없습니다.",
+        )
+
+    etag = f'"{image_hash}"'
+    headers = {
+        "ETag": etag,
+        "Accept-Ranges": "bytes",
+        "Cache-Control": "private, max-age=31536000, immutable",
+    }
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
 
-    # Base64 인코딩
-    base64_image = base64.b64encode(contents).decode("utf-8")
-    image_data_url = f"data:image/{file_extension};base64,{base64_image}"
+    head = await store.read_range(image_hash, 0, 16)
+    media_type = sniff_image_type(head) or "application/octet-stream"
 
-    return {"image_url": image_data_url, "filename": file.filename}
+    try:
+        byte_range = parse_range(request.headers.get("range"), size)
+    except ValueError:
+        return Response(
+            status_code=status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE,
+            headers={**headers, "Content-Range": f"bytes */{size}"},
+        )
+
+    if byte_range is None:
+        start, end, status_code = 0, size - 1, status.HTTP_200_OK
+    else:
+        start, end = byte_range
+        status_code = status.HTTP_206_PARTIAL_CONTENT
+        headers["Content-Range"] = f"bytes {start}-{end}/{size}"
+    headers["Content-Length"] = str(end - start + 1)
+
+    return StreamingResponse(
+        store.iter_range(image_hash, start, end),
+        status_code=status_code,
+        media_type=media_type,
+        headers=headers,
+    )
 
 
 @router.get("/", response_model=List[MealResponse])
@@ -164,13 +369,67 @@ async def delete_meal(
     return None
 
 
-@router.post("/{meal_id}/analyze")
+async def run_meal_analysis(meal: Meal, raise_errors: bool = False) -> dict:
+    """식단 이미지 AI 분석 후 결과를 식단에 반영 (커밋은 호출한 쪽에서)
+
+    raise_errors=True면 분석 실패 시 식단을 건드리지 않고 예외를 던진다.
+    """
+    analysis_result = await get_nutrition_analyzer().analyze_meal(
+        image_url=meal.image_url,
+        image_hash=meal.image_hash,
+        meal_type=meal.meal_type,
+        user_health_goals=None,  # 추후 사용자 프로필에서 가져올 수 있음
+        raise_errors=raise_errors,
+        user_id=meal.user_id,
+    )
+
+    meal.ai_analysis = analysis_result["ai_analysis"]
+    meal.ai_recommendation = analysis_result["ai_recommendation"]
+    meal.match_percentage = analysis_result["match_percentage"]
+    meal.calories = analysis_result["calories"]
+    meal.protein = analysis_result["protein"]
+    meal.carbs = analysis_result["carbs"]
+    meal.fat = analysis_result["fat"]
+    return analysis_result
+
+
+@job_queue.handler("meal_analysis", title="식단 분석")
+async def analyze_meal_job(payload: dict) -> dict:
+    """식단 분석 작업 (작업 큐에서 실행)
+
+    실패하면 재시도하며, 끝내 실패해도 기존 영양 정보를 0으로 덮어쓰지 않도록 폴백을 저장하지 않는다
+    (실패 알림만 남음).
+    """
+    async with AsyncSessionLocal() as db:
+        meal = await db.get(Meal, payload["meal_id"])
+        # 분석 전에 삭제됐거나 이미지가 없어진 식단은 재시도해도 소용없으므로 결과로 남김
+        if meal is None or not meal.image_url:
+            return {"meal_id": payload["meal_id"], "analyzed": False}
+
+        analysis_result = await run_meal_analysis(meal, raise_errors=True)
+        await db.commit()
+
+    return {
+        "meal_id": payload["meal_id"],
+        "analyzed": True,
+        "detected_foods": analysis_result["detected_foods"],
+        "health_score": analysis_result["health_score"],
+        "cached": analysis_result.get("cached", False),
+    }
+
+
+@router.post("/{meal_id}/analyze", responses={202: {"model": JobResponse}})
 async def analyze_meal(
     meal_id: int,
+    background: bool = Query(False),
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    """식단 이미지 AI 분석"""
+    """식단 이미지 AI 분석
+
+    background=true면 분석을 작업 큐에 넣고 202와 작업 정보를 바로 반환한다.
+    결과는 GET /api/jobs/{id} 또는 식단 조회로 확인한다.
+    """
 
     # 식단 조회
     result = await db.execute(
@@ -190,24 +449,15 @@ async def analyze_meal(
             detail="식단 이미지가 없습니다.",
         )
 
-    try:
-        # AI 분석 수행
-        analyzer = get_nutrition_analyzer()
-        analysis_result = await analyzer.analyze_meal(
-            image_url=meal.image_url,
-            meal_type=meal.meal_type,
-            user_health_goals=None,  # 추후 사용자 프로필에서 가져올 수 있음
-        )
-
-        # 분석 결과를 DB에 저장
-        meal.ai_analysis = analysis_result["ai_analysis"]
-        meal.ai_recommendation = analysis_result["ai_recommendation"]
-        meal.match_percentage = analysis_result["match_percentage"]
-        meal.calories = analysis_result["calories"]
-        meal.protein = analysis_result["protein"]
-        meal.carbs = analysis_result["carbs"]
-        meal.fat = analysis_result["fat"]
+    if background:
+        job = job_queue.enqueue(db, current_user.id, "meal_analysis", {"meal_id": meal.id})
+        await db.commit()
+        await db.refresh(job)
+        return job_accepted(job)
 
+    try:
+        # AI 분석 수행 후 DB에 저장
+        analysis_result = await run_meal_analysis(meal)
         await db.commit()
         await db.refresh(meal)
 
@@ -216,6 +466,7 @@ async def analyze_meal(
             "meal": meal,
             "detected_foods": analysis_result["detected_foods"],
             "health_score": analysis_result["health_score"],
+            "cached": analysis_result.get("cached", False),
         }
 
     except Exception as e:
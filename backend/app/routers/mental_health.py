@@ -1,25 +1,104 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, desc
-from ..database import get_db
+from ..database import get_db, AsyncSessionLocal
 from ..models.user import User
 from ..models.mental_health import MentalHealthCheck
 from ..schemas.mental_health import MentalHealthCheckCreate, MentalHealthCheckResponse
+from ..schemas.job import JobResponse
 from ..services.ai_service import AIService
 from ..dependencies import get_current_user
+from ..services.job_queue import get_job_queue
+from .jobs import job_accepted
 from typing import List
 
 router = APIRouter(prefix="/api/mental-health", tags=["mental-health"])
 ai_service = AIService()
+job_queue = get_job_queue()
+
+
+@job_queue.handler("mental_health_assessment", title="정신 건강 평가")
+async def fill_mental_health_assessment(payload: dict) -> dict:
+    """저장된 정신 건강 체크에 AI 평가를 채워 넣음 (작업 큐에서 실행, 실패하면 재시도)"""
+    ai_result = await ai_service.mental_health_assessment(
+        stress_level=payload["stress_level"],
+        anxiety_level=payload["anxiety_level"],
+        mood_level=payload["mood_level"],
+        sleep_quality=payload["sleep_quality"],
+        notes=payload["notes"],
+        raise_errors=True,
+    )
+    return await save_assessment(payload["check_id"], ai_result)
 
 
-@router.post("/", response_model=MentalHealthCheckResponse, status_code=status.HTTP_201_CREATED)
+@job_queue.on_failure("mental_health_assessment")
+async def fill_fallback_assessment(payload: dict, error: str) -> dict:
+    """재시도까지 모두 실패하면 기본 평가와 권장사항을 채워 넣음"""
+    ai_result = ai_service.mental_health_fallback(
+        stress_level=payload["stress_level"],
+        anxiety_level=payload["anxiety_level"],
+        mood_level=payload["mood_level"],
+        sleep_quality=payload["sleep_quality"],
+    )
+    return await save_assessment(payload["check_id"], ai_result)
+
+
+async def save_assessment(check_id: int, ai_result: dict) -> dict:
+    async with AsyncSessionLocal() as db:
+        check = await db.get(MentalHealthCheck, check_id)
+        if check is not None:
+            check.ai_assessment = ai_result["assessment"]
+            check.recommendations = ai_result["recommendations"]
+            await db.commit()
+
+    return {
+        "check_id": check_id,
+        "ai_assessment": ai_result["assessment"],
+        "recommendations": ai_result["recommendations"],
+    }
+
+
+@router.post(
+    "/",
+    response_model=MentalHealthCheckResponse,
+    status_code=status.HTTP_201_CREATED,
+    responses={202: {"model": JobResponse}},
+)
 async def create_mental_health_check(
     check_data: MentalHealthCheckCreate,
+    background: bool = Query(False),
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    """정신 건강 체크 생성"""
+    """정신 건강 체크 생성
+
+    background=true면 체크를 먼저 저장하고 AI 평가는 작업 큐에서 채운다.
+    이때 202와 작업 정보를 반환하며, 결과는 GET /api/jobs/{id}로 조회한다.
+    """
+
+    if background:
+        new_check = MentalHealthCheck(
+            user_id=current_user.id,
+            stress_level=check_data.stress_level,
+            anxiety_level=check_data.anxiety_level,
+            mood_level=check_data.mood_level,
+            sleep_quality=check_data.sleep_quality,
+            symptoms=check_data.symptoms,
+            notes=check_data.notes,
+        )
+        db.add(new_check)
+        await db.flush()
+        job = job_queue.enqueue(db, current_user.id, "mental_health_assessment", {
+            "check_id": new_check.id,
+            "stress_level": check_data.stress_level,
+            "anxiety_level": check_data.anxiety_level,
+            "mood_level": check_data.mood_level,
+            "sleep_quality": check_data.sleep_quality,
+            "notes": check_data.notes,
+        })
+        await db.commit()
+        await db.refresh(job)
+        return job_accepted(job)
 
     # AI 평가 받기
     try:
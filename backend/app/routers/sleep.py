@@ -1,11 +1,12 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
-from ..database import get_db
+from ..database import get_db, get_read_db
 from ..models.user import User
 from ..models.sleep import SleepRecord
 from ..schemas.sleep import SleepRecordCreate, SleepRecordResponse
-from ..dependencies import get_current_user
+from ..dependencies import get_current_user, get_current_user_id
+from ..services.daily_rollup import window_totals, average
 from typing import List
 from datetime import datetime, timedelta
 
@@ -101,24 +102,16 @@ async def get_latest_sleep_record(
 @router.get("/statistics")
 async def get_sleep_statistics(
     days: int = 7,
-    db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_read_db),
+    user_id: int = Depends(get_current_user_id),
 ):
-    """수면 통계 조회"""
+    """수면 통계 조회 (일별 집계 사용)"""
 
     start_date = datetime.utcnow() - timedelta(days=days)
+    totals = await window_totals(db, "sleep", user_id, start_date)
 
-    query = (
-        select(SleepRecord)
-        .where(SleepRecord.user_id == current_user.id)
-        .where(SleepRecord.sleep_start >= start_date)
-        .order_by(SleepRecord.sleep_start.desc())
-    )
-
-    result = await db.execute(query)
-    records = result.scalars().all()
-
-    if not records:
+    duration = totals.get("duration_hours")
+    if not duration:
         return {
             "count": 0,
             "average_duration": 0,
@@ -127,15 +120,13 @@ async def get_sleep_statistics(
             "total_rem_sleep": 0,
         }
 
-    avg_duration = sum(r.duration_hours for r in records) / len(records)
-    avg_quality = sum(r.sleep_quality for r in records) / len(records)
-    total_deep = sum(r.deep_sleep_hours or 0 for r in records)
-    total_rem = sum(r.rem_sleep_hours or 0 for r in records)
+    total_deep = totals.get("deep_sleep_hours", {}).get("total", 0)
+    total_rem = totals.get("rem_sleep_hours", {}).get("total", 0)
 
     return {
-        "count": len(records),
-        "average_duration": round(avg_duration, 2),
-        "average_quality": round(avg_quality, 1),
+        "count": duration["count"],
+        "average_duration": round(average(duration), 2),
+        "average_quality": round(average(totals.get("sleep_quality")), 1),
         "total_deep_sleep": round(total_deep, 2),
         "total_rem_sleep": round(total_rem, 2),
     }
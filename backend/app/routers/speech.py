@@ -1,9 +1,15 @@
 """음성 인식 API 라우터"""
-from fastapi import APIRouter, Depends, HTTPException, UploadFile, File
+import asyncio
+import json
+from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, WebSocket, WebSocketDisconnect, Query, status
 from pydantic import BaseModel
 from typing import Optional
-from ..services.speech_service import get_speech_service
-from ..dependencies import get_current_user
+from ..config import settings
+from ..services.auth_service import AuthService
+from ..services.audio_upload import AudioUpload
+from ..services.speech_service import audio_encoding, get_speech_service
+from ..services.streaming_speech import get_streaming_speech_service
+from ..dependencies import get_audio_upload, get_current_user
 
 
 router = APIRouter(prefix="/api/speech", tags=["speech"])
@@ -87,22 +93,10 @@ async def transcribe_speech_file(
             elif file.filename.endswith(".wav"):
                 encoding = "LINEAR16"
 
-        from google.cloud import speech
-        encoding_map = {
-            "LINEAR16": speech.RecognitionConfig.AudioEncoding.LINEAR16,
-            "WEBM_OPUS": speech.RecognitionConfig.AudioEncoding.WEBM_OPUS,
-            "OGG_OPUS": speech.RecognitionConfig.AudioEncoding.OGG_OPUS,
-            "MP3": speech.RecognitionConfig.AudioEncoding.MP3,
-        }
-        audio_encoding = encoding_map.get(
-            encoding,
-            speech.RecognitionConfig.AudioEncoding.WEBM_OPUS
-        )
-
         result = await speech_service.transcribe_audio(
             audio_content=audio_content,
             language_code=language_code,
-            encoding=audio_encoding,
+            encoding=audio_encoding(encoding),
             sample_rate_hertz=sample_rate_hertz,
         )
 
@@ -113,3 +107,135 @@ async def transcribe_speech_file(
             status_code=500,
             detail=f"음성 파일 처리 실패: {str(e)}"
         )
+
+
+@router.post("/transcribe-audio", response_model=SpeechToTextResponse)
+async def transcribe_speech_audio(
+    language_code: str = "ko-KR",
+    encoding: Optional[str] = None,
+    sample_rate_hertz: int = 48000,
+    current_user = Depends(get_current_user),
+    audio: AudioUpload = Depends(get_audio_upload),
+):
+    """
+    음성을 텍스트로 변환 (원본 바이트 또는 multipart)
+
+    - 바디에 녹음 파일을 그대로 전송 (Content-Type: audio/webm 등) - Base64 대비 전송량 약 25% 감소
+    - 또는 multipart/form-data의 file 필드로 전송
+    - 최대 AUDIO_UPLOAD_MAX_BYTES (초과 시 413)
+    - encoding을 생략하면 Content-Type/파일 확장자로 판단
+    """
+    speech_service = get_speech_service()
+
+    try:
+        with audio.view() as audio_content:
+            result = await speech_service.transcribe_audio(
+                audio_content=audio_content,
+                language_code=language_code,
+                encoding=audio_encoding(encoding or audio.encoding or "WEBM_OPUS"),
+                sample_rate_hertz=sample_rate_hertz,
+            )
+
+        return result
+
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"음성 파일 처리 실패: {str(e)}"
+        )
+
+
+def _is_end_message(text: str) -> bool:
+    """텍스트 프레임 중 입력 종료 신호 ("end" 또는 {"event": "end"})"""
+    if text.strip() == "end":
+        return True
+    try:
+        return json.loads(text).get("event") == "end"
+    except (ValueError, AttributeError):
+        return False
+
+
+@router.websocket("/stream")
+async def stream_speech(
+    websocket: WebSocket,
+    token: str = Query(...),
+    language_code: str = "ko-KR",
+    encoding: str = "WEBM_OPUS",
+    sample_rate_hertz: int = 48000,
+):
+    """
+    실시간 음성 인식 (WebSocket)
+
+    - 연결: /api/speech/stream?token=<JWT>&encoding=WEBM_OPUS&sample_rate_hertz=48000
+      (브라우저 WebSocket은 헤더를 설정할 수 없어 토큰을 쿼리로 받음)
+    - 클라이언트 → 서버: 오디오 청크(바이너리 프레임), 말하기가 끝나면 텍스트 프레임 "end"
+    - 서버 → 클라이언트 (JSON):
+        {"type": "interim", "transcript": "...", "stability": 0.8}
+        {"type": "final", "transcript": "...", "confidence": 0.93}
+        {"type": "error", "message": "..."}
+        {"type": "end", "transcript": "최종 결과 전체"}  # 마지막 메시지
+    """
+    payload = AuthService.verify_token(token)
+    if not payload or not payload.get("user_id"):
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
+        return
+
+    try:
+        session = get_streaming_speech_service().open_session(
+            language_code, encoding, sample_rate_hertz
+        )
+    except ValueError as e:
+        await websocket.accept()
+        await websocket.send_json({"type": "error", "message": str(e)})
+        await websocket.close(code=status.WS_1011_INTERNAL_ERROR)
+        return
+
+    if session is None:
+        await websocket.close(code=status.WS_1013_TRY_AGAIN_LATER)
+        return
+
+    await websocket.accept()
+    connected = True
+
+    async def forward_events():
+        nonlocal connected
+        async for event in session.events():
+            if connected:
+                try:
+                    await websocket.send_json(event)
+                except (WebSocketDisconnect, RuntimeError):
+                    connected = False
+
+    forwarder = asyncio.create_task(forward_events())
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + settings.STT_STREAM_MAX_SECONDS
+
+    try:
+        while True:
+            try:
+                message = await asyncio.wait_for(websocket.receive(), deadline - loop.time())
+            except asyncio.TimeoutError:
+                break
+
+            if message["type"] == "websocket.disconnect":
+                connected = False
+                break
+
+            chunk = message.get("bytes")
+            if chunk:
+                if len(chunk) > settings.STT_STREAM_MAX_CHUNK_BYTES or not session.send(chunk):
+                    await websocket.send_json({
+                        "type": "error",
+                        "message": "오디오 청크가 너무 크거나 너무 빠르게 전송되었습니다.",
+                    })
+                    break
+            elif message.get("text") and _is_end_message(message["text"]):
+                break
+    finally:
+        # 입력을 닫으면 인식기가 남은 최종 결과를 보내고 끝남
+        session.end()
+        await forwarder
+
+    if connected:
+        await websocket.send_json({"type": "end", "transcript": session.transcript})
+        await websocket.close()
@@ -1,12 +1,12 @@
-from fastapi import APIRouter, Depends, HTTPException, UploadFile, File
+from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Query
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
-from typing import List
+from sqlalchemy import select, or_
+from typing import List, Union
 from datetime import datetime
 import base64
 
-from app.database import get_db
-from app.dependencies import get_current_user
+from app.database import get_db, get_read_db
+from app.dependencies import get_audio_upload, get_current_user, get_current_user_id
 from app.models.user import User
 from app.models.voice_health import (
     VoiceHealthAnalysis,
@@ -33,14 +33,55 @@ from app.schemas.voice_health import (
     HealthNotificationUpdate,
     HealthNotificationResponse,
     VoiceAnalysisRequest,
-    VoiceNarrationRequest
+    VoiceNarrationRequest,
+    ContinuousAnalysisData,
+    ContinuousAnalysisBatch
 )
+from app.services.audio_upload import AudioUpload
+from app.services.blob_store import get_blob_store
+from app.services.checkin_stats import get_checkin_stats_cache
+from app.services.voice_features import get_voice_feature_extractor
+from app.services.continuous_ingest import CONTINUOUS_SOURCE, get_continuous_buffer, query_history
 
 router = APIRouter(prefix="/voice", tags=["voice_health"])
 
 
 # ==================== Voice Health Analysis ====================
 
+async def _create_voice_analysis(
+    db: AsyncSession, user_id: int, audio: Union[bytes, memoryview]
+) -> VoiceHealthAnalysis:
+    """녹음 파일의 음향 특징을 계산하고 파일 저장소에 보관한 뒤 분석 기록 생성"""
+    try:
+        # 프로세스 풀로 넘기려면 직렬화가 필요하므로 여기서 한 번 bytes로 복사
+        features = await get_voice_feature_extractor().extract(bytes(audio))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    audio_key, _ = await get_blob_store().put(audio)
+
+    # TODO: 감정/정신 건강 지표 AI 모델 연동 (현재는 음향 특징만 저장)
+    analysis = VoiceHealthAnalysis(
+        user_id=user_id,
+        audio_file_url=audio_key,  # 파일 저장소 키
+        recording_duration=features["duration"],
+        average_pitch=features["average_pitch"],
+        pitch_variance=features["pitch_variance"],
+        speech_rate=features["speech_rate"],
+        volume_level=features["volume_level"],
+        pause_frequency=features["pause_count"],
+        voice_tremor=features["voice_tremor"],
+        acoustic_features=features,
+        recording_date=datetime.utcnow(),
+    )
+
+    db.add(analysis)
+    await db.commit()
+    await db.refresh(analysis)
+
+    return analysis
+
+
 @router.post("/analyze", response_model=VoiceHealthAnalysisResponse)
 async def analyze_voice(
     request: VoiceAnalysisRequest,
@@ -50,39 +91,30 @@ async def analyze_voice(
     """
     음성 분석 API
     - 마이크 녹음 데이터를 받아 정신/육체 건강 상태 분석
-    - 감정, 스트레스, 우울/불안 지표 분석
+    - 음높이, 음량, 휴지, 말 속도, 지터/쉬머, 떨림 지표 계산
+    - WAV는 바로 분석, WebM/Ogg/MP3는 서버에 ffmpeg가 있어야 분석 가능
     """
-    # TODO: 실제 음성 분석 AI 모델 연동
-    # 현재는 시뮬레이션 데이터 반환
+    try:
+        audio_bytes = base64.b64decode(request.audio_data, validate=True)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="오디오 데이터가 올바른 Base64 형식이 아닙니다.")
 
-    # Base64 audio data를 디코딩하여 파일로 저장하는 로직 추가 필요
-    # audio_bytes = base64.b64decode(request.audio_data)
-    # 파일 저장 및 경로 생성
+    return await _create_voice_analysis(db, current_user.id, audio_bytes)
 
-    analysis = VoiceHealthAnalysis(
-        user_id=current_user.id,
-        audio_file_path="/uploads/voice/sample.webm",
-        average_pitch=180.5,
-        speech_rate=120.0,
-        pause_frequency=5,
-        voice_energy=0.75,
-        detected_emotion="happy",
-        emotion_confidence=0.85,
-        depression_indicator=0.15,
-        anxiety_indicator=0.20,
-        stress_level=3.5,
-        voice_tremor=False,
-        breathing_pattern="normal",
-        transcribed_text="오늘 기분이 좋습니다. 잘 잤어요.",
-        ai_health_suggestion="전반적으로 좋은 상태입니다. 수분 섭취를 잊지 마세요.",
-        analysis_timestamp=datetime.now()
-    )
-
-    db.add(analysis)
-    await db.commit()
-    await db.refresh(analysis)
 
-    return analysis
+@router.post("/analyze/upload", response_model=VoiceHealthAnalysisResponse)
+async def analyze_voice_upload(
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+    audio: AudioUpload = Depends(get_audio_upload),
+):
+    """
+    음성 분석 API (원본 바이트 또는 multipart)
+    - 바디에 녹음 파일을 그대로 전송하거나 multipart/form-data의 file 필드로 전송
+    - 최대 AUDIO_UPLOAD_MAX_BYTES (초과 시 413)
+    """
+    with audio.view() as audio_content:
+        return await _create_voice_analysis(db, current_user.id, audio_content)
 
 
 @router.get("/analyses", response_model=List[VoiceHealthAnalysisResponse])
@@ -92,11 +124,14 @@ async def get_voice_analyses(
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
-    """사용자의 음성 분석 기록 조회"""
+    """사용자의 음성 분석 기록 조회 (상시 모니터링 샘플은 /continuous-analysis/history로 조회)"""
     result = await db.execute(
         select(VoiceHealthAnalysis)
-        .where(VoiceHealthAnalysis.user_id == current_user.id)
-        .order_by(VoiceHealthAnalysis.analysis_timestamp.desc())
+        .where(
+            VoiceHealthAnalysis.user_id == current_user.id,
+            or_(VoiceHealthAnalysis.source.is_(None), VoiceHealthAnalysis.source != CONTINUOUS_SOURCE),
+        )
+        .order_by(VoiceHealthAnalysis.recording_date.desc())
         .offset(skip)
         .limit(limit)
     )
@@ -205,20 +240,23 @@ async def delete_voice_reminder(
 @router.post("/checkin", response_model=VoiceCheckInResponse)
 async def create_voice_checkin(
     checkin: VoiceCheckInCreate,
-    current_user: User = Depends(get_current_user),
+    user_id: int = Depends(get_current_user_id),
     db: AsyncSession = Depends(get_db)
 ):
     """일일 음성 체크인 생성"""
     db_checkin = VoiceCheckIn(
         **checkin.dict(),
-        user_id=current_user.id,
-        checkin_timestamp=datetime.now()
+        user_id=user_id,
+        checkin_date=datetime.utcnow()
     )
 
     db.add(db_checkin)
     await db.commit()
     await db.refresh(db_checkin)
 
+    # 캐시된 통계 요약은 다음 조회 때 다시 집계
+    get_checkin_stats_cache().invalidate(user_id)
+
     return db_checkin
 
 
@@ -233,7 +271,7 @@ async def get_voice_checkins(
     result = await db.execute(
         select(VoiceCheckIn)
         .where(VoiceCheckIn.user_id == current_user.id)
-        .order_by(VoiceCheckIn.checkin_timestamp.desc())
+        .order_by(VoiceCheckIn.checkin_date.desc())
         .offset(skip)
         .limit(limit)
     )
@@ -242,18 +280,14 @@ async def get_voice_checkins(
 
 @router.get("/checkins/stats")
 async def get_checkin_statistics(
-    current_user: User = Depends(get_current_user),
+    user_id: int = Depends(get_current_user_id),
     db: AsyncSession = Depends(get_db)
 ):
-    """체크인 통계 (평균 기분, 에너지, 스트레스 등)"""
-    # TODO: 통계 계산 로직 구현
-    return {
-        "average_mood": 7.5,
-        "average_energy": 6.8,
-        "average_stress": 4.2,
-        "total_checkins": 45,
-        "checkins_this_week": 6
-    }
+    """체크인 통계 (평균 기분, 에너지, 주별 체크인 수)
+
+    사용자별 요약을 캐시하므로 대시보드 폴링 시 DB를 조회하지 않는다.
+    """
+    return await get_checkin_stats_cache().get(db, user_id)
 
 
 # ==================== Conversation Logs ====================
@@ -382,8 +416,17 @@ async def create_health_notification(
 ):
     """건강 알림 생성 (터치 시 TTS 안내)"""
     db_notification = HealthNotification(
-        **notification.dict(),
-        user_id=current_user.id
+        user_id=current_user.id,
+        notification_type=notification.notification_type,
+        title=notification.title,
+        body=notification.message,
+        has_voice_narration=bool(notification.tts_narration or notification.narration_audio_path),
+        voice_narration_text=notification.tts_narration,
+        voice_narration_url=notification.narration_audio_path,
+        priority=notification.priority or "normal",
+        category=notification.category,
+        action_url=notification.action_url,
+        action_type=notification.action_type,
     )
 
     db.add(db_notification)
@@ -436,12 +479,15 @@ async def update_health_notification(
     if not db_notification:
         raise HTTPException(status_code=404, detail="Notification not found")
 
-    for field, value in notification_update.dict(exclude_unset=True).items():
-        setattr(db_notification, field, value)
+    # 읽음 처리 시 타임스탬프 기록
+    if notification_update.is_read is not None:
+        if notification_update.is_read and not db_notification.is_read:
+            db_notification.read_at = datetime.utcnow()
+        db_notification.is_read = notification_update.is_read
 
-    # 음성 안내 완료 시 타임스탬프 기록
-    if notification_update.is_narrated and notification_update.is_narrated != db_notification.is_narrated:
-        db_notification.narrated_at = datetime.now()
+    # 음성 안내 완료 여부
+    if notification_update.is_narrated is not None:
+        db_notification.voice_was_played = notification_update.is_narrated
 
     await db.commit()
     await db.refresh(db_notification)
@@ -500,119 +546,56 @@ async def narrate_health_summary(
 
 # ==================== Continuous Voice Monitoring ====================
 
-from pydantic import BaseModel
-
-class ContinuousAnalysisData(BaseModel):
-    """상시 모니터링 분석 데이터"""
-    stress_level: float
-    anxiety_indicator: float
-    depression_indicator: float
-    energy_level: float
-    overall_status: str
-    timestamp: str
-
-
 @router.post("/continuous-analysis")
 async def save_continuous_analysis(
     data: ContinuousAnalysisData,
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    user_id: int = Depends(get_current_user_id)
 ):
     """
     상시 음성 모니터링 분석 결과 저장
     - 30초마다 자동으로 분석된 정신 상태 데이터 저장
     - 이상 징후 감지 시 알림 생성
+    - 쓰기 버퍼에 모았다가 다른 요청의 샘플과 함께 저장
     """
-    # VoiceHealthAnalysis 테이블에 저장
-    analysis = VoiceHealthAnalysis(
-        user_id=current_user.id,
-        stress_level=data.stress_level,
-        detected_emotion=data.overall_status,
-        depression_indicator=data.depression_indicator,
-        anxiety_indicator=data.anxiety_indicator,
-        ai_health_suggestion=f"상시 모니터링 - {data.overall_status}",
-        analysis_timestamp=datetime.fromisoformat(data.timestamp.replace('Z', '+00:00'))
-    )
+    alerts = await get_continuous_buffer().add(user_id, [data])
 
-    db.add(analysis)
+    return {
+        "success": True,
+        "accepted": 1,
+        "alerts_created": alerts,
+        "message": "분석 결과가 저장되었습니다."
+    }
 
-    # 우려 상태인 경우 알림 생성
-    if data.overall_status == 'concern':
-        notification = HealthNotification(
-            user_id=current_user.id,
-            notification_type="alert",
-            title="정신 건강 주의",
-            message=f"상시 모니터링 결과 주의가 필요한 정신 상태가 감지되었습니다. 스트레스: {data.stress_level}/10, 불안: {int(data.anxiety_indicator * 100)}%, 우울: {int(data.depression_indicator * 100)}%",
-            tts_narration="주의가 필요한 정신 상태가 감지되었습니다. 잠시 휴식을 취하시거나 전문가와 상담하시기 바랍니다.",
-            priority="high"
-        )
-        db.add(notification)
 
-    await db.commit()
-    await db.refresh(analysis)
+@router.post("/continuous-analysis/batch")
+async def save_continuous_analysis_batch(
+    batch: ContinuousAnalysisBatch,
+    user_id: int = Depends(get_current_user_id)
+):
+    """
+    상시 음성 모니터링 분석 결과 묶음 저장
+    - 클라이언트에서 모은 샘플을 한 번에 전송
+    - 샘플마다 우려 상태이면 알림 생성
+    """
+    alerts = await get_continuous_buffer().add(user_id, batch.samples)
 
     return {
         "success": True,
-        "analysis_id": analysis.id,
+        "accepted": len(batch.samples),
+        "alerts_created": alerts,
         "message": "분석 결과가 저장되었습니다."
     }
 
 
 @router.get("/continuous-analysis/history")
 async def get_continuous_analysis_history(
-    hours: int = 24,
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    hours: int = Query(24, ge=1, le=2160),
+    user_id: int = Depends(get_current_user_id),
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     상시 모니터링 기록 조회
     - 지정된 시간 동안의 정신 상태 변화 추이
+    - 6시간 이하: 원본 샘플, 48시간 이하: 5분 구간, 그 이상: 1시간 구간 (resolution 필드)
     """
-    from datetime import timedelta
-
-    cutoff_time = datetime.now() - timedelta(hours=hours)
-
-    result = await db.execute(
-        select(VoiceHealthAnalysis)
-        .where(
-            VoiceHealthAnalysis.user_id == current_user.id,
-            VoiceHealthAnalysis.analysis_timestamp >= cutoff_time
-        )
-        .order_by(VoiceHealthAnalysis.analysis_timestamp.desc())
-    )
-
-    analyses = result.scalars().all()
-
-    # 통계 계산
-    if analyses:
-        avg_stress = sum(a.stress_level or 0 for a in analyses) / len(analyses)
-        avg_anxiety = sum(a.anxiety_indicator or 0 for a in analyses) / len(analyses)
-        avg_depression = sum(a.depression_indicator or 0 for a in analyses) / len(analyses)
-
-        concern_count = sum(1 for a in analyses if a.detected_emotion == 'concern')
-    else:
-        avg_stress = 0
-        avg_anxiety = 0
-        avg_depression = 0
-        concern_count = 0
-
-    return {
-        "analyses": [
-            {
-                "timestamp": a.analysis_timestamp.isoformat(),
-                "stress_level": a.stress_level,
-                "anxiety_indicator": a.anxiety_indicator,
-                "depression_indicator": a.depression_indicator,
-                "overall_status": a.detected_emotion,
-            }
-            for a in analyses
-        ],
-        "statistics": {
-            "total_analyses": len(analyses),
-            "average_stress": round(avg_stress, 2),
-            "average_anxiety": round(avg_anxiety, 2),
-            "average_depression": round(avg_depression, 2),
-            "concern_events": concern_count,
-            "monitoring_hours": hours
-        }
-    }
+    return await query_history(db, user_id, hours)
@@ -0,0 +1,20 @@
+from pydantic import BaseModel
+from datetime import datetime
+from typing import Optional, Any
+
+
+class JobResponse(BaseModel):
+    """작업 상태 응답 스키마"""
+
+    id: int
+    job_type: str
+    status: str  # queued, running, done, failed
+    result: Optional[Any] = None
+    error: Optional[str] = None
+    attempts: int
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from typing import Optional
 from datetime import datetime
 
@@ -12,6 +12,15 @@ class MealCreate(BaseModel):
     notes: Optional[str] = None
 
 
+class MealTextCreate(BaseModel):
+    """문장으로 식단 기록 (예: "김치찌개 1인분, 공기밥 210g")"""
+
+    meal_type: str  # breakfast, lunch, dinner, snack
+    meal_date: datetime
+    description: str = Field(..., min_length=1, max_length=1000)
+    notes: Optional[str] = None
+
+
 class MealResponse(BaseModel):
     """식단 응답 스키마"""
 
@@ -20,6 +29,8 @@ class MealResponse(BaseModel):
     meal_type: str
     meal_date: datetime
     image_url: Optional[str]
+    image_hash: Optional[str] = None
+    thumbnail_url: Optional[str] = None
     ai_analysis: Optional[str]
     ai_recommendation: Optional[str]
     match_percentage: Optional[float]
@@ -1,6 +1,6 @@
-from pydantic import BaseModel, Field
+from pydantic import AliasChoices, BaseModel, Field
 from datetime import datetime
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 from enum import Enum
 
 
@@ -38,11 +38,17 @@ class EmergencyType(str, Enum):
 # Voice Health Analysis Schemas
 class VoiceHealthAnalysisBase(BaseModel):
     """음성 건강 분석 기본 스키마"""
-    audio_file_path: Optional[str] = None
+    audio_file_path: Optional[str] = Field(
+        None, validation_alias=AliasChoices("audio_file_path", "audio_file_url")
+    )
     average_pitch: Optional[float] = Field(None, description="평균 음높이 (Hz)")
     speech_rate: Optional[float] = Field(None, description="말하기 속도 (단어/분)")
     pause_frequency: Optional[int] = Field(None, description="휴지 빈도")
-    voice_energy: Optional[float] = Field(None, description="음성 에너지")
+    voice_energy: Optional[float] = Field(
+        None,
+        description="음성 에너지 (발화 구간 평균 음량, dBFS)",
+        validation_alias=AliasChoices("voice_energy", "volume_level"),
+    )
     detected_emotion: Optional[EmotionType] = None
     emotion_confidence: Optional[float] = Field(None, ge=0, le=1)
     depression_indicator: Optional[float] = Field(None, ge=0, le=1)
@@ -51,7 +57,9 @@ class VoiceHealthAnalysisBase(BaseModel):
     voice_tremor: Optional[bool] = None
     breathing_pattern: Optional[str] = None
     transcribed_text: Optional[str] = None
-    ai_health_suggestion: Optional[str] = None
+    ai_health_suggestion: Optional[str] = Field(
+        None, validation_alias=AliasChoices("ai_health_suggestion", "ai_analysis")
+    )
 
 
 class VoiceHealthAnalysisCreate(VoiceHealthAnalysisBase):
@@ -63,7 +71,14 @@ class VoiceHealthAnalysisResponse(VoiceHealthAnalysisBase):
     """음성 건강 분석 응답"""
     id: int
     user_id: int
-    analysis_timestamp: datetime
+    analysis_timestamp: datetime = Field(
+        validation_alias=AliasChoices("analysis_timestamp", "recording_date")
+    )
+    recording_duration: Optional[float] = Field(None, description="녹음 길이 (초)")
+    pitch_variance: Optional[float] = Field(None, description="음높이 표준편차 (Hz)")
+    acoustic_features: Optional[Dict[str, Any]] = Field(
+        None, description="음향 특징 (지터, 쉬머, 떨림 지수, 음절 속도 등)"
+    )
     created_at: datetime
 
     class Config:
@@ -146,17 +161,19 @@ class ConversationLogResponse(ConversationLogBase):
 class VoiceCheckInBase(BaseModel):
     """음성 체크인 기본 스키마"""
     checkin_type: str = Field(..., description="morning, afternoon, evening, night")
-    audio_file_path: Optional[str] = None
-    mood_rating: Optional[int] = Field(None, ge=1, le=10)
+    question_asked: Optional[str] = None
+    voice_response_url: Optional[str] = None
+    text_response: Optional[str] = None
+    emotion_detected: Optional[str] = None
+    mood_score: Optional[int] = Field(None, ge=1, le=10)
     energy_level: Optional[int] = Field(None, ge=1, le=10)
-    detected_emotion: Optional[EmotionType] = None
+    pain_reported: bool = False
+    pain_location: Optional[str] = None
     pain_level: Optional[int] = Field(None, ge=0, le=10)
-    sleep_quality: Optional[int] = Field(None, ge=1, le=10)
-    stress_level: Optional[int] = Field(None, ge=1, le=10)
-    transcribed_response: Optional[str] = None
-    ai_analysis: Optional[str] = None
-    health_concern_detected: bool = False
-    concern_details: Optional[str] = None
+    symptoms_reported: Optional[List[str]] = None
+    health_concern_level: Optional[str] = Field(None, description="low, medium, high")
+    ai_suggestion: Optional[str] = None
+    follow_up_needed: bool = False
 
 
 class VoiceCheckInCreate(VoiceCheckInBase):
@@ -168,7 +185,7 @@ class VoiceCheckInResponse(VoiceCheckInBase):
     """음성 체크인 응답"""
     id: int
     user_id: int
-    checkin_timestamp: datetime
+    checkin_date: datetime
     created_at: datetime
 
     class Config:
@@ -216,12 +233,19 @@ class HealthNotificationBase(BaseModel):
     """건강 알림 기본 스키마"""
     notification_type: str = Field(..., description="reminder, alert, info, etc.")
     title: str = Field(..., min_length=1, max_length=200)
-    message: str
-    tts_narration: Optional[str] = Field(None, description="터치 시 읽을 TTS 텍스트")
-    narration_audio_path: Optional[str] = None
-    priority: str = Field(default="normal", description="low, normal, high, urgent")
-    is_read: bool = False
-    is_narrated: bool = False
+    message: str = Field(..., validation_alias=AliasChoices("message", "body"))
+    tts_narration: Optional[str] = Field(
+        None,
+        description="터치 시 읽을 TTS 텍스트",
+        validation_alias=AliasChoices("tts_narration", "voice_narration_text"),
+    )
+    narration_audio_path: Optional[str] = Field(
+        None, validation_alias=AliasChoices("narration_audio_path", "voice_narration_url")
+    )
+    priority: Optional[str] = Field(default="normal", description="low, normal, high, urgent")
+    category: Optional[str] = None
+    action_url: Optional[str] = None
+    action_type: Optional[str] = None
 
 
 class HealthNotificationCreate(HealthNotificationBase):
@@ -236,10 +260,14 @@ class HealthNotificationUpdate(BaseModel):
 
 
 class HealthNotificationResponse(HealthNotificationBase):
-    """건강 알림 응답"""
+    """건강 알림 응답 (HealthNotification 모델: message <- body, is_narrated <- voice_was_played)"""
     id: int
     user_id: int
-    narrated_at: Optional[datetime] = None
+    is_read: Optional[bool] = False
+    read_at: Optional[datetime] = None
+    is_narrated: Optional[bool] = Field(
+        False, validation_alias=AliasChoices("is_narrated", "voice_was_played")
+    )
     created_at: datetime
 
     class Config:
@@ -259,3 +287,19 @@ class VoiceNarrationRequest(BaseModel):
     text: str = Field(..., min_length=1, description="안내할 텍스트")
     voice_speed: float = Field(default=1.0, ge=0.5, le=2.0)
     voice_pitch: float = Field(default=1.0, ge=0.5, le=2.0)
+
+
+# Continuous Monitoring Schemas
+class ContinuousAnalysisData(BaseModel):
+    """상시 모니터링 분석 데이터 (NaN/inf는 저장·집계 전에 거부)"""
+    stress_level: float = Field(..., ge=0, le=10, allow_inf_nan=False)
+    anxiety_indicator: float = Field(..., ge=0, le=1, allow_inf_nan=False)
+    depression_indicator: float = Field(..., ge=0, le=1, allow_inf_nan=False)
+    energy_level: float = Field(..., ge=0, le=10, allow_inf_nan=False)  # 클라이언트 기준 0-10
+    overall_status: str = Field(..., max_length=20)  # normal, attention, concern
+    timestamp: str
+
+
+class ContinuousAnalysisBatch(BaseModel):
+    """상시 모니터링 분석 데이터 묶음 (클라이언트에서 모아서 전송)"""
+    samples: List[ContinuousAnalysisData] = Field(..., min_length=1, max_length=500)
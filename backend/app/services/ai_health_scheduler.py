@@ -4,6 +4,7 @@ from typing import List, Dict
 from datetime import datetime, timedelta
 import os
 import json
+from .llm_gateway import get_llm_gateway
 
 
 class HealthScheduler:
@@ -53,12 +54,25 @@ class HealthScheduler:
         """
 
         try:
-            # 사용자 정보 요약
-            user_summary = self._create_user_summary(user_data)
-            history_summary = self._create_history_summary(health_history)
+            return await self.request_schedule(user_data, health_history, days_ahead)
+        except Exception as e:
+            print(f"AI 스케줄 생성 오류: {str(e)}")
+            # 오류 발생 시 기본 스케줄 반환
+            return self.generate_default_schedule(days_ahead)
+
+    async def request_schedule(
+        self,
+        user_data: Dict,
+        health_history: List[Dict],
+        days_ahead: int = 7,
+    ) -> List[Dict]:
+        """Gemini로 스케줄 생성 (실패 시 예외 발생 - 호출 측에서 재시도 여부 결정)"""
+        # 사용자 정보 요약
+        user_summary = self._create_user_summary(user_data)
+        history_summary = self._create_history_summary(health_history)
 
-            # AI 프롬프트 생성
-            prompt = f"""
+        # AI 프롬프트 생성
+        prompt = f"""
 당신은 전문 건강 관리 AI입니다. 사용자의 건강 데이터를 분석하여 앞으로 {days_ahead}일간의 맞춤형 건강 관리 스케줄을 생성해주세요.
 
 ## 사용자 정보
@@ -97,31 +111,28 @@ type은 다음 중 하나: meal, exercise, medication, meditation, sleep, checku
 오늘 날짜: {datetime.now().strftime('%Y-%m-%d')}
 """
 
-            # Gemini API 호출
-            response = self.model.generate_content(prompt)
-            response_text = response.text.strip()
+        # Gemini API 호출
+        response = await get_llm_gateway().generate(self.model, prompt)
+        response_text = response.text.strip()
 
-            # JSON 파싱
-            import re
+        # JSON 파싱
+        import re
 
-            # JSON 부분만 추출
-            json_match = re.search(r"```json\s*(.*?)\s*```", response_text, re.DOTALL)
+        # JSON 부분만 추출
+        json_match = re.search(r"```json\s*(.*?)\s*```", response_text, re.DOTALL)
+        if json_match:
+            response_text = json_match.group(1)
+        else:
+            # 배열로 시작하는 부분 찾기
+            json_match = re.search(r"\[.*\]", response_text, re.DOTALL)
             if json_match:
-                response_text = json_match.group(1)
-            else:
-                # 배열로 시작하는 부분 찾기
-                json_match = re.search(r"\[.*\]", response_text, re.DOTALL)
-                if json_match:
-                    response_text = json_match.group(0)
+                response_text = json_match.group(0)
 
-            schedule = json.loads(response_text)
+        schedule = json.loads(response_text)
+        if not isinstance(schedule, list):
+            raise ValueError("스케줄 응답이 배열 형식이 아닙니다.")
 
-            return schedule
-
-        except Exception as e:
-            print(f"AI 스케줄 생성 오류: {str(e)}")
-            # 오류 발생 시 기본 스케줄 반환
-            return self._generate_default_schedule(days_ahead)
+        return schedule
 
     def _create_user_summary(self, user_data: Dict) -> str:
         """사용자 정보를 텍스트로 요약"""
@@ -152,7 +163,7 @@ type은 다음 중 하나: meal, exercise, medication, meditation, sleep, checku
 
         return "\n".join(summary)
 
-    def _generate_default_schedule(self, days_ahead: int) -> List[Dict]:
+    def generate_default_schedule(self, days_ahead: int) -> List[Dict]:
         """기본 스케줄 생성 (AI 실패 시 폴백)"""
         schedule = []
         base_date = datetime.now()
@@ -0,0 +1,112 @@
+"""AI 감정 기록 분석 서비스 - 감정 기록에 대한 분석과 조언 생성"""
+import google.generativeai as genai
+from typing import Dict, Tuple
+from ..config import settings
+from .llm_gateway import get_llm_gateway
+
+
+class MoodAnalyzer:
+    """감정 기록을 분석하여 공감적인 분석과 조언을 제공"""
+
+    # 감정 데이터를 한글로 매핑
+    MOOD_KOREAN = {
+        "very_happy": "매우 행복함",
+        "happy": "행복함",
+        "neutral": "보통",
+        "sad": "슬픔",
+        "very_sad": "매우 슬픔",
+        "angry": "화남",
+        "anxious": "불안함",
+        "stressed": "스트레스",
+        "tired": "피곤함",
+        "excited": "신남",
+    }
+
+    def __init__(self):
+        genai.configure(api_key=settings.GEMINI_API_KEY)
+        # 모델은 한 번만 생성하여 재사용
+        self.model = genai.GenerativeModel("gemini-1.5-pro")
+
+    async def analyze(self, mood_data: Dict, raise_errors: bool = False) -> Tuple[str, str]:
+        """
+        감정 기록 분석
+
+        Args:
+            mood_data: mood_level, mood_intensity, note, activities, triggers
+            raise_errors: True면 Gemini 호출 실패 시 기본 메시지 대신 예외를 던짐 (작업 큐 재시도용)
+
+        Returns:
+            (감정 분석, 조언)
+        """
+        mood_text = self.MOOD_KOREAN.get(
+            mood_data.get("mood_level", ""), mood_data.get("mood_level", "")
+        )
+        intensity = mood_data.get("mood_intensity", 5)
+        note = mood_data.get("note", "")
+        activities = mood_data.get("activities", [])
+        triggers = mood_data.get("triggers", [])
+
+        prompt = f"""
+당신은 공감력 높은 정신건강 전문가입니다. 사용자의 감정 기록을 분석하고 따뜻한 조언을 제공해주세요.
+
+**감정 기록:**
+- 감정 상태: {mood_text}
+- 감정 강도: {intensity}/10
+- 메모: {note if note else "없음"}
+- 활동: {", ".join(activities) if activities else "없음"}
+- 감정 유발 요인: {", ".join(triggers) if triggers else "없음"}
+
+다음 두 가지를 제공해주세요:
+
+1. **감정 분석** (2-3문장): 현재 감정 상태에 대한 전문적이지만 따뜻한 분석
+2. **조언** (3-4문장): 구체적이고 실천 가능한 조언
+
+응답 형식:
+[분석]
+분석 내용...
+
+[조언]
+조언 내용...
+"""
+
+        try:
+            response = await get_llm_gateway().generate(self.model, prompt)
+            full_response = response.text
+
+            # 응답 파싱
+            if "[분석]" in full_response and "[조언]" in full_response:
+                parts = full_response.split("[조언]")
+                analysis = parts[0].replace("[분석]", "").strip()
+                advice = parts[1].strip()
+            else:
+                # 파싱 실패 시 전체를 조언으로
+                analysis = f"{mood_text} 상태를 기록해주셨군요. 감정 강도는 {intensity}/10입니다."
+                advice = full_response.strip()
+
+            return analysis, advice
+
+        except Exception as e:
+            if raise_errors:
+                raise
+            print(f"AI analysis error: {e}")
+            return self.fallback(mood_data)
+
+    def fallback(self, mood_data: Dict) -> Tuple[str, str]:
+        """AI 분석을 할 수 없을 때의 기본 메시지 (감정 분석, 조언)"""
+        mood_text = self.MOOD_KOREAN.get(mood_data.get("mood_level", ""), "보통")
+        return (
+            f"현재 {mood_text} 상태를 경험하고 계시는군요. 감정을 기록해주셔서 감사합니다.",
+            "규칙적인 감정 기록은 자신을 더 잘 이해하는 데 도움이 됩니다. 계속해서 기록해주세요."
+        )
+
+
+# 싱글톤 인스턴스
+_mood_analyzer = None
+
+
+def get_mood_analyzer() -> MoodAnalyzer:
+    """MoodAnalyzer 싱글톤 인스턴스 반환"""
+    global _mood_analyzer
+    if _mood_analyzer is None:
+        _mood_analyzer = MoodAnalyzer()
+    return _mood_analyzer
@@ -2,9 +2,11 @@
 import google.generativeai as genai
 from typing import Dict, Optional
 import os
-import base64
-from io import BytesIO
-from PIL import Image
+from .llm_gateway import get_llm_gateway
+from .blob_store import get_blob_store, decode_data_url
+from .image_pipeline import get_image_pipeline
+from .meal_image_index import get_meal_analysis_index
+from .food_index import get_food_index
 
 
 class NutritionAnalyzer:
@@ -20,20 +22,55 @@ class NutritionAnalyzer:
         # Gemini Pro - 더 정확한 영양 분석
         self.model = genai.GenerativeModel("gemini-1.5-pro")
 
-    def _decode_base64_image(self, base64_str: str) -> Image.Image:
-        """Base64 문자열을 PIL Image로 변환"""
-        # data:image/jpeg;base64, 부분 제거
-        if "base64," in base64_str:
-            base64_str = base64_str.split("base64,")[1]
+    async def _load_image(self, image_url: str, image_hash: Optional[str]) -> bytes:
+        """원본 이미지 바이트 (파일 저장소 또는 예전 Base64 data URL)"""
+        if image_hash:
+            return await get_blob_store().read(image_hash)
+        return decode_data_url(image_url)
 
-        image_data = base64.b64decode(base64_str)
-        return Image.open(BytesIO(image_data))
+    async def _prepare_image(self, data: bytes) -> Dict:
+        """
+        Gemini 전송용 이미지
+
+        프로세스 풀에서 축소/재인코딩하여 SDK가 PIL 이미지를 다시 인코딩하지 않도록 바이트 그대로 전달한다.
+        """
+        image_data, mime_type = await get_image_pipeline().prepare_for_vision(data)
+        return {"mime_type": mime_type, "data": image_data}
+
+    def _ground_nutrition(self, analyzed_data: Dict, portions: Dict):
+        """
+        감지된 음식이 모두 음식 영양 DB에 있으면 Gemini 추정치 대신 DB 기준 값 사용
+
+        섭취량은 Gemini가 추정한 g을 쓰고, 없으면 DB의 1인분 기준 제공량으로 계산한다.
+        """
+        detected_foods = analyzed_data["detected_foods"]
+        if not detected_foods:
+            return
+
+        estimate = get_food_index().estimate([
+            (name, portions.get(name) if isinstance(portions.get(name), (int, float)) else None, 1.0)
+            for name in detected_foods
+        ])
+        if estimate["unmatched"]:
+            return
+
+        totals = estimate["totals"]
+        analyzed_data.update({
+            "calories": totals["calories"],
+            "protein": totals["protein"],
+            "carbs": totals["carbohydrates"],
+            "fat": totals["fat"],
+            "nutrition_source": "food_db",
+        })
 
     async def analyze_meal(
         self,
         image_url: str,
         meal_type: str,
         user_health_goals: Optional[str] = None,
+        image_hash: Optional[str] = None,
+        raise_errors: bool = False,
+        user_id: Optional[int] = None,
     ) -> Dict:
         """
         식단 이미지를 분석하여 영양 정보와 AI 추천사항을 반환
@@ -42,6 +79,9 @@ class NutritionAnalyzer:
             image_url: Base64 인코딩된 이미지 URL 또는 경로
             meal_type: 식사 종류 (breakfast, lunch, dinner, snack)
             user_health_goals: 사용자의 건강 목표 (선택사항)
+            image_hash: 파일 저장소에 저장된 이미지 키 (있으면 image_url 대신 사용)
+            raise_errors: True면 실패 시 0으로 채운 기본값 대신 예외를 던짐 (작업 큐 재시도용)
+            user_id: 식단 주인 (같은 사용자의 비슷한 사진 분석만 재사용, 없으면 재사용/저장 안 함)
 
         Returns:
             {
@@ -54,12 +94,23 @@ class NutritionAnalyzer:
                 'fat': 15.2,
                 'detected_foods': ['현미밥', '닭가슴살', '샐러드'],
                 'health_score': 8.5,  # 10점 만점
+                'nutrition_source': 'food_db',  # 영양 수치 출처 (food_db: 음식 영양 DB, ai: Gemini 추정)
+                'cached': False,  # 같은 사용자가 올린 비슷한 사진의 이전 분석 결과를 재사용했는지 여부
             }
         """
 
         try:
             # 이미지 로드
-            image = self._decode_base64_image(image_url)
+            data = await self._load_image(image_url, image_hash)
+
+            # 같은 사용자가 거의 같은 사진을 이미 분석했으면 결과 재사용
+            index = get_meal_analysis_index()
+            perceptual_hash = await get_image_pipeline().perceptual_hash(data)
+            cached = await index.lookup(perceptual_hash, meal_type, user_id)
+            if cached is not None:
+                return dict(cached, cached=True)
+
+            image = await self._prepare_image(data)
 
             # 한국어로 상세한 프롬프트 작성
             meal_type_kr = {
@@ -83,6 +134,7 @@ class NutritionAnalyzer:
 7. analysis: 이 식사에 대한 상세 분석 (3-4문장, 영양학적 관점)
 8. recommendation: 더 건강한 식사를 위한 구체적인 추천사항 (3-4문장)
 9. match_percentage: 이상적인 {meal_type_kr} 식사와의 일치도 (0-100, 숫자)
+10. portions: 감지된 음식별 추정 섭취량 (g, 숫자)
 
 {f"사용자의 건강 목표: {user_health_goals}" if user_health_goals else ""}
 
@@ -96,12 +148,13 @@ class NutritionAnalyzer:
   "health_score": 7.5,
   "analysis": "분석 내용...",
   "recommendation": "추천사항...",
-  "match_percentage": 75
+  "match_percentage": 75,
+  "portions": {{"음식1": 210, "음식2": 150}}
 }}
 """
 
             # Gemini Vision API 호출
-            response = self.model.generate_content([prompt, image])
+            response = await get_llm_gateway().generate(self.model, [prompt, image])
 
             # JSON 파싱
             import json
@@ -134,11 +187,16 @@ class NutritionAnalyzer:
                 "fat": float(result.get("fat", 0)),
                 "detected_foods": result.get("detected_foods", []),
                 "health_score": float(result.get("health_score", 5.0)),
+                "nutrition_source": "ai",
             }
+            self._ground_nutrition(analyzed_data, result.get("portions") or {})
 
-            return analyzed_data
+            await index.record(perceptual_hash, meal_type, user_id, image_hash, analyzed_data)
+            return dict(analyzed_data, cached=False)
 
         except Exception as e:
+            if raise_errors:
+                raise
             print(f"AI 분석 오류: {str(e)}")
             # 오류 발생 시 기본값 반환
             return {
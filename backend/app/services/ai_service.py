@@ -1,8 +1,72 @@
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, AsyncIterator, Tuple, Union
+from contextlib import aclosing
 import os
 import google.generativeai as genai
 from google.generativeai.types import HarmCategory, HarmBlockThreshold
 from ..config import settings
+from .llm_gateway import get_llm_gateway
+from .response_cache import get_response_cache
+from .emergency_detector import get_emergency_detector
+
+# 응답 마지막에 붙는 응급도 태그: [URGENCY: emergency/high/medium/low]
+URGENCY_TAG = "[URGENCY:"
+
+# 응급도별 권장 조치
+SUGGESTED_ACTIONS = {
+    "emergency": "⚠️ 즉시 119에 연락하거나 가까운 응급실로 가세요.",
+    "high": "가능한 빨리 병원을 방문하시거나 전문의 상담을 받으세요.",
+    "medium": "증상이 지속되거나 악화되면 병원을 방문하세요.",
+    "low": "경과를 지켜보시고 증상이 지속되면 병원을 방문하세요.",
+}
+
+
+class UrgencyStreamFilter:
+    """
+    스트리밍 응답에서 응급도 태그를 걸러내는 필터
+
+    태그가 청크 경계에 걸쳐 나뉘어 도착해도 사용자에게 노출되지 않도록,
+    태그의 앞부분일 수 있는 꼬리 문자열은 다음 청크가 올 때까지 보류한다.
+    전체 응답은 full_text에 누적되어 스트림 종료 후 응급도 파싱에 사용된다.
+    """
+
+    def __init__(self):
+        self._chunks: List[str] = []
+        self._pending = ""
+        self._tag_found = False
+
+    @property
+    def full_text(self) -> str:
+        return "".join(self._chunks)
+
+    def feed(self, text: str) -> str:
+        """새 청크를 받아 지금 내보내도 안전한 텍스트를 반환"""
+        self._chunks.append(text)
+        if self._tag_found:
+            return ""
+
+        buffer = self._pending + text
+        tag_index = buffer.find(URGENCY_TAG)
+        if tag_index != -1:
+            self._tag_found = True
+            self._pending = ""
+            return buffer[:tag_index]
+
+        # 태그의 접두사로 끝나면 그 부분만 보류
+        keep = 0
+        for size in range(min(len(URGENCY_TAG) - 1, len(buffer)), 0, -1):
+            if URGENCY_TAG.startswith(buffer[-size:]):
+                keep = size
+                break
+
+        self._pending = buffer[len(buffer) - keep:]
+        return buffer[:len(buffer) - keep]
+
+    def flush(self) -> str:
+        """스트림 종료 시 보류 중이던 텍스트 반환"""
+        if self._tag_found:
+            return ""
+        pending, self._pending = self._pending, ""
+        return pending
 
 
 class AIService:
@@ -76,9 +140,131 @@ class AIService:
 항상 한국어로 응답하고, 존댓말을 사용하세요."""
 
     async def symptom_check(
-        self, message: str, user_context: Optional[Dict] = None
+        self,
+        message: str,
+        user_context: Optional[Dict] = None,
+        conversation: str = "",
+        raise_errors: bool = False,
     ) -> Dict[str, str]:
-        """증상 체크 및 분석 (Gemini API 사용)"""
+        """증상 체크 및 분석 (Gemini API 사용)
+
+        conversation은 chat_context가 만든 이전 대화 문맥이며, 있으면 응답이 대화마다
+        달라지므로 캐시를 사용하지 않는다.
+        raise_errors=True면 API 실패 시 폴백 대신 예외를 던진다 (작업 큐 재시도용).
+        단, 응급 키워드가 감지된 경우에는 응급 안내가 늦어지지 않도록 바로 폴백을 반환한다.
+        """
+
+        # 로컬 응급 키워드 감지 - 감지되면 캐시를 거치지 않고 응급도를 고정
+        emergency = get_emergency_detector().detect(message)
+
+        cache = get_response_cache()
+        cache_key = self._symptom_cache_key(message, user_context)
+        use_cache = not emergency and not conversation
+        if use_cache:
+            cached = await cache.get(cache_key)
+            if cached:
+                return cached
+
+        prompt = self._build_symptom_prompt(message, user_context, conversation)
+
+        try:
+            # Gemini API 호출
+            response = await get_llm_gateway().generate(self.model, prompt)
+
+            # 응답 텍스트 추출 및 응급도 파싱
+            result = self._parse_symptom_response(response.text)
+
+        except Exception as e:
+            if raise_errors and not emergency:
+                raise
+            # API 호출 실패 시 폴백 응답
+            result = self._symptom_fallback(e)
+            return self._escalate(result, emergency) if emergency else result
+
+        if emergency:
+            return self._escalate(result, emergency)
+
+        if use_cache:
+            await cache.set(cache_key, result, urgency_level=result["urgency_level"])
+        return result
+
+    async def symptom_check_stream(
+        self,
+        message: str,
+        user_context: Optional[Dict] = None,
+        conversation: str = "",
+    ) -> AsyncIterator[Dict[str, str]]:
+        """
+        증상 체크 스트리밍 버전
+
+        Yields:
+            {'type': 'emergency', 'category': ..., 'guidance': ..., ...}  # 응급 키워드 감지 시 가장 먼저
+            {'type': 'token', 'text': '...'}  # 생성되는 대로 전달되는 응답 조각
+            {'type': 'done', 'response': ..., 'urgency_level': ..., 'suggested_action': ...}
+        """
+
+        # 응급 키워드는 LLM 응답을 기다리지 않고 즉시 안내
+        emergency = get_emergency_detector().detect(message)
+        if emergency:
+            yield {
+                "type": "emergency",
+                **emergency,
+                "suggested_action": SUGGESTED_ACTIONS["emergency"],
+            }
+
+        cache = get_response_cache()
+        cache_key = self._symptom_cache_key(message, user_context)
+        use_cache = not emergency and not conversation
+        cached = await cache.get(cache_key) if use_cache else None
+        if cached:
+            yield {"type": "token", "text": cached["response"]}
+            yield {"type": "done", **cached}
+            return
+
+        prompt = self._build_symptom_prompt(message, user_context, conversation)
+        urgency_filter = UrgencyStreamFilter()
+
+        try:
+            # 클라이언트가 끊어 이 제너레이터가 닫히면 게이트웨이 스트림도 바로 닫아 슬롯을 반환
+            async with aclosing(get_llm_gateway().stream(self.model, prompt)) as chunks:
+                async for chunk in chunks:
+                    text = urgency_filter.feed(chunk.text)
+                    if text:
+                        yield {"type": "token", "text": text}
+
+            tail = urgency_filter.flush()
+            if tail:
+                yield {"type": "token", "text": tail}
+
+            result = self._parse_symptom_response(urgency_filter.full_text)
+            if use_cache:
+                await cache.set(cache_key, result, urgency_level=result["urgency_level"])
+
+        except Exception as e:
+            result = self._symptom_fallback(e)
+            # 이미 일부 전송된 경우에도 폴백 전문을 별도 토큰으로 전달
+            yield {"type": "token", "text": result["response"]}
+
+        if emergency:
+            result = self._escalate(result, emergency)
+
+        yield {"type": "done", **result}
+
+    def _symptom_cache_key(
+        self, message: str, user_context: Optional[Dict] = None
+    ) -> str:
+        """증상 체크 캐시 키 (정규화된 증상 + 사용자 정보 구간)"""
+        cache = get_response_cache()
+        return cache.make_key(
+            "symptom_check",
+            cache.normalize(message),
+            cache.context_bucket(user_context),
+        )
+
+    def _build_symptom_prompt(
+        self, message: str, user_context: Optional[Dict] = None, conversation: str = ""
+    ) -> str:
+        """증상 체크 프롬프트 구성"""
 
         # 사용자 컨텍스트 정보 추가
         context_info = ""
@@ -91,11 +277,15 @@ class AIService:
             if user_context.get("medical_history"):
                 context_info += f"- 병력: {user_context['medical_history']}\n"
 
+        # 같은 세션의 이전 대화 (후속 질문이면 앞선 내용을 이어서 답변)
+        if conversation:
+            conversation = f"\n{conversation}\n\n위 대화에 이어지는 질문입니다. 앞서 나온 증상과 안내를 고려해 답변하세요.\n"
+
         # 프롬프트 구성 (system instruction 포함)
-        prompt = f"""{self.system_instruction}
+        return f"""{self.system_instruction}
 
 사용자의 증상에 대해 상담해주세요.
-
+{conversation}
 **사용자 증상:**
 {message}
 {context_info}
@@ -115,42 +305,44 @@ class AIService:
 - low: 경과 관찰
 
 응답의 마지막에 반드시 다음 형식으로 응급도를 명시하세요:
-[URGENCY: emergency/high/medium/low]"""
-
-        try:
-            # Gemini API 호출
-            response = self.model.generate_content(prompt)
-
-            # 응답 텍스트 추출
-            response_text = response.text
+{URGENCY_TAG} emergency/high/medium/low]"""
+
+    def _parse_symptom_response(self, response_text: str) -> Dict[str, str]:
+        """응답에서 응급도 태그를 추출하고 권장 조치를 붙임"""
+
+        # 응급도 추출
+        urgency_level = "medium"  # 기본값
+        if URGENCY_TAG in response_text:
+            urgency_part = response_text.split(URGENCY_TAG)[-1].split("]")[0].strip()
+            if urgency_part in SUGGESTED_ACTIONS:
+                urgency_level = urgency_part
+            # 응급도 태그 제거
+            response_text = response_text.split(URGENCY_TAG)[0].strip()
+
+        return {
+            "response": response_text,
+            "urgency_level": urgency_level,
+            "suggested_action": SUGGESTED_ACTIONS[urgency_level],
+        }
 
-            # 응급도 추출
-            urgency_level = "medium"  # 기본값
-            if "[URGENCY:" in response_text:
-                urgency_part = response_text.split("[URGENCY:")[-1].split("]")[0].strip()
-                if urgency_part in ["emergency", "high", "medium", "low"]:
-                    urgency_level = urgency_part
-                # 응급도 태그 제거
-                response_text = response_text.split("[URGENCY:")[0].strip()
-
-            # 권장 조치
-            suggested_actions = {
-                "emergency": "⚠️ 즉시 119에 연락하거나 가까운 응급실로 가세요.",
-                "high": "가능한 빨리 병원을 방문하시거나 전문의 상담을 받으세요.",
-                "medium": "증상이 지속되거나 악화되면 병원을 방문하세요.",
-                "low": "경과를 지켜보시고 증상이 지속되면 병원을 방문하세요."
-            }
+    def _escalate(self, result: Dict[str, str], emergency: Dict[str, str]) -> Dict[str, str]:
+        """로컬 응급 감지 결과를 반영 (LLM 판단과 무관하게 응급도 고정)"""
+        return {
+            "response": f"{emergency['guidance']}\n\n{result['response']}",
+            "urgency_level": "emergency",
+            "suggested_action": SUGGESTED_ACTIONS["emergency"],
+        }
 
-            return {
-                "response": response_text,
-                "urgency_level": urgency_level,
-                "suggested_action": suggested_actions[urgency_level],
-            }
+    def symptom_fallback(self, message: str, error: Union[Exception, str]) -> Dict[str, str]:
+        """증상 체크 작업이 끝내 실패했을 때의 응답 (응급 키워드가 있으면 응급도 고정)"""
+        result = self._symptom_fallback(error)
+        emergency = get_emergency_detector().detect(message)
+        return self._escalate(result, emergency) if emergency else result
 
-        except Exception as e:
-            # API 호출 실패 시 폴백 응답
-            return {
-                "response": f"""증상에 대해 말씀해 주셔서 감사합니다.
+    def _symptom_fallback(self, error: Union[Exception, str]) -> Dict[str, str]:
+        """API 호출 실패 시 폴백 응답"""
+        return {
+            "response": f"""증상에 대해 말씀해 주셔서 감사합니다.
 
 현재 AI 서비스에 일시적인 문제가 있어 자세한 상담을 제공하기 어렵습니다.
 
@@ -161,11 +353,39 @@ class AIService:
 
 ⚠️ 본 서비스는 정보 제공 목적이며, 의학적 진단이나 치료를 대체할 수 없습니다.
 
-[오류: {str(e)}]""",
-                "urgency_level": "medium",
-                "suggested_action": "증상이 지속되거나 악화되면 병원을 방문하세요."
-            }
+[오류: {str(error)}]""",
+            "urgency_level": "medium",
+            "suggested_action": SUGGESTED_ACTIONS["medium"],
+        }
+
+    async def summarize_conversation(
+        self, summary: str, turns: List[Tuple[str, str]], max_tokens: int
+    ) -> str:
+        """
+        증상 상담 대화의 누적 요약 갱신 (chat_context 요약 작업에서 사용)
+
+        Raises:
+            Exception: Gemini 호출 실패 시 (작업 큐가 재시도)
+        """
+        labels = {"user": "사용자", "assistant": "상담사"}
+        dialogue = "\n".join(f"{labels.get(role, role)}: {message}" for role, message in turns)
+
+        prompt = f"""다음은 건강 상담 챗봇의 대화입니다. 기존 요약에 새 대화 내용을 합쳐 요약을 갱신해주세요.
+
+**기존 요약:**
+{summary or "(없음)"}
+
+**새 대화:**
+{dialogue}
 
+**요약 요구사항:**
+1. 사용자가 말한 증상, 발생 시점과 기간, 복용 중인 약, 관련 병력을 빠짐없이 남깁니다.
+2. 상담사가 안내한 주요 조치와 판단한 응급도를 남깁니다.
+3. 인사말, 면책 조항, 반복되는 내용은 뺍니다.
+4. {max_tokens}자 이내의 한국어 문장으로 작성하고, 요약 외의 말은 쓰지 않습니다."""
+
+        response = await get_llm_gateway().generate(self.model, prompt)
+        return response.text.strip()
 
     async def mental_health_assessment(
         self,
@@ -174,8 +394,12 @@ class AIService:
         mood_level: Optional[int],
         sleep_quality: Optional[int],
         notes: Optional[str],
+        raise_errors: bool = False,
     ) -> Dict[str, str]:
-        """정신 건강 평가 및 조언 (Gemini API 사용)"""
+        """정신 건강 평가 및 조언 (Gemini API 사용)
+
+        raise_errors=True면 API 실패 시 폴백 대신 예외를 던진다 (작업 큐 재시도용).
+        """
 
         # 프롬프트 구성 (system instruction 포함)
         prompt = f"""{self.system_instruction}
@@ -212,7 +436,7 @@ class AIService:
 
         try:
             # Gemini API 호출
-            response = self.model.generate_content(prompt)
+            response = await get_llm_gateway().generate(self.model, prompt)
             response_text = response.text
 
             # 평가와 권장사항 분리
@@ -233,11 +457,22 @@ class AIService:
                 "recommendations": recommendations,
             }
 
-        except Exception as e:
+        except Exception:
+            if raise_errors:
+                raise
             # API 호출 실패 시 폴백 응답
-            avg_score = sum(filter(None, [stress_level, anxiety_level, mood_level, sleep_quality])) / 4 if any([stress_level, anxiety_level, mood_level, sleep_quality]) else 5
+            return self.mental_health_fallback(stress_level, anxiety_level, mood_level, sleep_quality)
+
+    def mental_health_fallback(
+        self,
+        stress_level: Optional[int],
+        anxiety_level: Optional[int],
+        mood_level: Optional[int],
+        sleep_quality: Optional[int],
+    ) -> Dict[str, str]:
+        """AI 평가를 할 수 없을 때의 기본 평가와 권장사항"""
 
-            fallback_assessment = f"""정신 건강 상태를 확인해주셔서 감사합니다.
+        fallback_assessment = f"""정신 건강 상태를 확인해주셔서 감사합니다.
 
 **현재 상태 기록:**
 - 스트레스: {stress_level if stress_level else '-'}/10
@@ -253,21 +488,40 @@ class AIService:
 - 정신건강 위기상담: ☎1577-0199
 - 자살예방 상담전화: ☎1393"""
 
-            fallback_recommendations = """- 규칙적인 생활 패턴 유지
+        fallback_recommendations = """- 규칙적인 생활 패턴 유지
 - 하루 30분 이상 운동
 - 충분한 수면 (7-8시간)
 - 가족, 친구와 소통
 - 전문가 상담 고려"""
 
-            return {
-                "assessment": fallback_assessment,
-                "recommendations": fallback_recommendations,
-            }
+        return {
+            "assessment": fallback_assessment,
+            "recommendations": fallback_recommendations,
+        }
 
     async def health_advice(
         self, record_type: str, value: float, user_context: Optional[Dict] = None
     ) -> str:
-        """건강 기록에 대한 조언 (Gemini API 사용)"""
+        """건강 기록에 대한 조언 (Gemini API 사용)
+
+        위험 구간이거나 측정 가능 범위를 벗어난 측정값은 캐시를 사용하지 않는다.
+        """
+
+        cache = get_response_cache()
+        band = cache.reading_band(record_type, value)
+        cache_key = cache.make_key(
+            "health_advice",
+            cache.normalize(record_type),
+            band or "-",
+            cache.value_bucket(value),
+            cache.context_bucket(user_context),
+        )
+        if band is None:
+            cache.bypass()
+        else:
+            cached = await cache.get(cache_key)
+            if cached:
+                return cached
 
         # 사용자 컨텍스트 정보
         context_info = ""
@@ -306,8 +560,8 @@ class AIService:
 
         try:
             # Gemini API 호출
-            response = self.model.generate_content(prompt)
-            return response.text
+            response = await get_llm_gateway().generate(self.model, prompt)
+            advice = response.text
 
         except Exception as e:
             # API 호출 실패 시 폴백 응답
@@ -324,3 +578,7 @@ class AIService:
 ⚠️ 본 정보는 참고용이며, 의학적 진단을 대체할 수 없습니다.
 
 [오류: {str(e)}]"""
+
+        if band is not None:
+            await cache.set(cache_key, advice)
+        return advice
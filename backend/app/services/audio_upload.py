@@ -0,0 +1,135 @@
+"""오디오 업로드 수신 - Base64/JSON 없이 원본 바이트를 받아 크기 제한된 임시 파일에 저장
+
+- 원본 바디(Content-Type: audio/*)와 multipart/form-data 모두 지원
+- Content-Length가 제한을 넘으면 바디를 읽기 전에 거절하고, 청크 전송도 받는 중에 초과하면 중단
+- 작은 파일은 메모리에, 큰 파일은 디스크에 두고(SpooledTemporaryFile) memoryview로 복사 없이 읽음
+"""
+import io
+import mmap
+import tempfile
+from contextlib import contextmanager
+from typing import AsyncIterator, Iterator, Optional
+
+from starlette.datastructures import UploadFile
+from starlette.formparsers import MultiPartParser
+from starlette.requests import Request
+
+from ..config import settings
+
+# Content-Type/파일 확장자 -> Google STT 인코딩
+AUDIO_ENCODINGS = {
+    "audio/webm": "WEBM_OPUS",
+    "audio/ogg": "OGG_OPUS",
+    "audio/mpeg": "MP3",
+    "audio/mp3": "MP3",
+    "audio/wav": "LINEAR16",
+    "audio/x-wav": "LINEAR16",
+    "audio/l16": "LINEAR16",
+    ".webm": "WEBM_OPUS",
+    ".ogg": "OGG_OPUS",
+    ".mp3": "MP3",
+    ".wav": "LINEAR16",
+}
+
+
+class AudioTooLargeError(ValueError):
+    """업로드 크기 제한 초과"""
+
+
+class AudioUpload:
+    """임시 파일에 받은 오디오 (사용 후 close)"""
+
+    def __init__(self, file, size: int, content_type: str, filename: Optional[str] = None):
+        self.file = file
+        self.size = size
+        self.content_type = content_type
+        self.filename = filename
+
+    @property
+    def encoding(self) -> Optional[str]:
+        """Content-Type 또는 파일 확장자로 추정한 인코딩 (알 수 없으면 None)"""
+        media_type = self.content_type.split(";")[0].strip().lower()
+        if media_type in AUDIO_ENCODINGS:
+            return AUDIO_ENCODINGS[media_type]
+        if self.filename and "." in self.filename:
+            return AUDIO_ENCODINGS.get("." + self.filename.rsplit(".", 1)[-1].lower())
+        return None
+
+    @contextmanager
+    def view(self) -> Iterator[memoryview]:
+        """
+        오디오 전체를 memoryview로 제공 (with 블록 안에서만 유효)
+
+        메모리에 있으면 BytesIO 버퍼를, 디스크로 넘어갔으면 mmap을 그대로 노출한다.
+        """
+        raw = self.file._file
+        if isinstance(raw, io.BytesIO):
+            with raw.getbuffer() as buffer:
+                yield buffer
+            return
+
+        raw.flush()
+        with mmap.mmap(raw.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            with memoryview(mapped) as buffer:
+                yield buffer
+
+    def close(self):
+        self.file.close()
+
+
+async def _limited(stream: AsyncIterator[bytes], max_bytes: int) -> AsyncIterator[bytes]:
+    received = 0
+    async for chunk in stream:
+        received += len(chunk)
+        if received > max_bytes:
+            raise AudioTooLargeError(f"오디오 파일이 너무 큽니다. (최대 {max_bytes // (1024 * 1024)}MB)")
+        yield chunk
+
+
+async def receive_audio(
+    request: Request,
+    max_bytes: int = settings.AUDIO_UPLOAD_MAX_BYTES,
+    field: str = "file",
+) -> AudioUpload:
+    """
+    요청 바디에서 오디오 수신
+
+    Raises:
+        AudioTooLargeError: 크기 제한 초과
+        ValueError: 오디오가 비어 있거나 multipart에 파일 필드가 없음
+    """
+    content_length = request.headers.get("content-length")
+    if content_length and content_length.isdigit() and int(content_length) > max_bytes:
+        raise AudioTooLargeError(f"오디오 파일이 너무 큽니다. (최대 {max_bytes // (1024 * 1024)}MB)")
+
+    content_type = request.headers.get("content-type", "application/octet-stream")
+    stream = _limited(request.stream(), max_bytes)
+
+    if content_type.startswith("multipart/form-data"):
+        # Starlette 파서도 파일 파트를 SpooledTemporaryFile에 받으므로 그 파일을 그대로 사용
+        form = await MultiPartParser(request.headers, stream, max_files=1, max_fields=10).parse()
+        upload = form.get(field)
+        if not isinstance(upload, UploadFile):
+            await form.close()
+            raise ValueError(f"multipart 요청에 '{field}' 파일 필드가 없습니다.")
+        upload.file.seek(0, io.SEEK_END)
+        audio = AudioUpload(
+            upload.file,
+            upload.file.tell(),
+            upload.content_type or "application/octet-stream",
+            upload.filename,
+        )
+    else:
+        spooled = tempfile.SpooledTemporaryFile(max_size=settings.AUDIO_SPOOL_MEMORY_BYTES)
+        try:
+            async for chunk in stream:
+                spooled.write(chunk)
+        except BaseException:
+            spooled.close()
+            raise
+        audio = AudioUpload(spooled, spooled.tell(), content_type)
+
+    if audio.size == 0:
+        audio.close()
+        raise ValueError("오디오 데이터가 비어 있습니다.")
+    return audio
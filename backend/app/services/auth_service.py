@@ -1,10 +1,23 @@
 from passlib.context import CryptContext
 from jose import JWTError, jwt
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
 from ..config import settings
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# min_rounds를 기본값과 같게 두어 비용 인자가 올라가면 로그인 시 자동 재해시
+pwd_context = CryptContext(
+    schemes=["bcrypt"],
+    deprecated="auto",
+    bcrypt__default_rounds=settings.BCRYPT_ROUNDS,
+    bcrypt__min_rounds=settings.BCRYPT_ROUNDS,
+)
+
+# bcrypt 해시/검증 전용 스레드 풀 (bcrypt는 GIL을 해제하므로 병렬 실행 가능)
+password_executor = ThreadPoolExecutor(
+    max_workers=settings.PASSWORD_HASH_WORKERS, thread_name_prefix="bcrypt"
+)
 
 
 class AuthService:
@@ -20,6 +33,32 @@ class AuthService:
         """비밀번호 해시"""
         return pwd_context.hash(password)
 
+    @staticmethod
+    async def verify_password_async(
+        plain_password: str, hashed_password: str
+    ) -> Tuple[bool, Optional[str]]:
+        """비밀번호 검증 (전용 스레드 풀에서 실행)
+
+        Returns:
+            (검증 결과, 재해시된 비밀번호 또는 None)
+            비용 인자가 바뀐 해시는 검증 성공 시 새 해시를 함께 반환합니다.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            password_executor,
+            pwd_context.verify_and_update,
+            plain_password,
+            hashed_password,
+        )
+
+    @staticmethod
+    async def get_password_hash_async(password: str) -> str:
+        """비밀번호 해시 (전용 스레드 풀에서 실행)"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            password_executor, pwd_context.hash, password
+        )
+
     @staticmethod
     def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
         """JWT 토큰 생성"""
@@ -0,0 +1,221 @@
+"""콘텐츠 주소 기반 파일 저장소 - 식단 사진 등 바이너리를 DB 밖에 저장
+
+파일은 SHA-256 해시를 키로 저장하므로 같은 사진을 여러 번 올려도 한 번만 저장된다.
+기본은 로컬 파일시스템이며 BLOB_STORE_BACKEND=s3 설정 시 S3 호환 저장소를 사용한다.
+"""
+import asyncio
+import base64
+import hashlib
+import os
+import re
+import tempfile
+from typing import AsyncIterator, Optional, Tuple, Union
+
+from ..config import settings
+
+BLOB_KEY_PATTERN = re.compile(r"^[0-9a-f]{64}$")
+
+# 매직 바이트로 판별하는 이미지 형식
+IMAGE_SIGNATURES = [
+    (b"\xff\xd8\xff", "image/jpeg"),
+    (b"\x89PNG\r\n\x1a\n", "image/png"),
+]
+
+
+def sniff_image_type(head: bytes) -> Optional[str]:
+    """파일 앞부분으로 이미지 MIME 타입 판별 (지원하지 않으면 None)"""
+    for signature, content_type in IMAGE_SIGNATURES:
+        if head.startswith(signature):
+            return content_type
+    if head[:4] == b"RIFF" and head[8:12] == b"WEBP":
+        return "image/webp"
+    return None
+
+
+def blob_key(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def is_blob_key(key: str) -> bool:
+    return bool(BLOB_KEY_PATTERN.match(key))
+
+
+class LocalBlobStore:
+    """로컬 파일시스템 저장소 (root/ab/cd/<해시>)"""
+
+    def __init__(self, root: str):
+        self.root = root
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.root, key[:2], key[2:4], key)
+
+    def put(self, key: str, data: bytes) -> bool:
+        """저장 (이미 있으면 False)"""
+        path = self._path(key)
+        if os.path.exists(path):
+            return False
+
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # 임시 파일에 쓴 뒤 rename하여 동시 업로드 시에도 불완전한 파일이 보이지 않게 함
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path))
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        return True
+
+    def size(self, key: str) -> Optional[int]:
+        try:
+            return os.path.getsize(self._path(key))
+        except FileNotFoundError:
+            return None
+
+    def read_range(self, key: str, start: int, length: int) -> bytes:
+        with open(self._path(key), "rb") as f:
+            f.seek(start)
+            return f.read(length)
+
+
+class S3BlobStore:
+    """
+    S3 호환 저장소 (AWS S3, MinIO, Cloudflare R2 등)
+
+    boto3는 선택 의존성이므로 이 저장소를 쓸 때만 import한다.
+    """
+
+    def __init__(self, bucket: str, endpoint_url: Optional[str] = None, prefix: str = "blobs/"):
+        try:
+            import boto3
+        except ImportError:
+            raise ValueError("BLOB_STORE_BACKEND=s3를 사용하려면 boto3 패키지를 설치하세요.")
+
+        self._client = boto3.client("s3", endpoint_url=endpoint_url)
+        self.bucket = bucket
+        self.prefix = prefix
+
+    def put(self, key: str, data: bytes) -> bool:
+        if self.size(key) is not None:
+            return False
+        self._client.put_object(Bucket=self.bucket, Key=self.prefix + key, Body=bytes(data))
+        return True
+
+    def size(self, key: str) -> Optional[int]:
+        from botocore.exceptions import ClientError
+
+        try:
+            head = self._client.head_object(Bucket=self.bucket, Key=self.prefix + key)
+        except ClientError:
+            return None
+        return head["ContentLength"]
+
+    def read_range(self, key: str, start: int, length: int) -> bytes:
+        response = self._client.get_object(
+            Bucket=self.bucket,
+            Key=self.prefix + key,
+            Range=f"bytes={start}-{start + length - 1}",
+        )
+        return response["Body"].read()
+
+
+class BlobStore:
+    """저장소 백엔드의 동기 I/O를 스레드에서 실행하는 비동기 래퍼"""
+
+    def __init__(self, backend):
+        self.backend = backend
+
+    async def put(self, data: Union[bytes, memoryview]) -> Tuple[str, bool]:
+        """
+        바이트 저장 (memoryview도 복사 없이 해시/저장)
+
+        Returns:
+            (해시 키, 새로 저장되었는지 여부)
+        """
+        key = blob_key(data)
+        created = await asyncio.to_thread(self.backend.put, key, data)
+        return key, created
+
+    async def size(self, key: str) -> Optional[int]:
+        return await asyncio.to_thread(self.backend.size, key)
+
+    async def read(self, key: str) -> bytes:
+        size = await self.size(key)
+        if size is None:
+            raise FileNotFoundError(key)
+        return await self.read_range(key, 0, size)
+
+    async def read_range(self, key: str, start: int, length: int) -> bytes:
+        return await asyncio.to_thread(self.backend.read_range, key, start, length)
+
+    async def iter_range(
+        self, key: str, start: int, end: int, chunk_size: int = 64 * 1024
+    ) -> AsyncIterator[bytes]:
+        """start~end(포함) 구간을 chunk_size씩 읽음"""
+        position = start
+        while position <= end:
+            length = min(chunk_size, end - position + 1)
+            chunk = await self.read_range(key, position, length)
+            if not chunk:
+                break
+            position += len(chunk)
+            yield chunk
+
+
+def parse_range(header: Optional[str], size: int) -> Optional[Tuple[int, int]]:
+    """
+    Range 헤더 파싱 (단일 구간만 지원)
+
+    Returns:
+        (start, end) - 헤더가 없으면 None
+    Raises:
+        ValueError: 만족할 수 없는 구간 (416 응답)
+    """
+    if not header:
+        return None
+
+    match = re.fullmatch(r"bytes=(\d*)-(\d*)", header.strip())
+    if not match or not (match.group(1) or match.group(2)):
+        raise ValueError(header)
+
+    first, last = match.groups()
+    if first:
+        start = int(first)
+        end = min(int(last), size - 1) if last else size - 1
+    else:
+        # bytes=-500: 마지막 500바이트
+        start = max(size - int(last), 0)
+        end = size - 1
+
+    if start > end or start >= size:
+        raise ValueError(header)
+    return start, end
+
+
+def decode_data_url(data_url: str) -> bytes:
+    """data:image/...;base64,... 문자열을 바이트로 변환"""
+    if "base64," in data_url:
+        data_url = data_url.split("base64,", 1)[1]
+    return base64.b64decode(data_url)
+
+
+# 싱글톤 인스턴스
+_blob_store = None
+
+
+def get_blob_store() -> BlobStore:
+    """BlobStore 싱글톤 인스턴스 반환"""
+    global _blob_store
+    if _blob_store is None:
+        if settings.BLOB_STORE_BACKEND == "s3":
+            backend = S3BlobStore(
+                bucket=settings.BLOB_S3_BUCKET,
+                endpoint_url=settings.BLOB_S3_ENDPOINT_URL,
+                prefix=settings.BLOB_S3_PREFIX,
+            )
+        else:
+            backend = LocalBlobStore(settings.BLOB_STORE_PATH)
+        _blob_store = BlobStore(backend)
+    return _blob_store
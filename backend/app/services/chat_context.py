@@ -0,0 +1,187 @@
+"""대화 문맥 - 같은 세션의 이전 대화를 프롬프트에 넣되 크기를 일정하게 유지
+
+- 최근 메시지 몇 개는 원문 그대로, 그보다 오래된 메시지는 세션별 누적 요약(chat_sessions)으로 전달
+- 대화가 오갈 때마다 최근 범위를 벗어난 메시지를 요약에 합치는 작업을 작업 큐에 넣음
+- 토큰 예산 안에서 요약 -> 최신 메시지 순으로 채우므로 대화가 길어져도 프롬프트 크기는 상한을 넘지 않음
+"""
+import math
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, List, Optional, Tuple
+
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..config import settings
+from ..models.chat_history import ChatHistory, ChatSession
+
+# (role, message) - role은 "user" 또는 "assistant"
+Turn = Tuple[str, str]
+Summarizer = Callable[[str, List[Turn], int], Awaitable[str]]
+
+SUMMARY_JOB = "chat_summary"
+ROLE_LABELS = {"user": "사용자", "assistant": "상담사"}
+ELLIPSIS = "…"
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    토큰 수 추정 (토크나이저 호출 없이)
+
+    영문/숫자는 약 4자당 1토큰, 한글 등 비ASCII 문자는 글자당 1토큰으로 넉넉하게 잡는다.
+    """
+    ascii_chars = len(text.encode("ascii", "ignore"))
+    return math.ceil(ascii_chars / 4) + (len(text) - ascii_chars)
+
+
+def clip_tokens(text: str, max_tokens: int) -> str:
+    """추정 토큰 수가 max_tokens 이하가 되도록 앞부분만 남김"""
+    if estimate_tokens(text) <= max_tokens:
+        return text
+    if max_tokens <= 1:
+        return ""
+
+    # 추정치는 접두사 길이에 대해 단조 증가하므로 이진 탐색
+    low, high = 0, len(text)
+    while low < high:
+        middle = (low + high + 1) // 2
+        if estimate_tokens(text[:middle]) <= max_tokens - 1:
+            low = middle
+        else:
+            high = middle - 1
+    return text[:low].rstrip() + ELLIPSIS
+
+
+def fit_budget(
+    summary: str,
+    turns: List[Turn],
+    max_tokens: int = settings.CHAT_CONTEXT_MAX_TOKENS,
+    message_max_tokens: int = settings.CHAT_CONTEXT_MESSAGE_MAX_TOKENS,
+    summary_max_tokens: int = settings.CHAT_SUMMARY_MAX_TOKENS,
+) -> Tuple[str, List[Turn]]:
+    """요약과 최근 메시지를 토큰 예산에 맞춤 (넘치면 오래된 메시지부터 제외)"""
+    summary = clip_tokens(summary, min(summary_max_tokens, max_tokens))
+    remaining = max_tokens - estimate_tokens(summary)
+
+    kept: List[Turn] = []
+    for role, message in reversed(turns):
+        message = clip_tokens(message, message_max_tokens)
+        cost = estimate_tokens(message)
+        if cost > remaining:
+            break
+        kept.append((role, message))
+        remaining -= cost
+    kept.reverse()
+    return summary, kept
+
+
+@dataclass
+class ConversationContext:
+    """프롬프트에 넣을 세션 문맥"""
+
+    summary: str = ""
+    turns: List[Turn] = field(default_factory=list)
+    pending: int = 0  # 아직 요약에 합쳐지지 않은 메시지 수 (최근 범위 + 1까지만 셈)
+
+    def render(self) -> str:
+        """프롬프트용 문자열 (이전 대화가 없으면 빈 문자열)"""
+        sections = []
+        if self.summary:
+            sections.append(f"**이전 대화 요약:**\n{self.summary}")
+        if self.turns:
+            lines = "\n".join(f"{ROLE_LABELS.get(role, role)}: {message}" for role, message in self.turns)
+            sections.append(f"**최근 대화:**\n{lines}")
+        return "\n\n".join(sections)
+
+    def needs_summary(self, added: int = 2) -> bool:
+        """이번 대화(added개 메시지)를 저장하면 최근 범위를 넘는지"""
+        return self.pending + added > settings.CHAT_CONTEXT_RECENT_MESSAGES
+
+
+async def _session(db: AsyncSession, user_id: int, session_id: str) -> Optional[ChatSession]:
+    result = await db.execute(
+        select(ChatSession).where(ChatSession.user_id == user_id, ChatSession.session_id == session_id)
+    )
+    return result.scalar_one_or_none()
+
+
+async def load_context(db: AsyncSession, user_id: int, session_id: Optional[str]) -> ConversationContext:
+    """세션 요약과 요약되지 않은 최근 메시지를 예산에 맞춰 불러옴"""
+    if not session_id:
+        return ConversationContext()
+
+    session = await _session(db, user_id, session_id)
+    summary = session.summary if session else ""
+    summarized_until = session.summarized_until if session else 0
+
+    # 요약 작업이 밀려 있어도 최근 범위 + 1개만 읽음
+    result = await db.execute(
+        select(ChatHistory.role, ChatHistory.message)
+        .where(
+            ChatHistory.user_id == user_id,
+            ChatHistory.session_id == session_id,
+            ChatHistory.id > summarized_until,
+        )
+        .order_by(ChatHistory.id.desc())
+        .limit(settings.CHAT_CONTEXT_RECENT_MESSAGES + 1)
+    )
+    rows = result.all()
+    turns = [(row.role, row.message) for row in reversed(rows[:settings.CHAT_CONTEXT_RECENT_MESSAGES])]
+
+    summary, turns = fit_budget(summary, turns)
+    return ConversationContext(summary=summary, turns=turns, pending=len(rows))
+
+
+async def update_summary(
+    db: AsyncSession,
+    user_id: int,
+    session_id: str,
+    summarize: Summarizer,
+    recent: int = settings.CHAT_CONTEXT_RECENT_MESSAGES,
+    batch: int = settings.CHAT_SUMMARY_BATCH_MESSAGES,
+    summary_max_tokens: int = settings.CHAT_SUMMARY_MAX_TOKENS,
+) -> int:
+    """
+    최근 recent개를 제외한 요약되지 않은 메시지를 누적 요약에 합침
+
+    같은 세션의 요약 작업이 동시에 돌면 summarized_until을 먼저 바꾼 쪽만 반영된다.
+
+    Returns:
+        요약에 합친 메시지 수
+    """
+    session = await _session(db, user_id, session_id)
+    if session is None:
+        session = ChatSession(user_id=user_id, session_id=session_id, summary="", summarized_until=0)
+        db.add(session)
+        await db.flush()  # 다른 작업이 먼저 만들었으면 IntegrityError -> 작업 큐가 재시도
+
+    result = await db.execute(
+        select(ChatHistory.id, ChatHistory.role, ChatHistory.message)
+        .where(
+            ChatHistory.user_id == user_id,
+            ChatHistory.session_id == session_id,
+            ChatHistory.id > session.summarized_until,
+        )
+        .order_by(ChatHistory.id)
+        .limit(recent + batch)
+    )
+    rows = result.all()
+    # LLM 호출 동안 트랜잭션(SQLite 쓰기 잠금 등)을 잡고 있지 않도록 먼저 종료
+    await db.commit()
+    overflow = rows[:max(len(rows) - recent, 0)]
+    if not overflow:
+        return 0
+
+    turns = [
+        (row.role, clip_tokens(row.message, settings.CHAT_CONTEXT_MESSAGE_MAX_TOKENS))
+        for row in overflow
+    ]
+    summary = await summarize(session.summary, turns, summary_max_tokens)
+    summary = clip_tokens(summary.strip(), summary_max_tokens)
+
+    applied = await db.execute(
+        update(ChatSession)
+        .where(ChatSession.id == session.id, ChatSession.summarized_until == session.summarized_until)
+        .values(summary=summary, summarized_until=overflow[-1].id)
+    )
+    await db.commit()
+    return len(overflow) if applied.rowcount == 1 else 0
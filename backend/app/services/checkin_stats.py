@@ -0,0 +1,157 @@
+"""음성 체크인 통계 캐시 - 대시보드 폴링 시 매번 집계하지 않도록 사용자별 요약 보관"""
+import time
+from collections import OrderedDict
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, Optional
+
+from sqlalchemy import and_, case, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..config import settings
+from ..models.voice_health import VoiceCheckIn
+
+
+def _week_start(moment: datetime) -> date:
+    """해당 시각이 속한 주의 월요일 (UTC 기준)"""
+    day = moment.date()
+    return day - timedelta(days=day.weekday())
+
+
+class CheckinStatsCache:
+    """
+    사용자별 체크인 요약(합계, 개수, 주별 개수)을 보관하는 LRU 캐시
+
+    캐시가 없을 때만 집계 쿼리 한 번으로 요약을 만들고,
+    POST /voice/checkin 시에는 해당 사용자의 요약을 버려 다음 조회 때 다시 집계한다.
+    (커밋 후 증분 갱신하면 그 사이 캐시를 채운 조회가 이미 새 체크인을 포함해 두 번 더해질 수 있음)
+    집계 도중 체크인이 생기면 그 결과는 캐시하지 않는다.
+    주가 바뀌면 주별 개수를 한 칸씩 밀어서 재사용한다.
+    다른 워커에서 생성된 체크인은 TTL이 지나면 반영된다.
+    """
+
+    def __init__(
+        self,
+        ttl: int = settings.CHECKIN_STATS_TTL_SECONDS,
+        max_entries: int = settings.CHECKIN_STATS_MAX_ENTRIES,
+        weeks: int = 8,
+    ):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.weeks = weeks
+        self._entries: "OrderedDict[int, Dict[str, Any]]" = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._writes = 0  # invalidate 횟수 (집계 중 쓰기 감지용)
+
+    async def get(self, db: AsyncSession, user_id: int) -> Dict[str, Any]:
+        """체크인 통계 조회"""
+        current_week = _week_start(datetime.utcnow())
+
+        summary = self._entries.get(user_id)
+        if summary is None or summary["expires_at"] < time.monotonic():
+            self._misses += 1
+            writes = self._writes
+            summary = await self._load(db, user_id, current_week)
+            if self._writes != writes:
+                # 집계하는 동안 체크인이 생김 - 포함 여부를 알 수 없으므로 이번 결과만 반환
+                self._roll(summary, current_week)
+                return self._to_response(summary)
+            self._entries[user_id] = summary
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        else:
+            self._hits += 1
+        self._entries.move_to_end(user_id)
+
+        self._roll(summary, current_week)
+        return self._to_response(summary)
+
+    def invalidate(self, user_id: int):
+        """체크인이 생긴 사용자의 요약 제거 (커밋 후 호출)"""
+        self._writes += 1
+        self._entries.pop(user_id, None)
+
+    async def _load(self, db: AsyncSession, user_id: int, current_week: date) -> Dict[str, Any]:
+        """집계 쿼리 한 번으로 요약 생성"""
+        week_starts = [current_week - timedelta(weeks=i) for i in range(self.weeks - 1, -1, -1)]
+        weekly_columns = [
+            func.sum(case((
+                and_(
+                    VoiceCheckIn.checkin_date >= datetime.combine(start, datetime.min.time()),
+                    VoiceCheckIn.checkin_date < datetime.combine(start + timedelta(weeks=1), datetime.min.time()),
+                ),
+                1,
+            ), else_=0))
+            for start in week_starts
+        ]
+
+        result = await db.execute(
+            select(
+                func.count(VoiceCheckIn.id),
+                func.sum(VoiceCheckIn.mood_score),
+                func.count(VoiceCheckIn.mood_score),
+                func.sum(VoiceCheckIn.energy_level),
+                func.count(VoiceCheckIn.energy_level),
+                *weekly_columns,
+            ).where(VoiceCheckIn.user_id == user_id)
+        )
+        row = result.one()
+
+        return {
+            "expires_at": time.monotonic() + self.ttl,
+            "week": current_week,
+            "total": row[0],
+            "mood_sum": row[1] or 0,
+            "mood_count": row[2],
+            "energy_sum": row[3] or 0,
+            "energy_count": row[4],
+            "weekly": [count or 0 for count in row[5:]],
+        }
+
+    def _roll(self, summary: Dict[str, Any], current_week: date):
+        """주가 바뀌었으면 주별 개수를 밀어서 맞춤"""
+        shift = (current_week - summary["week"]).days // 7
+        if shift <= 0:
+            return
+        shift = min(shift, self.weeks)
+        summary["weekly"] = summary["weekly"][shift:] + [0] * shift
+        summary["week"] = current_week
+
+    def _to_response(self, summary: Dict[str, Any]) -> Dict[str, Any]:
+        def _average(total: int, count: int) -> Optional[float]:
+            return round(total / count, 2) if count else None
+
+        return {
+            "average_mood": _average(summary["mood_sum"], summary["mood_count"]),
+            "average_energy": _average(summary["energy_sum"], summary["energy_count"]),
+            "total_checkins": summary["total"],
+            "checkins_this_week": summary["weekly"][-1],
+            "weekly_counts": [
+                {
+                    "week_start": (summary["week"] - timedelta(weeks=self.weeks - 1 - i)).isoformat(),
+                    "count": count,
+                }
+                for i, count in enumerate(summary["weekly"])
+            ],
+        }
+
+    def metrics(self) -> Dict[str, Any]:
+        lookups = self._hits + self._misses
+        return {
+            "entries": len(self._entries),
+            "hits": self._hits,
+            "misses": self._misses,
+            "hit_rate": round(self._hits / lookups, 4) if lookups else 0.0,
+        }
+
+
+# 싱글톤 인스턴스
+_checkin_stats_cache = None
+
+
+def get_checkin_stats_cache() -> CheckinStatsCache:
+    """CheckinStatsCache 싱글톤 인스턴스 반환"""
+    global _checkin_stats_cache
+    if _checkin_stats_cache is None:
+        _checkin_stats_cache = CheckinStatsCache()
+    return _checkin_stats_cache
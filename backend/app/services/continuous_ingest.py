@@ -0,0 +1,427 @@
+"""상시 음성 모니터링 데이터 적재 - 여러 사용자의 샘플을 모아 한 번에 INSERT
+
+원본 샘플(30초 간격)은 짧은 기간만 보관하고, 저장 시 5분/1시간 구간 집계를 함께 갱신한다.
+조회 시 요청 기간에 맞는 해상도를 골라 반환 행 수를 일정 범위로 유지한다.
+"""
+import asyncio
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import delete, func, insert, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.exc import DataError, IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..config import settings
+from ..database import AsyncSessionLocal, engine
+from ..models.voice_health import HealthNotification, VoiceAnalysisBucket, VoiceHealthAnalysis
+from ..schemas.voice_health import ContinuousAnalysisData
+
+CONTINUOUS_SOURCE = "continuous"
+
+# 구간 집계 해상도: 이름 -> 구간 길이(초)
+RESOLUTIONS = {
+    "5min": 300,
+    "1h": 3600,
+}
+
+
+def _parse_timestamp(value: str) -> datetime:
+    """클라이언트 ISO 시각(예: ...Z)을 naive UTC로 변환"""
+    try:
+        moment = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return datetime.utcnow()
+    if moment.tzinfo is not None:
+        moment = moment.astimezone(timezone.utc).replace(tzinfo=None)
+    return moment
+
+
+def build_rows(user_id: int, sample: ContinuousAnalysisData) -> tuple:
+    """샘플 하나를 (분석 행, 알림 행 또는 None)으로 변환"""
+    now = datetime.utcnow()
+    analysis = {
+        "user_id": user_id,
+        "recording_date": _parse_timestamp(sample.timestamp),
+        "stress_level": round(sample.stress_level),
+        "monitoring_status": sample.overall_status,
+        "depression_indicator": sample.depression_indicator,
+        "anxiety_indicator": sample.anxiety_indicator,
+        "ai_analysis": f"상시 모니터링 - {sample.overall_status}",
+        "source": CONTINUOUS_SOURCE,
+        "created_at": now,
+    }
+
+    # 우려 상태인 경우 알림 생성
+    notification = None
+    if sample.overall_status == "concern":
+        notification = {
+            "user_id": user_id,
+            "notification_type": "alert",
+            "title": "정신 건강 주의",
+            "body": (
+                f"상시 모니터링 결과 주의가 필요한 정신 상태가 감지되었습니다. "
+                f"스트레스: {sample.stress_level}/10, "
+                f"불안: {int(sample.anxiety_indicator * 100)}%, "
+                f"우울: {int(sample.depression_indicator * 100)}%"
+            ),
+            "has_voice_narration": True,
+            "voice_narration_text": "주의가 필요한 정신 상태가 감지되었습니다. 잠시 휴식을 취하시거나 전문가와 상담하시기 바랍니다.",
+            "priority": "high",
+            "category": "mental_health",
+            "created_at": now,
+        }
+    return analysis, notification
+
+
+def _bucket_start(moment: datetime, seconds: int) -> datetime:
+    return datetime.fromtimestamp(
+        moment.replace(tzinfo=timezone.utc).timestamp() // seconds * seconds, timezone.utc
+    ).replace(tzinfo=None)
+
+
+def build_bucket_rows(analyses: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """원본 행을 (사용자, 해상도, 구간 시작)별 집계 행으로 묶음"""
+    buckets: Dict[tuple, Dict[str, Any]] = {}
+    for row in analyses:
+        concern = 1 if row["monitoring_status"] == "concern" else 0
+        for seconds in RESOLUTIONS.values():
+            key = (row["user_id"], seconds, _bucket_start(row["recording_date"], seconds))
+            bucket = buckets.get(key)
+            if bucket is None:
+                buckets[key] = {
+                    "user_id": key[0],
+                    "resolution": seconds,
+                    "bucket_start": key[2],
+                    "sample_count": 1,
+                    "stress_sum": row["stress_level"],
+                    "stress_max": row["stress_level"],
+                    "anxiety_sum": row["anxiety_indicator"],
+                    "anxiety_max": row["anxiety_indicator"],
+                    "depression_sum": row["depression_indicator"],
+                    "depression_max": row["depression_indicator"],
+                    "concern_count": concern,
+                }
+                continue
+            bucket["sample_count"] += 1
+            bucket["concern_count"] += concern
+            for name, column in (("stress", "stress_level"), ("anxiety", "anxiety_indicator"),
+                                 ("depression", "depression_indicator")):
+                bucket[f"{name}_sum"] += row[column]
+                bucket[f"{name}_max"] = max(bucket[f"{name}_max"], row[column])
+    return list(buckets.values())
+
+
+async def upsert_buckets(db: AsyncSession, rows: List[Dict[str, Any]]):
+    """구간 집계 행을 기존 값에 더함 (여러 워커가 같은 구간에 써도 안전)"""
+    if engine.dialect.name == "postgresql":
+        statement = postgresql.insert(VoiceAnalysisBucket)
+        greatest = func.greatest
+    else:
+        statement = sqlite.insert(VoiceAnalysisBucket)
+        greatest = func.max
+
+    table, excluded = VoiceAnalysisBucket.__table__.c, statement.excluded
+    statement = statement.on_conflict_do_update(
+        index_elements=["user_id", "resolution", "bucket_start"],
+        set_={
+            "sample_count": table.sample_count + excluded.sample_count,
+            "concern_count": table.concern_count + excluded.concern_count,
+            **{
+                f"{name}_sum": table[f"{name}_sum"] + excluded[f"{name}_sum"]
+                for name in ("stress", "anxiety", "depression")
+            },
+            **{
+                f"{name}_max": greatest(table[f"{name}_max"], excluded[f"{name}_max"])
+                for name in ("stress", "anxiety", "depression")
+            },
+        },
+    )
+    await db.execute(statement, rows)
+
+
+async def prune_expired(db: AsyncSession):
+    """보존 기간이 지난 원본 샘플과 구간 집계 삭제"""
+    now = datetime.utcnow()
+    await db.execute(
+        delete(VoiceHealthAnalysis).where(
+            VoiceHealthAnalysis.source == CONTINUOUS_SOURCE,
+            VoiceHealthAnalysis.recording_date < now - timedelta(hours=settings.VOICE_RAW_RETENTION_HOURS),
+        )
+    )
+    retention_days = {
+        RESOLUTIONS["5min"]: settings.VOICE_5MIN_RETENTION_DAYS,
+        RESOLUTIONS["1h"]: settings.VOICE_HOURLY_RETENTION_DAYS,
+    }
+    for seconds, days in retention_days.items():
+        await db.execute(
+            delete(VoiceAnalysisBucket).where(
+                VoiceAnalysisBucket.resolution == seconds,
+                VoiceAnalysisBucket.bucket_start < now - timedelta(days=days),
+            )
+        )
+
+
+def pick_resolution(hours: int) -> str:
+    """요청 기간에 맞는 해상도 (raw는 최대 720개, 5분은 최대 576개 구간)"""
+    if hours <= 6 and hours <= settings.VOICE_RAW_RETENTION_HOURS:
+        return "raw"
+    if hours <= 48:
+        return "5min"
+    return "1h"
+
+
+async def query_history(db: AsyncSession, user_id: int, hours: int) -> Dict[str, Any]:
+    """기간 내 상시 모니터링 기록과 통계 (해상도 자동 선택)"""
+    cutoff_time = datetime.utcnow() - timedelta(hours=hours)
+    resolution = pick_resolution(hours)
+
+    if resolution == "raw":
+        conditions = [
+            VoiceHealthAnalysis.user_id == user_id,
+            VoiceHealthAnalysis.source == CONTINUOUS_SOURCE,
+            VoiceHealthAnalysis.recording_date >= cutoff_time,
+        ]
+        result = await db.execute(
+            select(
+                VoiceHealthAnalysis.recording_date,
+                VoiceHealthAnalysis.stress_level,
+                VoiceHealthAnalysis.anxiety_indicator,
+                VoiceHealthAnalysis.depression_indicator,
+                VoiceHealthAnalysis.monitoring_status,
+            )
+            .where(*conditions)
+            .order_by(VoiceHealthAnalysis.recording_date.desc())
+        )
+        points = [
+            {
+                "timestamp": recorded_at.isoformat(),
+                "stress_level": stress,
+                "anxiety_indicator": anxiety,
+                "depression_indicator": depression,
+                "overall_status": status,
+            }
+            for recorded_at, stress, anxiety, depression, status in result.all()
+        ]
+        totals = (await db.execute(
+            select(
+                func.count(VoiceHealthAnalysis.id),
+                func.sum(VoiceHealthAnalysis.stress_level),
+                func.sum(VoiceHealthAnalysis.anxiety_indicator),
+                func.sum(VoiceHealthAnalysis.depression_indicator),
+                func.count(VoiceHealthAnalysis.id).filter(
+                    VoiceHealthAnalysis.monitoring_status == "concern"
+                ),
+            ).where(*conditions)
+        )).one()
+    else:
+        seconds = RESOLUTIONS[resolution]
+        conditions = [
+            VoiceAnalysisBucket.user_id == user_id,
+            VoiceAnalysisBucket.resolution == seconds,
+            # 기간 시작 시각이 걸친 구간도 포함
+            VoiceAnalysisBucket.bucket_start >= _bucket_start(cutoff_time, seconds),
+        ]
+        result = await db.execute(
+            select(VoiceAnalysisBucket)
+            .where(*conditions)
+            .order_by(VoiceAnalysisBucket.bucket_start.desc())
+        )
+        points = [
+            {
+                "timestamp": bucket.bucket_start.isoformat(),
+                "sample_count": bucket.sample_count,
+                "stress_level": round(bucket.stress_sum / bucket.sample_count, 2),
+                "stress_max": bucket.stress_max,
+                "anxiety_indicator": round(bucket.anxiety_sum / bucket.sample_count, 2),
+                "anxiety_max": bucket.anxiety_max,
+                "depression_indicator": round(bucket.depression_sum / bucket.sample_count, 2),
+                "depression_max": bucket.depression_max,
+                "concern_count": bucket.concern_count,
+            }
+            for bucket in result.scalars().all()
+        ]
+        totals = (await db.execute(
+            select(
+                func.sum(VoiceAnalysisBucket.sample_count),
+                func.sum(VoiceAnalysisBucket.stress_sum),
+                func.sum(VoiceAnalysisBucket.anxiety_sum),
+                func.sum(VoiceAnalysisBucket.depression_sum),
+                func.sum(VoiceAnalysisBucket.concern_count),
+            ).where(*conditions)
+        )).one()
+
+    count, stress_sum, anxiety_sum, depression_sum, concern_count = totals
+    count = count or 0
+
+    def _average(total) -> float:
+        return round((total or 0) / count, 2) if count else 0
+
+    return {
+        "resolution": resolution,
+        "analyses": points,
+        "statistics": {
+            "total_analyses": count,
+            "average_stress": _average(stress_sum),
+            "average_anxiety": _average(anxiety_sum),
+            "average_depression": _average(depression_sum),
+            "concern_events": concern_count or 0,
+            "monitoring_hours": hours
+        }
+    }
+
+
+class ContinuousAnalysisBuffer:
+    """
+    상시 모니터링 쓰기 버퍼
+
+    요청마다 INSERT/COMMIT 하지 않고 샘플을 메모리에 모았다가
+    max_rows에 도달하거나 flush_interval이 지나면 테이블별 다중 행 INSERT 한 번으로 저장한다.
+    묶음 저장이 실패하면 한 행씩 다시 저장해, 저장할 수 없는 행(삭제된 사용자 등)만 버린다.
+    앱 종료 시 남은 샘플을 모두 저장한다.
+    """
+
+    def __init__(
+        self,
+        max_rows: int = settings.CONTINUOUS_BUFFER_MAX_ROWS,
+        flush_interval: float = settings.CONTINUOUS_BUFFER_FLUSH_SECONDS,
+    ):
+        self.max_rows = max_rows
+        self.flush_interval = flush_interval
+        self._analyses: List[Dict[str, Any]] = []
+        self._notifications: List[Dict[str, Any]] = []
+        self._lock = asyncio.Lock()
+        self._task: Optional[asyncio.Task] = None
+        self._flushed_rows = 0
+        self._flushes = 0
+        self._failed_flushes = 0
+        self._dropped_rows = 0
+
+    async def add(self, user_id: int, samples: List[ContinuousAnalysisData]) -> int:
+        """
+        샘플을 버퍼에 추가
+
+        Returns:
+            생성된 우려 알림 수
+        """
+        alerts = 0
+        for sample in samples:
+            analysis, notification = build_rows(user_id, sample)
+            self._analyses.append(analysis)
+            if notification:
+                self._notifications.append(notification)
+                alerts += 1
+
+        # 백그라운드 루프가 없으면(테스트, 스크립트) 즉시 저장
+        if self._task is None or len(self._analyses) >= self.max_rows:
+            await self.flush()
+        return alerts
+
+    async def flush(self):
+        """버퍼에 모인 행을 한 트랜잭션으로 저장"""
+        async with self._lock:
+            analyses, self._analyses = self._analyses, []
+            notifications, self._notifications = self._notifications, []
+            if not analyses and not notifications:
+                return
+
+            try:
+                async with AsyncSessionLocal() as db:
+                    if analyses:
+                        await db.execute(insert(VoiceHealthAnalysis), analyses)
+                        await upsert_buckets(db, build_bucket_rows(analyses))
+                    if notifications:
+                        await db.execute(insert(HealthNotification), notifications)
+                    await db.commit()
+            except Exception as e:
+                print(f"Continuous analysis flush error: {e}")
+                self._failed_flushes += 1
+                await self._flush_rows(analyses, notifications)
+                return
+
+            self._flushes += 1
+            self._flushed_rows += len(analyses) + len(notifications)
+
+    async def _flush_rows(self, analyses: List[Dict[str, Any]], notifications: List[Dict[str, Any]]):
+        """묶음 저장 실패 시 한 행씩 저장 (잠금을 잡은 상태에서 호출)
+
+        제약 조건 위반 등 그 행의 문제면 버리고, DB 연결 오류처럼 행과 무관한 실패면
+        남은 행을 다음 주기에 다시 시도한다.
+        """
+        rows = [(VoiceHealthAnalysis, row) for row in analyses]
+        rows += [(HealthNotification, row) for row in notifications]
+        for index, (model, row) in enumerate(rows):
+            try:
+                async with AsyncSessionLocal() as db:
+                    await db.execute(insert(model), [row])
+                    if model is VoiceHealthAnalysis:
+                        await upsert_buckets(db, build_bucket_rows([row]))
+                    await db.commit()
+            except (IntegrityError, DataError) as e:
+                print(f"Continuous analysis row dropped (user {row['user_id']}): {e}")
+                self._dropped_rows += 1
+                continue
+            except Exception as e:
+                print(f"Continuous analysis flush error: {e}")
+                # 버퍼가 무한히 커지지 않도록 최대 max_rows * 10개 유지
+                limit = self.max_rows * 10
+                remaining = rows[index:]
+                self._analyses = ([r for m, r in remaining if m is VoiceHealthAnalysis] + self._analyses)[-limit:]
+                self._notifications = ([r for m, r in remaining if m is HealthNotification] + self._notifications)[-limit:]
+                return
+            self._flushed_rows += 1
+
+    async def _run(self):
+        last_pruned = 0.0
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            await self.flush()
+
+            # 보존 기간 정리는 한 시간에 한 번
+            if time.monotonic() - last_pruned >= 3600:
+                last_pruned = time.monotonic()
+                try:
+                    async with AsyncSessionLocal() as db:
+                        await prune_expired(db)
+                        await db.commit()
+                except Exception as e:
+                    print(f"Continuous analysis prune error: {e}")
+
+    def start(self):
+        """주기적 저장 루프 시작 (앱 시작 시)"""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        """루프 종료 후 남은 샘플 저장 (앱 종료 시)"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.flush()
+
+    def metrics(self) -> Dict[str, Any]:
+        return {
+            "pending_analyses": len(self._analyses),
+            "pending_notifications": len(self._notifications),
+            "flushes": self._flushes,
+            "failed_flushes": self._failed_flushes,
+            "dropped_rows": self._dropped_rows,
+            "flushed_rows": self._flushed_rows,
+        }
+
+
+# 싱글톤 인스턴스
+_continuous_buffer = None
+
+
+def get_continuous_buffer() -> ContinuousAnalysisBuffer:
+    """ContinuousAnalysisBuffer 싱글톤 인스턴스 반환"""
+    global _continuous_buffer
+    if _continuous_buffer is None:
+        _continuous_buffer = ContinuousAnalysisBuffer()
+    return _continuous_buffer
@@ -0,0 +1,346 @@
+"""일별 집계(rollup) 서비스 - 통계 조회 시 원본 기록 대신 일별 합계를 읽음
+
+수면 기록, 건강 기록, 질병 진행 로그가 flush될 때 영향받은 (사용자, 대상, 날짜)
+행만 원본에서 다시 계산해 daily_rollups 테이블에 반영한다.
+삭제 시에도 최소/최대값을 정확히 유지하기 위해 증감 대신 해당 날짜를 재계산한다.
+같은 날짜를 동시에 갱신해도 충돌하지 않도록 INSERT ... ON CONFLICT DO UPDATE로 반영한다.
+"""
+from datetime import date, datetime, time, timedelta
+from itertools import chain
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import delete, event, func, insert, inspect, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from ..models.daily_rollup import DailyRollup
+from ..models.disease import DiseaseProgressLog
+from ..models.health_record import HealthRecord, RecordType
+from ..models.sleep import SleepRecord
+
+
+class RollupSource:
+    """집계 대상 테이블 정의"""
+
+    def __init__(self, name: str, model, time_column: str, metrics: List[str],
+                 subject_column: Optional[str] = None):
+        self.name = name
+        self.model = model
+        self.time_column = time_column
+        self.metrics = metrics
+        self.subject_column = subject_column
+
+    def subject_of(self, value) -> str:
+        """대상 컬럼 값을 rollup의 subject 문자열로 변환"""
+        if value is None:
+            return ""
+        return value.value if isinstance(value, RecordType) else str(value)
+
+    def subject_clause(self, subject: Optional[str]):
+        if self.subject_column is None or subject is None:
+            return None
+        column = getattr(self.model, self.subject_column)
+        if self.subject_column == "record_type":
+            return column == RecordType(subject)
+        return column == int(subject)
+
+    def affected_keys(self, obj) -> set:
+        """객체 변경으로 다시 계산해야 하는 (user_id, subject, day) 목록"""
+        state = inspect(obj)
+        watched = ["user_id", self.time_column]
+        if self.subject_column:
+            watched.append(self.subject_column)
+
+        current = {name: getattr(obj, name) for name in watched}
+        versions = [current]
+        # 날짜나 대상이 바뀐 경우 이전 날짜 행도 다시 계산
+        previous = dict(current)
+        for name in watched:
+            history = state.attrs[name].history
+            if history.deleted:
+                previous[name] = history.deleted[0]
+        if previous != current:
+            versions.append(previous)
+
+        keys = set()
+        for values in versions:
+            moment = values[self.time_column]
+            if values["user_id"] is None or moment is None:
+                continue
+            subject = self.subject_of(values.get(self.subject_column)) if self.subject_column else ""
+            keys.add((values["user_id"], subject, moment.date()))
+        return keys
+
+
+ROLLUP_SOURCES: Dict[str, RollupSource] = {
+    "sleep": RollupSource(
+        "sleep", SleepRecord, "sleep_start",
+        ["duration_hours", "sleep_quality", "deep_sleep_hours", "rem_sleep_hours"],
+    ),
+    "health": RollupSource(
+        "health", HealthRecord, "measured_at", ["value"], subject_column="record_type",
+    ),
+    "disease_progress": RollupSource(
+        "disease_progress", DiseaseProgressLog, "log_date", ["improvement_score"],
+        subject_column="disease_record_id",
+    ),
+}
+
+_SOURCES_BY_MODEL = {source.model: source for source in ROLLUP_SOURCES.values()}
+
+
+def _aggregate_columns(source: RollupSource) -> list:
+    columns = []
+    for metric in source.metrics:
+        column = getattr(source.model, metric)
+        columns += [func.count(column), func.sum(column), func.min(column), func.max(column)]
+    return columns
+
+
+def _raw_conditions(source: RollupSource, user_id: int, subject: Optional[str],
+                    start: datetime, end: Optional[datetime] = None) -> list:
+    time_column = getattr(source.model, source.time_column)
+    conditions = [source.model.user_id == user_id, time_column >= start]
+    if end is not None:
+        conditions.append(time_column < end)
+    subject_clause = source.subject_clause(subject)
+    if subject_clause is not None:
+        conditions.append(subject_clause)
+    return conditions
+
+
+def _unpack(source: RollupSource, row) -> Dict[str, Dict[str, Any]]:
+    """집계 결과 행을 {metric: {count, total, min, max}} 형태로 변환"""
+    totals = {}
+    for i, metric in enumerate(source.metrics):
+        count, total, min_value, max_value = row[i * 4:i * 4 + 4]
+        if count:
+            totals[metric] = {
+                "count": count,
+                "total": float(total),
+                "min": float(min_value),
+                "max": float(max_value),
+            }
+    return totals
+
+
+def _rollup_rows(source: RollupSource, user_id: int, subject: str, day: date,
+                 totals_by_metric: Dict[str, Dict[str, Any]]) -> List[Dict[str, Any]]:
+    return [
+        {
+            "user_id": user_id,
+            "source": source.name,
+            "subject": subject,
+            "metric": metric,
+            "day": day,
+            "count": totals["count"],
+            "total": totals["total"],
+            "min_value": totals["min"],
+            "max_value": totals["max"],
+        }
+        for metric, totals in totals_by_metric.items()
+    ]
+
+
+def refresh_day(connection, source: RollupSource, user_id: int, subject: str, day: date):
+    """원본 기록에서 하루치 집계를 다시 계산 (동기 커넥션)"""
+    start = datetime.combine(day, time.min)
+    row = connection.execute(
+        select(*_aggregate_columns(source)).where(
+            *_raw_conditions(source, user_id, subject if source.subject_column else None,
+                             start, start + timedelta(days=1))
+        )
+    ).one()
+
+    values = _rollup_rows(source, user_id, subject, day, _unpack(source, row))
+
+    # 기록이 모두 삭제된 지표의 행만 지움 (없는 행 삭제는 동시에 실행돼도 충돌하지 않음)
+    stale = delete(DailyRollup).where(
+        DailyRollup.user_id == user_id,
+        DailyRollup.source == source.name,
+        DailyRollup.subject == subject,
+        DailyRollup.day == day,
+    )
+    if values:
+        stale = stale.where(DailyRollup.metric.not_in([value["metric"] for value in values]))
+    connection.execute(stale)
+
+    if values:
+        connection.execute(_upsert(connection), values)
+
+
+def _upsert(connection):
+    """(user_id, source, subject, metric, day)가 이미 있으면 집계 값을 덮어쓰는 INSERT"""
+    if connection.dialect.name == "postgresql":
+        statement = postgresql.insert(DailyRollup)
+    else:
+        statement = sqlite.insert(DailyRollup)
+
+    excluded = statement.excluded
+    return statement.on_conflict_do_update(
+        index_elements=["user_id", "source", "subject", "metric", "day"],
+        set_={
+            "count": excluded["count"],
+            "total": excluded.total,
+            "min_value": excluded.min_value,
+            "max_value": excluded.max_value,
+        },
+    )
+
+
+def rebuild_all(connection):
+    """원본 기록 전체에서 집계를 다시 생성 (마이그레이션, 대량 적재 후 사용)
+
+    ORM flush를 거치지 않는 대량 INSERT는 이벤트가 실행되지 않으므로 이 함수로 보정한다.
+    """
+    for source in ROLLUP_SOURCES.values():
+        connection.execute(delete(DailyRollup).where(DailyRollup.source == source.name))
+
+        time_column = getattr(source.model, source.time_column)
+        day_column = func.date(time_column)
+        key_columns = [source.model.user_id, day_column]
+        if source.subject_column:
+            key_columns.append(getattr(source.model, source.subject_column))
+
+        rows = connection.execute(
+            select(*key_columns, *_aggregate_columns(source)).group_by(*key_columns)
+        ).all()
+
+        values = []
+        for row in rows:
+            user_id, day = row[0], row[1]
+            if isinstance(day, str):
+                day = date.fromisoformat(day)
+            subject = source.subject_of(row[2]) if source.subject_column else ""
+            values += _rollup_rows(
+                source, user_id, subject, day, _unpack(source, row[len(key_columns):])
+            )
+        if values:
+            connection.execute(insert(DailyRollup), values)
+
+
+@event.listens_for(Session, "after_flush")
+def _refresh_rollups(session: Session, flush_context):
+    """flush된 원본 기록의 날짜별 집계 갱신 (같은 트랜잭션 안에서 실행)"""
+    keys = set()
+    for obj in chain(session.new, session.dirty, session.deleted):
+        source = _SOURCES_BY_MODEL.get(type(obj))
+        if source is None:
+            continue
+        if obj in session.dirty and not session.is_modified(obj):
+            continue
+        keys.update((source,) + key for key in source.affected_keys(obj))
+
+    if not keys:
+        return
+
+    connection = session.connection()
+    for source, user_id, subject, day in keys:
+        refresh_day(connection, source, user_id, subject, day)
+
+
+async def _partial_day(db: AsyncSession, source: RollupSource, user_id: int,
+                       subject: Optional[str], start: datetime) -> Dict[str, Dict[str, Any]]:
+    """기간 시작일(하루 중간부터 시작)은 원본에서 직접 집계"""
+    next_day = datetime.combine(start.date(), time.min) + timedelta(days=1)
+    result = await db.execute(
+        select(*_aggregate_columns(source)).where(
+            *_raw_conditions(source, user_id, subject, start, next_day)
+        )
+    )
+    return _unpack(source, result.one())
+
+
+def _rollup_conditions(source: RollupSource, user_id: int, subject: Optional[str],
+                       start: datetime) -> list:
+    conditions = [
+        DailyRollup.user_id == user_id,
+        DailyRollup.source == source.name,
+        DailyRollup.day > start.date(),
+    ]
+    if subject is not None:
+        conditions.append(DailyRollup.subject == subject)
+    return conditions
+
+
+def _merge(target: Dict[str, Any], other: Dict[str, Any]) -> Dict[str, Any]:
+    if not target:
+        return dict(other)
+    return {
+        "count": target["count"] + other["count"],
+        "total": target["total"] + other["total"],
+        "min": min(target["min"], other["min"]),
+        "max": max(target["max"], other["max"]),
+    }
+
+
+async def window_totals(db: AsyncSession, source_name: str, user_id: int,
+                        start: datetime, subject: Optional[str] = None) -> Dict[str, Dict[str, Any]]:
+    """
+    start 이후 기록의 지표별 합계
+
+    Returns:
+        {
+            'duration_hours': {'count': 7, 'total': 49.5, 'min': 5.5, 'max': 8.0},
+            ...
+        }
+        기록이 없는 지표는 포함되지 않는다.
+    """
+    source = ROLLUP_SOURCES[source_name]
+    totals = await _partial_day(db, source, user_id, subject, start)
+
+    result = await db.execute(
+        select(
+            DailyRollup.metric,
+            func.sum(DailyRollup.count),
+            func.sum(DailyRollup.total),
+            func.min(DailyRollup.min_value),
+            func.max(DailyRollup.max_value),
+        )
+        .where(*_rollup_conditions(source, user_id, subject, start))
+        .group_by(DailyRollup.metric)
+    )
+    for metric, count, total, min_value, max_value in result.all():
+        totals[metric] = _merge(totals.get(metric), {
+            "count": count, "total": total, "min": min_value, "max": max_value,
+        })
+    return totals
+
+
+async def daily_series(db: AsyncSession, source_name: str, user_id: int, metric: str,
+                       start: datetime, subject: Optional[str] = None) -> List[Dict[str, Any]]:
+    """start 이후 날짜별 집계 (날짜 오름차순, 기간 일수만큼의 행)"""
+    source = ROLLUP_SOURCES[source_name]
+    series: Dict[date, Dict[str, Any]] = {}
+
+    first_day = (await _partial_day(db, source, user_id, subject, start)).get(metric)
+    if first_day:
+        series[start.date()] = first_day
+
+    result = await db.execute(
+        select(
+            DailyRollup.day,
+            func.sum(DailyRollup.count),
+            func.sum(DailyRollup.total),
+            func.min(DailyRollup.min_value),
+            func.max(DailyRollup.max_value),
+        )
+        .where(
+            *_rollup_conditions(source, user_id, subject, start),
+            DailyRollup.metric == metric,
+        )
+        .group_by(DailyRollup.day)
+        .order_by(DailyRollup.day)
+    )
+    for day, count, total, min_value, max_value in result.all():
+        series[day] = {"count": count, "total": total, "min": min_value, "max": max_value}
+
+    return [dict(day=day, **values) for day, values in sorted(series.items())]
+
+
+def average(totals: Optional[Dict[str, Any]]) -> float:
+    """합계 딕셔너리의 평균 (기록이 없으면 0)"""
+    if not totals or not totals["count"]:
+        return 0
+    return totals["total"] / totals["count"]
@@ -0,0 +1,217 @@
+"""응급 키워드 감지기 - LLM 호출 전에 로컬에서 응급 상황을 즉시 판별"""
+import re
+import unicodedata
+from collections import deque
+from typing import Dict, List, Optional
+
+
+# 응급 유형별 키워드 (한국어/영어). 공백을 제거한 형태로 매칭하므로
+# "가슴 통증", "가슴통증" 모두 같은 키워드로 잡힌다.
+# 영어 키워드는 단어 경계에서만 인정하고("backstroke"의 stroke 제외),
+# 부정 표현("가슴 통증은 없어요", "no chest pain")이 붙은 키워드는 감지하지 않는다.
+# 부정이 키워드 의미의 일부인 경우는 키워드에 포함한다 (예: "피가멈추지않").
+EMERGENCY_KEYWORDS: Dict[str, List[str]] = {
+    "chest_pain": [
+        "가슴통증", "가슴이아파", "가슴이아프", "가슴이조여", "가슴이답답", "흉통",
+        "심장이아파", "심근경색", "심장마비",
+        "chestpain", "heartattack", "chesttightness",
+    ],
+    "breathing": [
+        "호흡곤란", "숨이안쉬어", "숨을못쉬", "숨쉬기힘들", "숨쉬기가힘들", "숨이막혀",
+        "숨이차서", "질식",
+        "cantbreathe", "can'tbreathe", "shortnessofbreath", "difficultybreathing", "choking",
+    ],
+    "consciousness": [
+        "의식을잃", "의식이없", "의식소실", "기절", "실신", "쓰러졌", "쓰러짐", "발작",
+        "unconscious", "passedout", "fainted", "seizure",
+    ],
+    "bleeding": [
+        "심한출혈", "피가안멈", "피가멈추지않", "피를토", "각혈", "토혈",
+        "severebleeding", "won'tstopbleeding", "vomitingblood",
+    ],
+    "stroke": [
+        "극심한두통", "머리가깨질", "마비", "말이어눌", "얼굴이한쪽",
+        "worstheadache", "stroke", "slurredspeech",
+    ],
+    "self_harm": [
+        "자살", "자해", "죽고싶", "죽어버리", "살기싫", "목숨을끊", "손목을긋",
+        "suicide", "killmyself", "selfharm", "wanttodie", "endmylife",
+    ],
+}
+
+EMERGENCY_GUIDANCE = """⚠️ 응급 상황일 수 있습니다.
+
+지금 바로 119에 연락하거나 가까운 응급실을 방문하세요.
+혼자 계시다면 주변 사람에게 도움을 요청하세요.
+
+AI 상담 내용은 이어서 안내해드리지만, 응급 처치를 늦추지 마세요."""
+
+SELF_HARM_GUIDANCE = """⚠️ 지금 많이 힘드신 것 같아요. 혼자 견디지 않으셔도 됩니다.
+
+- 자살예방 상담전화: ☎1393 (24시간)
+- 정신건강 위기상담: ☎1577-0199
+- 위급한 상황이면 즉시 119에 연락하세요.
+
+AI 상담 내용은 이어서 안내해드릴게요."""
+
+
+# 부정 표현은 무시하면 안 되는 유형 (놓치는 쪽이 훨씬 위험)
+NEGATION_EXEMPT = {"self_harm"}
+
+# 한국어: 키워드 바로 뒤 서술어가 부정인 경우만 인정 ("통증은 없어요", "아프지 않아요", "마비는 아니고",
+# "기절은 안 했어요", "기절할 것 같지는 않은데"). 창 안 아무 곳의 부정어가 아니라 키워드에 이어지는
+# 조사/어미 다음에 부정어가 와야 하므로 "통증이 없어지지 않아요", "흉통이 없던 적이 없어요",
+# "실신했어요 아니 진짜로" 같은 문장은 부정으로 보지 않는다.
+KOREAN_NEGATION = re.compile(
+    r"^(은|는|이|가|도|을|를)?"
+    r"(할|한|될|된)?(것같|적이?)?"
+    r"(전혀|별로|딱히)?"
+    r"(지|진|질)?(는|도|은)?"
+    r"(없(?!어지|던)(어|다|습|음|고|는)|아니|않|안(했|해|한|됐|났|함))"
+)
+KOREAN_NEGATION_WINDOW = 12  # 공백 제외 글자 수
+# 영어: 키워드 앞 몇 단어 안에 오는 부정어 ("no chest pain", "I don't have chest pain")
+ENGLISH_NEGATION = re.compile(r"\b(no|not|without|never|denies|deny|denied|don't|doesn't|didn't|haven't|hasn't)\b")
+ENGLISH_NEGATION_WORDS = 3
+CLAUSE_BREAK = re.compile(r"[.,;:!?\n]|\bbut\b|지만|는데")
+
+
+def _fold(text: str) -> str:
+    """매칭용 정규화 (NFKC, 소문자, 둥근 작은따옴표 통일) - 글자 위치는 유지"""
+    return unicodedata.normalize("NFKC", text).lower().replace("\u2019", "'")
+
+
+def _normalize(text: str) -> str:
+    """키워드 정규화 (_fold + 공백 제거)"""
+    return "".join(_fold(text).split())
+
+
+def _is_word_char(char: str) -> bool:
+    return char.isascii() and (char.isalnum() or char == "'")
+
+
+def _negated(folded: str, start: int, end: int, english: bool) -> bool:
+    """folded[start:end]의 키워드가 같은 절 안의 부정어로 부정되는지"""
+    if english:
+        before = CLAUSE_BREAK.split(folded[max(start - 40, 0):start])[-1]
+        words = before.split()[-ENGLISH_NEGATION_WORDS:]
+        return bool(ENGLISH_NEGATION.search(" ".join(words)))
+
+    after = CLAUSE_BREAK.split(folded[end:end + KOREAN_NEGATION_WINDOW * 3])[0]
+    after = "".join(after.split())[:KOREAN_NEGATION_WINDOW]
+    return bool(KOREAN_NEGATION.match(after))
+
+
+class EmergencyKeywordDetector:
+    """
+    Aho-Corasick 오토마톤 기반 다중 패턴 매처
+
+    모든 키워드를 하나의 오토마톤으로 미리 컴파일하므로
+    메시지 길이에 비례하는 한 번의 스캔으로 전체 키워드를 검사한다.
+    후보가 나오면 원문 위치에서 단어 경계와 부정 표현을 확인한다.
+    """
+
+    def __init__(self, keywords: Dict[str, List[str]] = EMERGENCY_KEYWORDS):
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[List[tuple]] = [[]]
+
+        for category, words in keywords.items():
+            for word in words:
+                self._add(_normalize(word), category)
+        self._build_failure_links()
+
+    def _add(self, word: str, category: str):
+        state = 0
+        for char in word:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][char] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+            state = next_state
+        self._output[state].append((category, word))
+
+    def _build_failure_links(self):
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[next_state] = self._goto[fallback].get(char, 0)
+                self._output[next_state] += self._output[self._fail[next_state]]
+
+    def find_all(self, text: str) -> List[tuple]:
+        """메시지에 포함된 모든 (응급 유형, 키워드) 반환 (단어 경계가 아니거나 부정된 키워드 제외)"""
+        goto, fail, output = self._goto, self._fail, self._output
+        folded = _fold(text)
+        # 공백을 뺀 글자별 원문(folded) 위치
+        positions = [index for index, char in enumerate(folded) if not char.isspace()]
+
+        matches = []
+        state = 0
+        for position, index in enumerate(positions):
+            char = folded[index]
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            for category, word in output[state]:
+                start, end = positions[position - len(word) + 1], index + 1
+                if self._accept(folded, start, end, category, word):
+                    matches.append((category, word))
+        return matches
+
+    @staticmethod
+    def _accept(folded: str, start: int, end: int, category: str, word: str) -> bool:
+        english = word.isascii()
+        if english and (
+            (start > 0 and _is_word_char(folded[start - 1]))
+            or (end < len(folded) and _is_word_char(folded[end]))
+        ):
+            return False
+        return category in NEGATION_EXEMPT or not _negated(folded, start, end, english)
+
+    def detect(self, text: str) -> Optional[Dict[str, str]]:
+        """
+        응급 키워드 감지
+
+        Returns:
+            감지되지 않으면 None, 감지되면
+            {
+                'category': 'chest_pain',
+                'keyword': '가슴통증',
+                'urgency_level': 'emergency',
+                'guidance': '...'
+            }
+            자해 관련 키워드는 다른 유형보다 우선한다.
+        """
+        matches = self.find_all(text)
+        if not matches:
+            return None
+
+        category, keyword = next(
+            (m for m in matches if m[0] == "self_harm"), matches[0]
+        )
+        return {
+            "category": category,
+            "keyword": keyword,
+            "urgency_level": "emergency",
+            "guidance": SELF_HARM_GUIDANCE if category == "self_harm" else EMERGENCY_GUIDANCE,
+        }
+
+
+# 싱글톤 인스턴스
+_emergency_detector = None
+
+
+def get_emergency_detector() -> EmergencyKeywordDetector:
+    """EmergencyKeywordDetector 싱글톤 인스턴스 반환"""
+    global _emergency_detector
+    if _emergency_detector is None:
+        _emergency_detector = EmergencyKeywordDetector()
+    return _emergency_detector
@@ -3,6 +3,7 @@ import google.generativeai as genai
 from typing import Dict
 import os
 import json
+from .llm_gateway import get_llm_gateway
 
 
 class EmotionAnalyzer:
@@ -81,7 +82,7 @@ class EmotionAnalyzer:
 - analysis는 한국어로 간단히 설명"""
 
         try:
-            response = self.model.generate_content(prompt)
+            response = await get_llm_gateway().generate(self.model, prompt)
             result_text = response.text.strip()
 
             # JSON 파싱 (마크다운 코드 블록 제거)
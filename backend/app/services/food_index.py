@@ -0,0 +1,287 @@
+"""음식 영양 DB 색인 - food_items를 메모리에 올려 음식명 유사 검색과 영양소 합계를 LLM 없이 계산
+
+음식명은 한글을 자모로 분해한 3-gram으로 색인하므로 띄어쓰기, 받침 오타("김치찌게"), 일부 누락에도 찾을 수 있다.
+"""
+import re
+import unicodedata
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..config import settings
+from ..models.nutrition import FoodItem
+
+# 합계를 계산하는 영양소 컬럼 (food_items 기준 제공량당 값)
+NUTRIENT_COLUMNS = [
+    "calories", "protein", "carbohydrates", "fat", "fiber", "sugar",
+    "sodium", "cholesterol", "saturated_fat",
+    "vitamin_a", "vitamin_c", "vitamin_d", "vitamin_b12",
+    "calcium", "iron", "potassium", "magnesium",
+]
+
+# 섭취량 표기: 무게 단위는 g으로 환산, 그 외 단위는 1인분(기준 제공량) 개수로 취급
+GRAM_UNITS = {"g": 1.0, "그램": 1.0, "kg": 1000.0, "ml": 1.0}
+SERVING_UNITS = ["인분", "공기", "그릇", "접시", "조각", "개", "컵", "잔", "봉지", "캔", "장"]
+NUMBER_WORDS = {"반": 0.5, "한": 1.0, "하나": 1.0, "두": 2.0, "둘": 2.0, "세": 3.0, "셋": 3.0, "네": 4.0, "넷": 4.0}
+
+_UNIT_PATTERN = "|".join(sorted(list(GRAM_UNITS) + SERVING_UNITS, key=len, reverse=True))
+QUANTITY_PATTERN = re.compile(
+    rf"(\d+(?:\.\d+)?|(?<![가-힣])(?:{'|'.join(sorted(NUMBER_WORDS, key=len, reverse=True))}))"
+    rf"\s*({_UNIT_PATTERN})(?![가-힣a-z])"
+    rf"|(?<!\S)(\d+(?:\.\d+)?)\s*$",
+    re.IGNORECASE,
+)
+SEGMENT_SEPARATOR = re.compile(r"[,，\n;+/]|\s그리고\s|(?:이랑|랑|하고)\s+")
+
+
+def to_jamo(text: str) -> str:
+    """한글 음절을 초성/중성/종성 자모로 분해 (그 외 문자는 그대로)"""
+    chars = []
+    for char in text:
+        code = ord(char) - 0xAC00
+        if 0 <= code < 11172:
+            chars.append(chr(0x1100 + code // 588))
+            chars.append(chr(0x1161 + (code % 588) // 28))
+            if code % 28:
+                chars.append(chr(0x11A7 + code % 28))
+        else:
+            chars.append(char)
+    return "".join(chars)
+
+
+def normalize_name(name: str) -> str:
+    """비교용 음식명 (공백/문장부호 제거, 소문자)"""
+    name = unicodedata.normalize("NFC", name).lower()
+    return "".join(char for char in name if char.isalnum())
+
+
+def name_grams(name: str, n: int = 3) -> List[str]:
+    """자모 n-gram 집합 (앞뒤 경계 문자를 붙여 짧은 이름도 gram이 생기도록 함)"""
+    jamo = f"^{to_jamo(normalize_name(name))}$"
+    if len(jamo) <= n:
+        return [jamo]
+    return sorted({jamo[i:i + n] for i in range(len(jamo) - n + 1)})
+
+
+def parse_meal_text(text: str) -> List[Tuple[str, Optional[float], float]]:
+    """
+    식사 설명 문장을 음식별로 분리
+
+    예) "김치찌개 1인분, 공기밥 210g, 계란 두 개"
+        -> [("김치찌개", None, 1.0), ("공기밥", 210.0, 1.0), ("계란", None, 2.0)]
+
+    Returns:
+        [(음식명, 섭취량 g 또는 None, 인분 수)]
+    """
+    items = []
+    for segment in SEGMENT_SEPARATOR.split(text):
+        segment = segment.strip()
+        if not segment:
+            continue
+
+        grams = None
+        servings = 1.0
+        match = QUANTITY_PATTERN.search(segment)
+        if match:
+            amount_text, unit, bare_amount = match.groups()
+            if bare_amount is not None:
+                servings = float(bare_amount)
+            else:
+                amount = NUMBER_WORDS.get(amount_text) or float(amount_text)
+                if unit.lower() in GRAM_UNITS:
+                    grams = amount * GRAM_UNITS[unit.lower()]
+                else:
+                    servings = amount
+            segment = (segment[:match.start()] + " " + segment[match.end():]).strip()
+
+        if normalize_name(segment):
+            items.append((segment, grams, servings))
+    return items
+
+
+class FoodIndex:
+    """
+    food_items 메모리 색인
+
+    - 이름 검색: 자모 3-gram 역색인에서 후보별 공통 gram 수를 np.bincount로 세고 Dice 계수로 순위
+    - 영양소 합계: 음식별 1g당 영양소 행렬에 섭취량 벡터를 곱해 한 번에 계산
+    색인은 load() 때 통째로 새로 만들어 교체한다.
+    """
+
+    def __init__(self, min_score: float = settings.FOOD_MATCH_MIN_SCORE):
+        self.min_score = min_score
+        self._foods: List[Dict[str, Any]] = []
+        self._exact: Dict[str, int] = {}
+        self._postings: Dict[str, np.ndarray] = {}
+        self._name_food = np.zeros(0, dtype=np.int64)  # 이름 항목 -> 음식 위치
+        self._name_gram_counts = np.zeros(0, dtype=np.int64)
+        self._per_gram = np.zeros((0, len(NUTRIENT_COLUMNS)))
+
+    @property
+    def size(self) -> int:
+        return len(self._foods)
+
+    async def load(self, db: AsyncSession):
+        """food_items 전체를 읽어 색인 재구성"""
+        result = await db.execute(select(FoodItem).order_by(FoodItem.id))
+        items = result.scalars().all()
+
+        foods = []
+        exact: Dict[str, int] = {}
+        postings: Dict[str, List[int]] = {}
+        name_food: List[int] = []
+        name_gram_counts: List[int] = []
+        per_gram = np.zeros((len(items), len(NUTRIENT_COLUMNS)))
+
+        for position, item in enumerate(items):
+            serving_size = item.serving_size or 100.0
+            foods.append({
+                "food_id": item.id,
+                "food_name": item.food_name,
+                "serving_size": serving_size,
+                "allergens": item.allergens or [],
+            })
+            per_gram[position] = [
+                (getattr(item, column) or 0.0) / serving_size for column in NUTRIENT_COLUMNS
+            ]
+
+            for name in (item.food_name, item.food_name_en):
+                if not name or not normalize_name(name):
+                    continue
+                exact.setdefault(normalize_name(name), position)
+                grams = name_grams(name)
+                for gram in grams:
+                    postings.setdefault(gram, []).append(len(name_food))
+                name_food.append(position)
+                name_gram_counts.append(len(grams))
+
+        # 대기 없이 한 번에 교체하므로 조회 중인 요청은 이전/새 색인 중 하나만 봄
+        self._foods = foods
+        self._exact = exact
+        self._postings = {gram: np.array(ids, dtype=np.int64) for gram, ids in postings.items()}
+        self._name_food = np.array(name_food, dtype=np.int64)
+        self._name_gram_counts = np.array(name_gram_counts, dtype=np.int64)
+        self._per_gram = per_gram
+
+    def _rank(self, query: str, limit: int) -> List[Tuple[int, float]]:
+        """(음식 위치, 점수) 점수 높은 순, 음식별 최고 점수 하나"""
+        normalized = normalize_name(query)
+        if not normalized or not self._foods:
+            return []
+
+        grams = name_grams(query)
+        hits = [self._postings[gram] for gram in grams if gram in self._postings]
+        if not hits:
+            return []
+
+        shared = np.bincount(np.concatenate(hits), minlength=len(self._name_food))
+        scores = 2.0 * shared / (len(grams) + self._name_gram_counts)
+
+        # 이름 항목 점수를 음식 단위 최고 점수로 모음 (한글명/영문명)
+        food_scores = np.zeros(len(self._foods))
+        np.maximum.at(food_scores, self._name_food, scores)
+        if normalized in self._exact:
+            food_scores[self._exact[normalized]] = 1.0
+
+        count = min(limit, len(food_scores))
+        top = np.argpartition(-food_scores, count - 1)[:count]
+        top = top[np.argsort(-food_scores[top])]
+        return [
+            (int(position), round(float(food_scores[position]), 3))
+            for position in top
+            if food_scores[position] > 0
+        ]
+
+    def search(self, query: str, limit: int = 5) -> List[Dict[str, Any]]:
+        """음식명 유사 검색"""
+        return [
+            dict(self._foods[position], score=score)
+            for position, score in self._rank(query, limit)
+        ]
+
+    def _match(self, name: str) -> Optional[Tuple[int, float]]:
+        ranked = self._rank(name, limit=1)
+        if ranked and ranked[0][1] >= self.min_score:
+            return ranked[0]
+        return None
+
+    def match(self, name: str) -> Optional[Dict[str, Any]]:
+        """가장 비슷한 음식 (min_score 미만이면 None)"""
+        matched = self._match(name)
+        if matched is None:
+            return None
+        position, score = matched
+        return dict(self._foods[position], score=score)
+
+    def estimate(self, portions: List[Tuple[str, Optional[float], float]]) -> Dict[str, Any]:
+        """
+        음식별 섭취량으로 영양소 합계 계산
+
+        Args:
+            portions: [(음식명, 섭취량 g 또는 None, 인분 수)] - g이 없으면 기준 제공량 × 인분 수
+
+        Returns:
+            {"items": [...], "unmatched": [음식명], "totals": {영양소: 값}, "allergens": [...]}
+        """
+        items = []
+        unmatched = []
+        positions = []
+        weights = []
+        for name, grams, servings in portions:
+            matched = self._match(name)
+            if matched is None:
+                unmatched.append(name)
+                continue
+            position, score = matched
+            food = self._foods[position]
+            grams = grams if grams is not None else food["serving_size"] * servings
+            positions.append(position)
+            weights.append(grams)
+            items.append({
+                "name": name,
+                "food_id": food["food_id"],
+                "food_name": food["food_name"],
+                "score": score,
+                "grams": round(grams, 1),
+            })
+
+        if positions:
+            nutrients = np.asarray(weights)[:, None] * self._per_gram[positions]
+            for item, row in zip(items, nutrients):
+                item.update(self._round(row[:4]))
+            totals = self._round(nutrients.sum(axis=0))
+        else:
+            totals = self._round(np.zeros(len(NUTRIENT_COLUMNS)))
+
+        allergens = sorted({
+            allergen
+            for position in positions
+            for allergen in self._foods[position]["allergens"]
+        })
+        return {"items": items, "unmatched": unmatched, "totals": totals, "allergens": allergens}
+
+    @staticmethod
+    def _round(values: np.ndarray) -> Dict[str, float]:
+        return {column: round(float(value), 1) for column, value in zip(NUTRIENT_COLUMNS, values)}
+
+    def metrics(self) -> Dict[str, Any]:
+        return {
+            "foods": len(self._foods),
+            "names": len(self._name_food),
+            "grams": len(self._postings),
+            "min_score": self.min_score,
+        }
+
+
+# 싱글톤 인스턴스
+_food_index = None
+
+
+def get_food_index() -> FoodIndex:
+    """FoodIndex 싱글톤 인스턴스 반환"""
+    global _food_index
+    if _food_index is None:
+        _food_index = FoodIndex()
+    return _food_index
@@ -0,0 +1,339 @@
+"""건강 스케줄 저장소 - 조회 시 Gemini를 호출하지 않고 저장된 스케줄을 내려줌
+
+- 조회: 저장된 스케줄을 바로 반환하고, 오래됐거나(stale) 없으면 백그라운드 재생성을 예약
+- 입력 데이터(복약, 수면, 식단, 프로필)가 flush되면 해당 사용자 스케줄을 stale로 표시하고
+  잠시 모았다가(debounce) 재생성한다.
+- 재생성 전 입력 데이터 해시를 비교해 실제로 바뀐 게 없으면 Gemini를 호출하지 않는다.
+"""
+import asyncio
+import hashlib
+import json
+import time
+from datetime import date, datetime, timedelta
+from itertools import chain
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from sqlalchemy import delete, event, func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from ..config import settings
+from ..database import AsyncSessionLocal
+from ..models.health_schedule import HealthSchedule
+from ..models.meal import Meal
+from ..models.medication import Medication
+from ..models.sleep import SleepRecord
+from ..models.user import User
+from .ai_health_scheduler import get_health_scheduler
+from .daily_rollup import average, window_totals
+
+# 스케줄 생성에 쓰이는 입력 데이터 모델 (변경 시 재생성)
+SCHEDULE_INPUT_MODELS = (Medication, SleepRecord, Meal, User)
+
+
+async def collect_inputs(db: AsyncSession, user: User) -> Tuple[Dict, List[Dict]]:
+    """스케줄 생성 입력 (사용자 정보, 최근 건강 기록 요약)"""
+    user_data = {
+        "age": user.age,
+        "gender": user.gender.value if user.gender else None,
+        "chronic_conditions": user.chronic_conditions,
+        "allergies": user.allergies,
+    }
+
+    today = date.today().isoformat()
+    since = datetime.utcnow() - timedelta(days=7)
+    health_history = []
+
+    result = await db.execute(
+        select(Medication)
+        .where(Medication.user_id == user.id, Medication.is_active.is_(True))
+        .order_by(Medication.id)
+    )
+    for medication in result.scalars().all():
+        times = [
+            moment.strftime("%H:%M")
+            for moment in (medication.time_morning, medication.time_afternoon, medication.time_evening)
+            if moment is not None
+        ]
+        health_history.append({
+            "type": "medication",
+            "date": medication.start_date.date().isoformat(),
+            "description": " ".join(
+                [medication.medication_name, medication.dosage, medication.frequency] + times
+            ),
+        })
+
+    sleep = await window_totals(db, "sleep", user.id, since)
+    if sleep.get("duration_hours"):
+        health_history.append({
+            "type": "sleep",
+            "date": today,
+            "description": (
+                f"최근 7일 {sleep['duration_hours']['count']}회, "
+                f"평균 {average(sleep['duration_hours']):.1f}시간, "
+                f"수면 질 {average(sleep.get('sleep_quality')):.1f}/10"
+            ),
+        })
+
+    meal_count, meal_calories = (await db.execute(
+        select(func.count(Meal.id), func.avg(Meal.calories))
+        .where(Meal.user_id == user.id, Meal.meal_date >= since)
+    )).one()
+    if meal_count:
+        description = f"최근 7일 식사 기록 {meal_count}회"
+        if meal_calories:
+            description += f", 끼니당 평균 {meal_calories:.0f}kcal"
+        health_history.append({"type": "meal", "date": today, "description": description})
+
+    return user_data, health_history
+
+
+def input_fingerprint(user_data: Dict, health_history: List[Dict]) -> str:
+    payload = json.dumps([user_data, health_history], sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _is_expired(row: HealthSchedule) -> bool:
+    return row.generated_at < datetime.utcnow() - timedelta(hours=settings.HEALTH_SCHEDULE_TTL_HOURS)
+
+
+async def _latest(db: AsyncSession, user_id: int) -> Optional[HealthSchedule]:
+    result = await db.execute(
+        select(HealthSchedule)
+        .where(HealthSchedule.user_id == user_id)
+        .order_by(HealthSchedule.generated_at.desc())
+        .limit(1)
+    )
+    return result.scalar_one_or_none()
+
+
+async def read_schedule(db: AsyncSession, user_id: int, days_ahead: int) -> Dict[str, Any]:
+    """
+    저장된 스케줄 조회 (Gemini 호출 없음)
+
+    Returns:
+        {
+            'user_id': 1,
+            'generated_at': '...' 또는 None,
+            'status': 'fresh' | 'stale' | 'pending',
+            'schedule': [...]  # 저장본에 없는 날짜는 기본 스케줄로 채움
+        }
+    """
+    refresher = get_schedule_refresher()
+    default = get_health_scheduler().generate_default_schedule(days_ahead)
+    row = await _latest(db, user_id)
+
+    if row is None:
+        refresher.enqueue(user_id, days=days_ahead)
+        return {"user_id": user_id, "generated_at": None, "status": "pending", "schedule": default}
+
+    stored = {day.get("date"): day for day in row.schedule if isinstance(day, dict)}
+    schedule = [stored.get(day["date"], day) for day in default]
+    covered = all(day["date"] in stored for day in default)
+
+    status = "fresh"
+    if row.is_stale or not covered or _is_expired(row):
+        refresher.enqueue(user_id, days=days_ahead)
+        status = "stale"
+
+    return {
+        "user_id": user_id,
+        "generated_at": row.generated_at.isoformat(),
+        "status": status,
+        "schedule": schedule,
+    }
+
+
+class ScheduleRefresher:
+    """
+    스케줄 재생성 백그라운드 작업
+
+    사용자별로 예약 시각을 하나만 두어 짧은 시간 안의 여러 변경은 한 번의 생성으로 합친다.
+    Gemini 호출 동시 실행 수를 제한하고, 실패한 사용자는 일정 시간 재시도하지 않는다.
+    """
+
+    def __init__(
+        self,
+        days: int = settings.HEALTH_SCHEDULE_DAYS,
+        debounce: float = settings.HEALTH_SCHEDULE_DEBOUNCE_SECONDS,
+        retry_after: float = settings.HEALTH_SCHEDULE_RETRY_SECONDS,
+        concurrency: int = settings.HEALTH_SCHEDULE_CONCURRENCY,
+    ):
+        self.days = days
+        self.debounce = debounce
+        self.retry_after = retry_after
+        self.concurrency = concurrency
+        self._pending: Dict[int, Tuple[float, int]] = {}  # user_id -> (예약 시각, 생성 일수)
+        self._in_flight: Set[int] = set()
+        self._retry_at: Dict[int, float] = {}
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self._workers: Set[asyncio.Task] = set()
+        self._generated = 0
+        self._unchanged = 0
+        self._failed = 0
+
+    def enqueue(self, user_id: int, delay: float = 0.0, days: Optional[int] = None):
+        """재생성 예약 (이미 예약돼 있으면 더 이른 시각과 더 긴 기간으로 합침)"""
+        now = time.monotonic()
+        if self._retry_at.get(user_id, 0.0) > now:
+            return
+
+        days = max(days or 0, self.days)
+        due, pending_days = self._pending.get(user_id, (float("inf"), 0))
+        self._pending[user_id] = (min(due, now + delay), max(days, pending_days))
+        self._wakeup.set()
+
+    async def refresh(self, user_id: int, days: int):
+        """입력 데이터가 바뀌었거나 기간이 부족할 때만 Gemini로 재생성"""
+        async with AsyncSessionLocal() as db:
+            user = await db.get(User, user_id)
+            if user is None:
+                return
+
+            user_data, health_history = await collect_inputs(db, user)
+            fingerprint = input_fingerprint(user_data, health_history)
+            row = await _latest(db, user_id)
+
+            if (
+                row is not None
+                and row.input_fingerprint == fingerprint
+                and row.start_date == date.today()
+                and row.days >= days
+                and not _is_expired(row)
+            ):
+                if row.is_stale:
+                    row.is_stale = False
+                    await db.commit()
+                self._unchanged += 1
+                return
+
+            try:
+                schedule = await get_health_scheduler().request_schedule(
+                    user_data=user_data, health_history=health_history, days_ahead=days
+                )
+            except Exception as e:
+                print(f"스케줄 재생성 오류 (user {user_id}): {e}")
+                self._failed += 1
+                self._retry_at[user_id] = time.monotonic() + self.retry_after
+                return
+
+            await db.execute(delete(HealthSchedule).where(HealthSchedule.user_id == user_id))
+            db.add(HealthSchedule(
+                user_id=user_id,
+                start_date=date.today(),
+                days=days,
+                schedule=schedule,
+                input_fingerprint=fingerprint,
+            ))
+            await db.commit()
+            self._retry_at.pop(user_id, None)
+            self._generated += 1
+
+    async def _work(self, user_id: int, days: int, semaphore: asyncio.Semaphore):
+        try:
+            async with semaphore:
+                await self.refresh(user_id, days)
+        except Exception as e:
+            print(f"스케줄 재생성 작업 오류 (user {user_id}): {e}")
+        finally:
+            self._in_flight.discard(user_id)
+            self._wakeup.set()
+
+    async def _run(self):
+        semaphore = asyncio.Semaphore(self.concurrency)
+        while True:
+            now = time.monotonic()
+            for user_id, (due, days) in list(self._pending.items()):
+                # 같은 사용자는 동시에 한 번만 생성 (진행 중이면 끝난 뒤 다시 확인)
+                if due > now or user_id in self._in_flight:
+                    continue
+                del self._pending[user_id]
+                self._in_flight.add(user_id)
+                worker = asyncio.create_task(self._work(user_id, days, semaphore))
+                self._workers.add(worker)
+                worker.add_done_callback(self._workers.discard)
+
+            waiting = [due for user_id, (due, _) in self._pending.items() if user_id not in self._in_flight]
+            timeout = max(min(waiting) - now, 0.0) if waiting else None
+            self._wakeup.clear()
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+
+    def start(self):
+        """재생성 루프 시작 (앱 시작 시)"""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        """루프와 진행 중인 생성 작업 종료 (앱 종료 시)"""
+        tasks = list(self._workers)
+        if self._task is not None:
+            tasks.append(self._task)
+            self._task = None
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def metrics(self) -> Dict[str, Any]:
+        return {
+            "pending": len(self._pending),
+            "in_flight": len(self._in_flight),
+            "generated": self._generated,
+            "unchanged": self._unchanged,
+            "failed": self._failed,
+        }
+
+
+@event.listens_for(Session, "after_flush")
+def _mark_schedules_stale(session: Session, flush_context):
+    """입력 데이터가 바뀐 사용자의 스케줄을 stale로 표시 (같은 트랜잭션 안에서 실행)"""
+    user_ids = set()
+    for obj in chain(session.new, session.dirty, session.deleted):
+        if not isinstance(obj, SCHEDULE_INPUT_MODELS):
+            continue
+        if obj in session.dirty and not session.is_modified(obj):
+            continue
+        user_id = obj.id if isinstance(obj, User) else obj.user_id
+        if user_id is not None:
+            user_ids.add(user_id)
+
+    if not user_ids:
+        return
+
+    session.connection().execute(
+        update(HealthSchedule)
+        .where(HealthSchedule.user_id.in_(user_ids), HealthSchedule.is_stale.is_(False))
+        .values(is_stale=True)
+    )
+    session.info.setdefault("stale_schedule_users", set()).update(user_ids)
+
+
+@event.listens_for(Session, "after_commit")
+def _enqueue_stale_schedules(session: Session):
+    """커밋된 변경만 재생성 예약 (debounce 후 실행)"""
+    user_ids = session.info.pop("stale_schedule_users", None)
+    if not user_ids:
+        return
+    refresher = get_schedule_refresher()
+    for user_id in user_ids:
+        refresher.enqueue(user_id, delay=refresher.debounce)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_stale_schedules(session: Session):
+    session.info.pop("stale_schedule_users", None)
+
+
+# 싱글톤 인스턴스
+_schedule_refresher = None
+
+
+def get_schedule_refresher() -> ScheduleRefresher:
+    """ScheduleRefresher 싱글톤 인스턴스 반환"""
+    global _schedule_refresher
+    if _schedule_refresher is None:
+        _schedule_refresher = ScheduleRefresher()
+    return _schedule_refresher
@@ -0,0 +1,151 @@
+"""이미지 전처리 파이프라인 - Gemini Vision 전송 전 축소/재인코딩 및 목록용 썸네일 생성
+
+Pillow 디코딩/리사이즈는 CPU 작업이므로 별도 프로세스 풀에서 실행해 이벤트 루프를 막지 않는다.
+"""
+import asyncio
+import math
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from io import BytesIO
+from typing import Optional, Tuple
+
+from PIL import Image, ImageOps
+
+from ..config import settings
+
+MIME_TYPES = {
+    "JPEG": "image/jpeg",
+    "WEBP": "image/webp",
+}
+
+
+def _load(data: bytes, target: Tuple[int, int]) -> Image.Image:
+    """디코딩 + EXIF 회전 적용 (JPEG는 draft로 목표 크기에 가깝게 축소 디코딩)"""
+    image = Image.open(BytesIO(data))
+    image.draft("RGB", target)
+    image = ImageOps.exif_transpose(image)
+    if image.mode != "RGB":
+        image = image.convert("RGB")
+    return image
+
+
+def _encode(image: Image.Image, fmt: str, quality: int) -> Tuple[bytes, str]:
+    """EXIF 등 메타데이터 없이 재인코딩"""
+    out = BytesIO()
+    image.save(out, format=fmt, quality=quality, optimize=True)
+    return out.getvalue(), MIME_TYPES[fmt]
+
+
+def resize_for_vision(data: bytes, max_pixels: int, fmt: str, quality: int) -> Tuple[bytes, str]:
+    """
+    총 픽셀 수가 max_pixels 이하가 되도록 비율 유지 축소 후 재인코딩
+
+    Returns:
+        (이미지 바이트, MIME 타입)
+    """
+    with Image.open(BytesIO(data)) as probe:
+        width, height = probe.size
+    scale = min(1.0, math.sqrt(max_pixels / (width * height)))
+    target = (max(1, int(width * scale)), max(1, int(height * scale)))
+
+    image = _load(data, target)
+    if image.width * image.height > max_pixels:
+        scale = math.sqrt(max_pixels / (image.width * image.height))
+        image = image.resize(
+            (max(1, int(image.width * scale)), max(1, int(image.height * scale))),
+            Image.LANCZOS,
+        )
+    return _encode(image, fmt, quality)
+
+
+def make_thumbnail(data: bytes, size: int, fmt: str, quality: int) -> Tuple[bytes, str]:
+    """긴 변이 size 이하인 목록용 썸네일"""
+    image = _load(data, (size, size))
+    image.thumbnail((size, size), Image.LANCZOS)
+    return _encode(image, fmt, quality)
+
+
+def difference_hash(data: bytes, hash_size: int = 8) -> int:
+    """
+    dHash (hash_size² 비트) - 가까운 이미지일수록 해밍 거리가 작음
+
+    회색조 (hash_size+1)×hash_size로 줄인 뒤 가로로 이웃한 픽셀의 밝기 비교 결과를 비트로 사용한다.
+    재압축/축소/약간의 밝기 차이에는 거의 변하지 않는다.
+    """
+    image = Image.open(BytesIO(data))
+    image.draft("L", (hash_size * 8, hash_size * 8))
+    image = ImageOps.exif_transpose(image).convert("L")
+    pixels = list(image.resize((hash_size + 1, hash_size), Image.LANCZOS).getdata())
+
+    value = 0
+    for row in range(hash_size):
+        offset = row * (hash_size + 1)
+        for col in range(hash_size):
+            value = (value << 1) | (pixels[offset + col] > pixels[offset + col + 1])
+    return value
+
+
+class ImagePipeline:
+    """
+    이미지 전처리 프로세스 풀
+
+    워커는 첫 요청 시 spawn 방식으로 생성한다
+    (스레드를 가진 서버 프로세스를 fork하지 않기 위함).
+    """
+
+    def __init__(self, workers: int = settings.IMAGE_PIPELINE_WORKERS):
+        self.workers = workers
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    def _pool(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return self._executor
+
+    async def _run(self, func, *args):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._pool(), func, *args)
+
+    async def prepare_for_vision(self, data: bytes) -> Tuple[bytes, str]:
+        """Gemini Vision 전송용 이미지 (픽셀 수 상한, 메타데이터 제거)"""
+        return await self._run(
+            resize_for_vision,
+            data,
+            settings.VISION_IMAGE_MAX_PIXELS,
+            settings.VISION_IMAGE_FORMAT,
+            settings.VISION_IMAGE_QUALITY,
+        )
+
+    async def thumbnail(self, data: bytes) -> Tuple[bytes, str]:
+        """목록용 썸네일"""
+        return await self._run(
+            make_thumbnail,
+            data,
+            settings.THUMBNAIL_SIZE,
+            settings.VISION_IMAGE_FORMAT,
+            settings.VISION_IMAGE_QUALITY,
+        )
+
+    async def perceptual_hash(self, data: bytes) -> int:
+        """중복 분석 판별용 64비트 dHash"""
+        return await self._run(difference_hash, data)
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+# 싱글톤 인스턴스
+_image_pipeline = None
+
+
+def get_image_pipeline() -> ImagePipeline:
+    """ImagePipeline 싱글톤 인스턴스 반환"""
+    global _image_pipeline
+    if _image_pipeline is None:
+        _image_pipeline = ImagePipeline()
+    return _image_pipeline
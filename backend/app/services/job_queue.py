@@ -0,0 +1,410 @@
+"""백그라운드 작업 큐 - Gemini 호출처럼 오래 걸리는 작업을 요청과 분리해 앱 프로세스 안에서 실행
+
+- 작업은 jobs 테이블에 저장되므로 서버가 재시작되어도 대기 중인 작업이 사라지지 않는다.
+- 작업 종류별로 동시 실행 수를 제한하고, 실패하면 지수 백오프로 재시도한다.
+- 여러 워커 프로세스가 같은 DB를 쓰더라도 조건부 UPDATE로 작업을 가져가므로 한 번만 실행된다.
+- 끝나면 건강 알림(health_notifications)을 남기고, 같은 프로세스에서 기다리는 조회 요청을 깨운다.
+"""
+import asyncio
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, Awaitable, Callable, Dict, Optional, Set
+
+from sqlalchemy import delete, event, func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from ..config import settings
+from ..database import AsyncSessionLocal
+from ..models.job import Job, JobStatus
+from ..models.voice_health import HealthNotification
+
+JobFunction = Callable[[Dict[str, Any]], Awaitable[Optional[Dict[str, Any]]]]
+# (payload, 마지막 오류) -> 실패한 작업의 결과로 남길 dict
+FailureFunction = Callable[[Dict[str, Any], str], Awaitable[Optional[Dict[str, Any]]]]
+
+# 실행 중 상태가 이 시간 넘게 이어지면 프로세스가 죽은 것으로 보고 다시 대기열에 넣음
+# (시도 횟수를 다 쓴 작업은 프로세스를 죽이거나 멈추게 하는 작업일 수 있으므로 실패 처리)
+LEASE_FACTOR = 2
+LEASE_EXPIRED_ERROR = "실행 중 중단됨 (작업 프로세스 종료 또는 응답 없음)"
+MAINTENANCE_INTERVAL = timedelta(minutes=10)
+
+
+@dataclass
+class JobHandler:
+    func: JobFunction
+    title: str  # 알림 제목에 쓰는 작업 이름 (예: "식단 분석")
+    concurrency: int
+    notify: bool = True  # 끝나면 건강 알림 생성 (내부 유지보수 작업은 False)
+    on_failure: Optional[FailureFunction] = None  # 마지막 시도까지 실패하면 폴백 저장
+
+
+class JobQueue:
+    """
+    작업 실행 루프
+
+    핸들러는 payload(dict)를 받아 결과(dict, JSON 저장 가능)를 반환하는 비동기 함수이며,
+    예외를 던지면 실패로 보고 max_attempts까지 재시도한다.
+    폴백 결과는 핸들러 안에서 만들지 말고 on_failure()로 등록해 마지막 시도가 실패한 뒤에만 저장한다.
+    """
+
+    def __init__(
+        self,
+        default_concurrency: int = settings.JOB_DEFAULT_CONCURRENCY,
+        concurrency: Optional[Dict[str, int]] = None,
+        max_attempts: int = settings.JOB_MAX_ATTEMPTS,
+        retry_base: float = settings.JOB_RETRY_BASE_SECONDS,
+        retry_max: float = settings.JOB_RETRY_MAX_SECONDS,
+        timeout: float = settings.JOB_TIMEOUT_SECONDS,
+        poll_interval: float = settings.JOB_POLL_SECONDS,
+        retention_days: int = settings.JOB_RETENTION_DAYS,
+    ):
+        self.default_concurrency = default_concurrency
+        self.concurrency = settings.JOB_CONCURRENCY if concurrency is None else concurrency
+        self.max_attempts = max_attempts
+        self.retry_base = retry_base
+        self.retry_max = retry_max
+        self.timeout = timeout
+        self.poll_interval = poll_interval
+        self.retention_days = retention_days
+        self._handlers: Dict[str, JobHandler] = {}
+        self._running: Dict[str, int] = {}
+        self._waiters: Dict[int, asyncio.Event] = {}
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self._workers: Set[asyncio.Task] = set()
+        self._last_maintenance = datetime.min
+        self._done = 0
+        self._failed = 0
+        self._retried = 0
+
+    def register(
+        self,
+        job_type: str,
+        func: JobFunction,
+        title: str,
+        concurrency: Optional[int] = None,
+        notify: bool = True,
+    ):
+        """작업 종류 등록 (동시 실행 수는 인자 > JOB_CONCURRENCY > 기본값 순)"""
+        if concurrency is None:
+            concurrency = self.concurrency.get(job_type, self.default_concurrency)
+        self._handlers[job_type] = JobHandler(func, title, max(concurrency, 1), notify)
+        self._running.setdefault(job_type, 0)
+
+    def handler(self, job_type: str, title: str, concurrency: Optional[int] = None, notify: bool = True):
+        """register()의 데코레이터 형태"""
+        def decorator(func: JobFunction) -> JobFunction:
+            self.register(job_type, func, title, concurrency, notify)
+            return func
+        return decorator
+
+    def on_failure(self, job_type: str):
+        """마지막 시도까지 실패한 작업의 폴백 처리 함수 등록 (데코레이터, 반환값은 작업 결과로 저장)"""
+        def decorator(func: FailureFunction) -> FailureFunction:
+            self._handlers[job_type].on_failure = func
+            return func
+        return decorator
+
+    def enqueue(
+        self,
+        db: AsyncSession,
+        user_id: int,
+        job_type: str,
+        payload: Dict[str, Any],
+        max_attempts: Optional[int] = None,
+    ) -> Job:
+        """
+        작업 추가 (호출한 쪽의 트랜잭션과 함께 커밋되며, 커밋되면 실행 루프를 깨움)
+
+        Raises:
+            ValueError: 등록되지 않은 작업 종류
+        """
+        if job_type not in self._handlers:
+            raise ValueError(f"등록되지 않은 작업 종류입니다: {job_type}")
+
+        job = Job(
+            user_id=user_id,
+            job_type=job_type,
+            status=JobStatus.QUEUED.value,
+            payload=payload,
+            attempts=0,
+            max_attempts=max_attempts or self.max_attempts,
+            run_after=datetime.utcnow(),
+        )
+        db.add(job)
+        db.info["jobs_enqueued"] = True
+        return job
+
+    def wake(self):
+        self._wakeup.set()
+
+    async def wait(self, job_id: int, timeout: float):
+        """작업이 끝나거나 timeout이 지날 때까지 대기 (이 프로세스에서 실행된 작업만 바로 깨어남)"""
+        waiter = self._waiters.setdefault(job_id, asyncio.Event())
+        try:
+            await asyncio.wait_for(waiter.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            if self._waiters.get(job_id) is waiter and not waiter.is_set():
+                self._waiters.pop(job_id, None)
+
+    def _backoff(self, attempts: int) -> float:
+        return min(self.retry_base * 2 ** max(attempts - 1, 0), self.retry_max)
+
+    async def _maintain(self, db: AsyncSession, now: datetime):
+        """
+        멈춘 작업 복구 (실행 중 프로세스 종료) 및 오래된 완료 작업 삭제
+
+        임대가 만료된 작업은 시도 횟수가 남았으면 다시 대기열에 넣고,
+        다 썼으면 마지막 시도가 실패한 것과 같이 폴백/실패 알림을 남긴다.
+        """
+        lease_expired = now - timedelta(seconds=self.timeout * LEASE_FACTOR)
+        expired = (Job.status == JobStatus.RUNNING.value, Job.started_at < lease_expired)
+        await db.execute(
+            update(Job)
+            .where(*expired, Job.attempts < Job.max_attempts)
+            .values(status=JobStatus.QUEUED.value, run_after=now, error="실행 중 중단되어 다시 대기열에 넣음")
+        )
+
+        exhausted = (await db.execute(
+            select(Job.id, Job.job_type).where(
+                *expired, Job.attempts >= Job.max_attempts, Job.job_type.in_(list(self._handlers))
+            )
+        )).all()
+        abandoned = []
+        for job_id, job_type in exhausted:
+            # 임대를 갱신해 다른 프로세스가 같은 작업을 동시에 실패 처리하지 않게 함
+            claimed = await db.execute(
+                update(Job).where(Job.id == job_id, *expired).values(started_at=now)
+            )
+            if claimed.rowcount == 1:
+                abandoned.append((job_id, job_type))
+
+        await db.execute(
+            delete(Job).where(
+                Job.status.in_([JobStatus.DONE.value, JobStatus.FAILED.value]),
+                Job.finished_at < now - timedelta(days=self.retention_days),
+            )
+        )
+        await db.commit()
+
+        for job_id, job_type in abandoned:
+            worker = asyncio.create_task(self._abandon(job_id, self._handlers[job_type]))
+            self._workers.add(worker)
+            worker.add_done_callback(self._workers.discard)
+
+    async def _fallback(
+        self, job_id: int, handler: JobHandler, payload: Dict[str, Any], error: str
+    ) -> Optional[Dict[str, Any]]:
+        """마지막 시도 실패 시 on_failure 실행 -> 작업 결과로 남길 폴백 (없거나 오류 시 None)"""
+        if handler.on_failure is None:
+            return None
+        # 상태를 저장하는 세션을 열기 전에 실행 (SQLite에서 읽기 트랜잭션이 쓰기를 막지 않도록)
+        try:
+            return await handler.on_failure(payload, error)
+        except Exception as e:
+            print(f"작업 폴백 처리 오류 ({job_id}): {e}")
+            return None
+
+    async def _abandon(self, job_id: int, handler: JobHandler):
+        """시도 횟수를 다 쓴 채 임대가 만료된 작업을 실패로 마무리"""
+        try:
+            async with AsyncSessionLocal() as db:
+                payload = (await db.get(Job, job_id)).payload
+
+            result = await self._fallback(job_id, handler, payload, LEASE_EXPIRED_ERROR)
+            await self._finish(job_id, handler, result, LEASE_EXPIRED_ERROR)
+            waiter = self._waiters.pop(job_id, None)
+            if waiter is not None:
+                waiter.set()
+        except Exception as e:
+            print(f"작업 실패 처리 오류 ({job_id}): {e}")
+
+    async def _dispatch(self) -> Optional[datetime]:
+        """실행 가능한 작업을 가져가 실행하고, 다음 재시도 예정 시각 반환"""
+        now = datetime.utcnow()
+        async with AsyncSessionLocal() as db:
+            if now - self._last_maintenance >= MAINTENANCE_INTERVAL:
+                await self._maintain(db, now)
+                self._last_maintenance = now
+
+            for job_type, handler in self._handlers.items():
+                free = handler.concurrency - self._running[job_type]
+                if free <= 0:
+                    continue
+                result = await db.execute(
+                    select(Job.id)
+                    .where(
+                        Job.status == JobStatus.QUEUED.value,
+                        Job.job_type == job_type,
+                        Job.run_after <= now,
+                    )
+                    .order_by(Job.id)
+                    .limit(free)
+                )
+                for job_id in result.scalars().all():
+                    # 다른 프로세스가 먼저 가져갔으면 rowcount 0
+                    claimed = await db.execute(
+                        update(Job)
+                        .where(Job.id == job_id, Job.status == JobStatus.QUEUED.value)
+                        .values(status=JobStatus.RUNNING.value, started_at=now, attempts=Job.attempts + 1)
+                    )
+                    await db.commit()
+                    if claimed.rowcount != 1:
+                        continue
+                    self._running[job_type] += 1
+                    worker = asyncio.create_task(self._execute(job_id, job_type, handler))
+                    self._workers.add(worker)
+                    worker.add_done_callback(self._workers.discard)
+
+            return (await db.execute(
+                select(func.min(Job.run_after)).where(
+                    Job.status == JobStatus.QUEUED.value,
+                    Job.job_type.in_(list(self._handlers)),
+                )
+            )).scalar_one_or_none()
+
+    async def _execute(self, job_id: int, job_type: str, handler: JobHandler):
+        try:
+            async with AsyncSessionLocal() as db:
+                job = await db.get(Job, job_id)
+                payload, last_attempt = job.payload, job.attempts >= job.max_attempts
+
+            try:
+                result = await asyncio.wait_for(handler.func(payload), self.timeout)
+                error = None
+            except asyncio.TimeoutError:
+                result, error = None, f"작업 시간 초과 ({self.timeout:.0f}초)"
+            except Exception as e:
+                result, error = None, str(e) or type(e).__name__
+
+            if error is not None and last_attempt:
+                result = await self._fallback(job_id, handler, payload, error)
+
+            if await self._finish(job_id, handler, result, error):
+                waiter = self._waiters.pop(job_id, None)
+                if waiter is not None:
+                    waiter.set()
+        except Exception as e:
+            # 상태 저장 자체가 실패하면 실행 중으로 남고, 임대 시간이 지나면 _maintain이 다시 대기열에 넣거나 실패 처리
+            print(f"작업 처리 오류 ({job_id}): {e}")
+        finally:
+            self._running[job_type] -= 1
+            self._wakeup.set()
+
+    async def _finish(
+        self, job_id: int, handler: JobHandler, result: Optional[Dict[str, Any]], error: Optional[str]
+    ) -> bool:
+        """실행 결과 저장 (재시도 대기로 돌아가면 False)"""
+        now = datetime.utcnow()
+        async with AsyncSessionLocal() as db:
+            job = await db.get(Job, job_id)
+            if job is None:
+                return True
+
+            if error is None:
+                job.status = JobStatus.DONE.value
+                job.result = result
+                job.error = None
+                job.finished_at = now
+                self._done += 1
+            elif job.attempts < job.max_attempts:
+                job.status = JobStatus.QUEUED.value
+                job.error = error
+                job.run_after = now + timedelta(seconds=self._backoff(job.attempts))
+                self._retried += 1
+                await db.commit()
+                return False
+            else:
+                job.status = JobStatus.FAILED.value
+                job.result = result  # on_failure가 남긴 폴백 결과
+                job.error = error
+                job.finished_at = now
+                self._failed += 1
+
+            if not handler.notify:
+                await db.commit()
+                return True
+
+            db.add(HealthNotification(
+                user_id=job.user_id,
+                notification_type="job_completed" if error is None else "job_failed",
+                title=f"{handler.title} {'완료' if error is None else '실패'}",
+                body=(
+                    f"{handler.title} 결과가 준비되었습니다."
+                    if error is None
+                    else f"{handler.title} 중 오류가 발생했습니다. 잠시 후 다시 시도해주세요."
+                ),
+                category="ai",
+                action_url=f"/api/jobs/{job.id}",
+                action_type="open_page",
+                sent_at=now,
+                is_sent=True,
+            ))
+            await db.commit()
+        return True
+
+    async def _run(self):
+        while True:
+            self._wakeup.clear()
+            timeout = self.poll_interval
+            try:
+                next_due = await self._dispatch()
+                if next_due is not None:
+                    timeout = min(timeout, max((next_due - datetime.utcnow()).total_seconds(), 0.0))
+            except Exception as e:
+                print(f"작업 큐 오류: {e}")
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+
+    def start(self):
+        """실행 루프 시작 (앱 시작 시)"""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        """루프와 실행 중인 작업 종료 (앱 종료 시) - 중단된 작업은 다음 시작 후 임대 만료 시 재실행"""
+        tasks = list(self._workers)
+        if self._task is not None:
+            tasks.append(self._task)
+            self._task = None
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def metrics(self) -> Dict[str, Any]:
+        return {
+            "running": dict(self._running),
+            "concurrency": {job_type: handler.concurrency for job_type, handler in self._handlers.items()},
+            "done": self._done,
+            "failed": self._failed,
+            "retried": self._retried,
+        }
+
+
+@event.listens_for(Session, "after_commit")
+def _wake_job_queue(session: Session):
+    """작업이 커밋되면 바로 실행 루프를 깨움"""
+    if session.info.pop("jobs_enqueued", False):
+        get_job_queue().wake()
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_job_wakeup(session: Session):
+    session.info.pop("jobs_enqueued", None)
+
+
+# 싱글톤 인스턴스
+_job_queue = None
+
+
+def get_job_queue() -> JobQueue:
+    """JobQueue 싱글톤 인스턴스 반환"""
+    global _job_queue
+    if _job_queue is None:
+        _job_queue = JobQueue()
+    return _job_queue
@@ -0,0 +1,214 @@
+"""LLM 게이트웨이 - Gemini 동기 SDK 호출을 이벤트 루프 밖에서 실행"""
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterator, Dict, Optional
+
+from ..config import settings
+
+# 스트리밍 스레드가 종료를 알리는 표식
+_STREAM_END = object()
+
+
+class LLMGateway:
+    """
+    모든 Gemini 호출이 거쳐가는 공용 비동기 게이트웨이
+
+    - 전용 스레드 풀에서 generate_content()를 실행해 이벤트 루프를 막지 않음
+    - 세마포어로 동시 호출 수 제한 (초과분은 대기열에서 대기)
+    - 호출별 타임아웃
+    - 대기열 깊이, 진행 중 호출 수 등 메트릭 수집
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = settings.LLM_MAX_CONCURRENCY,
+        timeout: float = settings.LLM_TIMEOUT_SECONDS,
+    ):
+        self.max_concurrency = max_concurrency
+        self.timeout = timeout
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_concurrency, thread_name_prefix="llm"
+        )
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+
+        # 메트릭
+        self._queued = 0
+        self._in_flight = 0
+        self._peak_queued = 0
+        self._completed = 0
+        self._failed = 0
+        self._timed_out = 0
+        self._total_latency = 0.0
+
+    async def generate(
+        self,
+        model: Any,
+        contents: Any,
+        timeout: Optional[float] = None,
+        **kwargs,
+    ) -> Any:
+        """
+        model.generate_content(contents, **kwargs)를 비동기로 실행
+
+        Args:
+            model: genai.GenerativeModel 인스턴스
+            contents: 프롬프트 (문자열 또는 [프롬프트, 이미지] 리스트)
+            timeout: 호출별 타임아웃 (초, 기본값: LLM_TIMEOUT_SECONDS)
+
+        Raises:
+            asyncio.TimeoutError: 타임아웃 초과 시
+        """
+        return await self.run(model.generate_content, contents, timeout=timeout, **kwargs)
+
+    async def run(self, func, *args, timeout: Optional[float] = None, **kwargs) -> Any:
+        """임의의 동기 LLM 호출을 게이트웨이 스레드 풀에서 실행"""
+        await self._acquire()
+
+        loop = asyncio.get_running_loop()
+        started = time.perf_counter()
+        future = loop.run_in_executor(self._executor, lambda: func(*args, **kwargs))
+        # 타임아웃으로 호출자가 떠나더라도 스레드가 끝날 때까지 슬롯을 점유
+        future.add_done_callback(self._release)
+
+        try:
+            result = await asyncio.wait_for(
+                asyncio.shield(future), timeout or self.timeout
+            )
+        except asyncio.TimeoutError:
+            self._timed_out += 1
+            raise
+        except Exception:
+            self._failed += 1
+            raise
+
+        self._completed += 1
+        self._total_latency += time.perf_counter() - started
+        return result
+
+    async def stream(
+        self,
+        model: Any,
+        contents: Any,
+        timeout: Optional[float] = None,
+        **kwargs,
+    ) -> AsyncIterator[Any]:
+        """
+        model.generate_content(contents, stream=True)의 청크를 도착하는 대로 전달
+
+        SDK의 스트리밍 이터레이터는 게이트웨이 스레드에서 소비하고, 청크는
+        asyncio.Queue를 통해 이벤트 루프로 넘긴다. 타임아웃은 스트림 전체에 적용된다.
+        소비자가 중간에 떠나면(SSE 연결 끊김 등) 다음 청크에서 업스트림 스트림을 닫고 슬롯을 반환한다.
+        """
+        await self._acquire()
+
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue()
+        cancelled = threading.Event()
+
+        def produce():
+            response = None
+            try:
+                response = model.generate_content(contents, stream=True, **kwargs)
+                for chunk in response:
+                    if cancelled.is_set():
+                        break
+                    loop.call_soon_threadsafe(queue.put_nowait, chunk)
+            except Exception as e:
+                if not cancelled.is_set():
+                    loop.call_soon_threadsafe(queue.put_nowait, e)
+            finally:
+                if cancelled.is_set() and response is not None:
+                    _close_stream(response)
+                if not loop.is_closed():
+                    loop.call_soon_threadsafe(queue.put_nowait, _STREAM_END)
+
+        started = time.perf_counter()
+        deadline = loop.time() + (timeout or self.timeout)
+        future = loop.run_in_executor(self._executor, produce)
+        future.add_done_callback(self._release)
+
+        try:
+            while True:
+                item = await asyncio.wait_for(queue.get(), deadline - loop.time())
+                if item is _STREAM_END:
+                    break
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        except asyncio.TimeoutError:
+            self._timed_out += 1
+            raise
+        except Exception:
+            self._failed += 1
+            raise
+        finally:
+            # 정상 종료 후에는 영향 없음. 중간에 닫히면(타임아웃, aclose, 취소) 생산 스레드를 멈춤
+            cancelled.set()
+
+        self._completed += 1
+        self._total_latency += time.perf_counter() - started
+
+    async def _acquire(self):
+        """동시 실행 슬롯 확보 (대기열 깊이 기록)"""
+        self._queued += 1
+        self._peak_queued = max(self._peak_queued, self._queued)
+        try:
+            await self._semaphore.acquire()
+        finally:
+            self._queued -= 1
+        self._in_flight += 1
+
+    def _release(self, future: asyncio.Future):
+        """스레드 종료 시 슬롯 반환"""
+        self._in_flight -= 1
+        self._semaphore.release()
+        # 타임아웃 후 완료된 호출의 예외가 로그에 남지 않도록 회수
+        if not future.cancelled():
+            future.exception()
+
+    def metrics(self) -> Dict[str, Any]:
+        """게이트웨이 메트릭"""
+        return {
+            "max_concurrency": self.max_concurrency,
+            "timeout_seconds": self.timeout,
+            "in_flight": self._in_flight,
+            "queued": self._queued,
+            "peak_queued": self._peak_queued,
+            "completed": self._completed,
+            "failed": self._failed,
+            "timed_out": self._timed_out,
+            "avg_latency_ms": round(
+                self._total_latency / self._completed * 1000, 1
+            ) if self._completed else 0.0,
+        }
+
+
+def _close_stream(response: Any):
+    """
+    소비를 멈춘 SDK 스트리밍 응답의 업스트림 연결 종료
+
+    GenerateContentResponse는 gRPC 스트림(_iterator)을 감싸고 있으며, cancel()로 서버 스트림을 끊는다.
+    """
+    for target in (response, getattr(response, "_iterator", None)):
+        for name in ("cancel", "close"):
+            method = getattr(target, name, None)
+            if callable(method):
+                try:
+                    method()
+                except Exception as e:
+                    print(f"LLM 스트림 종료 오류: {e}")
+                return
+
+
+# 싱글톤 인스턴스
+_llm_gateway = None
+
+
+def get_llm_gateway() -> LLMGateway:
+    """LLMGateway 싱글톤 인스턴스 반환"""
+    global _llm_gateway
+    if _llm_gateway is None:
+        _llm_gateway = LLMGateway()
+    return _llm_gateway
@@ -0,0 +1,207 @@
+"""비슷한 식단 사진의 AI 분석 결과 재사용 - dHash + 다중 색인 해싱 근접 검색"""
+import asyncio
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+from sqlalchemy import select
+
+from ..config import settings
+from ..database import AsyncSessionLocal
+from ..models.meal import MealImageAnalysis
+
+
+def hamming(a: int, b: int) -> int:
+    return (a ^ b).bit_count()
+
+
+class MultiIndexHash:
+    """
+    해밍 거리 근접 검색용 다중 색인 해싱
+
+    hash_bits비트를 radius+1개 구간으로 나누어 구간별로 해시 테이블을 둔다.
+    비둘기집 원리에 따라 거리 radius 이내인 해시는 적어도 한 구간이 정확히 일치하므로,
+    각 구간 값이 같은 후보만 거리를 계산하면 된다 (후보 수 ≈ N / 2^구간비트 × 구간 수).
+    """
+
+    def __init__(self, radius: int, hash_bits: int = 64):
+        self.radius = radius
+        chunks = radius + 1
+        self._chunks = []
+        start = 0
+        for i in range(chunks):
+            width = hash_bits // chunks + (1 if i < hash_bits % chunks else 0)
+            self._chunks.append((start, (1 << width) - 1))
+            start += width
+        self._tables: List[Dict[int, List[int]]] = [{} for _ in self._chunks]
+        self._entries: Dict[int, Tuple[int, Any]] = {}
+        self._next_position = 0
+
+    @property
+    def size(self) -> int:
+        return len(self._entries)
+
+    def add(self, value: int, item: Any) -> int:
+        """항목 추가 후 remove에 쓸 위치 반환"""
+        position = self._next_position
+        self._next_position += 1
+        self._entries[position] = (value, item)
+        for table, (shift, mask) in zip(self._tables, self._chunks):
+            table.setdefault((value >> shift) & mask, []).append(position)
+        return position
+
+    def remove(self, position: int):
+        value, _ = self._entries.pop(position)
+        for table, (shift, mask) in zip(self._tables, self._chunks):
+            key = (value >> shift) & mask
+            bucket = table[key]
+            bucket.remove(position)
+            if not bucket:
+                del table[key]
+
+    def search(self, value: int) -> List[Tuple[int, Any]]:
+        """radius 이내 항목을 (거리, 항목)으로 가까운 순 반환"""
+        seen = set()
+        results = []
+        for table, (shift, mask) in zip(self._tables, self._chunks):
+            for position in table.get((value >> shift) & mask, ()):
+                if position in seen:
+                    continue
+                seen.add(position)
+                candidate, item = self._entries[position]
+                distance = hamming(value, candidate)
+                if distance <= self.radius:
+                    results.append((distance, item))
+        results.sort(key=lambda result: result[0])
+        return results
+
+
+class MealAnalysisIndex:
+    """
+    분석된 식단 사진의 dHash 색인
+
+    (사용자 ID, 식사 종류)별로 다중 색인 해시를 두고, 항목에는 행 ID만 넣어 분석 결과는 적중 시 DB에서 읽는다.
+    분석/추천 문구는 사용자에게 보여 주는 개인 기록이고 식사 종류(아침/점심 등)를 언급하므로
+    같은 사용자의 같은 종류끼리만 재사용한다 (사용자가 없는 예전 행은 색인하지 않음).
+    조회 때마다 마지막으로 읽은 ID 이후의 행만 가져오므로 다른 워커가 저장한 결과도 반영되고,
+    전체 항목이 max_entries를 넘으면 가장 오래된(ID가 작은) 항목부터 하나씩 뺀다.
+    """
+
+    def __init__(
+        self,
+        max_distance: int = settings.MEAL_DEDUP_MAX_DISTANCE,
+        max_entries: int = settings.MEAL_DEDUP_MAX_ENTRIES,
+    ):
+        self.max_distance = max_distance
+        self.max_entries = max_entries
+        self._indexes: Dict[Tuple[int, str], MultiIndexHash] = {}
+        # 추가 순서(행 ID 오름차순)대로 (색인 키, 색인 내 위치)
+        self._order: Deque[Tuple[Tuple[int, str], int]] = deque()
+        self._last_id = 0
+        self._lock = asyncio.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    async def _sync(self, db):
+        """새로 저장된 행을 색인에 추가하고 max_entries를 넘는 오래된 항목 제거"""
+        async with self._lock:
+            result = await db.execute(
+                select(
+                    MealImageAnalysis.id,
+                    MealImageAnalysis.user_id,
+                    MealImageAnalysis.perceptual_hash,
+                    MealImageAnalysis.meal_type,
+                )
+                .where(MealImageAnalysis.id > self._last_id)
+                .order_by(MealImageAnalysis.id.desc())
+                .limit(self.max_entries)
+            )
+            rows = result.all()
+            if not rows:
+                return
+
+            self._last_id = rows[0][0]
+            for row_id, user_id, perceptual_hash, meal_type in reversed(rows):
+                if user_id is None:
+                    continue
+                key = (user_id, meal_type)
+                index = self._indexes.get(key)
+                if index is None:
+                    index = self._indexes[key] = MultiIndexHash(max(self.max_distance, 0))
+                self._order.append((key, index.add(int(perceptual_hash, 16), row_id)))
+
+            while len(self._order) > self.max_entries:
+                key, position = self._order.popleft()
+                index = self._indexes[key]
+                index.remove(position)
+                if not index.size:
+                    del self._indexes[key]
+
+    async def lookup(
+        self, perceptual_hash: int, meal_type: str, user_id: Optional[int]
+    ) -> Optional[Dict[str, Any]]:
+        """같은 사용자가 올린 비슷한 사진의 분석 결과 (없거나 오류 시 None)"""
+        if self.max_distance < 0 or user_id is None:
+            return None
+
+        try:
+            async with AsyncSessionLocal() as db:
+                await self._sync(db)
+                index = self._indexes.get((user_id, meal_type))
+                for distance, row_id in index.search(perceptual_hash) if index else ():
+                    result = await db.get(MealImageAnalysis, row_id)
+                    if result is not None:
+                        self._hits += 1
+                        return dict(result.result, hash_distance=distance)
+        except Exception as e:
+            print(f"식단 사진 색인 조회 오류: {e}")
+            return None
+
+        self._misses += 1
+        return None
+
+    async def record(
+        self,
+        perceptual_hash: int,
+        meal_type: str,
+        user_id: Optional[int],
+        image_hash: Optional[str],
+        result: Dict[str, Any],
+    ):
+        """분석 결과 저장 (다음 조회 시 색인에 반영)"""
+        if self.max_distance < 0 or user_id is None:
+            return
+
+        try:
+            async with AsyncSessionLocal() as db:
+                db.add(MealImageAnalysis(
+                    user_id=user_id,
+                    perceptual_hash=f"{perceptual_hash:016x}",
+                    image_hash=image_hash,
+                    meal_type=meal_type,
+                    result=result,
+                ))
+                await db.commit()
+        except Exception as e:
+            print(f"식단 사진 색인 저장 오류: {e}")
+
+    def metrics(self) -> Dict[str, Any]:
+        lookups = self._hits + self._misses
+        return {
+            "entries": len(self._order),
+            "max_distance": self.max_distance,
+            "hits": self._hits,
+            "misses": self._misses,
+            "hit_rate": round(self._hits / lookups, 4) if lookups else 0.0,
+        }
+
+
+# 싱글톤 인스턴스
+_meal_analysis_index = None
+
+
+def get_meal_analysis_index() -> MealAnalysisIndex:
+    """MealAnalysisIndex 싱글톤 인스턴스 반환"""
+    global _meal_analysis_index
+    if _meal_analysis_index is None:
+        _meal_analysis_index = MealAnalysisIndex()
+    return _meal_analysis_index
@@ -0,0 +1,86 @@
+"""인증 사용자 캐시 - 요청마다 반복되는 사용자 조회(SELECT) 제거"""
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import make_transient_to_detached
+
+from ..config import settings
+from ..models.user import User
+
+
+class PrincipalCache:
+    """
+    user_id별 사용자 컬럼 값을 짧은 TTL 동안 보관하는 LRU 캐시
+
+    ORM 객체 자체를 요청 간에 공유하지 않고 컬럼 값만 저장한 뒤,
+    요청마다 detached 상태의 새 User 인스턴스를 만들어 반환한다.
+    사용자 정보가 수정/삭제되면 SQLAlchemy 이벤트로 즉시 무효화된다.
+    """
+
+    def __init__(
+        self,
+        ttl: int = settings.PRINCIPAL_CACHE_TTL_SECONDS,
+        max_entries: int = settings.PRINCIPAL_CACHE_MAX_ENTRIES,
+    ):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[int, tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, user_id: int) -> Optional[User]:
+        entry = self._entries.get(user_id)
+        if entry is None or entry[0] < time.monotonic():
+            self._entries.pop(user_id, None)
+            self._misses += 1
+            return None
+
+        self._entries.move_to_end(user_id)
+        self._hits += 1
+
+        user = User(**entry[1])
+        make_transient_to_detached(user)
+        return user
+
+    def set(self, user: User):
+        values = {
+            attr.key: getattr(user, attr.key)
+            for attr in inspect(User).column_attrs
+        }
+        self._entries[user.id] = (time.monotonic() + self.ttl, values)
+        self._entries.move_to_end(user.id)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, user_id: int):
+        self._entries.pop(user_id, None)
+
+    def metrics(self) -> Dict[str, Any]:
+        lookups = self._hits + self._misses
+        return {
+            "entries": len(self._entries),
+            "hits": self._hits,
+            "misses": self._misses,
+            "hit_rate": round(self._hits / lookups, 4) if lookups else 0.0,
+        }
+
+
+# 싱글톤 인스턴스
+_principal_cache = None
+
+
+def get_principal_cache() -> PrincipalCache:
+    """PrincipalCache 싱글톤 인스턴스 반환"""
+    global _principal_cache
+    if _principal_cache is None:
+        _principal_cache = PrincipalCache()
+    return _principal_cache
+
+
+@event.listens_for(User, "after_update")
+@event.listens_for(User, "after_delete")
+def _invalidate_user(mapper, connection, target: User):
+    """사용자 정보 변경 시 캐시 무효화"""
+    get_principal_cache().invalidate(target.id)
@@ -0,0 +1,231 @@
+"""AI 응답 캐시 - 반복되는 증상 상담/건강 조언 프롬프트의 Gemini 호출 절감"""
+import hashlib
+import json
+import re
+import time
+import unicodedata
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from ..config import settings
+
+# 측정 항목별 (측정 가능 범위, [(구간 하한, 구간 이름, 캐시 가능 여부), ...])
+# - 구간 경계는 health_advice 프롬프트와 일반적인 임상 기준을 따름
+# - 범위를 벗어나거나 위험 구간인 측정값은 항상 새로 평가
+CLINICAL_RANGES: Dict[str, Tuple[Tuple[float, float], Tuple[Tuple[float, str, bool], ...]]] = {
+    "blood_pressure": ((50, 260), (  # 수축기 mmHg
+        (50, "hypotension", False),
+        (90, "normal", True),
+        (120, "elevated", True),
+        (130, "stage1", True),
+        (140, "stage2", True),
+        (180, "crisis", False),
+    )),
+    "blood_sugar": ((20, 600), (  # 공복 mg/dL
+        (20, "hypoglycemia", False),
+        (70, "normal", True),
+        (100, "prediabetes", True),
+        (126, "diabetes", True),
+        (250, "severe", False),
+    )),
+    "temperature": ((30, 43), (  # °C
+        (30, "hypothermia", False),
+        (35, "low", True),
+        (36.5, "normal", True),
+        (37.6, "mild_fever", True),
+        (38, "fever", True),
+        (39, "high_fever", False),
+    )),
+    "heart_rate": ((20, 250), (  # bpm
+        (20, "severe_bradycardia", False),
+        (40, "bradycardia", True),
+        (60, "normal", True),
+        (101, "tachycardia", True),
+        (130, "severe_tachycardia", False),
+    )),
+    "oxygen_saturation": ((50, 100), (  # %
+        (50, "hypoxemia", False),
+        (92, "low", True),
+        (95, "normal", True),
+    )),
+    "weight": ((1, 400), (  # kg
+        (1, "any", True),
+    )),
+}
+
+
+class InMemoryCacheBackend:
+    """프로세스 내 LRU + TTL 캐시"""
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, tuple[float, Any]]" = OrderedDict()
+
+    async def get(self, key: str) -> Optional[Any]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return value
+
+    async def set(self, key: str, value: Any, ttl: int):
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def size(self) -> int:
+        return len(self._entries)
+
+
+class RedisCacheBackend:
+    """
+    여러 워커가 공유하는 Redis 캐시 (RESPONSE_CACHE_URL 설정 시 사용)
+
+    redis 패키지는 선택 의존성이므로 이 백엔드를 쓸 때만 import한다.
+    LRU 제거는 Redis의 maxmemory-policy(allkeys-lru)에 맡긴다.
+    """
+
+    def __init__(self, url: str, prefix: str = "ai-cache:"):
+        try:
+            import redis.asyncio as redis
+        except ImportError:
+            raise ValueError("RESPONSE_CACHE_URL을 사용하려면 redis 패키지를 설치하세요.")
+
+        self._client = redis.from_url(url)
+        self._prefix = prefix
+
+    async def get(self, key: str) -> Optional[Any]:
+        raw = await self._client.get(self._prefix + key)
+        return json.loads(raw) if raw is not None else None
+
+    async def set(self, key: str, value: Any, ttl: int):
+        await self._client.set(
+            self._prefix + key, json.dumps(value, ensure_ascii=False), ex=ttl
+        )
+
+    def size(self) -> Optional[int]:
+        return None
+
+
+class ResponseCache:
+    """
+    정규화된 프롬프트 + 사용자 컨텍스트 구간을 키로 하는 AI 응답 캐시
+
+    - 공백/대소문자/문장부호 차이는 같은 키로 취급
+    - 나이는 10세 단위로 묶음
+    - 측정값은 항목별 임상 구간 + 소수 첫째 자리로 묶어 판정 기준을 넘나드는 값이 같은 키가 되지 않게 함
+    - 응급도가 emergency/high인 응답, 위험 구간이거나 범위를 벗어난 측정값은 저장하지 않음 (항상 새로 평가)
+    """
+
+    UNCACHEABLE_URGENCY = {"emergency", "high"}
+
+    def __init__(self, backend, ttl: int = settings.RESPONSE_CACHE_TTL_SECONDS):
+        self.backend = backend
+        self.ttl = ttl
+        self._hits = 0
+        self._misses = 0
+        self._bypassed = 0
+
+    @staticmethod
+    def normalize(text: str) -> str:
+        """프롬프트 정규화"""
+        text = unicodedata.normalize("NFKC", text).lower()
+        text = re.sub(r"[^\w\s]", " ", text)
+        return " ".join(text.split())
+
+    @staticmethod
+    def context_bucket(user_context: Optional[Dict]) -> str:
+        """프롬프트에 들어가는 사용자 정보를 구간화"""
+        if not user_context:
+            return "-"
+
+        age = user_context.get("age")
+        age_bucket = f"{age // 10 * 10}s" if age else "-"
+        gender = user_context.get("gender")
+        gender = getattr(gender, "value", gender) or "-"
+        history = user_context.get("medical_history") or "-"
+        return f"{age_bucket}|{gender}|{history}"
+
+    @staticmethod
+    def value_bucket(value: float) -> str:
+        """측정값 구간화 (소수 첫째 자리)"""
+        return f"{value:.1f}"
+
+    @staticmethod
+    def reading_band(record_type: str, value: float) -> Optional[str]:
+        """
+        측정값의 임상 구간 이름
+
+        Returns:
+            구간 이름 (기준이 없는 항목은 "-"), 위험 구간이거나 측정 가능 범위를 벗어나면 None (캐시 금지)
+        """
+        clinical_range = CLINICAL_RANGES.get(record_type.lower())
+        if clinical_range is None:
+            return "-"
+
+        (low, high), bands = clinical_range
+        if not low <= value <= high:
+            return None
+        band, cacheable = None, False
+        for lower, name, name_cacheable in bands:
+            if value < lower:
+                break
+            band, cacheable = name, name_cacheable
+        return band if cacheable else None
+
+    def make_key(self, kind: str, *parts: str) -> str:
+        raw = "\x1f".join((kind,) + parts)
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    async def get(self, key: str) -> Optional[Any]:
+        value = await self.backend.get(key)
+        if value is None:
+            self._misses += 1
+        else:
+            self._hits += 1
+        return value
+
+    def bypass(self):
+        """캐시를 거치지 않은 요청 집계 (위험한 측정값 등)"""
+        self._bypassed += 1
+
+    async def set(self, key: str, value: Any, urgency_level: Optional[str] = None):
+        if urgency_level in self.UNCACHEABLE_URGENCY:
+            self.bypass()
+            return
+        await self.backend.set(key, value, self.ttl)
+
+    def metrics(self) -> Dict[str, Any]:
+        """캐시 적중률 등 메트릭"""
+        lookups = self._hits + self._misses
+        return {
+            "backend": type(self.backend).__name__,
+            "entries": self.backend.size(),
+            "hits": self._hits,
+            "misses": self._misses,
+            "bypassed": self._bypassed,
+            "hit_rate": round(self._hits / lookups, 4) if lookups else 0.0,
+        }
+
+
+# 싱글톤 인스턴스
+_response_cache = None
+
+
+def get_response_cache() -> ResponseCache:
+    """ResponseCache 싱글톤 인스턴스 반환"""
+    global _response_cache
+    if _response_cache is None:
+        if settings.RESPONSE_CACHE_URL:
+            backend = RedisCacheBackend(settings.RESPONSE_CACHE_URL)
+        else:
+            backend = InMemoryCacheBackend(settings.RESPONSE_CACHE_MAX_ENTRIES)
+        _response_cache = ResponseCache(backend)
+    return _response_cache
@@ -1,12 +1,22 @@
 """Google Cloud Speech-to-Text 서비스"""
 import os
+import asyncio
 import base64
 from google.cloud import speech
 from google.oauth2 import service_account
-from typing import Optional, Dict
+from typing import Optional, Dict, Union
 import json
 
 
+def audio_encoding(encoding: str) -> speech.RecognitionConfig.AudioEncoding:
+    """인코딩 문자열을 enum으로 변환 (v1 API에 없는 인코딩은 WEBM_OPUS)"""
+    return getattr(
+        speech.RecognitionConfig.AudioEncoding,
+        encoding,
+        speech.RecognitionConfig.AudioEncoding.WEBM_OPUS,
+    )
+
+
 class SpeechService:
     """음성 텍스트 변환 서비스"""
 
@@ -43,7 +53,7 @@ class SpeechService:
 
     async def transcribe_audio(
         self,
-        audio_content: bytes,
+        audio_content: Union[bytes, memoryview],
         language_code: str = "ko-KR",
         encoding: speech.RecognitionConfig.AudioEncoding = speech.RecognitionConfig.AudioEncoding.WEBM_OPUS,
         sample_rate_hertz: int = 48000,
@@ -52,7 +62,7 @@ class SpeechService:
         음성을 텍스트로 변환
 
         Args:
-            audio_content: 오디오 바이트 데이터
+            audio_content: 오디오 바이트 데이터 (업로드 임시 파일의 memoryview도 가능)
             language_code: 언어 코드 (기본: 한국어)
             encoding: 오디오 인코딩 형식
             sample_rate_hertz: 샘플링 레이트
@@ -74,8 +84,8 @@ class SpeechService:
             }
 
         try:
-            # 오디오 설정
-            audio = speech.RecognitionAudio(content=audio_content)
+            # 오디오 설정 (protobuf 메시지는 bytes만 받으므로 요청 생성 시 한 번만 복사)
+            audio = speech.RecognitionAudio(content=bytes(audio_content))
 
             config = speech.RecognitionConfig(
                 encoding=encoding,
@@ -85,8 +95,8 @@ class SpeechService:
                 model="default",  # 또는 'medical_conversation' (의료 대화 특화)
             )
 
-            # 음성 인식 요청
-            response = self.client.recognize(config=config, audio=audio)
+            # 음성 인식 요청 (블로킹 gRPC 호출이므로 스레드에서 실행)
+            response = await asyncio.to_thread(self.client.recognize, config=config, audio=audio)
 
             # 결과 처리
             if not response.results:
@@ -139,22 +149,10 @@ class SpeechService:
             # Base64 디코딩
             audio_content = base64.b64decode(audio_base64)
 
-            # 인코딩 문자열을 enum으로 변환
-            encoding_map = {
-                "LINEAR16": speech.RecognitionConfig.AudioEncoding.LINEAR16,
-                "WEBM_OPUS": speech.RecognitionConfig.AudioEncoding.WEBM_OPUS,
-                "OGG_OPUS": speech.RecognitionConfig.AudioEncoding.OGG_OPUS,
-                "MP3": speech.RecognitionConfig.AudioEncoding.MP3,
-            }
-            audio_encoding = encoding_map.get(
-                encoding,
-                speech.RecognitionConfig.AudioEncoding.WEBM_OPUS
-            )
-
             return await self.transcribe_audio(
                 audio_content,
                 language_code,
-                audio_encoding,
+                audio_encoding(encoding),
                 sample_rate_hertz
             )
 
@@ -0,0 +1,238 @@
+"""실시간 음성 인식 서비스 - WebSocket으로 받은 오디오 청크를 스트리밍 인식기에 전달
+
+인식기 API(gRPC 스트림)는 블로킹 반복자이므로 전용 스레드 풀에서 실행하고,
+청크는 thread-safe 큐로 넘기며 인식 결과는 이벤트 루프의 asyncio 큐로 돌려받는다.
+"""
+import asyncio
+import queue
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional
+
+from ..config import settings
+
+
+class GoogleStreamingRecognizer:
+    """Google Cloud Speech-to-Text 스트리밍 인식 (중간 결과 포함)"""
+
+    def __init__(self, client, language_code: str, encoding: str, sample_rate_hertz: int):
+        from google.cloud import speech
+
+        self._speech = speech
+        self.client = client
+        self.config = speech.StreamingRecognitionConfig(
+            config=speech.RecognitionConfig(
+                encoding=getattr(
+                    speech.RecognitionConfig.AudioEncoding,
+                    encoding,
+                    speech.RecognitionConfig.AudioEncoding.WEBM_OPUS,
+                ),
+                sample_rate_hertz=sample_rate_hertz,
+                language_code=language_code,
+                enable_automatic_punctuation=True,
+            ),
+            interim_results=True,
+        )
+
+    def recognize(self, chunks: Iterator[bytes]) -> Iterator[Dict[str, Any]]:
+        requests = (self._speech.StreamingRecognizeRequest(audio_content=chunk) for chunk in chunks)
+        for response in self.client.streaming_recognize(config=self.config, requests=requests):
+            for result in response.results:
+                if not result.alternatives:
+                    continue
+                alternative = result.alternatives[0]
+                if result.is_final:
+                    yield {
+                        "type": "final",
+                        "transcript": alternative.transcript,
+                        "confidence": alternative.confidence,
+                    }
+                else:
+                    yield {
+                        "type": "interim",
+                        "transcript": alternative.transcript,
+                        "stability": result.stability,
+                    }
+
+
+class LocalStreamingRecognizer:
+    """
+    오프라인 대체 인식기 (개발/테스트용, STT_STREAMING_BACKEND=local)
+
+    UTF-8 텍스트 청크는 발화 내용으로 보고 단어가 쌓일 때마다 중간 결과를 보내며,
+    스트림이 끝나면 전체를 최종 결과로 보낸다. 실제 오디오(바이너리)는 인식하지 않는다.
+    """
+
+    def __init__(self, language_code: str, encoding: str, sample_rate_hertz: int):
+        self.language_code = language_code
+
+    def recognize(self, chunks: Iterator[bytes]) -> Iterator[Dict[str, Any]]:
+        words: List[str] = []
+        for chunk in chunks:
+            try:
+                text = chunk.decode("utf-8")
+            except UnicodeDecodeError:
+                continue
+            if not text.strip() or not text.isprintable():
+                continue
+            words.extend(text.split())
+            yield {"type": "interim", "transcript": " ".join(words), "stability": 0.5}
+
+        if words:
+            yield {"type": "final", "transcript": " ".join(words), "confidence": 1.0}
+
+
+class StreamingSession:
+    """
+    WebSocket 연결 하나에 대응하는 인식 세션
+
+    send()로 넣은 청크를 워커 스레드의 인식기가 소비하고, events()로 결과를 받는다.
+    """
+
+    def __init__(self, recognizer, max_queued_chunks: int):
+        self.recognizer = recognizer
+        self._chunks: "queue.Queue[Optional[bytes]]" = queue.Queue(maxsize=max_queued_chunks)
+        self._events: "asyncio.Queue[Optional[Dict[str, Any]]]" = asyncio.Queue()
+        self._loop = asyncio.get_running_loop()
+        self._ended = False
+        self.finals: List[str] = []
+
+    def _iter_chunks(self) -> Iterator[bytes]:
+        while True:
+            chunk = self._chunks.get()
+            if chunk is None:
+                return
+            yield chunk
+
+    def _emit(self, event: Optional[Dict[str, Any]]):
+        self._loop.call_soon_threadsafe(self._events.put_nowait, event)
+
+    def run(self):
+        """워커 스레드에서 실행"""
+        try:
+            for event in self.recognizer.recognize(self._iter_chunks()):
+                self._emit(event)
+        except Exception as e:
+            self._emit({"type": "error", "message": f"음성 인식 오류: {e}"})
+        finally:
+            # 인식기가 먼저 끝나도 send()가 막히지 않도록 남은 청크를 비움
+            self._ended = True
+            while True:
+                try:
+                    self._chunks.get_nowait()
+                except queue.Empty:
+                    break
+            self._emit(None)
+
+    def send(self, chunk: bytes) -> bool:
+        """청크 전달 (인식기가 따라오지 못해 큐가 가득 차면 False)"""
+        if self._ended:
+            return True
+        try:
+            self._chunks.put_nowait(chunk)
+        except queue.Full:
+            return False
+        return True
+
+    def end(self):
+        """입력 종료 - 인식기가 남은 결과를 내보내고 끝남"""
+        if self._ended:
+            return
+        self._ended = True
+        try:
+            self._chunks.put_nowait(None)
+        except queue.Full:
+            # 워커가 큐를 비우는 중이면 자리가 날 때까지 기다리지 않고 스레드에서 넣음
+            self._loop.run_in_executor(None, self._chunks.put, None)
+
+    async def events(self) -> AsyncIterator[Dict[str, Any]]:
+        while True:
+            event = await self._events.get()
+            if event is None:
+                return
+            if event["type"] == "final":
+                self.finals.append(event["transcript"])
+            yield event
+
+    @property
+    def transcript(self) -> str:
+        return " ".join(text.strip() for text in self.finals if text.strip())
+
+
+class StreamingSpeechService:
+    """
+    스트리밍 인식 세션 관리
+
+    세션마다 스레드 하나를 쓰므로 동시 세션 수를 STT_STREAM_MAX_SESSIONS로 제한한다.
+    """
+
+    def __init__(
+        self,
+        backend: str = settings.STT_STREAMING_BACKEND,
+        max_sessions: int = settings.STT_STREAM_MAX_SESSIONS,
+        max_queued_chunks: int = 200,
+    ):
+        self.backend = backend
+        self.max_sessions = max_sessions
+        self.max_queued_chunks = max_queued_chunks
+        self._executor = ThreadPoolExecutor(max_workers=max_sessions, thread_name_prefix="stt-stream")
+        self._active = 0
+        self._sessions = 0
+        self._rejected = 0
+
+    def _recognizer(self, language_code: str, encoding: str, sample_rate_hertz: int):
+        if self.backend == "local":
+            return LocalStreamingRecognizer(language_code, encoding, sample_rate_hertz)
+
+        from .speech_service import get_speech_service
+
+        client = get_speech_service().client
+        if client is None:
+            raise ValueError("Google Cloud STT 클라이언트가 초기화되지 않았습니다.")
+        return GoogleStreamingRecognizer(client, language_code, encoding, sample_rate_hertz)
+
+    def open_session(
+        self, language_code: str, encoding: str, sample_rate_hertz: int
+    ) -> Optional[StreamingSession]:
+        """
+        세션 시작 (동시 세션 수 초과 시 None)
+
+        Raises:
+            ValueError: 인식기를 사용할 수 없음
+        """
+        if self._active >= self.max_sessions:
+            self._rejected += 1
+            return None
+
+        session = StreamingSession(
+            self._recognizer(language_code, encoding, sample_rate_hertz),
+            self.max_queued_chunks,
+        )
+        self._active += 1
+        self._sessions += 1
+        future = asyncio.get_running_loop().run_in_executor(self._executor, session.run)
+        future.add_done_callback(self._release)
+        return session
+
+    def _release(self, future):
+        self._active -= 1
+
+    def metrics(self) -> Dict[str, Any]:
+        return {
+            "backend": self.backend,
+            "active": self._active,
+            "max_sessions": self.max_sessions,
+            "sessions": self._sessions,
+            "rejected": self._rejected,
+        }
+
+
+# 싱글톤 인스턴스
+_streaming_speech_service = None
+
+
+def get_streaming_speech_service() -> StreamingSpeechService:
+    """StreamingSpeechService 싱글톤 인스턴스 반환"""
+    global _streaming_speech_service
+    if _streaming_speech_service is None:
+        _streaming_speech_service = StreamingSpeechService()
+    return _streaming_speech_service
@@ -0,0 +1,331 @@
+"""음성 음향 특징 추출 - 녹음에서 음높이, 음량, 휴지, 말 속도, 떨림/지터 지표를 계산
+
+모든 계산은 프레임 행렬에 대한 NumPy 벡터 연산이며, CPU 작업이므로 별도 프로세스 풀에서 실행한다.
+WAV(PCM)는 표준 라이브러리로 읽고, WebM/Ogg/MP3는 ffmpeg가 설치된 경우에만 디코딩한다.
+"""
+import asyncio
+import io
+import multiprocessing
+import shutil
+import subprocess
+import wave
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+
+from ..config import settings
+
+SAMPLE_RATE = 16000
+FRAME_SECONDS = 0.04  # 40ms 창 (최저 음높이 60Hz의 두 주기 이상)
+HOP_SECONDS = 0.01
+MIN_PITCH_HZ = 60.0
+MAX_PITCH_HZ = 400.0
+YIN_THRESHOLD = 0.15
+MIN_PAUSE_SECONDS = 0.25
+SYLLABLES_PER_WORD = 3.0  # 한국어 어절당 평균 음절 수 (말 속도 단어/분 환산용 근사치)
+TREMOR_BAND_HZ = (4.0, 12.0)
+TREMOR_THRESHOLD = 0.5  # 음높이 변화 중 4~12Hz 성분 비율이 이 이상이고
+TREMOR_MIN_CENTS = 5.0  # 그 성분의 크기(RMS)가 이 이상이면 떨림으로 판단
+
+
+def _decode_wav(data: bytes) -> Tuple[np.ndarray, int]:
+    try:
+        with wave.open(io.BytesIO(data)) as wav:
+            channels = wav.getnchannels()
+            width = wav.getsampwidth()
+            rate = wav.getframerate()
+            frames = wav.readframes(wav.getnframes())
+    except (wave.Error, EOFError) as e:
+        # 부동소수점 WAV 등 표준 라이브러리가 읽지 못하는 형식 포함
+        raise ValueError(f"WAV 파일을 읽을 수 없습니다: {e}")
+
+    if width == 1:
+        samples = (np.frombuffer(frames, dtype=np.uint8).astype(np.float32) - 128.0) / 128.0
+    elif width == 2:
+        samples = np.frombuffer(frames, dtype="<i2").astype(np.float32) / 32768.0
+    elif width == 3:
+        raw = np.frombuffer(frames, dtype=np.uint8).reshape(-1, 3).astype(np.int32)
+        values = raw[:, 0] | (raw[:, 1] << 8) | (raw[:, 2] << 16)
+        samples = (np.where(values >= 1 << 23, values - (1 << 24), values) / float(1 << 23)).astype(np.float32)
+    elif width == 4:
+        samples = np.frombuffer(frames, dtype="<i4").astype(np.float32) / float(1 << 31)
+    else:
+        raise ValueError(f"지원하지 않는 WAV 샘플 크기입니다: {width}바이트")
+
+    if channels > 1:
+        samples = samples[: len(samples) // channels * channels].reshape(-1, channels).mean(axis=1)
+    return samples, rate
+
+
+def _decode_ffmpeg(data: bytes, ffmpeg_path: str) -> Tuple[np.ndarray, int]:
+    executable = shutil.which(ffmpeg_path)
+    if executable is None:
+        raise ValueError("WAV 이외의 오디오(WebM, Ogg, MP3)를 분석하려면 ffmpeg를 설치하세요.")
+
+    result = subprocess.run(
+        [executable, "-nostdin", "-loglevel", "error", "-i", "pipe:0",
+         "-f", "s16le", "-ac", "1", "-ar", str(SAMPLE_RATE), "pipe:1"],
+        input=data,
+        capture_output=True,
+        check=False,
+    )
+    if result.returncode != 0:
+        raise ValueError(f"오디오 디코딩 실패: {result.stderr.decode(errors='replace').strip()[:200]}")
+    return np.frombuffer(result.stdout, dtype="<i2").astype(np.float32) / 32768.0, SAMPLE_RATE
+
+
+def decode_audio(data: bytes, ffmpeg_path: str = "ffmpeg") -> np.ndarray:
+    """오디오를 16kHz 모노 float32 [-1, 1]로 디코딩"""
+    if data[:4] == b"RIFF" and data[8:12] == b"WAVE":
+        samples, rate = _decode_wav(data)
+    else:
+        samples, rate = _decode_ffmpeg(data, ffmpeg_path)
+
+    if rate == SAMPLE_RATE or len(samples) == 0:
+        return samples
+    if rate % SAMPLE_RATE == 0:
+        # 48kHz 등 정수배: 구간 평균(간단한 저역 통과) 후 솎아내기
+        factor = rate // SAMPLE_RATE
+        return samples[: len(samples) // factor * factor].reshape(-1, factor).mean(axis=1)
+    positions = np.arange(0, len(samples) - 1, rate / SAMPLE_RATE)
+    return np.interp(positions, np.arange(len(samples)), samples).astype(np.float32)
+
+
+def _frames(samples: np.ndarray, frame: int, hop: int) -> np.ndarray:
+    count = 1 + (len(samples) - frame) // hop
+    return np.lib.stride_tricks.sliding_window_view(samples, frame)[::hop][:count]
+
+
+def _yin(frames: np.ndarray) -> np.ndarray:
+    """
+    프레임별 기본 주파수 (Hz, 무성음은 0)
+
+    자기상관은 FFT로 모든 프레임을 한 번에 계산하고, YIN의 누적 평균 정규화 차이 함수에서
+    임계값 아래로 처음 내려가는 지연을 주기로 쓴다 (포물선 보간).
+    """
+    frame = frames.shape[1]
+    max_lag = int(SAMPLE_RATE / MIN_PITCH_HZ)
+    min_lag = int(SAMPLE_RATE / MAX_PITCH_HZ)
+
+    spectrum = np.fft.rfft(frames, n=2 * frame, axis=1)
+    autocorr = np.fft.irfft(spectrum * np.conj(spectrum), axis=1)[:, : max_lag + 2]
+
+    # 차이 함수 d(τ) = Σx² (앞 구간) + Σx² (τ 이동 구간) - 2r(τ)
+    energy = np.cumsum(np.square(frames), axis=1)
+    total = energy[:, -1:]
+    lags = np.arange(max_lag + 2)
+    shifted = total - np.concatenate([np.zeros((len(frames), 1)), energy[:, : max_lag + 1]], axis=1)
+    head = np.concatenate([total, energy[:, frame - 1 - lags[1:]]], axis=1)
+    difference = head + shifted - 2.0 * autocorr
+    difference[:, 0] = 0.0
+
+    cumulative = np.cumsum(difference[:, 1:], axis=1)
+    normalized = np.ones_like(difference)
+    normalized[:, 1:] = difference[:, 1:] * lags[1:] / np.maximum(cumulative, 1e-12)
+
+    search = normalized[:, min_lag : max_lag + 1]
+    below = search < YIN_THRESHOLD
+    voiced = below.any(axis=1)
+    first = np.argmax(below, axis=1)
+
+    # 임계값 아래로 들어간 뒤 국소 최솟값까지 진행
+    rows = np.arange(len(frames))
+    last = search.shape[1] - 1
+    index = first.copy()
+    for _ in range(last):
+        following = np.minimum(index + 1, last)
+        step = (index < last) & (search[rows, following] < search[rows, index])
+        if not step.any():
+            break
+        index = index + step
+
+    lag = (index + min_lag).astype(np.float64)
+    inner = (lag > min_lag) & (lag < max_lag)
+    center = lag.astype(int)
+    left = normalized[rows, np.maximum(center - 1, 0)]
+    middle = normalized[rows, center]
+    right = normalized[rows, np.minimum(center + 1, normalized.shape[1] - 1)]
+    denominator = left - 2.0 * middle + right
+    usable = inner & (np.abs(denominator) > 1e-12)
+    offset = np.where(usable, 0.5 * (left - right) / np.where(usable, denominator, 1.0), 0.0)
+
+    return np.where(voiced, SAMPLE_RATE / (lag + np.clip(offset, -1, 1)), 0.0)
+
+
+def _runs(mask: np.ndarray) -> np.ndarray:
+    """True 구간의 (시작, 끝) 인덱스 배열"""
+    padded = np.concatenate([[False], mask, [False]])
+    edges = np.flatnonzero(padded[1:] != padded[:-1])
+    return edges.reshape(-1, 2)
+
+
+def extract_features(data: bytes, ffmpeg_path: str = "ffmpeg") -> Dict[str, Any]:
+    """
+    녹음 파일의 음향 특징
+
+    Returns:
+        {
+            'duration': 12.3,           # 녹음 길이 (초)
+            'speech_seconds': 9.1,      # 발화 구간 길이
+            'average_pitch': 182.4,     # 유성음 평균 기본 주파수 (Hz)
+            'pitch_variance': 21.7,     # 기본 주파수 표준편차 (Hz)
+            'volume_level': -23.5,      # 발화 구간 평균 음량 (dBFS)
+            'pause_count': 4,           # 0.25초 이상 휴지 수
+            'pauses_per_minute': 26.4,
+            'syllable_rate': 4.8,       # 초당 음절 수 (음량 봉우리 기준)
+            'speech_rate': 96.0,        # 분당 단어 수 (음절 수 / SYLLABLES_PER_WORD)
+            'jitter': 0.012,            # 인접 유성음 프레임 간 주기 변화율
+            'shimmer': 0.08,            # 인접 유성음 프레임 간 진폭 변화율
+            'tremor_index': 0.21,       # 음높이 변화 중 4~12Hz 성분 비율 (0.5초 이상 이어진 유성음 기준)
+            'tremor_cents': 3.2,        # 4~12Hz 성분 크기 (cent RMS)
+            'voice_tremor': False,
+        }
+
+    Raises:
+        ValueError: 디코딩 실패 또는 분석하기에 너무 짧은 녹음
+    """
+    samples = decode_audio(data, ffmpeg_path).astype(np.float64)
+    frame = int(FRAME_SECONDS * SAMPLE_RATE)
+    hop = int(HOP_SECONDS * SAMPLE_RATE)
+    if len(samples) < frame * 5:
+        raise ValueError("녹음이 너무 짧아 분석할 수 없습니다.")
+
+    samples = samples - samples.mean()
+    frames = _frames(samples, frame, hop)
+    rms = np.sqrt(np.mean(np.square(frames), axis=1))
+    decibels = 20.0 * np.log10(np.maximum(rms, 1e-10))
+
+    # 발화 구간: 배경 소음(하위 10%)보다 12dB 이상 크고 -50dBFS 이상인 프레임
+    noise_floor = np.percentile(decibels, 10)
+    speech = decibels > max(noise_floor + 12.0, -50.0)
+    speech_runs = _runs(speech)
+
+    duration = len(samples) / SAMPLE_RATE
+    speech_seconds = float(speech.sum() * HOP_SECONDS)
+
+    # 휴지: 발화 구간 사이의 무음 중 MIN_PAUSE_SECONDS 이상
+    gaps = speech_runs[1:, 0] - speech_runs[:-1, 1] if len(speech_runs) > 1 else np.zeros(0)
+    pause_count = int(np.sum(gaps * HOP_SECONDS >= MIN_PAUSE_SECONDS))
+
+    # 음절: 평활화한 음량 곡선에서 발화 구간 안의 봉우리 (간격 100ms 이상)
+    kernel = np.hanning(7)
+    envelope = np.convolve(decibels, kernel / kernel.sum(), mode="same")
+    peaks = np.flatnonzero(
+        (envelope[1:-1] > envelope[:-2]) & (envelope[1:-1] >= envelope[2:]) & speech[1:-1]
+    ) + 1
+    syllables = 0
+    last_peak = -10 ** 9
+    for peak in peaks:
+        # 봉우리 양옆 50ms 안의 최솟값보다 3dB 이상 높아야 음절로 셈
+        window = envelope[max(peak - 5, 0) : peak + 6]
+        if peak - last_peak >= 10 and envelope[peak] - window.min() >= 3.0:
+            syllables += 1
+            last_peak = peak
+    syllable_rate = syllables / speech_seconds if speech_seconds else 0.0
+
+    pitch = _yin(frames)
+    voiced = (pitch > 0) & speech
+    voiced_pitch = pitch[voiced]
+
+    jitter = shimmer = tremor_index = tremor_cents = 0.0
+    if len(voiced_pitch) >= 3:
+        # 연속된 유성음 프레임 쌍만 사용 (프레임 단위 근사)
+        pairs = voiced[1:] & voiced[:-1]
+        periods = 1.0 / np.where(pitch > 0, pitch, 1.0)
+        if pairs.any():
+            jitter = float(np.mean(np.abs(np.diff(periods)[pairs])) / np.mean(periods[voiced]))
+            shimmer = float(np.mean(np.abs(np.diff(rms)[pairs])) / np.mean(rms[voiced]))
+
+        # 떨림: 0.5초 이상 이어지는 유성음 구간의 음높이 곡선(cent) 스펙트럼
+        band_power = total_power = band_square = 0.0
+        band_frames = 0
+        for start, end in _runs(voiced):
+            if end - start < 50:
+                continue
+            cents = 1200.0 * np.log2(pitch[start:end] / np.median(pitch[start:end]))
+            cents = cents - np.polyval(np.polyfit(np.arange(len(cents)), cents, 1), np.arange(len(cents)))
+            frequencies = np.fft.rfftfreq(len(cents), d=HOP_SECONDS)
+            modulation = frequencies >= 1.0
+            band = (frequencies >= TREMOR_BAND_HZ[0]) & (frequencies <= TREMOR_BAND_HZ[1])
+
+            power = np.abs(np.fft.rfft(cents * np.hanning(len(cents)))) ** 2
+            band_power += power[band].sum()
+            total_power += power[modulation].sum()
+
+            # 떨림 성분 크기: 4~12Hz만 남겨 되돌린 곡선의 RMS (cent)
+            band_signal = np.fft.irfft(np.where(band, np.fft.rfft(cents), 0), n=len(cents))
+            band_square += np.sum(np.square(band_signal))
+            band_frames += len(cents)
+        if total_power > 0:
+            tremor_index = float(band_power / total_power)
+            tremor_cents = float(np.sqrt(band_square / band_frames))
+
+    return {
+        "duration": round(duration, 2),
+        "speech_seconds": round(speech_seconds, 2),
+        "average_pitch": round(float(voiced_pitch.mean()), 1) if len(voiced_pitch) else None,
+        "pitch_variance": round(float(voiced_pitch.std()), 1) if len(voiced_pitch) else None,
+        "volume_level": round(float(decibels[speech].mean()), 1) if speech.any() else None,
+        "pause_count": pause_count,
+        "pauses_per_minute": round(pause_count / duration * 60.0, 1),
+        "syllable_rate": round(syllable_rate, 2),
+        "speech_rate": round(syllable_rate * 60.0 / SYLLABLES_PER_WORD, 1),
+        "jitter": round(jitter, 4),
+        "shimmer": round(shimmer, 4),
+        "tremor_index": round(tremor_index, 3),
+        "tremor_cents": round(tremor_cents, 1),
+        "voice_tremor": tremor_index >= TREMOR_THRESHOLD and tremor_cents >= TREMOR_MIN_CENTS,
+    }
+
+
+class VoiceFeatureExtractor:
+    """
+    음향 특징 추출 프로세스 풀
+
+    이미지 파이프라인과 같이 첫 요청 시 spawn 방식으로 워커를 만든다.
+    """
+
+    def __init__(
+        self,
+        workers: int = settings.VOICE_FEATURE_WORKERS,
+        ffmpeg_path: str = settings.FFMPEG_PATH,
+    ):
+        self.workers = workers
+        self.ffmpeg_path = ffmpeg_path
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    def _pool(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return self._executor
+
+    async def extract(self, data: bytes) -> Dict[str, Any]:
+        """
+        음향 특징 추출 (extract_features 참고)
+
+        Raises:
+            ValueError: 디코딩 실패 또는 너무 짧은 녹음
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._pool(), extract_features, data, self.ffmpeg_path)
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+# 싱글톤 인스턴스
+_voice_feature_extractor = None
+
+
+def get_voice_feature_extractor() -> VoiceFeatureExtractor:
+    """VoiceFeatureExtractor 싱글톤 인스턴스 반환"""
+    global _voice_feature_extractor
+    if _voice_feature_extractor is None:
+        _voice_feature_extractor = VoiceFeatureExtractor()
+    return _voice_feature_extractor
@@ -0,0 +1,14 @@
+"""성능 벤치마크 스크립트 (backend 디렉터리에서 python -m benchmarks.<이름> 으로 실행)
+
+앱 설정은 import 시점에 읽으므로 app 모듈을 불러오기 전에 이 패키지가 먼저 환경 변수를 채운다.
+DATABASE_URL을 지정하지 않으면 임시 SQLite 파일을 쓴다.
+"""
+import os
+import tempfile
+
+os.environ.setdefault(
+    "DATABASE_URL",
+    f"sqlite+aiosqlite:///{tempfile.mkdtemp(prefix='health-chatbot-bench-')}/bench.db",
+)
+os.environ.setdefault("GEMINI_API_KEY", "benchmark")
+os.environ.setdefault("DEBUG", "False")
@@ -0,0 +1,160 @@
+"""채팅 세션 목록 벤치마크 - 세션 수를 늘려 가며 GET /api/chat/sessions 첫 페이지와 중간 페이지 지연 측정
+
+세션 수마다 새 사용자를 만들어 세션당 메시지 몇 개씩 채운 뒤,
+1) 현재 구현(집계 쿼리 한 번 + 키셋 페이지네이션)의 첫 페이지/중간 페이지 지연,
+2) 세션마다 쿼리를 두 번 더 보내던 이전 방식(N+1)의 지연 (--legacy-max 이하 세션 수만)
+을 재고, 커서로 끝까지 넘겨 모든 세션이 정확히 한 번씩 나오는지 확인한다.
+
+    python -m benchmarks.chat_sessions --sessions 100 1000 5000 --messages 4
+"""
+import argparse
+import asyncio
+import random
+import time
+import uuid
+from datetime import datetime, timedelta
+
+import httpx
+from sqlalchemy import insert, select
+
+from app.database import AsyncSessionLocal, init_db
+from app.main import app
+from app.models.chat_history import ChatHistory, ChatType
+from app.models.user import User
+from app.services.auth_service import AuthService
+
+BATCH = 5000
+PAGE = 50
+
+
+async def seed(sessions: int, messages: int, seed_value: int) -> tuple:
+    """사용자 한 명과 세션별 사용자/AI 메시지 생성 (일부 세션은 마지막 메시지 시간이 같음)"""
+    rng = random.Random(seed_value)
+    email = f"bench-{uuid.uuid4().hex[:12]}@example.com"
+    async with AsyncSessionLocal() as db:
+        user = User(email=email, username=email.split("@")[0], hashed_password="-")
+        db.add(user)
+        await db.commit()
+
+        now = datetime.utcnow().replace(microsecond=0)
+        rows = []
+        for index in range(sessions):
+            session_id = str(uuid.uuid4())
+            # 초 단위로 잘라 여러 세션이 같은 last_message_at을 갖게 함 (커서 동률 처리 확인용)
+            started = now - timedelta(seconds=rng.randrange(sessions * 60))
+            for offset in range(messages):
+                rows.append({
+                    "user_id": user.id,
+                    "chat_type": ChatType.SYMPTOM_CHECK,
+                    "session_id": session_id,
+                    "role": "user" if offset % 2 == 0 else "assistant",
+                    "message": f"세션 {index}의 {offset}번째 메시지 - 머리가 아프고 열이 조금 있어요. " * 2,
+                    "created_at": started + timedelta(seconds=offset),
+                })
+
+        for offset in range(0, len(rows), BATCH):
+            await db.execute(insert(ChatHistory), rows[offset:offset + BATCH])
+        await db.commit()
+    return user.id, AuthService.create_access_token({"sub": email, "user_id": user.id})
+
+
+async def legacy_sessions(user_id: int) -> list:
+    """비교 기준: 세션마다 첫 사용자 메시지와 마지막 메시지 시간을 따로 조회 (변경 전 방식)"""
+    async with AsyncSessionLocal() as db:
+        result = await db.execute(
+            select(ChatHistory.session_id).where(ChatHistory.user_id == user_id).distinct()
+        )
+        sessions = []
+        for (session_id,) in result.all():
+            first_msg = (await db.execute(
+                select(ChatHistory)
+                .where(
+                    ChatHistory.user_id == user_id,
+                    ChatHistory.session_id == session_id,
+                    ChatHistory.role == "user",
+                )
+                .order_by(ChatHistory.created_at)
+                .limit(1)
+            )).scalar_one_or_none()
+            last_message_at = (await db.execute(
+                select(ChatHistory.created_at)
+                .where(ChatHistory.user_id == user_id, ChatHistory.session_id == session_id)
+                .order_by(ChatHistory.created_at.desc())
+                .limit(1)
+            )).scalar_one()
+            sessions.append({
+                "session_id": session_id,
+                "preview": first_msg.message[:50] if first_msg else "대화 없음",
+                "last_message_at": last_message_at,
+            })
+    sessions.sort(key=lambda session: session["last_message_at"], reverse=True)
+    return sessions[:PAGE]
+
+
+async def timed(call, repeat: int) -> float:
+    """repeat번 실행한 중앙값 (초)"""
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        await call()
+        timings.append(time.perf_counter() - started)
+    timings.sort()
+    return timings[len(timings) // 2]
+
+
+async def run(count: int, args) -> None:
+    user_id, token = await seed(count, args.messages, args.seed)
+
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app),
+        base_url="http://bench",
+        headers={"Authorization": f"Bearer {token}"},
+    ) as client:
+        async def page(params: dict) -> list:
+            response = await client.get("/api/chat/sessions", params=dict(params, limit=PAGE))
+            response.raise_for_status()
+            return response.json()
+
+        # 커서로 끝까지 넘기며 중복/누락 확인, 중간 페이지 커서 기억
+        seen, params, middle = [], {}, {}
+        while True:
+            items = await page(params)
+            if not items:
+                break
+            seen.extend(item["session_id"] for item in items)
+            params = {
+                "before": items[-1]["last_message_at"],
+                "before_session_id": items[-1]["session_id"],
+            }
+            if len(seen) <= count // 2:
+                middle = params
+        complete = len(seen) == len(set(seen)) == count
+
+        first = await timed(lambda: page({}), args.repeat)
+        deep = await timed(lambda: page(middle), args.repeat)
+
+    legacy = (
+        f"{await timed(lambda: legacy_sessions(user_id), 1) * 1000:>9.1f} ms"
+        if count <= args.legacy_max else f"{'skipped':>12}"
+    )
+    print(
+        f"{count:>7,} sessions  first page {first * 1000:>7.1f} ms  middle page {deep * 1000:>7.1f} ms  "
+        f"legacy (N+1) {legacy}  all sessions once: {complete}"
+    )
+
+
+async def main(args):
+    await init_db()
+    print(f"{args.messages} messages per session, page size {PAGE}, median of {args.repeat}")
+    for count in args.sessions:
+        await run(count, args)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sessions", type=int, nargs="+", default=[100, 1000, 5000])
+    parser.add_argument("--messages", type=int, default=4)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--legacy-max", type=int, default=1000, help="이전 방식을 측정할 최대 세션 수")
+    parser.add_argument("--seed", type=int, default=5)
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,128 @@
+"""응급 키워드 감지 벤치마크 - 대량 메시지 코퍼스에서 Aho-Corasick 감지기와 단순 부분 문자열 검색 비교
+
+    python -m benchmarks.emergency_detector --messages 200000
+"""
+import argparse
+import random
+import statistics
+import time
+
+from app.services.emergency_detector import (
+    EMERGENCY_KEYWORDS,
+    EmergencyKeywordDetector,
+    _normalize,
+)
+
+# 일반 상담 문장 (응급 키워드 없음)
+ROUTINE = [
+    "요즘 잠을 잘 못 자요. 밤에 자꾸 깨는데 어떻게 해야 할까요?",
+    "어제부터 목이 칼칼하고 콧물이 나요.",
+    "혈압약을 아침에 먹어야 하나요 저녁에 먹어야 하나요?",
+    "운동을 시작했는데 무릎이 조금 시큰거려요.",
+    "I have had a mild headache since this morning.",
+    "What should I eat to lower my cholesterol?",
+    "I swim backstroke every morning and my shoulder is sore.",
+    "Any tips to avoid heatstroke while hiking?",
+]
+# 응급 키워드를 포함한 문장
+URGENT = [
+    "갑자기 가슴 통증이 심하고 식은땀이 나요",
+    "아버지가 쓰러졌는데 의식이 없어요",
+    "숨이 안 쉬어져요 도와주세요",
+    "I think my father is having a stroke, his speech is slurred",
+    "My chest pain is getting worse and spreading to my arm",
+    "너무 힘들어서 죽고 싶어요",
+]
+# 키워드가 있지만 부정된 문장
+NEGATED = [
+    "가슴 통증은 없어요. 그냥 소화가 안 돼요.",
+    "어지럽긴 한데 기절은 안 했어요, 의식도 멀쩡해요",
+    "No chest pain, just a runny nose.",
+    "I don't have shortness of breath but I cough a lot.",
+]
+
+
+def build_corpus(size: int, seed: int, long_ratio: float) -> list:
+    """(메시지, 응급 여부) 목록 - 일반 80% / 응급 10% / 부정 10%, 일부는 여러 문장을 이어 붙인 긴 메시지"""
+    rng = random.Random(seed)
+    corpus = []
+    for _ in range(size):
+        roll = rng.random()
+        pool = ROUTINE if roll < 0.8 else URGENT if roll < 0.9 else NEGATED
+        message = rng.choice(pool)
+        if rng.random() < long_ratio:
+            message = " ".join([rng.choice(ROUTINE) for _ in range(rng.randint(5, 20))] + [message])
+        corpus.append((message, pool is URGENT))
+    return corpus
+
+
+def naive_detect(normalized_keywords: list, text: str) -> bool:
+    """비교 기준: 키워드마다 부분 문자열 검색 (단어 경계/부정 처리 없음)"""
+    normalized = _normalize(text)
+    return any(word in normalized for _, word in normalized_keywords)
+
+
+def run(label: str, detect, corpus: list, repeat: int) -> dict:
+    messages = [message for message, _ in corpus]
+    rounds = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        flags = [bool(detect(message)) for message in messages]
+        rounds.append(time.perf_counter() - started)
+
+    best = min(rounds)
+    false_positives = sum(1 for flag, (_, urgent) in zip(flags, corpus) if flag and not urgent)
+    missed = sum(1 for flag, (_, urgent) in zip(flags, corpus) if urgent and not flag)
+    result = {
+        "label": label,
+        "messages_per_second": len(corpus) / best,
+        "microseconds_per_message": best / len(corpus) * 1e6,
+        "median_seconds": statistics.median(rounds),
+        "false_positives": false_positives,
+        "missed": missed,
+    }
+    print(
+        f"{label:<14} {result['messages_per_second']:>12,.0f} msg/s  "
+        f"{result['microseconds_per_message']:>8.2f} us/msg  "
+        f"false_positives={false_positives:,}  missed={missed:,}"
+    )
+    return result
+
+
+def latency_percentiles(detector: EmergencyKeywordDetector, corpus: list) -> None:
+    samples = []
+    for message, _ in corpus:
+        started = time.perf_counter()
+        detector.detect(message)
+        samples.append((time.perf_counter() - started) * 1e6)
+    samples.sort()
+    p50, p99 = samples[len(samples) // 2], samples[int(len(samples) * 0.99)]
+    print(f"detect() latency: p50 {p50:.1f} us, p99 {p99:.1f} us, max {samples[-1]:.1f} us")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--messages", type=int, default=100_000)
+    parser.add_argument("--long-ratio", type=float, default=0.1, help="긴 메시지 비율")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    detector = EmergencyKeywordDetector()
+    build_ms = (time.perf_counter() - started) * 1000
+    keywords = [(category, _normalize(word)) for category, words in EMERGENCY_KEYWORDS.items() for word in words]
+
+    corpus = build_corpus(args.messages, args.seed, args.long_ratio)
+    chars = sum(len(message) for message, _ in corpus)
+    urgent = sum(1 for _, is_urgent in corpus if is_urgent)
+    print(f"corpus: {len(corpus):,} messages ({urgent:,} urgent), {chars:,} chars, "
+          f"{len(keywords)} keywords (automaton built in {build_ms:.1f} ms)")
+
+    run("aho-corasick", detector.detect, corpus, args.repeat)
+    run("naive", lambda text: naive_detect(keywords, text), corpus, args.repeat)
+    latency_percentiles(detector, corpus)
+
+
+if __name__ == "__main__":
+    main()
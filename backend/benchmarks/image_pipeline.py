@@ -0,0 +1,151 @@
+"""이미지 전처리 벤치마크 - 식단 사진 한 장을 분석할 때의 전처리 지연과 Gemini로 보내는 바이트 수
+
+여러 해상도의 합성 JPEG(그라데이션 + 도형 + 잡음, 휴대폰 사진과 비슷한 압축률)으로
+1) 현재 프로세스에서 resize_for_vision / make_thumbnail / difference_hash 시간과
+   원본 바이트 대비 전송 바이트를 재고 (비교 기준: 원본 해상도 그대로 재인코딩하던 이전 방식),
+2) ImagePipeline 프로세스 풀로 여러 장을 동시에 보내 처리량과 이벤트 루프 지연을 잰다.
+
+    python -m benchmarks.image_pipeline --resolutions 1280x960 2016x1512 4032x3024 --photos 8
+"""
+import argparse
+import asyncio
+import io
+import time
+
+import numpy as np
+from PIL import Image, ImageDraw
+
+from app.config import settings
+from app.services.image_pipeline import ImagePipeline, difference_hash, make_thumbnail, resize_for_vision
+
+TICK = 0.01
+
+
+def synthesize(width: int, height: int, quality: int = 92, seed: int = 17) -> bytes:
+    """접시와 음식 모양의 도형, 조명 그라데이션, 센서 잡음이 있는 JPEG"""
+    rng = np.random.default_rng(seed)
+    y, x = np.mgrid[0:height, 0:width].astype(np.float32)
+    base = np.stack([
+        180 + 50 * x / width,
+        150 + 40 * y / height,
+        120 + 30 * (x + y) / (width + height),
+    ], axis=-1)
+    base += rng.normal(0, 6, base.shape)
+    image = Image.fromarray(np.clip(base, 0, 255).astype(np.uint8))
+
+    draw = ImageDraw.Draw(image)
+    short = min(width, height)
+    draw.ellipse(
+        (width / 2 - short * 0.42, height / 2 - short * 0.42, width / 2 + short * 0.42, height / 2 + short * 0.42),
+        fill=(240, 240, 235),
+    )
+    for _ in range(40):
+        cx, cy = rng.uniform(0.3, 0.7) * width, rng.uniform(0.3, 0.7) * height
+        radius = rng.uniform(0.02, 0.08) * short
+        color = tuple(int(c) for c in rng.integers(40, 220, 3))
+        draw.ellipse((cx - radius, cy - radius, cx + radius, cy + radius), fill=color)
+
+    buffer = io.BytesIO()
+    image.save(buffer, "JPEG", quality=quality)
+    return buffer.getvalue()
+
+
+def reencode_full(data: bytes) -> bytes:
+    """비교 기준: 원본 해상도 그대로 JPEG 재인코딩 (SDK가 PIL 이미지를 보내던 방식)"""
+    image = Image.open(io.BytesIO(data)).convert("RGB")
+    buffer = io.BytesIO()
+    image.save(buffer, "JPEG")
+    return buffer.getvalue()
+
+
+def best_of(repeat: int, func, *args):
+    timings, result = [], None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = func(*args)
+        timings.append(time.perf_counter() - started)
+    return min(timings), result
+
+
+def in_process(resolutions: list, repeat: int):
+    vision = (settings.VISION_IMAGE_MAX_PIXELS, settings.VISION_IMAGE_FORMAT, settings.VISION_IMAGE_QUALITY)
+    thumb = (settings.THUMBNAIL_SIZE, settings.VISION_IMAGE_FORMAT, settings.VISION_IMAGE_QUALITY)
+    print(
+        f"in-process (max_pixels={vision[0]:,}, {vision[1]} q{vision[2]}, thumbnail {thumb[0]}px):"
+    )
+    for width, height in resolutions:
+        data = synthesize(width, height)
+        legacy_time, legacy = best_of(repeat, reencode_full, data)
+        vision_time, (sent, _) = best_of(repeat, resize_for_vision, data, *vision)
+        thumb_time, (thumbnail, _) = best_of(repeat, make_thumbnail, data, *thumb)
+        hash_time, _ = best_of(repeat, difference_hash, data)
+
+        print(
+            f"  {width}x{height}  original {len(data) / 1024:>7.0f} KiB  "
+            f"sent {len(sent) / 1024:>5.0f} KiB ({1 - len(sent) / len(data):.1%} saved) in {vision_time * 1000:>6.1f} ms  "
+            f"[full-res re-encode {len(legacy) / 1024:>6.0f} KiB in {legacy_time * 1000:>6.1f} ms]  "
+            f"thumbnail {len(thumbnail) / 1024:>4.1f} KiB in {thumb_time * 1000:>5.1f} ms  "
+            f"dHash {hash_time * 1000:>5.1f} ms"
+        )
+
+
+async def measure_loop_lag(stop: asyncio.Event, lags: list):
+    while not stop.is_set():
+        expected = time.perf_counter() + TICK
+        await asyncio.sleep(TICK)
+        lags.append(max(time.perf_counter() - expected, 0.0))
+
+
+async def pooled(width: int, height: int, photos: int, workers: int):
+    """분석 한 건의 전처리(dHash + Vision용 축소)를 photos장 동시에 실행"""
+    data = synthesize(width, height)
+    pipeline = ImagePipeline(workers=workers)
+    try:
+        # 워커 프로세스 기동(spawn + import) 비용 제외
+        await asyncio.gather(*(pipeline.perceptual_hash(data) for _ in range(workers)))
+
+        async def analysis_preprocessing():
+            await pipeline.perceptual_hash(data)
+            return await pipeline.prepare_for_vision(data)
+
+        stop, lags = asyncio.Event(), []
+        ticker = asyncio.create_task(measure_loop_lag(stop, lags))
+        started = time.perf_counter()
+        results = await asyncio.gather(*(analysis_preprocessing() for _ in range(photos)))
+        elapsed = time.perf_counter() - started
+        stop.set()
+        await ticker
+    finally:
+        pipeline.shutdown()
+
+    sent = sum(len(image) for image, _ in results)
+    print(
+        f"process pool ({workers} workers, {photos} x {width}x{height}): "
+        f"{photos / elapsed:.1f} analyses/s, {elapsed / photos * 1000:.0f} ms per analysis, "
+        f"{(len(data) * photos - sent) / photos / 1024:.0f} KiB saved per analysis, "
+        f"max loop lag {max(lags, default=0.0) * 1000:.1f} ms"
+    )
+
+
+def resolution(value: str) -> tuple:
+    width, height = value.lower().split("x")
+    return int(width), int(height)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--resolutions", type=resolution, nargs="+",
+        default=[(1280, 960), (2016, 1512), (4032, 3024)],
+    )
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--photos", type=int, default=8)
+    parser.add_argument("--workers", type=int, default=settings.IMAGE_PIPELINE_WORKERS)
+    args = parser.parse_args()
+
+    in_process(args.resolutions, args.repeat)
+    asyncio.run(pooled(*args.resolutions[-1], args.photos, args.workers))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""로그인 처리량 벤치마크 - bcrypt 전용 스레드 풀 사용 시와 이벤트 루프에서 직접 검증할 때 비교
+
+동시 로그인 요청을 앱에 직접(ASGI) 보내면서, 같은 루프에서 10ms 주기 타이머의 지연(루프 멈춤)을 함께 잰다.
+처리량은 CPU 코어 수와 PASSWORD_HASH_WORKERS에, 루프 지연은 스레드 풀 사용 여부에 좌우된다.
+
+    BCRYPT_ROUNDS=12 PASSWORD_HASH_WORKERS=4 python -m benchmarks.login_throughput --logins 200
+"""
+import argparse
+import asyncio
+import time
+import uuid
+
+import httpx
+
+from app.config import settings
+from app.database import AsyncSessionLocal, init_db
+from app.main import app
+from app.models.user import User
+from app.services.auth_service import AuthService, pwd_context
+
+PASSWORD = "password123"
+TICK = 0.01
+
+
+async def create_users(count: int) -> list:
+    """벤치마크용 사용자 생성 (해시는 한 번만 계산해 재사용)"""
+    hashed = await AuthService.get_password_hash_async(PASSWORD)
+    emails = [f"bench-{uuid.uuid4().hex[:12]}@example.com" for _ in range(count)]
+    async with AsyncSessionLocal() as db:
+        db.add_all(
+            User(email=email, username=email.split("@")[0], hashed_password=hashed) for email in emails
+        )
+        await db.commit()
+    return emails
+
+
+async def measure_loop_lag(stop: asyncio.Event, lags: list):
+    """TICK마다 깨어나도록 예약하고 실제로 늦어진 시간을 기록"""
+    while not stop.is_set():
+        expected = time.perf_counter() + TICK
+        await asyncio.sleep(TICK)
+        lags.append(max(time.perf_counter() - expected, 0.0))
+
+
+async def login_storm(emails: list, logins: int, concurrency: int) -> dict:
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies, failures = [], 0
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench") as client:
+        async def login(index: int):
+            nonlocal failures
+            async with semaphore:
+                started = time.perf_counter()
+                response = await client.post("/api/auth/login", json={
+                    "username": emails[index % len(emails)], "password": PASSWORD,
+                })
+                latencies.append(time.perf_counter() - started)
+                if response.status_code != 200:
+                    failures += 1
+
+        stop, lags = asyncio.Event(), []
+        ticker = asyncio.create_task(measure_loop_lag(stop, lags))
+        started = time.perf_counter()
+        await asyncio.gather(*(login(index) for index in range(logins)))
+        elapsed = time.perf_counter() - started
+        stop.set()
+        await ticker
+
+    latencies.sort()
+    lags.sort()
+    return {
+        "logins_per_second": logins / elapsed,
+        "p50_ms": latencies[len(latencies) // 2] * 1000,
+        "p99_ms": latencies[int(len(latencies) * 0.99)] * 1000,
+        "max_loop_lag_ms": (lags[-1] if lags else elapsed) * 1000,
+        "failures": failures,
+    }
+
+
+async def verify_on_loop(plain_password: str, hashed_password: str):
+    """비교 기준: 스레드 풀 없이 이벤트 루프에서 직접 검증 (변경 전 동작)"""
+    return pwd_context.verify_and_update(plain_password, hashed_password)
+
+
+def report(label: str, result: dict):
+    print(
+        f"{label:<10} {result['logins_per_second']:>8.1f} logins/s  "
+        f"p50 {result['p50_ms']:>7.1f} ms  p99 {result['p99_ms']:>7.1f} ms  "
+        f"max loop lag {result['max_loop_lag_ms']:>7.1f} ms  failures={result['failures']}"
+    )
+
+
+async def main(args):
+    await init_db()
+    emails = await create_users(args.users)
+    print(
+        f"bcrypt rounds={settings.BCRYPT_ROUNDS}, workers={settings.PASSWORD_HASH_WORKERS}, "
+        f"logins={args.logins}, concurrency={args.concurrency}"
+    )
+
+    report("executor", await login_storm(emails, args.logins, args.concurrency))
+
+    original = AuthService.verify_password_async
+    AuthService.verify_password_async = staticmethod(verify_on_loop)
+    try:
+        report("on-loop", await login_storm(emails, args.logins, args.concurrency))
+    finally:
+        AuthService.verify_password_async = original
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--users", type=int, default=20)
+    parser.add_argument("--logins", type=int, default=100)
+    parser.add_argument("--concurrency", type=int, default=50)
+    asyncio.run(main(parser.parse_args()))
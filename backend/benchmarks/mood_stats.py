@@ -0,0 +1,153 @@
+"""감정 통계 벤치마크 - 사용자 한 명의 감정 기록 10만 건에서 GET /api/mood-records/stats 측정
+
+SQL GROUP BY 집계(현재 구현)와 기록을 모두 불러와 Python에서 계산하던 이전 방식을 비교하고,
+두 결과가 같은지 확인한다. 메모리는 tracemalloc 최대치(Python 할당 기준)로 잰다.
+
+    python -m benchmarks.mood_stats --records 100000 --days 365
+"""
+import argparse
+import asyncio
+import random
+import time
+import tracemalloc
+import uuid
+from datetime import datetime, timedelta
+
+import httpx
+from sqlalchemy import insert, select
+
+from app.database import AsyncSessionLocal, init_db
+from app.main import app
+from app.models.mood_record import MoodLevel, MoodRecord
+from app.models.user import User
+from app.routers.mood_records import MOOD_SCORES
+from app.services.auth_service import AuthService
+
+BATCH = 5000
+# 측정하는 동안 기록이 기간/최근 7일 경계를 넘지 않도록 경계 근처는 비워 둠
+EDGE = 3600
+
+
+async def seed(records: int, days: int, seed_value: int) -> tuple:
+    """사용자 한 명과 기간 내에 고르게 흩어진 감정 기록 생성"""
+    rng = random.Random(seed_value)
+    email = f"bench-{uuid.uuid4().hex[:12]}@example.com"
+    async with AsyncSessionLocal() as db:
+        user = User(email=email, username=email.split("@")[0], hashed_password="-")
+        db.add(user)
+        await db.commit()
+
+        now = datetime.utcnow()
+        levels = list(MoodLevel)
+
+        def recorded_at():
+            while True:
+                age = rng.uniform(EDGE, days * 86400 - EDGE)
+                if abs(age - 7 * 86400) > EDGE:
+                    return now - timedelta(seconds=age)
+
+        for offset in range(0, records, BATCH):
+            await db.execute(insert(MoodRecord), [
+                {
+                    "user_id": user.id,
+                    "mood_level": rng.choice(levels),
+                    "mood_intensity": rng.randint(1, 10),
+                    "recorded_at": recorded_at(),
+                    "created_at": now,
+                }
+                for _ in range(min(BATCH, records - offset))
+            ])
+        await db.commit()
+    return user.id, AuthService.create_access_token({"sub": email, "user_id": user.id})
+
+
+async def legacy_stats(user_id: int, days: int) -> dict:
+    """비교 기준: 기간 내 기록을 모두 불러와 Python에서 계산 (변경 전 방식)"""
+    async with AsyncSessionLocal() as db:
+        result = await db.execute(
+            select(MoodRecord).where(
+                MoodRecord.user_id == user_id,
+                MoodRecord.recorded_at >= datetime.utcnow() - timedelta(days=days),
+            )
+        )
+        records = result.scalars().all()
+
+    total_score = sum(MOOD_SCORES.get(r.mood_level.value, 5) * (r.mood_intensity / 10) for r in records)
+    mood_counts = {}
+    for record in records:
+        mood_counts[record.mood_level.value] = mood_counts.get(record.mood_level.value, 0) + 1
+
+    mood_trend = "stable"
+    recent_start = datetime.utcnow() - timedelta(days=7)
+    recent = [r for r in records if r.recorded_at >= recent_start]
+    older = [r for r in records if r.recorded_at < recent_start]
+    if len(records) >= 7 and recent and older:
+        recent_avg = sum(MOOD_SCORES.get(r.mood_level.value, 5) for r in recent) / len(recent)
+        older_avg = sum(MOOD_SCORES.get(r.mood_level.value, 5) for r in older) / len(older)
+        if recent_avg > older_avg + 0.5:
+            mood_trend = "improving"
+        elif recent_avg < older_avg - 0.5:
+            mood_trend = "declining"
+
+    return {
+        "average_mood": round(total_score / len(records), 2),
+        "most_common_mood": max(mood_counts, key=mood_counts.get),
+        "mood_trend": mood_trend,
+        "total_records": len(records),
+        "mood_distribution": mood_counts,
+    }
+
+
+async def measure(label: str, call, repeat: int) -> dict:
+    timings = []
+    tracemalloc.start()
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = await call()
+        timings.append(time.perf_counter() - started)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    timings.sort()
+    print(
+        f"{label:<8} best {timings[0] * 1000:>8.1f} ms  median {timings[len(timings) // 2] * 1000:>8.1f} ms  "
+        f"peak memory {peak / 1024 / 1024:>7.1f} MiB"
+    )
+    return result
+
+
+async def main(args):
+    await init_db()
+    started = time.perf_counter()
+    user_id, token = await seed(args.records, args.days, args.seed)
+    print(f"seeded {args.records:,} mood records over {args.days} days in {time.perf_counter() - started:.1f} s")
+
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app),
+        base_url="http://bench",
+        headers={"Authorization": f"Bearer {token}"},
+    ) as client:
+        async def endpoint_stats():
+            response = await client.get("/api/mood-records/stats", params={"days": args.days})
+            response.raise_for_status()
+            return response.json()
+
+        current = await measure("sql", endpoint_stats, args.repeat)
+
+    legacy = await measure("legacy", lambda: legacy_stats(user_id, args.days), args.repeat)
+
+    same = {key: value for key, value in current.items() if key != "average_mood"} == {
+        key: value for key, value in legacy.items() if key != "average_mood"
+    } and abs(current["average_mood"] - legacy["average_mood"]) <= 0.01
+    print(f"results match: {same}")
+    if not same:
+        print(f"  sql:    {current}\n  legacy: {legacy}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--records", type=int, default=100_000)
+    parser.add_argument("--days", type=int, default=365)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=11)
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,119 @@
+"""음향 특징 추출 벤치마크 - CPU 1초당 처리하는 녹음 길이(초)와 프로세스 풀 처리량
+
+합성한 말소리 WAV(음절 단위 유성음 + 휴지 + 잡음, 음높이를 알고 있음)로
+1) 현재 프로세스에서 extract_features를 실행해 녹음 초 / CPU 초를 재고,
+2) VoiceFeatureExtractor 프로세스 풀로 여러 녹음을 동시에 보내 녹음 초 / 경과 초와 이벤트 루프 지연을 잰다.
+
+    python -m benchmarks.voice_features --durations 5 30 120 --clips 8 --workers 2
+"""
+import argparse
+import asyncio
+import io
+import time
+import wave
+
+import numpy as np
+
+from app.services.voice_features import SAMPLE_RATE, VoiceFeatureExtractor, extract_features
+
+TICK = 0.01
+
+
+def synthesize(seconds: float, pitch_hz: float, seed: int = 3) -> bytes:
+    """음절(유성음 0.15~0.3초)과 휴지(0.05~0.6초)가 번갈아 나오는 16kHz 모노 WAV"""
+    rng = np.random.default_rng(seed)
+    total = int(seconds * SAMPLE_RATE)
+    samples = np.zeros(total, dtype=np.float32)
+
+    position = 0
+    while position < total:
+        length = int(rng.uniform(0.15, 0.3) * SAMPLE_RATE)
+        end = min(position + length, total)
+        t = np.arange(end - position) / SAMPLE_RATE
+        # 약간의 음높이 흔들림과 배음, 음절 모양의 음량 변화
+        f0 = pitch_hz * (1 + 0.02 * np.sin(2 * np.pi * 5 * t))
+        phase = 2 * np.pi * np.cumsum(f0) / SAMPLE_RATE
+        voiced = np.sin(phase) + 0.5 * np.sin(2 * phase) + 0.25 * np.sin(3 * phase)
+        samples[position:end] = 0.3 * voiced * np.hanning(end - position)
+        position = end + int(rng.uniform(0.05, 0.6) * SAMPLE_RATE)
+
+    samples += rng.normal(0, 0.003, total).astype(np.float32)
+    pcm = (np.clip(samples, -1, 1) * 32767).astype("<i2")
+
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(SAMPLE_RATE)
+        wav.writeframes(pcm.tobytes())
+    return buffer.getvalue()
+
+
+def in_process(durations: list, pitch_hz: float, repeat: int):
+    print("in-process (extract_features):")
+    for seconds in durations:
+        data = synthesize(seconds, pitch_hz)
+        extract_features(data)  # 첫 호출 비용(메모리 할당 등) 제외
+
+        cpu_times, wall_times = [], []
+        for _ in range(repeat):
+            cpu, wall = time.process_time(), time.perf_counter()
+            features = extract_features(data)
+            cpu_times.append(time.process_time() - cpu)
+            wall_times.append(time.perf_counter() - wall)
+
+        cpu_best = min(cpu_times)
+        print(
+            f"  {seconds:>6.0f} s audio  {seconds / cpu_best:>8.1f} audio-s/CPU-s  "
+            f"wall {min(wall_times) * 1000:>7.1f} ms  "
+            f"pitch {features['average_pitch']} Hz (synthetic {pitch_hz:.0f})  "
+            f"pauses/min {features['pauses_per_minute']}"
+        )
+
+
+async def measure_loop_lag(stop: asyncio.Event, lags: list):
+    while not stop.is_set():
+        expected = time.perf_counter() + TICK
+        await asyncio.sleep(TICK)
+        lags.append(max(time.perf_counter() - expected, 0.0))
+
+
+async def pooled(seconds: float, clips: int, workers: int, pitch_hz: float):
+    data = synthesize(seconds, pitch_hz)
+    extractor = VoiceFeatureExtractor(workers=workers)
+    try:
+        # 워커 프로세스 기동(spawn + import) 비용 제외
+        await asyncio.gather(*(extractor.extract(data) for _ in range(workers)))
+
+        stop, lags = asyncio.Event(), []
+        ticker = asyncio.create_task(measure_loop_lag(stop, lags))
+        started = time.perf_counter()
+        await asyncio.gather(*(extractor.extract(data) for _ in range(clips)))
+        elapsed = time.perf_counter() - started
+        stop.set()
+        await ticker
+    finally:
+        extractor.shutdown()
+
+    print(
+        f"process pool ({workers} workers, {clips} x {seconds:.0f} s clips): "
+        f"{clips * seconds / elapsed:.1f} audio-s/wall-s, "
+        f"max loop lag {max(lags, default=0.0) * 1000:.1f} ms"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--durations", type=float, nargs="+", default=[5, 30, 120])
+    parser.add_argument("--pitch", type=float, default=180.0, help="합성 음성의 기본 음높이 (Hz)")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--clips", type=int, default=8)
+    parser.add_argument("--workers", type=int, default=2)
+    args = parser.parse_args()
+
+    in_process(args.durations, args.pitch, args.repeat)
+    asyncio.run(pooled(args.durations[len(args.durations) // 2], args.clips, args.workers, args.pitch))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""테스트 공통 설정 - 임시 SQLite DB로 앱을 띄우고 사용자별 인증 클라이언트를 제공"""
+import os
+import sys
+import tempfile
+import uuid
+
+# 앱 설정은 import 시점에 읽으므로 먼저 환경 변수를 지정
+_db_dir = tempfile.mkdtemp(prefix="health-chatbot-test-")
+os.environ.setdefault("DATABASE_URL", f"sqlite+aiosqlite:///{_db_dir}/test.db")
+os.environ.setdefault("BLOB_STORE_PATH", f"{_db_dir}/blobs")
+os.environ.setdefault("STT_STREAMING_BACKEND", "local")
+os.environ.setdefault("GEMINI_API_KEY", "test-key")
+os.environ.setdefault("DEBUG", "False")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+
+
+@pytest.fixture(scope="session")
+def app_client():
+    """lifespan(DB 초기화, 백그라운드 루프)을 세션 동안 한 번만 실행"""
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+@pytest.fixture
+def client(app_client):
+    """새 사용자로 로그인한 클라이언트"""
+    email = f"{uuid.uuid4().hex[:12]}@example.com"
+    app_client.post("/api/auth/register", json={
+        "email": email,
+        "username": email.split("@")[0],
+        "password": "password123",
+        "age": 30,
+        "gender": "MALE",
+    })
+    response = app_client.post("/api/auth/login", json={"username": email, "password": "password123"})
+    token = response.json()["access_token"]
+
+    # 같은 이벤트 루프를 쓰도록 세션 클라이언트를 재사용하고 인증 헤더만 바꿈
+    app_client.headers["Authorization"] = f"Bearer {token}"
+    yield app_client
+    app_client.headers.pop("Authorization", None)
@@ -0,0 +1,149 @@
+import asyncio
+
+import pytest
+from sqlalchemy import func, insert, select
+
+import app.routers.chat as chat_router
+from app.config import settings
+from app.database import AsyncSessionLocal
+from app.models.chat_history import ChatHistory, ChatSession, ChatType
+from app.models.job import Job
+from app.services.chat_context import SUMMARY_JOB, clip_tokens, estimate_tokens, fit_budget, update_summary
+
+LONG_KOREAN = "가슴이 답답하고 머리가 아파요. " * 200
+LONG_ENGLISH = "headache and mild fever since yesterday " * 300
+
+
+@pytest.mark.parametrize("text, max_tokens", [
+    ("가나다", 1),
+    ("가나다", 0),
+    ("가나다", -3),
+    ("", 0),
+    ("abc", 1),
+    ("가나다라", 3),
+    (LONG_KOREAN, 50),
+    (LONG_ENGLISH, 50),
+])
+def test_clip_tokens_stays_within_limit(text, max_tokens):
+    clipped = clip_tokens(text, max_tokens)
+    assert estimate_tokens(clipped) <= max(max_tokens, 0)
+    assert text.startswith(clipped.rstrip("…").rstrip())
+
+
+def test_clip_tokens_keeps_text_that_fits():
+    assert clip_tokens("abc", 1) == "abc"
+    assert clip_tokens("가나다라", 3) == "가나…"
+    assert clip_tokens("가나다", 1) == ""
+
+
+@pytest.mark.parametrize("summary, messages", [
+    (LONG_KOREAN, [LONG_KOREAN] * 10),
+    (LONG_ENGLISH, [LONG_ENGLISH, LONG_KOREAN] * 5),
+    ("", [LONG_KOREAN] * 30),
+    (LONG_KOREAN * 5, []),
+])
+@pytest.mark.parametrize("summary_max_tokens", [settings.CHAT_SUMMARY_MAX_TOKENS, settings.CHAT_CONTEXT_MAX_TOKENS * 2])
+def test_fit_budget_never_exceeds_max_tokens(summary, messages, summary_max_tokens):
+    turns = [("user" if index % 2 == 0 else "assistant", message) for index, message in enumerate(messages)]
+    kept_summary, kept = fit_budget(summary, turns, summary_max_tokens=summary_max_tokens)
+
+    total = estimate_tokens(kept_summary) + sum(estimate_tokens(message) for _, message in kept)
+    assert total <= settings.CHAT_CONTEXT_MAX_TOKENS
+    # 넘치면 가장 최근 메시지부터 남김
+    if kept:
+        assert kept[-1][0] == turns[-1][0]
+
+
+async def _insert_messages(user_id: int, session_id: str, count: int):
+    async with AsyncSessionLocal() as db:
+        await db.execute(insert(ChatHistory), [
+            {
+                "user_id": user_id,
+                "chat_type": ChatType.SYMPTOM_CHECK,
+                "session_id": session_id,
+                "role": "user" if index % 2 == 0 else "assistant",
+                "message": f"메시지 {index}",
+            }
+            for index in range(count)
+        ])
+        await db.commit()
+
+
+def test_concurrent_summary_runs_apply_once(client):
+    user_id = client.get("/api/auth/me").json()["id"]
+    session_id = "summary-race"
+    recent = settings.CHAT_CONTEXT_RECENT_MESSAGES
+
+    async def scenario():
+        async def no_llm(summary, turns, max_tokens):
+            raise AssertionError("요약할 메시지가 없으면 호출되지 않아야 함")
+
+        # 세션 행을 먼저 만들어 두 작업이 같은 summarized_until을 읽게 함
+        async with AsyncSessionLocal() as db:
+            assert await update_summary(db, user_id, session_id, no_llm) == 0
+        await _insert_messages(user_id, session_id, recent + 4)
+
+        both_summarizing = asyncio.Barrier(2)
+
+        async def summarize(summary, turns, max_tokens):
+            await both_summarizing.wait()
+            return f"요약 {len(turns)}개"
+
+        async def run():
+            async with AsyncSessionLocal() as db:
+                return await update_summary(db, user_id, session_id, summarize)
+
+        results = await asyncio.gather(run(), run())
+        async with AsyncSessionLocal() as db:
+            session = (await db.execute(
+                select(ChatSession).where(ChatSession.user_id == user_id, ChatSession.session_id == session_id)
+            )).scalar_one()
+            ids = (await db.execute(
+                select(ChatHistory.id)
+                .where(ChatHistory.user_id == user_id, ChatHistory.session_id == session_id)
+                .order_by(ChatHistory.id)
+            )).scalars().all()
+        return results, session, ids
+
+    results, session, ids = client.portal.call(scenario)
+
+    assert sorted(results) == [0, 4]
+    assert session.summary == "요약 4개"
+    assert session.summarized_until == ids[3]
+
+
+def test_summary_job_enqueued_only_after_recent_window_overflows(client, monkeypatch):
+    user_id = client.get("/api/auth/me").json()["id"]
+
+    async def symptom_check(message, user_context=None, conversation="", raise_errors=False):
+        return {"response": "물을 충분히 드세요.", "urgency_level": "low", "suggested_action": "self_care"}
+
+    async def summarize_conversation(summary, turns, max_tokens):
+        return "요약"
+
+    monkeypatch.setattr(chat_router.ai_service, "symptom_check", symptom_check)
+    monkeypatch.setattr(chat_router.ai_service, "summarize_conversation", summarize_conversation)
+
+    def summary_jobs():
+        async def count():
+            async with AsyncSessionLocal() as db:
+                return await db.scalar(
+                    select(func.count(Job.id)).where(Job.user_id == user_id, Job.job_type == SUMMARY_JOB)
+                )
+        return client.portal.call(count)
+
+    session_id = None
+    exchanges_in_window = settings.CHAT_CONTEXT_RECENT_MESSAGES // 2
+    for _ in range(exchanges_in_window):
+        response = client.post("/api/chat/symptom-check", json={
+            "message": "머리가 아파요", "chat_type": "symptom_check", "session_id": session_id,
+        })
+        assert response.status_code == 200
+        session_id = response.json()["session_id"]
+        assert summary_jobs() == 0
+
+    response = client.post("/api/chat/symptom-check", json={
+        "message": "아직도 아파요", "chat_type": "symptom_check", "session_id": session_id,
+    })
+    assert response.status_code == 200
+    assert summary_jobs() == 1
@@ -0,0 +1,51 @@
+from datetime import datetime
+
+from sqlalchemy import insert
+
+from app.database import AsyncSessionLocal
+from app.models.chat_history import ChatHistory, ChatType
+
+
+def test_session_pages_keep_sessions_with_same_last_message_time(client):
+    user_id = client.get("/api/auth/me").json()["id"]
+    same_time = datetime(2026, 10, 1, 9, 0, 0)
+    session_ids = [f"session-{index}" for index in range(5)]
+
+    async def seed():
+        async with AsyncSessionLocal() as db:
+            await db.execute(insert(ChatHistory), [
+                {
+                    "user_id": user_id,
+                    "chat_type": ChatType.SYMPTOM_CHECK,
+                    "session_id": session_id,
+                    "role": "user",
+                    "message": f"{session_id} 질문",
+                    "created_at": same_time,
+                }
+                for session_id in session_ids
+            ])
+            await db.commit()
+
+    client.portal.call(seed)
+
+    seen, params = [], {"limit": 2}
+    while True:
+        page = client.get("/api/chat/sessions", params=params).json()
+        if not page:
+            break
+        seen.extend(item["session_id"] for item in page)
+        params = {
+            "limit": 2,
+            "before": page[-1]["last_message_at"],
+            "before_session_id": page[-1]["session_id"],
+        }
+
+    assert seen == sorted(session_ids, reverse=True)
+
+
+def test_session_cursor_requires_both_parts(client):
+    response = client.get("/api/chat/sessions", params={"before": "2026-10-01T09:00:00"})
+    assert response.status_code == 422
+
+    response = client.get("/api/chat/sessions", params={"before_session_id": "session-1"})
+    assert response.status_code == 422
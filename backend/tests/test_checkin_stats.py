@@ -0,0 +1,43 @@
+from app.database import AsyncSessionLocal
+from app.services.checkin_stats import CheckinStatsCache
+
+
+def _checkin(client, mood_score):
+    response = client.post("/voice/checkin", json={
+        "checkin_type": "morning", "mood_score": mood_score, "energy_level": 5,
+    })
+    assert response.status_code == 200
+
+
+def test_stats_count_each_checkin_once(client):
+    assert client.get("/voice/checkins/stats").json()["total_checkins"] == 0
+
+    _checkin(client, 6)
+    stats = client.get("/voice/checkins/stats").json()
+    assert (stats["total_checkins"], stats["average_mood"]) == (1, 6.0)
+    # 캐시 적중 시에도 같은 값
+    assert client.get("/voice/checkins/stats").json() == stats
+
+    _checkin(client, 8)
+    stats = client.get("/voice/checkins/stats").json()
+    assert (stats["total_checkins"], stats["average_mood"], stats["checkins_this_week"]) == (2, 7.0, 2)
+
+
+def test_load_overlapping_a_write_is_not_cached(client):
+    user_id = client.get("/api/auth/me").json()["id"]
+
+    class RacingCache(CheckinStatsCache):
+        async def _load(self, db, user_id, current_week):
+            summary = await super()._load(db, user_id, current_week)
+            # 집계 직후 다른 요청이 체크인을 커밋한 상황
+            self.invalidate(user_id)
+            return summary
+
+    cache = RacingCache(ttl=60)
+
+    async def scenario():
+        async with AsyncSessionLocal() as db:
+            return await cache.get(db, user_id)
+
+    assert client.portal.call(scenario)["total_checkins"] == 0
+    assert cache.metrics()["entries"] == 0
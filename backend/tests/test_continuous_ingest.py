@@ -0,0 +1,54 @@
+import json
+from datetime import datetime
+
+from app.schemas.voice_health import ContinuousAnalysisData
+from app.services.continuous_ingest import ContinuousAnalysisBuffer, build_rows
+
+
+def _sample(**overrides):
+    sample = {
+        "timestamp": datetime.utcnow().isoformat() + "Z",
+        "stress_level": 3.0,
+        "anxiety_indicator": 0.2,
+        "depression_indicator": 0.1,
+        "energy_level": 6.5,
+        "overall_status": "normal",
+    }
+    sample.update(overrides)
+    return sample
+
+
+def test_rejects_out_of_range_and_non_finite_samples(client):
+    response = client.post("/voice/continuous-analysis", json=_sample(stress_level=11))
+    assert response.status_code == 422
+
+    response = client.post("/voice/continuous-analysis", json=_sample(anxiety_indicator=1.5))
+    assert response.status_code == 422
+
+    # 표준 JSON이 아니지만 파서가 받아들이는 NaN 리터럴
+    body = json.dumps(_sample(stress_level=float("nan")))
+    response = client.post(
+        "/voice/continuous-analysis", content=body, headers={"Content-Type": "application/json"}
+    )
+    assert response.status_code == 422
+
+
+def test_bad_row_is_dropped_without_blocking_the_batch(client):
+    user_id = client.get("/api/auth/me").json()["id"]
+    buffer = ContinuousAnalysisBuffer()
+
+    # NOT NULL 위반으로 묶음 INSERT를 실패시키는 행
+    bad_row, _ = build_rows(user_id, ContinuousAnalysisData(**_sample()))
+    bad_row["user_id"] = None
+    buffer._analyses.append(bad_row)
+
+    client.portal.call(buffer.add, user_id, [ContinuousAnalysisData(**_sample())])
+
+    metrics = buffer.metrics()
+    assert metrics["failed_flushes"] == 1
+    assert metrics["dropped_rows"] == 1
+    assert metrics["pending_analyses"] == 0
+    assert metrics["flushed_rows"] == 1
+
+    history = client.get("/voice/continuous-analysis/history", params={"hours": 1}).json()
+    assert history["statistics"]["total_analyses"] == 1
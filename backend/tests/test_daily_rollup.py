@@ -0,0 +1,50 @@
+from datetime import datetime
+
+from sqlalchemy import select
+
+from app.database import engine
+from app.models.daily_rollup import DailyRollup
+from app.services.daily_rollup import ROLLUP_SOURCES, refresh_day
+
+
+def _rollups(client, user_id):
+    async def load():
+        async with engine.connect() as connection:
+            result = await connection.execute(
+                select(DailyRollup.metric, DailyRollup.count, DailyRollup.total).where(
+                    DailyRollup.user_id == user_id, DailyRollup.source == "health"
+                )
+            )
+            return result.all()
+
+    return client.portal.call(load)
+
+
+def test_refresh_day_overwrites_existing_rollup(client):
+    user_id = client.get("/api/auth/me").json()["id"]
+    measured_at = datetime.utcnow().replace(hour=8, minute=0, second=0, microsecond=0)
+    for value in (36.6, 37.0):
+        response = client.post("/api/health-records/", json={
+            "record_type": "temperature",
+            "value": value,
+            "unit": "°C",
+            "measured_at": measured_at.isoformat(),
+        })
+        assert response.status_code == 201
+
+    assert _rollups(client, user_id) == [("value", 2, 73.6)]
+
+    # 다른 트랜잭션이 먼저 같은 날짜 행을 넣은 상황에서 다시 계산해도 충돌 없이 덮어씀
+    async def refresh_again():
+        async with engine.begin() as connection:
+            await connection.run_sync(
+                refresh_day, ROLLUP_SOURCES["health"], user_id, "temperature", measured_at.date()
+            )
+
+    client.portal.call(refresh_again)
+    assert _rollups(client, user_id) == [("value", 2, 73.6)]
+
+    record_ids = [record["id"] for record in client.get("/api/health-records/").json()]
+    for record_id in record_ids:
+        assert client.delete(f"/api/health-records/{record_id}").status_code == 204
+    assert _rollups(client, user_id) == []
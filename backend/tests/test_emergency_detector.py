@@ -0,0 +1,39 @@
+import pytest
+
+from app.services.emergency_detector import EmergencyKeywordDetector
+
+detector = EmergencyKeywordDetector()
+
+
+@pytest.mark.parametrize("message, category", [
+    ("가슴 통증이 심해요", "chest_pain"),
+    ("가슴이 아프고 숨이 안 쉬어져요", "chest_pain"),
+    ("피가 멈추지 않아요", "bleeding"),
+    ("I think I had a stroke", "stroke"),
+    ("I can’t breathe", "breathing"),
+    ("No chest pain, but I fainted", "consciousness"),
+    ("기절할 것 같지는 않은데 가슴이 아파요", "chest_pain"),
+    # 부정어가 키워드의 서술어가 아닌 경우 (이중 부정, 다른 절의 "아니")
+    ("가슴 통증이 없어지지 않아요", "chest_pain"),
+    ("호흡곤란이 없어지질 않아요", "breathing"),
+    ("흉통이 없던 적이 없어요", "chest_pain"),
+    ("실신했어요 아니 진짜로", "consciousness"),
+    # 자해 관련 표현은 부정이 붙어도 항상 감지
+    ("죽고 싶지 않아요 근데 너무 힘들어요", "self_harm"),
+])
+def test_detects_emergency(message, category):
+    assert detector.detect(message)["category"] == category
+
+
+@pytest.mark.parametrize("message", [
+    "I swim backstroke every morning",
+    "Heatstroke prevention tips?",
+    "가슴 통증은 없어요",
+    "가슴이 아프지 않아요",
+    "마비는 아니고 조금 저려요",
+    "어지럽긴 한데 기절은 안 했어요",
+    "I don't have chest pain",
+    "no shortness of breath",
+])
+def test_ignores_substrings_and_negations(message):
+    assert detector.detect(message) is None
@@ -0,0 +1,188 @@
+import asyncio
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import select
+
+from app.database import AsyncSessionLocal
+from app.models.job import Job, JobStatus
+from app.models.voice_health import HealthNotification
+from app.services.job_queue import LEASE_EXPIRED_ERROR, JobQueue, get_job_queue
+from app.services.llm_gateway import LLMGateway
+
+CHECK = {"stress_level": 7, "anxiety_level": 6, "mood_level": 4, "sleep_quality": 5, "notes": "야근이 많음"}
+
+
+@pytest.fixture
+def fast_retry(monkeypatch):
+    monkeypatch.setattr(get_job_queue(), "retry_base", 0.01)
+
+
+def _run_assessment_job(client):
+    response = client.post("/api/mental-health/", params={"background": True}, json=CHECK)
+    assert response.status_code == 202
+    response = client.get(response.headers["Location"], params={"wait": 10})
+    assert response.status_code == 200
+    return response.json()
+
+
+def test_job_notification_is_listed(client, monkeypatch):
+    async def generate(self, model, contents, timeout=None, **kwargs):
+        return SimpleNamespace(text="[ASSESSMENT] 스트레스가 높은 편입니다. [RECOMMENDATIONS] - 충분히 쉬세요")
+
+    monkeypatch.setattr(LLMGateway, "generate", generate)
+
+    job = _run_assessment_job(client)
+    assert job["status"] == "done"
+    assert job["attempts"] == 1
+
+    response = client.get("/voice/notifications")
+    assert response.status_code == 200
+    [notification] = response.json()
+    assert notification["title"] == "정신 건강 평가 완료"
+    assert notification["action_url"] == f"/api/jobs/{job['id']}"
+
+
+def test_job_retries_then_saves_fallback(client, monkeypatch, fast_retry):
+    calls = []
+
+    async def generate(self, model, contents, timeout=None, **kwargs):
+        calls.append(contents)
+        raise RuntimeError("upstream unavailable")
+
+    monkeypatch.setattr(LLMGateway, "generate", generate)
+
+    job = _run_assessment_job(client)
+    assert job["status"] == "failed"
+    assert job["attempts"] == get_job_queue().max_attempts
+    assert len(calls) == get_job_queue().max_attempts
+    assert job["error"] == "upstream unavailable"
+    assert "일시적인 문제" in job["result"]["ai_assessment"]
+
+    [check] = client.get("/api/mental-health/").json()
+    assert check["ai_assessment"] == job["result"]["ai_assessment"]
+
+    [notification] = client.get("/voice/notifications").json()
+    assert notification["title"] == "정신 건강 평가 실패"
+
+
+def _insert_job(user_id: int, job_type: str, **values) -> int:
+    """직접 만든 작업 행 (요청을 거치지 않고 특정 상태를 재현)"""
+    async def insert():
+        async with AsyncSessionLocal() as db:
+            job = Job(user_id=user_id, job_type=job_type, payload={"user_id": user_id}, **values)
+            db.add(job)
+            await db.commit()
+            return job.id
+    return insert
+
+
+def test_per_type_concurrency_limit(client):
+    user_id = client.get("/api/auth/me").json()["id"]
+    queue = JobQueue(concurrency={}, poll_interval=0.02)
+    running, peak = {"limited": 0, "other": 0}, {"limited": 0, "other": 0}
+
+    async def scenario():
+        release = asyncio.Event()
+
+        def make_handler(job_type):
+            async def handler(payload):
+                running[job_type] += 1
+                peak[job_type] = max(peak[job_type], running[job_type])
+                await release.wait()
+                running[job_type] -= 1
+                return {"ok": True}
+            return handler
+
+        queue.register("test_limited", make_handler("limited"), title="제한 작업", concurrency=2, notify=False)
+        queue.register("test_other", make_handler("other"), title="다른 작업", concurrency=1, notify=False)
+
+        async with AsyncSessionLocal() as db:
+            jobs = [queue.enqueue(db, user_id, "test_limited", {}) for _ in range(5)]
+            jobs += [queue.enqueue(db, user_id, "test_other", {}) for _ in range(2)]
+            await db.commit()
+
+        queue.start()
+        try:
+            for _ in range(100):
+                if queue.metrics()["running"] == {"test_limited": 2, "test_other": 1}:
+                    break
+                await asyncio.sleep(0.02)
+            # 한도까지 찬 상태로 몇 번 더 폴링해도 늘어나지 않음
+            await asyncio.sleep(0.1)
+            at_limit = dict(queue.metrics()["running"])
+
+            release.set()
+            await asyncio.gather(*(queue.wait(job.id, 5) for job in jobs))
+        finally:
+            await queue.stop()
+
+        async with AsyncSessionLocal() as db:
+            statuses = (await db.execute(
+                select(Job.status).where(Job.id.in_([job.id for job in jobs]))
+            )).scalars().all()
+        return at_limit, statuses
+
+    at_limit, statuses = client.portal.call(scenario)
+
+    assert at_limit == {"test_limited": 2, "test_other": 1}
+    assert peak == {"limited": 2, "other": 1}
+    assert statuses == [JobStatus.DONE.value] * 7
+
+
+def test_expired_lease_requeues_or_fails_exhausted_jobs(client):
+    user_id = client.get("/api/auth/me").json()["id"]
+    queue = JobQueue(timeout=1, poll_interval=0.02)
+    fallbacks = []
+
+    async def crashing(payload):
+        raise AssertionError("임대 만료 작업은 _maintain에서만 처리")
+
+    async def fallback(payload, error):
+        fallbacks.append(error)
+        return {"fallback": True}
+
+    queue.register("test_crashing", crashing, title="충돌 작업")
+    queue.on_failure("test_crashing")(fallback)
+
+    now = datetime.utcnow()
+    # 워커 프로세스가 실행 도중 죽어 RUNNING으로 남은 작업들
+    stale = now - timedelta(minutes=5)
+    retryable = client.portal.call(_insert_job(
+        user_id, "test_crashing", status=JobStatus.RUNNING.value, attempts=1, max_attempts=3,
+        started_at=stale, run_after=stale,
+    ))
+    exhausted = client.portal.call(_insert_job(
+        user_id, "test_crashing", status=JobStatus.RUNNING.value, attempts=3, max_attempts=3,
+        started_at=stale, run_after=stale,
+    ))
+    # 아직 임대 중인 작업은 건드리지 않음
+    active = client.portal.call(_insert_job(
+        user_id, "test_crashing", status=JobStatus.RUNNING.value, attempts=3, max_attempts=3,
+        started_at=now, run_after=now,
+    ))
+
+    async def scenario():
+        async with AsyncSessionLocal() as db:
+            await queue._maintain(db, datetime.utcnow())
+        await asyncio.gather(*queue._workers)
+
+        async with AsyncSessionLocal() as db:
+            jobs = {job.id: job for job in (await db.execute(
+                select(Job).where(Job.id.in_([retryable, exhausted, active]))
+            )).scalars()}
+            notifications = (await db.execute(
+                select(HealthNotification.title).where(HealthNotification.action_url == f"/api/jobs/{exhausted}")
+            )).scalars().all()
+        return jobs, notifications
+
+    jobs, notifications = client.portal.call(scenario)
+
+    assert jobs[retryable].status == JobStatus.QUEUED.value
+    assert jobs[exhausted].status == JobStatus.FAILED.value
+    assert jobs[exhausted].error == LEASE_EXPIRED_ERROR
+    assert jobs[exhausted].result == {"fallback": True}
+    assert fallbacks == [LEASE_EXPIRED_ERROR]
+    assert notifications == ["충돌 작업 실패"]
+    assert jobs[active].status == JobStatus.RUNNING.value
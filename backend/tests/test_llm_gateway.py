@@ -0,0 +1,45 @@
+import asyncio
+import threading
+import time
+from types import SimpleNamespace
+
+from app.services.llm_gateway import LLMGateway
+
+
+class EndlessStream:
+    """청크를 끝없이 내보내는 SDK 스트리밍 응답 대역 (cancel 호출 기록)"""
+
+    def __init__(self):
+        self.cancelled = threading.Event()
+        self.produced = 0
+
+    def __iter__(self):
+        while not self.cancelled.is_set():
+            time.sleep(0.01)
+            self.produced += 1
+            yield SimpleNamespace(text=f"조각 {self.produced} ")
+
+    def cancel(self):
+        self.cancelled.set()
+
+
+def test_disconnected_stream_releases_its_slot():
+    upstream = EndlessStream()
+    model = SimpleNamespace(generate_content=lambda contents, stream=False: upstream)
+
+    async def scenario():
+        gateway = LLMGateway(max_concurrency=1, timeout=5)
+        chunks = gateway.stream(model, "프롬프트")
+        assert (await chunks.__anext__()).text == "조각 1 "
+        # SSE 클라이언트 연결이 끊겨 소비자 제너레이터가 닫힘
+        await chunks.aclose()
+
+        # 다른 호출이 같은 (유일한) 슬롯을 받을 수 있어야 함
+        result = await asyncio.wait_for(gateway.run(lambda: "다음 호출"), 2)
+        return gateway, result
+
+    gateway, result = asyncio.run(scenario())
+
+    assert result == "다음 호출"
+    assert upstream.cancelled.is_set()
+    assert gateway.metrics()["in_flight"] == 0
@@ -0,0 +1,94 @@
+import uuid
+
+from app.database import AsyncSessionLocal
+from app.models.user import User
+from app.services.meal_image_index import MealAnalysisIndex, MultiIndexHash
+
+PERCEPTUAL_HASH = 0x0F0F_3C3C_5A5A_A5A5
+ANALYSIS = {
+    "ai_analysis": "저녁으로 먹은 현미밥과 닭가슴살은 단백질이 충분합니다.",
+    "ai_recommendation": "채소를 조금 더 곁들여 보세요.",
+    "match_percentage": 80.0,
+    "calories": 520.0,
+    "protein": 35.0,
+    "carbs": 60.0,
+    "fat": 12.0,
+    "detected_foods": ["현미밥", "닭가슴살"],
+    "health_score": 8.0,
+    "nutrition_source": "ai",
+}
+
+
+async def _create_user() -> int:
+    async with AsyncSessionLocal() as db:
+        email = f"{uuid.uuid4().hex[:12]}@example.com"
+        user = User(email=email, username=email.split("@")[0], hashed_password="-")
+        db.add(user)
+        await db.commit()
+        return user.id
+
+
+def test_multi_index_hash_remove():
+    index = MultiIndexHash(radius=2)
+    first = index.add(0b1111, "first")
+    index.add(0b1110, "second")
+    index.remove(first)
+
+    assert index.size == 1
+    assert index.search(0b1111) == [(1, "second")]
+
+
+def test_similar_photo_reused_only_for_same_user(client):
+    owner_id = client.get("/api/auth/me").json()["id"]
+
+    async def scenario():
+        other_id = await _create_user()
+
+        index = MealAnalysisIndex(max_distance=4)
+        await index.record(PERCEPTUAL_HASH, "dinner", owner_id, None, ANALYSIS)
+        nearby = PERCEPTUAL_HASH ^ 0b101  # 해밍 거리 2
+
+        return (
+            await index.lookup(nearby, "dinner", owner_id),
+            await index.lookup(nearby, "dinner", other_id),
+            await index.lookup(nearby, "lunch", owner_id),
+            await index.lookup(nearby, "dinner", None),
+        )
+
+    same_user, other_user, other_meal_type, anonymous = client.portal.call(scenario)
+
+    assert same_user == dict(ANALYSIS, hash_distance=2)
+    # 다른 사용자의 분석/추천 문구를 내보내지 않음
+    assert other_user is None
+    assert other_meal_type is None
+    assert anonymous is None
+
+
+def test_index_evicts_oldest_entries_without_rebuilding(client):
+    async def scenario():
+        user_id, other_id = await _create_user(), await _create_user()
+        index = MealAnalysisIndex(max_distance=4, max_entries=3)
+        # 색인 전에 쌓인 다른 사용자의 행이 있어도 최근 max_entries개만 올라감
+        for offset in range(3):
+            await index.record(PERCEPTUAL_HASH ^ (0xFF << 8 * offset), "dinner", other_id, None, ANALYSIS)
+
+        # 서로 해밍 거리 16 (max_distance 밖)
+        hashes = [PERCEPTUAL_HASH ^ (0xFF << 8 * offset) for offset in range(5)]
+        for perceptual_hash in hashes:
+            await index.record(perceptual_hash, "dinner", user_id, None, ANALYSIS)
+            # 매 조회가 새 행 하나만 읽고 가장 오래된 항목 하나를 뺌 (전체 재구성 없음)
+            await index.lookup(perceptual_hash, "dinner", user_id)
+            assert len(index._order) == 3
+
+        user_index = index._indexes[(user_id, "dinner")]
+        found = [await index.lookup(perceptual_hash, "dinner", user_id) for perceptual_hash in hashes]
+        return user_id, index, user_index, found
+
+    user_id, index, user_index, found = client.portal.call(scenario)
+
+    assert [result is not None for result in found] == [False, False, True, True, True]
+    # 사용자 색인에는 5번 추가되고 2번 제거됐을 뿐 다시 만들어지지 않음
+    assert user_index.size == 3 and user_index._next_position == 5
+    # 밀려난 다른 사용자 색인은 비면 삭제됨
+    assert list(index._indexes) == [(user_id, "dinner")]
+    assert index.metrics()["entries"] == 3
@@ -0,0 +1,37 @@
+import io
+import uuid
+
+from PIL import Image
+
+
+def _png() -> bytes:
+    buffer = io.BytesIO()
+    Image.new("RGB", (32, 32), (200, 120, 40)).save(buffer, "PNG")
+    return buffer.getvalue()
+
+
+def _login_other_user(client):
+    email = f"{uuid.uuid4().hex[:12]}@example.com"
+    client.post("/api/auth/register", json={
+        "email": email, "username": email.split("@")[0], "password": "password123",
+    })
+    token = client.post("/api/auth/login", json={"username": email, "password": "password123"}).json()["access_token"]
+    client.headers["Authorization"] = f"Bearer {token}"
+
+
+def test_upload_does_not_reveal_other_users_copy(client):
+    data = _png()
+    first = client.post("/api/meals/upload-image", files={"file": ("meal.png", data, "image/png")})
+    assert first.status_code == 200
+
+    _login_other_user(client)
+    second = client.post("/api/meals/upload-image", files={"file": ("meal.png", data, "image/png")})
+    assert second.status_code == 200
+
+    # 같은 내용은 한 번만 저장하지만 응답으로는 구분할 수 없음
+    assert first.json() == second.json()
+    assert "deduplicated" not in second.json()
+
+    image = client.get(second.json()["image_url"])
+    assert image.status_code == 200
+    assert image.content == data
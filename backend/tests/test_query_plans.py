@@ -0,0 +1,84 @@
+"""사용자별 시계열 조회가 (user_id, 시간) 복합 인덱스를 쓰는지 실행 계획으로 확인
+
+SQLite는 테스트 DB에서 항상 확인하고, PostgreSQL은 TEST_POSTGRES_URL이 있을 때만 확인한다.
+"""
+import asyncio
+import os
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import select, text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.database import Base, _to_async_url, engine
+from app.models.chat_history import ChatHistory
+from app.models.disease import DiseaseProgressLog
+from app.models.health_record import HealthRecord
+from app.models.meal import Meal
+from app.models.mood_record import MoodRecord
+from app.models.sleep import SleepRecord
+from app.models.voice_health import VoiceHealthAnalysis
+
+SINCE = datetime(2026, 1, 1)
+
+
+def _recent(model, time_column, *conditions):
+    column = getattr(model, time_column)
+    return (
+        select(model)
+        .where(model.user_id == 1, column >= SINCE, *conditions)
+        .order_by(column.desc())
+        .limit(50)
+    )
+
+
+QUERIES = [
+    ("ix_chat_histories_user_id_created_at", _recent(ChatHistory, "created_at")),
+    (
+        "ix_chat_histories_user_id_session_id_created_at",
+        _recent(ChatHistory, "created_at", ChatHistory.session_id == "session"),
+    ),
+    ("ix_meals_user_id_meal_date", _recent(Meal, "meal_date")),
+    ("ix_sleep_records_user_id_sleep_start", _recent(SleepRecord, "sleep_start")),
+    ("ix_voice_health_analyses_user_id_recording_date", _recent(VoiceHealthAnalysis, "recording_date")),
+    ("ix_disease_progress_logs_user_id_log_date", _recent(DiseaseProgressLog, "log_date")),
+    ("ix_mood_records_user_id_recorded_at", _recent(MoodRecord, "recorded_at")),
+    ("ix_health_records_user_id_measured_at", _recent(HealthRecord, "measured_at")),
+]
+QUERY_IDS = [index for index, _ in QUERIES]
+
+
+async def _plan(connection, prefix: str, query) -> str:
+    compiled = query.compile(connection.engine, compile_kwargs={"literal_binds": True})
+    result = await connection.execute(text(f"{prefix} {compiled}"))
+    return "\n".join(str(row[-1]) for row in result.all())
+
+
+@pytest.mark.parametrize("index, query", QUERIES, ids=QUERY_IDS)
+def test_sqlite_uses_user_time_index(app_client, index, query):
+    if engine.dialect.name != "sqlite":
+        pytest.skip("테스트 DB가 SQLite가 아님")
+
+    async def explain():
+        async with engine.connect() as connection:
+            return await _plan(connection, "EXPLAIN QUERY PLAN", query)
+
+    plan = app_client.portal.call(explain)
+    assert f"USING INDEX {index}" in plan or f"USING COVERING INDEX {index}" in plan, plan
+
+
+@pytest.mark.skipif(not os.getenv("TEST_POSTGRES_URL"), reason="TEST_POSTGRES_URL 미설정")
+def test_postgres_uses_user_time_indexes():
+    async def explain_all():
+        pg_engine = create_async_engine(_to_async_url(os.environ["TEST_POSTGRES_URL"]))
+        try:
+            async with pg_engine.begin() as connection:
+                await connection.run_sync(Base.metadata.create_all)
+                # 빈 테이블에서는 순차 탐색이 더 싸므로 인덱스 사용 가능 여부만 확인
+                await connection.execute(text("SET LOCAL enable_seqscan = off"))
+                return {index: await _plan(connection, "EXPLAIN", query) for index, query in QUERIES}
+        finally:
+            await pg_engine.dispose()
+
+    for index, plan in asyncio.run(explain_all()).items():
+        assert index in plan, plan
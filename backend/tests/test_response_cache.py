@@ -0,0 +1,58 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from app.services.ai_service import AIService
+from app.services.llm_gateway import LLMGateway
+from app.services.response_cache import ResponseCache
+
+
+@pytest.mark.parametrize("record_type, first, second", [
+    ("temperature", 37.5, 37.6),
+    ("temperature", 37.9, 38.0),
+    ("temperature", 36.4, 36.5),
+    ("blood_sugar", 99.96, 100.04),
+    ("blood_pressure", 119.5, 120.0),
+])
+def test_readings_across_clinical_thresholds_get_different_keys(record_type, first, second):
+    def key(value):
+        return (ResponseCache.reading_band(record_type, value), ResponseCache.value_bucket(value))
+
+    assert key(first) != key(second)
+
+
+@pytest.mark.parametrize("record_type, value", [
+    ("temperature", 39.4),
+    ("temperature", 34.0),
+    ("temperature", 60.0),
+    ("blood_pressure", 185),
+    ("blood_sugar", 55),
+    ("heart_rate", 35),
+    ("oxygen_saturation", 88),
+    ("oxygen_saturation", 120),
+])
+def test_dangerous_or_out_of_range_readings_are_not_cacheable(record_type, value):
+    assert ResponseCache.reading_band(record_type, value) is None
+
+
+def test_health_advice_skips_cache_for_dangerous_readings(monkeypatch):
+    calls = []
+
+    async def generate(self, model, contents, timeout=None, **kwargs):
+        calls.append(contents)
+        return SimpleNamespace(text="조언")
+
+    monkeypatch.setattr(LLMGateway, "generate", generate)
+    service = AIService()
+
+    async def advise(value):
+        return await service.health_advice("temperature", value, {"age": 41})
+
+    asyncio.run(advise(36.8))
+    asyncio.run(advise(36.8))
+    assert len(calls) == 1
+
+    asyncio.run(advise(39.6))
+    asyncio.run(advise(39.6))
+    assert len(calls) == 3
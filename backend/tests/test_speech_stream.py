@@ -0,0 +1,40 @@
+import pytest
+from starlette.websockets import WebSocketDisconnect
+
+from app.config import settings
+
+
+def _stream_url(client) -> str:
+    token = client.headers["Authorization"].split(" ", 1)[1]
+    return f"/api/speech/stream?token={token}"
+
+
+def test_invalid_token_closes_with_policy_violation(client):
+    with pytest.raises(WebSocketDisconnect) as exc_info:
+        with client.websocket_connect("/api/speech/stream?token=invalid"):
+            pass
+    assert exc_info.value.code == 1008
+
+
+def test_audio_frames_yield_interim_then_final_then_end(client):
+    with client.websocket_connect(_stream_url(client)) as websocket:
+        # 로컬 인식기는 UTF-8 청크를 발화 내용으로 취급
+        websocket.send_bytes("머리가".encode())
+        assert websocket.receive_json() == {"type": "interim", "transcript": "머리가", "stability": 0.5}
+        websocket.send_bytes("아파요".encode())
+        assert websocket.receive_json()["transcript"] == "머리가 아파요"
+
+        websocket.send_text("end")
+        assert websocket.receive_json() == {"type": "final", "transcript": "머리가 아파요", "confidence": 1.0}
+        assert websocket.receive_json() == {"type": "end", "transcript": "머리가 아파요"}
+
+
+def test_oversized_chunk_is_rejected(client):
+    with client.websocket_connect(_stream_url(client)) as websocket:
+        websocket.send_bytes(b"\x00" * (settings.STT_STREAM_MAX_CHUNK_BYTES + 1))
+
+        error = websocket.receive_json()
+        assert error["type"] == "error"
+        assert "너무 크거나" in error["message"]
+        # 세션을 끝내고 (인식된 내용 없이) 종료 메시지를 보냄
+        assert websocket.receive_json() == {"type": "end", "transcript": ""}
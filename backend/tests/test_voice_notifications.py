@@ -0,0 +1,50 @@
+from datetime import datetime
+
+from app.services.continuous_ingest import get_continuous_buffer
+
+
+def _concern_sample():
+    return {
+        "timestamp": datetime.utcnow().isoformat() + "Z",
+        "stress_level": 8.0,
+        "anxiety_indicator": 0.7,
+        "depression_indicator": 0.6,
+        "energy_level": 0.4,
+        "overall_status": "concern",
+    }
+
+
+def test_notifications_list_includes_monitoring_alert(client):
+    response = client.post("/voice/continuous-analysis", json=_concern_sample())
+    assert response.status_code == 200
+    client.portal.call(get_continuous_buffer().flush)
+
+    response = client.get("/voice/notifications")
+    assert response.status_code == 200
+    [alert] = response.json()
+    assert alert["title"] == "정신 건강 주의"
+    assert alert["message"].startswith("상시 모니터링 결과")
+    assert alert["tts_narration"]
+    assert alert["is_read"] is False
+
+
+def test_notification_create_and_mark_read(client):
+    response = client.post("/voice/notifications", json={
+        "notification_type": "reminder",
+        "title": "물 마시기",
+        "message": "물 한 잔 드세요.",
+        "tts_narration": "물 한 잔 드세요.",
+    })
+    assert response.status_code == 200
+    notification = response.json()
+    assert notification["message"] == "물 한 잔 드세요."
+
+    response = client.patch(
+        f"/voice/notifications/{notification['id']}",
+        json={"is_read": True, "is_narrated": True},
+    )
+    assert response.status_code == 200
+    assert response.json()["is_read"] is True
+    assert response.json()["is_narrated"] is True
+    assert response.json()["read_at"] is not None
+
@@ -34,6 +34,7 @@ const ChatBot = () => {
   const recordingTimerRef = useRef(null);
   const recordingStreamRef = useRef(null);
   const voiceTonePromiseRef = useRef(null);
+  const speechStreamRef = useRef(null);
 
   // 대화 로그 자동 저장 훅
   const {
@@ -166,16 +167,33 @@ const ChatBot = () => {
       mediaRecorderRef.current = mediaRecorder;
       audioChunksRef.current = [];
 
+      // 실시간 음성 인식: 녹음 중 청크를 바로 보내고 중간 결과를 입력창에 표시
+      speechStreamRef.current = speechAPI.openStream({
+        onInterim: (transcript) => setInput(transcript),
+      });
+
       mediaRecorder.ondataavailable = (event) => {
         if (event.data.size > 0) {
           audioChunksRef.current.push(event.data);
+          speechStreamRef.current?.send(event.data);
         }
       };
 
       mediaRecorder.onstop = async () => {
-        // 녹음 완료 후 처리
+        // 녹음 완료 후 처리 (실시간 인식 결과가 있으면 업로드 없이 사용)
         const audioBlob = new Blob(audioChunksRef.current, { type: 'audio/webm' });
-        await processVoiceInput(audioBlob);
+        let streamedTranscript = null;
+        if (speechStreamRef.current) {
+          try {
+            streamedTranscript = await speechStreamRef.current.finish();
+          } catch (error) {
+            console.warn('실시간 음성 인식 실패, 전체 녹음으로 변환:', error);
+          } finally {
+            speechStreamRef.current.close();
+            speechStreamRef.current = null;
+          }
+        }
+        await processVoiceInput(audioBlob, streamedTranscript);
 
         // 스트림 정리
         if (recordingStreamRef.current) {
@@ -184,7 +202,7 @@ const ChatBot = () => {
         }
       };
 
-      mediaRecorder.start();
+      mediaRecorder.start(250); // 250ms마다 청크 전송
       setIsRecording(true);
       setRecordingTime(0);
       setVoiceToneAnalysis(null);
@@ -231,35 +249,26 @@ const ChatBot = () => {
   };
 
   // 음성 입력 처리 (STT + 음성 톤 + 감정 분석)
-  const processVoiceInput = async (audioBlob) => {
+  const processVoiceInput = async (audioBlob, streamedTranscript = null) => {
     setIsTranscribing(true);
 
     try {
-      // 1. 오디오 → Base64 변환
-      const reader = new FileReader();
-      const audioBase64 = await new Promise((resolve, reject) => {
-        reader.onloadend = () => {
-          const base64 = reader.result.split(',')[1];
-          resolve(base64);
-        };
-        reader.onerror = reject;
-        reader.readAsDataURL(audioBlob);
-      });
+      let transcript = streamedTranscript;
+
+      if (!transcript) {
+        // Google STT로 음성 → 텍스트 변환 (녹음 파일 원본 전송)
+        console.log('🔄 음성을 텍스트로 변환 중...');
+        const sttResponse = await speechAPI.transcribeAudio(audioBlob, {
+          language_code: 'ko-KR',
+          sample_rate_hertz: 48000,
+        });
 
-      // 2. Google STT로 음성 → 텍스트 변환
-      console.log('🔄 음성을 텍스트로 변환 중...');
-      const sttResponse = await speechAPI.transcribe({
-        audio_base64: audioBase64,
-        language_code: 'ko-KR',
-        encoding: 'WEBM_OPUS',
-        sample_rate_hertz: 48000,
-      });
+        if (!sttResponse.data.success) {
+          throw new Error(sttResponse.data.error || '음성 인식 실패');
+        }
 
-      if (!sttResponse.data.success) {
-        throw new Error(sttResponse.data.error || '음성 인식 실패');
+        transcript = sttResponse.data.transcript;
       }
-
-      const transcript = sttResponse.data.transcript;
       console.log('📝 변환된 텍스트:', transcript);
 
       // 3. 음성 톤 분석 결과 대기 (이미 실행 중)
@@ -41,6 +41,8 @@ const ContinuousVoiceMonitor = () => {
   const volumeHistoryRef = useRef([]);
   const analysisIntervalRef = useRef(null);
   const streamRef = useRef(null);
+  const pendingSamplesRef = useRef([]); // 전송 대기 중인 분석 샘플
+  const sendingSamplesRef = useRef(false);
   const lastAnnouncementTimeRef = useRef(null); // 마지막 음성 안내 시간 (5분 간격 제한용)
   const symptomAnnouncementCountRef = useRef({}); // 증상별 안내 횟수 추적
 
@@ -328,20 +330,25 @@ const ContinuousVoiceMonitor = () => {
     console.log('정신 상태 분석:', newState);
   };
 
-  // 백엔드로 분석 결과 전송
+  // 백엔드로 분석 결과 전송 (전송 중이거나 실패한 샘플은 모아서 다음에 한 번에 전송)
   const sendAnalysisToBackend = async (state) => {
+    pendingSamplesRef.current.push({
+      ...state,
+      timestamp: new Date().toISOString(),
+    });
+    if (sendingSamplesRef.current) return;
+
+    sendingSamplesRef.current = true;
+    const samples = pendingSamplesRef.current.splice(0);
     try {
       const token = localStorage.getItem('token');
-      const response = await fetch('http://localhost:8000/api/voice/continuous-analysis', {
+      const response = await fetch('http://localhost:8000/voice/continuous-analysis/batch', {
         method: 'POST',
         headers: {
           'Content-Type': 'application/json',
           'Authorization': `Bearer ${token}`
         },
-        body: JSON.stringify({
-          ...state,
-          timestamp: new Date().toISOString(),
-        })
+        body: JSON.stringify({ samples })
       });
 
       if (response.ok) {
@@ -349,12 +356,21 @@ const ContinuousVoiceMonitor = () => {
         console.log('분석 결과 저장 완료:', result);
       } else {
         console.error('분석 결과 전송 실패:', response.status);
+        requeueSamples(samples);
       }
     } catch (error) {
       console.error('분석 결과 전송 오류:', error);
+      requeueSamples(samples);
+    } finally {
+      sendingSamplesRef.current = false;
     }
   };
 
+  // 전송 실패한 샘플을 다시 대기열에 (최대 100개)
+  const requeueSamples = (samples) => {
+    pendingSamplesRef.current = [...samples, ...pendingSamplesRef.current].slice(-100);
+  };
+
   // 알림 추가
   const addAlert = (message, enableVoice = true, symptomKey = null) => {
     const newAlert = {
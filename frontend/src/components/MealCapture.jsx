@@ -4,6 +4,7 @@ import './MealCapture.css';
 
 const MealCapture = ({ onClose, onMealSaved }) => {
   const [capturedImage, setCapturedImage] = useState(null);
+  const [capturedFile, setCapturedFile] = useState(null);
   const [mealType, setMealType] = useState('lunch');
   const [notes, setNotes] = useState('');
   const [isAnalyzing, setIsAnalyzing] = useState(false);
@@ -22,6 +23,7 @@ const MealCapture = ({ onClose, onMealSaved }) => {
     const file = event.target.files[0];
     if (!file) return;
 
+    setCapturedFile(file);
     const reader = new FileReader();
     reader.onloadend = () => {
       setCapturedImage(reader.result);
@@ -40,13 +42,27 @@ const MealCapture = ({ onClose, onMealSaved }) => {
     try {
       const token = localStorage.getItem('access_token');
 
-      // 1. 식단 기록 생성
+      // 1. 사진 업로드 (서버 파일 저장소에 저장 후 주소 반환)
+      const formData = new FormData();
+      formData.append('file', capturedFile);
+      const uploadResponse = await axios.post(
+        'http://localhost:8000/api/meals/upload-image',
+        formData,
+        {
+          headers: {
+            Authorization: `Bearer ${token}`,
+            'Content-Type': 'multipart/form-data',
+          },
+        }
+      );
+
+      // 2. 식단 기록 생성
       const mealResponse = await axios.post(
         'http://localhost:8000/api/meals/',
         {
           meal_type: mealType,
           meal_date: new Date().toISOString(),
-          image_url: capturedImage,
+          image_url: uploadResponse.data.image_url,
           notes: notes,
         },
         {
@@ -59,7 +75,7 @@ const MealCapture = ({ onClose, onMealSaved }) => {
 
       const mealId = mealResponse.data.id;
 
-      // 2. AI 분석 요청
+      // 3. AI 분석 요청
       const analysisResponse = await axios.post(
         `http://localhost:8000/api/meals/${mealId}/analyze`,
         {},
@@ -87,6 +103,7 @@ const MealCapture = ({ onClose, onMealSaved }) => {
 
   const handleRetake = () => {
     setCapturedImage(null);
+    setCapturedFile(null);
     setAnalysisResult(null);
     setStep(1);
   };
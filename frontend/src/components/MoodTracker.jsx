@@ -79,6 +79,11 @@ const MoodTracker = () => {
       const data = await response.json();
       setAiAnalysis(data);
 
+      // AI 분석은 서버에서 비동기로 채워지므로 완료될 때까지 조회
+      if (!data.ai_analysis) {
+        pollMoodAnalysis(data.id);
+      }
+
       // 폼 초기화
       setSelectedMood(null);
       setMoodIntensity(5);
@@ -102,6 +107,32 @@ const MoodTracker = () => {
     }
   };
 
+  // AI 분석 결과 조회 (최대 약 30초)
+  const pollMoodAnalysis = async (recordId, attempts = 15) => {
+    const token = localStorage.getItem('token');
+    for (let i = 0; i < attempts; i++) {
+      await new Promise((resolve) => setTimeout(resolve, 2000));
+      try {
+        const response = await fetch(`http://localhost:8000/api/mood-records/${recordId}`, {
+          headers: {
+            'Authorization': `Bearer ${token}`
+          }
+        });
+        if (!response.ok) return;
+
+        const record = await response.json();
+        if (record.ai_analysis) {
+          setAiAnalysis((current) => (current && current.id === recordId ? record : current));
+          fetchMoodRecords();
+          return;
+        }
+      } catch (error) {
+        console.error('AI 분석 조회 오류:', error);
+        return;
+      }
+    }
+  };
+
   // 감정 기록 목록 가져오기
   const fetchMoodRecords = async () => {
     setIsLoading(true);
@@ -266,12 +297,12 @@ const MoodTracker = () => {
               <div className="ai-analysis-content">
                 <div className="analysis-section">
                   <h4>📋 감정 분석</h4>
-                  <p>{aiAnalysis.ai_analysis}</p>
+                  <p>{aiAnalysis.ai_analysis || 'AI가 감정을 분석하고 있어요...'}</p>
                 </div>
 
                 <div className="analysis-section">
                   <h4>💡 조언</h4>
-                  <p>{aiAnalysis.ai_advice}</p>
+                  <p>{aiAnalysis.ai_advice || '잠시만 기다려주세요.'}</p>
                 </div>
               </div>
 
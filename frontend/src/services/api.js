@@ -97,6 +97,12 @@ export const disclaimerAPI = {
 // Speech API (Google STT)
 export const speechAPI = {
   transcribe: (data) => api.post('/api/speech/transcribe', data),
+  // 녹음 파일을 Base64 없이 원본 바이트로 전송
+  transcribeAudio: (audioBlob, params = {}) =>
+    api.post('/api/speech/transcribe-audio', audioBlob, {
+      params,
+      headers: { 'Content-Type': audioBlob.type || 'audio/webm' },
+    }),
   transcribeFile: (file) => {
     const formData = new FormData();
     formData.append('file', file);
@@ -104,6 +110,59 @@ export const speechAPI = {
       headers: { 'Content-Type': 'multipart/form-data' },
     });
   },
+  // 실시간 음성 인식 (WebSocket) - 녹음 중 청크를 보내고 중간 결과를 바로 받음
+  openStream: ({ encoding = 'WEBM_OPUS', sampleRateHertz = 48000, languageCode = 'ko-KR', onInterim } = {}) => {
+    const params = new URLSearchParams({
+      token: localStorage.getItem('token') || '',
+      encoding,
+      sample_rate_hertz: String(sampleRateHertz),
+      language_code: languageCode,
+    });
+    const socket = new WebSocket(`${API_URL.replace(/^http/, 'ws')}/api/speech/stream?${params}`);
+    const pending = [];
+    let resolveEnd;
+    let rejectEnd;
+    const ended = new Promise((resolve, reject) => {
+      resolveEnd = resolve;
+      rejectEnd = reject;
+    });
+
+    socket.onopen = () => {
+      pending.splice(0).forEach((chunk) => socket.send(chunk));
+    };
+    socket.onmessage = (event) => {
+      const message = JSON.parse(event.data);
+      if (message.type === 'interim' && onInterim) {
+        onInterim(message.transcript);
+      } else if (message.type === 'error') {
+        rejectEnd(new Error(message.message));
+      } else if (message.type === 'end') {
+        resolveEnd(message.transcript);
+      }
+    };
+    socket.onerror = () => rejectEnd(new Error('실시간 음성 인식 연결 실패'));
+    socket.onclose = () => rejectEnd(new Error('실시간 음성 인식 연결이 종료되었습니다.'));
+
+    return {
+      send: (chunk) => {
+        if (socket.readyState === WebSocket.OPEN) {
+          socket.send(chunk);
+        } else if (socket.readyState === WebSocket.CONNECTING) {
+          pending.push(chunk);
+        }
+      },
+      // 입력 종료 후 최종 인식 결과 반환
+      finish: () => {
+        if (socket.readyState === WebSocket.OPEN) {
+          socket.send('end');
+        } else if (socket.readyState === WebSocket.CONNECTING) {
+          pending.push('end');
+        }
+        return ended;
+      },
+      close: () => socket.close(),
+    };
+  },
 };
 
 // Emotion Analysis API